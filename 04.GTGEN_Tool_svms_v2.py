@@ -9,7 +9,7 @@ from xml.dom.minidom import Element
 from xml.etree import ElementTree
 import six
 import numpy.core.multiarray
-from PIL import Image, ImageTk
+from PIL import Image, ImageTk, ImageDraw
 import tkinter as tk
 from tkinter import messagebox
 from tkinter import filedialog
@@ -24,13 +24,79 @@ import shutil
 import numpy as np
 import pyautogui
 from numpy import array
-from collections import Counter
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import json
+import threading
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
 #BASE_DIR = "C:/S1/TrainData/"
 BASE_DIR = os.getcwd() + "\\"
 _dir_goodbye = ""
 
+def zones_signature(zones, fields=('enabled',)):
+	"""영역 리스트 비교용 키 (래스터 캐시 갱신 확인용)
+
+	폴리곤 점 리스트는 객체 id로, 나머지 필드는 값으로 비교합니다.
+	캐시 쪽에서 점 리스트를 함께 보관해야 id가 다른 영역에 재사용되지 않습니다.
+	"""
+	return tuple((id(zone['points']),) + tuple(repr(zone.get(field)) for field in fields) for zone in zones)
+
+# 폴리곤 영역 래스터 (제외 영역/클래스 변경 영역 조회용)
+class ZoneRaster:
+	"""폴리곤들을 원본 해상도 픽셀 마스크로 래스터화하고 적분 영상(summed-area table)으로 조회
+
+	마스크는 폴리곤들을 감싸는 사각형 범위만 만들고, 그 밖의 박스/점은
+	경계 사각형 비교만으로 바로 제외합니다. 박스 하나는 적분 영상 네 칸 조회로 판정합니다.
+	"""
+
+	def __init__(self, polygons):
+		points = np.concatenate([np.floor(np.asarray(p, dtype=np.float64).reshape(-1, 2)) for p in polygons])
+		self.x0 = int(points[:, 0].min())
+		self.y0 = int(points[:, 1].min())
+		width = int(points[:, 0].max()) - self.x0 + 1
+		height = int(points[:, 1].max()) - self.y0 + 1
+
+		canvas = Image.new('L', (width, height), 0)
+		draw = ImageDraw.Draw(canvas)
+		for polygon in polygons:
+			pixels = [(int(np.floor(x)) - self.x0, int(np.floor(y)) - self.y0) for x, y in polygon]
+			draw.polygon(pixels, fill=1, outline=1)  # 경계 픽셀 포함
+		self.mask = np.asarray(canvas, dtype=bool)
+		self.origin = np.array([self.x0, self.y0, self.x0, self.y0])
+		self.limit = np.array([width, height, width, height])
+
+		# 적분 영상: sat[r, c] = mask[:r, :c] 합
+		self.sat = np.zeros((height + 1, width + 1), dtype=np.int32)
+		self.sat[1:, 1:] = self.mask.cumsum(axis=0, dtype=np.int32).cumsum(axis=1, dtype=np.int32)
+
+	@staticmethod
+	def pixel_boxes(boxes):
+		"""원본 좌표 박스 [x1, y1, x2, y2] -> 걸친 픽셀 범위 [c1, r1, c2, r2) (끝 좌표 픽셀 포함)"""
+		boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+		low = np.minimum(boxes[:, :2], boxes[:, 2:])
+		high = np.maximum(boxes[:, :2], boxes[:, 2:])
+		return np.floor(np.concatenate([low, high + 1], axis=1)).astype(np.int64)
+
+	def boxes_overlap(self, pixel_boxes):
+		"""pixel_boxes() 범위가 영역과 한 픽셀이라도 겹치는지 (bool 배열)"""
+		# 마스크 범위로 자르기 (범위 밖 박스는 면적 0이 되어 바로 제외)
+		c1, r1, c2, r2 = np.clip(pixel_boxes - self.origin, 0, self.limit).T
+		sat = self.sat
+		return (sat[r2, c2] - sat[r1, c2] - sat[r2, c1] + sat[r1, c1]) > 0
+
+	def points_inside(self, xs, ys):
+		"""원본 좌표 점들이 영역 안에 있는지 (bool 배열)"""
+		height, width = self.mask.shape
+		cols = np.floor(np.asarray(xs, dtype=np.float64)).astype(np.int64) - self.x0
+		rows = np.floor(np.asarray(ys, dtype=np.float64)).astype(np.int64) - self.y0
+		valid = (cols >= 0) & (cols < width) & (rows >= 0) & (rows < height)
+		inside = np.zeros(len(cols), dtype=bool)
+		inside[valid] = self.mask[rows[valid], cols[valid]]
+		return inside
+
 # 폴리곤 제외 영역 관리 클래스
 class ExclusionZoneManager:
 	"""폴리곤 제외 영역을 관리하는 클래스"""
@@ -43,6 +109,9 @@ class ExclusionZoneManager:
 		self.global_zone_file = os.path.join(self.base_dir, ".global_exclusion_zones.json")
 		self.enabled_file = os.path.join(self.base_dir, ".exclusion_zone_enabled.txt")
 		self.use_global = True  # 전역 영역 사용 여부
+		self._raster_key = None  # 래스터 캐시를 만든 영역 키
+		self._raster_points = []  # 캐시를 만든 폴리곤 점 리스트 (키의 id 유지용)
+		self._rasters = {}  # 적용 클래스(None은 모든 클래스) -> ZoneRaster
 		self.load_global_zones()
 
 	def add_zone(self, points, use_global=True, class_ids=None):
@@ -103,109 +172,49 @@ class ExclusionZoneManager:
 		Returns:
 			bool: 조금이라도 겹치면 True
 		"""
-		zones_to_check = self.global_zones if self.use_global else self.zones
-		if not zones_to_check:
-			# 제외 영역이 없으면 False 반환 (디버그 로그 제거)
-			return False
-
-		# bbox의 클래스 ID 가져오기
-		bbox_class_id = bbox[2]  # info 필드가 class_id
-		# bbox를 원본 좌표로 변환 (화면 좌표 / zoom_ratio)
-		x1, y1, x2, y2 = bbox[3] / zoom_ratio, bbox[4] / zoom_ratio, bbox[5] / zoom_ratio, bbox[6] / zoom_ratio
-
-		for i, zone in enumerate(zones_to_check):
-			# 하위 호환성: class_ids 키가 없으면 빈 리스트로 간주
-			zone_class_ids = zone.get('class_ids', [])
+		return bool(self.find_bboxes_in_exclusion_zone([bbox], zoom_ratio)[0])
 
-			if zone['enabled']:
-				# 클래스 필터 체크: class_ids가 비어있으면 모든 클래스에 적용
-				if zone_class_ids and bbox_class_id not in zone_class_ids:
-					continue
-
-				overlap = self._bbox_polygon_overlap(x1, y1, x2, y2, zone['points'])
-				if overlap:
-					return True
-		return False
-
-	def _bbox_polygon_overlap(self, x1, y1, x2, y2, polygon):
-		"""bbox와 폴리곤이 겹치는지 확인 (면적 기반)
+	def find_bboxes_in_exclusion_zone(self, bbox_list, zoom_ratio=1.0):
+		"""bbox 리스트 전체를 한 번에 검사 (래스터 적분 영상 조회)
 		Args:
-			x1, y1, x2, y2: bbox 좌표
-			polygon: 폴리곤 점들 [(x, y), ...]
+			bbox_list: [sel, clsname, info, x1, y1, x2, y2] 리스트 (화면 좌표)
+			zoom_ratio: 현재 줌 비율
 		Returns:
-			bool: 조금이라도 겹치면 True
+			np.ndarray: bbox별로 제외 영역과 조금이라도 겹치면 True
 		"""
-		# bbox 좌표 정규화 (x1 < x2, y1 < y2 보장)
-		min_x, max_x = min(x1, x2), max(x1, x2)
-		min_y, max_y = min(y1, y2), max(y1, y2)
-
-		# 1. bbox의 네 모서리 중 하나라도 폴리곤 안에 있는지 확인
-		bbox_corners = [
-			(min_x, min_y),  # 왼쪽 위
-			(max_x, min_y),  # 오른쪽 위
-			(min_x, max_y),  # 왼쪽 아래
-			(max_x, max_y)   # 오른쪽 아래
-		]
-
-		for corner in bbox_corners:
-			if self._point_in_polygon(corner, polygon):
-				return True  # bbox 모서리가 폴리곤 안에 있음
-
-		# 2. 폴리곤의 점 중 하나라도 bbox 안에 있는지 확인
-		for point in polygon:
-			px, py = point
-			if min_x <= px <= max_x and min_y <= py <= max_y:
-				return True  # 폴리곤 점이 bbox 안에 있음
-
-		# 3. bbox의 변과 폴리곤의 변이 교차하는지 확인
-		bbox_edges = [
-			((min_x, min_y), (max_x, min_y)),  # 위쪽 변
-			((max_x, min_y), (max_x, max_y)),  # 오른쪽 변
-			((max_x, max_y), (min_x, max_y)),  # 아래쪽 변
-			((min_x, max_y), (min_x, min_y))   # 왼쪽 변
-		]
-
-		n = len(polygon)
-		for i in range(n):
-			polygon_edge = (polygon[i], polygon[(i + 1) % n])
-			for bbox_edge in bbox_edges:
-				if self._segments_intersect(bbox_edge[0], bbox_edge[1], polygon_edge[0], polygon_edge[1]):
-					return True  # 변들이 교차함
-
-		return False  # 겹치지 않음
+		hits = np.zeros(len(bbox_list), dtype=bool)
+		zones_to_check = self.global_zones if self.use_global else self.zones
+		if not zones_to_check or not bbox_list:
+			return hits
 
-	def _segments_intersect(self, p1, p2, p3, p4):
-		"""두 선분이 교차하는지 확인
-		Args:
-			p1, p2: 첫 번째 선분의 시작/끝점
-			p3, p4: 두 번째 선분의 시작/끝점
-		Returns:
-			bool: 교차하면 True
-		"""
-		def ccw(A, B, C):
-			return (C[1] - A[1]) * (B[0] - A[0]) > (B[1] - A[1]) * (C[0] - A[0])
-
-		return ccw(p1, p3, p4) != ccw(p2, p3, p4) and ccw(p1, p2, p3) != ccw(p1, p2, p4)
-
-	def _point_in_polygon(self, point, polygon):
-		"""점이 폴리곤 안에 있는지 확인 (Ray casting algorithm)"""
-		x, y = point
-		n = len(polygon)
-		inside = False
-
-		p1x, p1y = polygon[0]
-		for i in range(1, n + 1):
-			p2x, p2y = polygon[i % n]
-			if y > min(p1y, p2y):
-				if y <= max(p1y, p2y):
-					if x <= max(p1x, p2x):
-						if p1y != p2y:
-							xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-						if p1x == p2x or x <= xinters:
-							inside = not inside
-			p1x, p1y = p2x, p2y
+		# bbox를 원본 좌표로 변환 (화면 좌표 / zoom_ratio)
+		boxes = ZoneRaster.pixel_boxes(np.array([bbox[3:7] for bbox in bbox_list], dtype=np.float64) / zoom_ratio)
+		bbox_class_ids = np.array([bbox[2] for bbox in bbox_list])  # info 필드가 class_id
 
-		return inside
+		for class_id, raster in self._zone_rasters(zones_to_check).items():
+			if class_id is None:
+				hits |= raster.boxes_overlap(boxes)
+			else:
+				idx = np.flatnonzero((bbox_class_ids == class_id) & ~hits)
+				if len(idx):
+					hits[idx] = raster.boxes_overlap(boxes[idx])
+		return hits
+
+	def _zone_rasters(self, zones):
+		"""활성 영역을 적용 클래스별로 합친 래스터 (영역 내용이 바뀔 때만 다시 생성)"""
+		key = zones_signature(zones, ('enabled', 'class_ids'))
+		if key != self._raster_key:
+			groups = {}
+			for zone in zones:
+				if not zone['enabled']:
+					continue
+				# 하위 호환성: class_ids 키가 없거나 비어있으면 모든 클래스에 적용
+				for class_id in zone.get('class_ids', []) or [None]:
+					groups.setdefault(class_id, []).append(zone['points'])
+			self._rasters = {class_id: ZoneRaster(polygons) for class_id, polygons in groups.items()}
+			self._raster_key = key
+			self._raster_points = [zone['points'] for zone in zones]
+		return self._rasters
 
 	def save_global_zones(self):
 		"""전역 제외 영역을 파일로 저장"""
@@ -263,6 +272,9 @@ class ClassChangeZoneManager:
 		self.base_dir = base_dir or os.getcwd()
 		self.zones = []  # 클래스 변경 영역 리스트
 		self.global_zone_file = os.path.join(self.base_dir, ".class_change_zones.json")
+		self._raster_key = None  # 래스터 캐시를 만든 영역 키
+		self._raster_points = []  # 캐시를 만든 폴리곤 점 리스트 (키의 id 유지용)
+		self._rasters = []  # 영역별 ZoneRaster (비활성 영역은 None)
 		self.load_zones()
 
 	def add_zone(self, points, mode, target_class_id, source_class_id=None):
@@ -304,7 +316,7 @@ class ClassChangeZoneManager:
 		self.zones = []
 
 	def apply_class_changes(self, bbox_list, class_name_list, zoom_ratio=1.0):
-		"""bbox 리스트에 클래스 변경 영역 적용
+		"""bbox 리스트에 클래스 변경 영역 적용 (bbox 중심점 기준, 앞쪽 영역 우선)
 		Args:
 			bbox_list: bbox 리스트 (화면 좌표)
 			class_name_list: 클래스 이름 리스트
@@ -312,91 +324,67 @@ class ClassChangeZoneManager:
 		Returns:
 			tuple: (변경된 bbox 리스트, 변경 개수)
 		"""
-		if not self.zones:
+		if not self.zones or not bbox_list:
 			return bbox_list, 0
 
-		changed_count = 0
-		new_bbox_list = []
+		# bbox: [sel, clsname, info, x1, y1, x2, y2] -> 원본 좌표 중심점
+		boxes = np.array([bbox[3:7] for bbox in bbox_list], dtype=np.float64) / zoom_ratio
+		cx = (boxes[:, 0] + boxes[:, 2]) / 2
+		cy = (boxes[:, 1] + boxes[:, 3]) / 2
+		bbox_class_ids = np.array([bbox[2] for bbox in bbox_list])
 
-		for bbox in bbox_list:
-			# bbox: [sel, clsname, info, x1, y1, x2, y2]
-			bbox_class_id = bbox[2]
-			x1, y1, x2, y2 = bbox[3] / zoom_ratio, bbox[4] / zoom_ratio, bbox[5] / zoom_ratio, bbox[6] / zoom_ratio
+		new_class_ids = np.full(len(bbox_list), -1, dtype=np.int64)
+		pending = np.ones(len(bbox_list), dtype=bool)  # 아직 변경되지 않은 bbox
+		for zone, raster in zip(self.zones, self._zone_rasters()):
+			if raster is None:
+				continue
+			new_class_id = zone['target_class_id']
+			if not 0 <= new_class_id < len(class_name_list):
+				continue
 
-			changed = False
-			for zone in self.zones:
-				if not zone['enabled']:
-					continue
+			# 모드에 따라 대상 bbox 선택
+			if zone['mode'] == 'all':
+				# 모든 클래스를 target_class_id로 변경
+				candidates = pending
+			elif zone['mode'] == 'filter':
+				# source_class_id와 일치하는 경우만 target_class_id로 변경
+				candidates = pending & (bbox_class_ids == zone['source_class_id'])
+			else:
+				continue
 
-				# 폴리곤 내부에 있는지 확인
-				if self._bbox_in_polygon(x1, y1, x2, y2, zone['points']):
-					# 모드에 따라 클래스 변경
-					if zone['mode'] == 'all':
-						# 모든 클래스를 target_class_id로 변경
-						new_class_id = zone['target_class_id']
-						if 0 <= new_class_id < len(class_name_list):
-							new_class_name = class_name_list[new_class_id]
-							# bbox 복사 후 클래스 정보 변경
-							new_bbox = list(bbox)
-							new_bbox[1] = new_class_name
-							new_bbox[2] = new_class_id
-							new_bbox_list.append(new_bbox)
-							changed = True
-							changed_count += 1
-							break
-					elif zone['mode'] == 'filter':
-						# source_class_id와 일치하는 경우만 target_class_id로 변경
-						if bbox_class_id == zone['source_class_id']:
-							new_class_id = zone['target_class_id']
-							if 0 <= new_class_id < len(class_name_list):
-								new_class_name = class_name_list[new_class_id]
-								new_bbox = list(bbox)
-								new_bbox[1] = new_class_name
-								new_bbox[2] = new_class_id
-								new_bbox_list.append(new_bbox)
-								changed = True
-								changed_count += 1
-								break
-
-			# 변경되지 않았으면 원본 bbox 추가
-			if not changed:
+			idx = np.flatnonzero(candidates)
+			if len(idx) == 0:
+				continue
+			# 폴리곤 내부에 중심점이 있는 bbox만 변경
+			idx = idx[raster.points_inside(cx[idx], cy[idx])]
+			new_class_ids[idx] = new_class_id
+			pending[idx] = False
+
+		changed_count = 0
+		new_bbox_list = []
+		for bbox, new_class_id in zip(bbox_list, new_class_ids.tolist()):
+			if new_class_id < 0 or new_class_id == bbox[2]:
+				# 변경되지 않았으면 (이미 목표 클래스인 경우 포함) 원본 bbox 추가
 				new_bbox_list.append(bbox)
+				continue
+			# bbox 복사 후 클래스 정보 변경
+			new_bbox = list(bbox)
+			new_bbox[1] = class_name_list[new_class_id]
+			new_bbox[2] = new_class_id
+			new_bbox_list.append(new_bbox)
+			changed_count += 1
 
 		return new_bbox_list, changed_count
 
-	def _bbox_in_polygon(self, x1, y1, x2, y2, polygon):
-		"""bbox가 폴리곤 내부에 있는지 확인 (중심점 기준)
-		Args:
-			x1, y1, x2, y2: bbox 좌표
-			polygon: 폴리곤 점들 [(x, y), ...]
-		Returns:
-			bool: bbox 중심점이 폴리곤 안에 있으면 True
-		"""
-		# bbox 중심점 계산
-		cx = (x1 + x2) / 2
-		cy = (y1 + y2) / 2
-
-		return self._point_in_polygon((cx, cy), polygon)
-
-	def _point_in_polygon(self, point, polygon):
-		"""점이 폴리곤 안에 있는지 확인 (Ray casting algorithm)"""
-		x, y = point
-		n = len(polygon)
-		inside = False
-
-		p1x, p1y = polygon[0]
-		for i in range(1, n + 1):
-			p2x, p2y = polygon[i % n]
-			if y > min(p1y, p2y):
-				if y <= max(p1y, p2y):
-					if x <= max(p1x, p2x):
-						if p1y != p2y:
-							xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-						if p1x == p2x or x <= xinters:
-							inside = not inside
-			p1x, p1y = p2x, p2y
-
-		return inside
+	def _zone_rasters(self):
+		"""영역별 래스터 (영역 내용이 바뀔 때만 다시 생성)"""
+		key = zones_signature(self.zones)
+		if key != self._raster_key:
+			self._rasters = [ZoneRaster([zone['points']]) if zone['enabled'] else None
+								for zone in self.zones]
+			self._raster_key = key
+			self._raster_points = [zone['points'] for zone in self.zones]
+		return self._rasters
 
 	def save_zones(self):
 		"""클래스 변경 영역을 파일로 저장"""
@@ -554,9 +542,9 @@ class AutoDeleteClassManager:
 
 # 클래스 설정 관리 클래스
 class ClassConfigManager:
-	def __init__(self, config_file="class_config.json"):
-		# 현재 작업 디렉토리를 기준으로 설정 파일 저장/로드
-		self.base_dir = os.getcwd()
+	def __init__(self, config_file="class_config.json", base_dir=None):
+		# base_dir(기본: 현재 작업 디렉토리)를 기준으로 설정 파일 저장/로드
+		self.base_dir = base_dir or os.getcwd()
 		self.config_file = os.path.join(self.base_dir, config_file)
 		self.last_config_file = os.path.join(self.base_dir, ".last_class_config.txt")
 		self.classes = []
@@ -639,8 +627,8 @@ class ClassConfigManager:
 	def config_exists(self):
 		return os.path.exists(self.config_file)
 
-	def load_config(self, config_file=None):
-		"""설정 파일 로드"""
+	def load_config(self, config_file=None, remember=True):
+		"""설정 파일 로드 (remember가 False면 마지막 사용 설정으로 기록하지 않음)"""
 		if config_file:
 			self.set_config_file(config_file)
 
@@ -653,7 +641,8 @@ class ClassConfigManager:
 				self.classes = data.get('classes', [])
 				# 백업 옵션 로드 (기본값: True)
 				self.enable_backup = data.get('enable_backup', True)
-			self.save_last_config()
+			if remember:
+				self.save_last_config()
 			return True
 		except Exception as e:
 			print(f"설정 파일 로드 실패: {e}")
@@ -1061,12 +1050,666 @@ def get_list_jpg(_dir):
 	if not os.path.exists(_dir): os.makedirs(_dir)
 	return [_dir + '/' + f for f in os.listdir(_dir) if f.find('.jpg') >= 0 or f.find('.png') >= 0 ]
 
+def rel_to_abs_bbox(rc, imsize, class_name_list):
+	"""YOLO 상대 좌표 [cls, cx, cy, w, h] -> [sel, clsname, info, x1, y1, x2, y2] (imsize 기준 좌표, 이미지 범위로 보정)"""
+	w = rc[3] * imsize[0]
+	h = rc[4] * imsize[1]
+	x = (rc[1] - rc[3]/2) * imsize[0]
+	y = (rc[2] - rc[4]/2) * imsize[1]
+	if x<0:
+		x=0
+	if y<0:
+		y=0
+	if x+w>imsize[0]:
+		w=imsize[0]-x-1
+	if y+h>imsize[1]:
+		h=imsize[1]-y-1
+
+	# 클래스 인덱스 범위 체크 - 원본 ID 유지
+	class_idx = int(rc[0])
+	if 0 <= class_idx < len(class_name_list):
+		name = class_name_list[class_idx]
+	else:
+		# 설정에 없는 클래스는 원본 ID를 유지하고 Unknown으로 표시
+		print(f"WARNING: Class index {class_idx} not in config, keeping original ID")
+		name = f"Unknown({class_idx})"
+
+	return [False, name, class_idx, (x), (y), (x+w), (y+h)]
+
+def image_to_label_path(image_path):
+	"""이미지 경로 -> 라벨 경로 (draw_image와 같은 규칙)"""
+	label_path = image_path.replace('JPEGImages','labels')
+	label_path = label_path.replace('images','annotations')
+	label_path = label_path.replace('.jpg','.txt')
+	label_path = label_path.replace('.png','.txt')
+	return label_path
+
+def write_text_atomic(path, text):
+	"""같은 폴더의 임시 파일에 쓴 뒤 교체 (중간에 끊겨도 기존 파일이 깨지지 않음)"""
+	tmp_path = f"{path}.{os.getpid()}.tmp"
+	try:
+		with open(tmp_path, 'wt') as f:
+			f.write(text)
+		os.replace(tmp_path, path)
+	except BaseException:
+		if os.path.exists(tmp_path):
+			os.remove(tmp_path)
+		raise
+
+class LabelWriteBehind:
+	"""
+	라벨 파일 write-behind 저장기
+	같은 파일에 대한 연속 저장은 마지막 내용 하나로 합쳐 백그라운드 스레드에서 원자적으로 씁니다.
+	마지막 요청 후 delay초가 지나거나 첫 요청 후 max_delay초가 지나면 저장합니다.
+	"""
+
+	def __init__(self, delay=0.3, max_delay=2.0):
+		self.delay = delay  # 편집이 멈춘 뒤 저장까지 대기 시간
+		self.max_delay = max_delay  # 편집이 계속되어도 이 시간 안에는 저장
+		self.cond = threading.Condition()
+		self.pending = {}  # 경로 -> [내용, 첫 요청 시각, 마지막 요청 시각]
+		self.in_flight = set()  # 쓰는 중인 경로
+		self.errors = []  # (경로, 예외) - UI 스레드에서 꺼내 알림
+		self.thread = None
+		self.closed = False
+
+	def submit(self, path, text):
+		"""저장 요청 (같은 경로의 이전 요청은 덮어씀)"""
+		if self.closed:
+			write_text_atomic(path, text)
+			return
+		now = time.monotonic()
+		with self.cond:
+			entry = self.pending.get(path)
+			if entry is None:
+				self.pending[path] = [text, now, now]
+			else:
+				entry[0] = text
+				entry[2] = now
+			if self.thread is None:
+				self.thread = threading.Thread(target=self._run, name="LabelWriteBehind", daemon=True)
+				self.thread.start()
+			self.cond.notify_all()
+
+	def _due_time(self, entry):
+		return min(entry[2] + self.delay, entry[1] + self.max_delay)
+
+	def _run(self):
+		while True:
+			with self.cond:
+				while True:
+					if self.closed and not self.pending:
+						return
+					now = time.monotonic()
+					due = [path for path, entry in self.pending.items() if self._due_time(entry) <= now]
+					if due:
+						break
+					timeout = min(self._due_time(entry) for entry in self.pending.values()) - now if self.pending else None
+					self.cond.wait(timeout)
+				batch = [(path, self.pending.pop(path)[0]) for path in due]
+				self.in_flight.update(due)
+			for path, text in batch:
+				try:
+					write_text_atomic(path, text)
+				except Exception as e:
+					# 어떤 오류든 기록만 하고 스레드는 유지 (flush 대기가 끝나지 않는 일이 없도록)
+					print(f"[LabelWriteBehind] 라벨 저장 실패 ({path}): {e}")
+					with self.cond:
+						self.errors.append((path, e))
+				finally:
+					with self.cond:
+						self.in_flight.discard(path)
+						self.cond.notify_all()
+
+	def flush(self, path=None, wait=True):
+		"""대기 중인 저장을 즉시 실행 (path 지정 시 해당 파일만). wait=True면 디스크에 써질 때까지 기다림"""
+		with self.cond:
+			targets = [path] if path is not None else list(self.pending)
+			for key in targets:
+				entry = self.pending.get(key)
+				if entry is not None:
+					entry[1] = -self.max_delay  # 기한 지남으로 표시
+			self.cond.notify_all()
+			if not wait:
+				return
+			if path is None:
+				self.cond.wait_for(lambda: not self.pending and not self.in_flight)
+			else:
+				self.cond.wait_for(lambda: path not in self.pending and path not in self.in_flight)
+
+	def pending_count(self):
+		with self.cond:
+			return len(self.pending) + len(self.in_flight)
+
+	def pop_errors(self):
+		with self.cond:
+			errors, self.errors = self.errors, []
+		return errors
+
+	def close(self):
+		"""남은 저장을 모두 마치고 스레드 종료 (이후 요청은 바로 씀)"""
+		self.flush()
+		with self.cond:
+			self.closed = True
+			self.cond.notify_all()
+		if self.thread is not None:
+			self.thread.join()
+
+# 라벨 파일 write-behind 저장기 (프로그램 전체 공유)
+label_writer = LabelWriteBehind()
+
+# 마스킹 색상 (마젠타)
+MASK_COLOR = [255, 0, 255]
+# 바이트 값별 설정 비트 수
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+# 비트 압축 마스크 (마스킹 영역 저장용)
+class PackedMask:
+	"""마스킹 영역을 행마다 8픽셀씩 비트로 압축해 보관하는 마스크
+
+	np.where 좌표 튜플(픽셀당 int64 두 개) 대신 픽셀당 1비트만 사용하며,
+	적용/영역 계산은 마스크가 있는 행·열 범위에서만 수행합니다.
+	"""
+	FILE_VERSION = 2
+
+	def __init__(self, bits, width, height):
+		self.bits = bits  # (height, ceil(width / 8)) uint8
+		self.width = int(width)
+		self.height = int(height)
+		self._bounds = False  # 계산 전 표시 (None은 빈 마스크)
+
+	@classmethod
+	def from_bool(cls, mask):
+		"""(H, W) bool 배열로부터 생성"""
+		height, width = mask.shape
+		return cls(np.packbits(mask, axis=1), width, height)
+
+	@classmethod
+	def from_image_array(cls, img_array, color=MASK_COLOR):
+		"""이미지 배열에서 마스킹 색상 픽셀을 찾아 생성"""
+		mask = ((img_array[..., 0] == color[0]) & (img_array[..., 1] == color[1]) &
+				(img_array[..., 2] == color[2]))
+		return cls.from_bool(mask)
+
+	@classmethod
+	def from_coords(cls, ys, xs, width, height):
+		"""기존 (y 배열, x 배열) 좌표 튜플로부터 생성"""
+		mask = np.zeros((int(height), int(width)), dtype=bool)
+		mask[ys, xs] = True
+		return cls.from_bool(mask)
+
+	def bounds(self):
+		"""마스킹 픽셀을 감싸는 (x1, y1, x2, y2) (끝 포함), 비어 있으면 None"""
+		if self._bounds is False:
+			rows = np.flatnonzero(self.bits.any(axis=1))
+			if len(rows) == 0:
+				self._bounds = None
+			else:
+				merged = np.bitwise_or.reduce(self.bits[rows[0]:rows[-1] + 1], axis=0)
+				cols = np.flatnonzero(np.unpackbits(merged, count=self.width))
+				self._bounds = (int(cols[0]), int(rows[0]), int(cols[-1]), int(rows[-1]))
+		return self._bounds
+
+	def __bool__(self):
+		return self.bounds() is not None
+
+	def count(self):
+		"""마스킹된 픽셀 수"""
+		return int(_POPCOUNT[self.bits].sum())
+
+	def region(self, x1, y1, x2, y2):
+		"""[y1:y2, x1:x2] 영역의 bool 배열 (끝 제외)"""
+		byte1, byte2 = x1 // 8, (x2 + 7) // 8
+		unpacked = np.unpackbits(self.bits[y1:y2, byte1:byte2], axis=1)
+		offset = x1 - byte1 * 8
+		return unpacked[:, offset:offset + (x2 - x1)].view(bool)
+
+	def apply(self, img_array, color=MASK_COLOR):
+		"""이미지 배열의 마스킹 픽셀을 색상으로 칠합니다 (마스크 범위만 처리)."""
+		bounds = self.bounds()
+		if bounds is None:
+			return img_array
+		x1, y1, x2, y2 = bounds
+		img_array[y1:y2 + 1, x1:x2 + 1][self.region(x1, y1, x2 + 1, y2 + 1)] = color
+		return img_array
+
+	def is_applied(self, img_array, color=MASK_COLOR, tolerance=40):
+		"""이미지에 이 마스크가 이미 칠해져 있는지 확인 (JPEG 손실을 고려해 채널별 허용 오차 적용)"""
+		bounds = self.bounds()
+		if bounds is None:
+			return True
+		x1, y1, x2, y2 = bounds
+		pixels = img_array[y1:y2 + 1, x1:x2 + 1][self.region(x1, y1, x2 + 1, y2 + 1)]
+		diff = np.abs(pixels[:, :3].astype(np.int16) - np.array(color, dtype=np.int16))
+		return bool((diff <= tolerance).all())
+
+	def save(self, path):
+		"""압축 마스크 파일(.npz)로 저장"""
+		np.savez_compressed(path, version=self.FILE_VERSION, mask_bits=self.bits,
+							width=self.width, height=self.height)
+
+	@classmethod
+	def load(cls, path):
+		"""마스크 파일을 읽습니다. 이전 형식(masking_y/masking_x 좌표)도 읽을 수 있습니다."""
+		with np.load(path) as data:
+			width = int(data['width'])
+			height = int(data['height'])
+			if 'mask_bits' in data.files:
+				return cls(data['mask_bits'], width, height)
+			return cls.from_coords(data['masking_y'], data['masking_x'], width, height)
+
+# 현재 프레임 마스킹 편집 층 (원본 배열은 읽기 전용으로 공유)
+class MaskOverlay:
+	"""디코딩된 원본 프레임 위에 마스킹 편집만 따로 쌓아 두는 오버레이 층
+
+	원본 배열은 프레임 버퍼와 공유하며 수정하지 않습니다. 편집 영역 bool 배열은
+	첫 편집 때 만들고, 마스킹 색상을 칠한 합성 배열은 표시나 저장이 필요할 때만
+	만든 뒤 이후 편집을 바로 반영해 재사용합니다.
+	"""
+
+	def __init__(self, base):
+		self.base = base  # (H, W, 3) 원본 배열 (읽기 전용)
+		self.height, self.width = base.shape[:2]
+		self.edits = None  # (H, W) bool 편집 영역 (첫 편집 때 생성)
+		self._composite = None  # 합성 배열 캐시
+
+	@property
+	def edited(self):
+		return self.edits is not None
+
+	def _edit_layer(self):
+		if self.edits is None:
+			self.edits = np.zeros((self.height, self.width), dtype=bool)
+		return self.edits
+
+	def paint_rect(self, x1, y1, x2, y2, color=MASK_COLOR):
+		"""원본 좌표 [y1:y2, x1:x2] 영역 (끝 제외)을 마스킹"""
+		x1, x2 = max(0, int(x1)), min(self.width, int(x2))
+		y1, y2 = max(0, int(y1)), min(self.height, int(y2))
+		if x1 >= x2 or y1 >= y2:
+			return
+		self._edit_layer()[y1:y2, x1:x2] = True
+		if self._composite is not None:
+			self._composite[y1:y2, x1:x2] = color
+
+	def paint_mask(self, mask, color=MASK_COLOR):
+		"""(H, W) bool 배열 영역을 마스킹"""
+		self._edit_layer()[mask] = True
+		if self._composite is not None:
+			self._composite[mask] = color
+
+	def paint_packed(self, packed, color=MASK_COLOR):
+		"""PackedMask 영역을 마스킹 (마스크 범위만 처리)"""
+		bounds = packed.bounds()
+		if bounds is None:
+			return
+		x1, y1, x2, y2 = bounds
+		region = packed.region(x1, y1, x2 + 1, y2 + 1)
+		self._edit_layer()[y1:y2 + 1, x1:x2 + 1] |= region
+		if self._composite is not None:
+			self._composite[y1:y2 + 1, x1:x2 + 1][region] = color
+
+	def composite(self, color=MASK_COLOR):
+		"""마스킹이 칠해진 프레임 배열 (편집이 없으면 원본 배열 자체, 수정 금지)"""
+		if self.edits is None:
+			return self.base
+		if self._composite is None:
+			self._composite = self.base.copy()
+			self._composite[self.edits] = color
+		return self._composite
+
+	def to_packed(self, color=MASK_COLOR):
+		"""원본에 이미 있던 마스킹 색상 픽셀과 편집 영역을 합친 PackedMask"""
+		return PackedMask.from_image_array(self.composite(color), color)
+
+# 프레임 범위 작업 실행기 (범위 마스킹/라벨 복사용)
+class RangeJobRunner:
+	"""프레임 범위 작업을 작업자 스레드 풀에서 실행하는 실행기
+
+	동시에 처리 중인 프레임 수를 max_in_flight로 제한하고, 진행 상황과 완료는
+	Tk after 폴링으로 UI 스레드에서 알립니다. 작업 함수는 Tk 객체를 건드리면 안 됩니다.
+	"""
+
+	def __init__(self, master, work, items, on_progress=None, on_done=None,
+				 workers=4, max_in_flight=8, poll_ms=50):
+		self.master = master
+		self.work = work  # item -> 결과 (작업자 스레드에서 실행)
+		self.items = list(items)
+		self.on_progress = on_progress  # (완료 수, 전체 수) 콜백
+		self.on_done = on_done  # (결과 [(item, 결과 또는 예외)], 취소 여부) 콜백
+		self.workers = workers
+		self.max_in_flight = max(1, max_in_flight)
+		self.poll_ms = poll_ms
+		self.executor = None
+		self.pending = {}  # future -> item
+		self.next_index = 0
+		self.results = []
+		self.cancelled = False
+
+	def start(self):
+		self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="RangeJob")
+		self._fill()
+		self.master.after(self.poll_ms, self._poll)
+
+	def cancel(self):
+		"""아직 시작하지 않은 프레임은 건너뛰고, 처리 중인 프레임은 끝까지 마칩니다."""
+		self.cancelled = True
+
+	def _fill(self):
+		while not self.cancelled and self.next_index < len(self.items) and len(self.pending) < self.max_in_flight:
+			item = self.items[self.next_index]
+			self.next_index += 1
+			self.pending[self.executor.submit(self.work, item)] = item
+
+	def _poll(self):
+		for future in [f for f in self.pending if f.done()]:
+			item = self.pending.pop(future)
+			try:
+				self.results.append((item, future.result()))
+			except Exception as e:
+				self.results.append((item, e))
+		self._fill()
+		if self.on_progress:
+			self.on_progress(len(self.results), len(self.items))
+		if self.pending or (not self.cancelled and self.next_index < len(self.items)):
+			self.master.after(self.poll_ms, self._poll)
+			return
+		self.executor.shutdown(wait=False)
+		if self.on_done:
+			self.on_done(self.results, self.cancelled)
+
+# 프레임 미리 디코딩 버퍼 (다음/이전 프레임을 작업자 스레드에서 준비)
+class FrameDecodeBuffer:
+	"""현재 프레임 앞뒤의 이미지를 작업자 스레드에서 미리 디코딩하고 축소 단계(피라미드)를 만들어 두는 링 버퍼
+
+	프레임은 경로별로 보관하고 파일 mtime/size로 유효성을 확인하므로
+	마스킹 저장 등으로 이미지가 바뀌면 자동으로 다시 디코딩합니다.
+	PhotoImage는 Tk 스레드에서만 만들 수 있어 PIL 이미지 단계까지만 준비합니다.
+	"""
+
+	def __init__(self, ahead=2, behind=1, workers=2):
+		self.ahead = ahead  # 진행 방향으로 미리 읽을 장 수
+		self.behind = behind  # 반대 방향으로 유지할 장 수
+		self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="FrameDecode")
+		self.frames = {}  # 경로 -> 프레임 dict
+		self.futures = {}  # 경로 -> 디코딩 작업
+		self.last_index = None
+
+	@staticmethod
+	def file_signature(path):
+		try:
+			st = os.stat(path)
+		except OSError:
+			return None
+		return (st.st_mtime_ns, st.st_size)
+
+	@staticmethod
+	def decode(path):
+		"""이미지를 열어 원본 배열과 표시용 피라미드를 만듭니다."""
+		signature = FrameDecodeBuffer.file_signature(path)
+		im = Image.open(path)
+		im.load()
+		frame_array = array(im)
+		frame_array.flags.writeable = False  # 마스킹 편집은 MaskOverlay에만 기록
+		return {
+			'signature': signature,
+			'size': im.size,
+			'array': frame_array,  # 원본 배열 (읽기 전용으로 공유)
+			'levels': ViewportRenderer.build_levels(im),
+		}
+
+	def _harvest(self):
+		"""완료된 작업 결과를 버퍼로 옮깁니다 (Tk 스레드)."""
+		for key, future in list(self.futures.items()):
+			if not future.done():
+				continue
+			del self.futures[key]
+			if future.cancelled() or future.exception() is not None:
+				continue
+			self.frames[key] = future.result()
+
+	def get(self, path):
+		"""
+		표시할 프레임을 반환합니다. 준비된 것이 없으면 진행 중인 작업을 기다리거나 직접 디코딩합니다.
+		Returns:
+			dict: 'size' 원본 크기, 'array' 원본 배열, 'levels' 피라미드 [(배율, PIL 이미지)]
+		"""
+		key = path
+		signature = self.file_signature(path)
+		future = self.futures.pop(key, None)
+		if future is not None and not future.cancelled():
+			try:
+				self.frames[key] = future.result()
+			except Exception:
+				pass  # 아래에서 직접 디코딩해 실제 오류를 알림
+		self._harvest()
+		frame = self.frames.get(key)
+		if frame is None or signature is None or frame['signature'] != signature:
+			frame = self.decode(path)
+			self.frames[key] = frame
+		return frame
+
+	def schedule(self, imlist, index):
+		"""현재 위치 기준으로 진행 방향 ahead장, 반대 방향 behind장을 예약하고 범위 밖 프레임은 버립니다."""
+		self._harvest()
+		direction = -1 if self.last_index is not None and index < self.last_index else 1
+		self.last_index = index
+
+		wanted = [index]
+		wanted += [index + direction * step for step in range(1, self.ahead + 1)]
+		wanted += [index - direction * step for step in range(1, self.behind + 1)]
+		keys = [imlist[i] for i in wanted if 0 <= i < len(imlist)]
+		keep = set(keys)
+
+		for key in list(self.frames):
+			if key not in keep:
+				del self.frames[key]
+		for key in list(self.futures):
+			if key not in keep:
+				self.futures.pop(key).cancel()
+
+		for key in keys[1:]:
+			if key in self.futures:
+				continue
+			frame = self.frames.get(key)
+			if frame is not None and frame['signature'] == self.file_signature(key):
+				continue
+			self.futures[key] = self.executor.submit(self.decode, key)
+
+	def clear(self):
+		"""모든 프레임과 예약 작업을 버립니다 (이미지 목록 변경 시)."""
+		for future in self.futures.values():
+			future.cancel()
+		self.futures = {}
+		self.frames = {}
+		self.last_index = None
+
+	def shutdown(self):
+		self.clear()
+		self.executor.shutdown(wait=False)
+
+# 라벨 크롭 프리뷰 LRU 캐시
+class CropPreviewCache:
+	"""
+	디코딩된 프레임에서 잘라 축소한 크롭 프리뷰를 (프레임, 크롭 영역, 캔버스 크기) 단위로 보관합니다.
+	프레임 키에 파일 시그니처가 들어가므로 이미지가 바뀌면 이전 항목은 쓰이지 않고 밀려납니다.
+	"""
+
+	PAD_RATIO = 0.40  # bbox 크기 대비 패딩 비율
+	MIN_PAD = 5  # 최소 패딩 (픽셀)
+
+	def __init__(self, capacity=48):
+		self.capacity = capacity
+		self.items = OrderedDict()
+
+	@classmethod
+	def crop_rect(cls, rc, zoom_ratio, image_size):
+		"""화면 좌표 bbox를 원본 좌표로 바꾸고 패딩을 더한 크롭 영역 (x1, y1, x2, y2)를 반환합니다. 비어 있으면 None"""
+		x1, y1, x2, y2 = [v / zoom_ratio for v in rc]
+		pad_x = max(cls.MIN_PAD, int((x2 - x1) * cls.PAD_RATIO))
+		pad_y = max(cls.MIN_PAD, int((y2 - y1) * cls.PAD_RATIO))
+		crop_x1 = max(0.0, x1 - pad_x)
+		crop_y1 = max(0.0, y1 - pad_y)
+		crop_x2 = min(float(image_size[0]), x2 + pad_x)
+		crop_y2 = min(float(image_size[1]), y2 + pad_y)
+		if crop_x2 <= crop_x1 or crop_y2 <= crop_y1:
+			return None
+		return crop_x1, crop_y1, crop_x2, crop_y2
+
+	@staticmethod
+	def fit_size(width, height, canvas_size):
+		"""비율을 유지하며 캔버스(여백 3픽셀)에 들어가는 크기를 계산합니다."""
+		canvas_width, canvas_height = canvas_size
+		max_width = canvas_width - 6
+		max_height = canvas_height - 6
+		img_ratio = width / height
+		if img_ratio > canvas_width / canvas_height:
+			new_width = max_width
+			new_height = int(max_width / img_ratio)
+		else:
+			new_height = max_height
+			new_width = int(max_height * img_ratio)
+		return max(1, new_width), max(1, new_height)
+
+	def get(self, frame_key, image, rect, canvas_size):
+		"""캐시된 프리뷰를 반환하고, 없으면 원본 이미지에서 잘라 축소한 뒤 보관합니다."""
+		box = tuple(int(v) for v in rect)
+		key = (frame_key, box, tuple(canvas_size))
+		preview = self.items.get(key)
+		if preview is not None:
+			self.items.move_to_end(key)
+			return preview
+		cropped = image.crop(box)
+		preview = cropped.resize(self.fit_size(cropped.width, cropped.height, canvas_size),
+								 Image.Resampling.LANCZOS)
+		self.items[key] = preview
+		while len(self.items) > self.capacity:
+			self.items.popitem(last=False)
+		return preview
+
+	def clear(self):
+		self.items.clear()
+
+# 보이는 영역만 그리는 캔버스 이미지 렌더러
+class ViewportRenderer:
+	"""캔버스에 보이는 스크롤 영역만 잘라 현재 줌으로 그리는 렌더러
+
+	이미지마다 1/2씩 줄인 단계(피라미드)를 두고, 줌 이상의 해상도를 가진 가장 작은 단계에서
+	보이는 부분만 리사이즈합니다. 스크롤/줌 중에는 빠른 필터로, 입력이 멈추면 고품질 필터로 다시 그립니다.
+	캔버스 이미지 항목은 하나만 유지하며 항상 맨 아래에 둡니다 (태그 "img").
+	"""
+	FAST_FILTER = Image.BILINEAR
+	QUALITY_FILTER = Image.LANCZOS
+	MIN_LEVEL_SIZE = 256  # 이보다 작아지면 더 줄이지 않음
+	IDLE_DELAY = 150  # ms, 고품질로 다시 그리기까지 대기 시간
+
+	def __init__(self, canvas):
+		self.canvas = canvas
+		self.levels = []  # [(배율, PIL 이미지)], 원본(1.0)부터
+		self.zoom_ratio = 1.0
+		self.item = None
+		self.photo = None
+		self.rendered = None  # 마지막으로 그린 (영역, 필터)
+		self.fast_job = None
+		self.quality_job = None
+
+	@staticmethod
+	def build_levels(image):
+		"""원본에서 1/2씩 줄인 피라미드 [(배율, 이미지)]를 만듭니다 (전체 메모리는 원본의 약 4/3)."""
+		levels = [(1.0, image)]
+		scale = 1.0
+		while min(image.size) // 2 >= ViewportRenderer.MIN_LEVEL_SIZE:
+			image = image.reduce(2)
+			scale /= 2
+			levels.append((scale, image))
+		return levels
+
+	def set_image(self, image, zoom_ratio):
+		"""새 원본 이미지(PIL)를 표시합니다."""
+		self.set_levels(self.build_levels(image), zoom_ratio)
+
+	def set_levels(self, levels, zoom_ratio):
+		"""미리 만든 피라미드를 표시합니다."""
+		self.levels = levels
+		self.zoom_ratio = zoom_ratio
+		self.rendered = None
+		self.render(high_quality=False)
+		self.schedule_quality_render()
+
+	def on_view_changed(self):
+		"""스크롤/크기 변경 시 호출 - 빠른 필터로 한 번에 모아 그리고 고품질 렌더를 예약합니다."""
+		if not self.levels:
+			return
+		if self.fast_job is None:
+			self.fast_job = self.canvas.after_idle(self._fast_render)
+		self.schedule_quality_render()
+
+	def _fast_render(self):
+		self.fast_job = None
+		self.render(high_quality=False)
+
+	def schedule_quality_render(self):
+		if self.quality_job is not None:
+			self.canvas.after_cancel(self.quality_job)
+		self.quality_job = self.canvas.after(self.IDLE_DELAY, self._quality_render)
+
+	def _quality_render(self):
+		self.quality_job = None
+		self.render(high_quality=True)
+
+	def render(self, high_quality=True):
+		"""현재 보이는 영역을 그립니다."""
+		if not self.levels:
+			return
+		zoom = self.zoom_ratio
+		full_w, full_h = self.levels[0][1].size
+		view_w, view_h = int(full_w * zoom), int(full_h * zoom)
+		x0 = max(0, int(self.canvas.canvasx(0)))
+		y0 = max(0, int(self.canvas.canvasy(0)))
+		x1 = min(view_w, x0 + max(1, self.canvas.winfo_width()))
+		y1 = min(view_h, y0 + max(1, self.canvas.winfo_height()))
+		if x1 <= x0 or y1 <= y0:
+			return
+		box = (x0, y0, x1, y1)
+		resample = self.QUALITY_FILTER if high_quality else self.FAST_FILTER
+		if self.rendered == (box, resample) and self.item is not None and self.canvas.find_withtag(self.item):
+			return
+
+		# 줌 이상의 해상도를 가진 가장 작은 단계 선택
+		scale, level = self.levels[0]
+		for level_scale, level_image in self.levels:
+			if level_scale >= zoom:
+				scale, level = level_scale, level_image
+		factor = scale / zoom
+		source_box = (x0 * factor, y0 * factor, min(level.width, x1 * factor), min(level.height, y1 * factor))
+		visible = level.resize((x1 - x0, y1 - y0), resample, box=source_box)
+
+		self.photo = ImageTk.PhotoImage(visible)
+		if self.item is None or not self.canvas.find_withtag(self.item):
+			# canvas.delete("all"/"img")로 지워졌으면 다시 생성
+			self.item = self.canvas.create_image(x0, y0, image=self.photo, anchor='nw', tags="img")
+		else:
+			self.canvas.itemconfig(self.item, image=self.photo)
+			self.canvas.coords(self.item, x0, y0)
+		self.canvas.tag_lower(self.item)
+		self.canvas.image = self.photo  # 참조 유지
+		self.rendered = (box, resample)
+
+	def clear(self):
+		if self.fast_job is not None:
+			self.canvas.after_cancel(self.fast_job)
+			self.fast_job = None
+		if self.quality_job is not None:
+			self.canvas.after_cancel(self.quality_job)
+			self.quality_job = None
+		self.levels = []
+		self.rendered = None
+
 class MainApp:
 	maskingframewidth=0
 	maskingframeheight=0
 	is_masking_dirty = False  # 저장 필요 플래그
-	original_img_array = None  # 원본 이미지 배열 (백업용)
-	current_img_array = None   # 현재 작업중인 이미지 배열
+	mask_layer = None  # 현재 프레임 마스킹 오버레이 (MaskOverlay)
 	ci = 0
 	pi = -1
 	multi_selected = set()  # 다중 선택된 라벨 인덱스들
@@ -1093,6 +1736,9 @@ class MainApp:
 	zoom_ratio = 1
 	cross_line = False
 	pre_rc = None
+	selected_bbox_items = None  # 선택 bbox의 캔버스 항목 id (방향키 이동 시 좌표만 갱신)
+	bbox_redraw_job = None  # 예약된 bbox 화면 갱신
+	BBOX_REDRAW_MS = 16  # 방향키 반복 입력 시 화면 갱신 간격 (디스플레이 프레임당 최대 한 번)
 	_dir = None	
 	CLASSIFY_TPFP=True
 	masking = None
@@ -1102,6 +1748,10 @@ class MainApp:
 	crop_was_dragged = False    # 드래그 발생 여부 (click vs drag 구분)
 	crop_drag_last = None       # 이전 드래그 마우스 좌표 (move 계산용)
 	crop_drag_active = False    # 드래그 중 update_crop_preview 재진입 방지 플래그
+	crop_prerender_job = None   # 다음 라벨 크롭 프리뷰 미리 만들기 예약 id
+	label_writes_job = None     # 라벨 저장 대기 표시 갱신 예약 id
+	CROP_CANVAS_SIZE = (260, 300)  # 크롭 프리뷰 캔버스 크기
+	CROP_PRERENDER_AHEAD = 3    # Tab 순서로 미리 만들어 둘 라벨 수
 	onlyselect = False
 	onlybox = True
 	has_saved_masking = False	
@@ -1322,6 +1972,10 @@ class MainApp:
 		self.button_class_map = {}
 		# zoom_ratio 명시적 초기화
 		self.zoom_ratio = 1.0
+		# 다음/이전 프레임 미리 디코딩 버퍼
+		self.frame_buffer = FrameDecodeBuffer()
+		# 라벨 크롭 프리뷰 캐시 (Tab 순회 시 재디코딩/재축소 방지)
+		self.crop_cache = CropPreviewCache()
 
 		
 		# == UI 레이아웃 구성 시작 ==
@@ -1426,6 +2080,10 @@ class MainApp:
 		self.configFileLabel = tk.Label(self.button_frame, text=f"[{config_filename}]", fg="blue", bd=0)
 		self.configFileLabel.pack(side=tk.RIGHT, padx=5)
 
+		# 라벨 저장 대기 표시 (write-behind)
+		self.pendingWriteLabel = tk.Label(self.button_frame, text="", fg="red", bd=0)
+		self.pendingWriteLabel.pack(side=tk.RIGHT, padx=5)
+
 		self.show_size_info = tk.BooleanVar()
 		self.show_size_info.set(False)  # 기본값은 표시하지 않음
 		self.chk_show_size = tk.Checkbutton(
@@ -1635,10 +2293,12 @@ class MainApp:
 			self.canvas_frame, 
 			width=100, 
 			height=100,
-			xscrollcommand=self.h_scrollbar.set,
-			yscrollcommand=self.v_scrollbar.set
+			xscrollcommand=self.on_canvas_xscroll,
+			yscrollcommand=self.on_canvas_yscroll
 		)
 		self.canvas.pack(side="left", fill="both", expand=True)
+		# 보이는 영역만 그리는 이미지 렌더러
+		self.viewport_renderer = ViewportRenderer(self.canvas)
 		
 		# 스크롤바와 캔버스 연결
 		self.v_scrollbar.config(command=self.canvas.yview)
@@ -1698,13 +2358,47 @@ class MainApp:
     # == UI 레이아웃 구성 시작 ==
 		self.process()
 		self.master.mainloop()        
+		label_writer.close()
+		self.frame_buffer.shutdown()
 		return
+	def on_canvas_xscroll(self, first, last):
+		"""캔버스 수평 보기 변경 - 스크롤바 갱신 및 보이는 영역 다시 그리기"""
+		self.h_scrollbar.set(first, last)
+		self.viewport_renderer.on_view_changed()
+	def on_canvas_yscroll(self, first, last):
+		"""캔버스 수직 보기 변경 - 스크롤바 갱신 및 보이는 영역 다시 그리기"""
+		self.v_scrollbar.set(first, last)
+		self.viewport_renderer.on_view_changed()
+	def open_range_progress(self, title, message, total):
+		"""범위 작업 진행 창 (취소 버튼 포함, 작업 중 메인 창 입력 차단)"""
+		progress_window = tk.Toplevel(self.master)
+		progress_window.title(title)
+		progress_window.geometry("300x130")
+		progress_window.transient(self.master)
+
+		progress_label = tk.Label(progress_window, text=message, pady=10)
+		progress_label.pack()
+
+		progress_bar = tk.ttk.Progressbar(progress_window, orient="horizontal",
+										length=250, mode="determinate")
+		progress_bar.pack(pady=5)
+		progress_bar["maximum"] = max(1, total)
+		progress_bar["value"] = 0
+
+		cancel_button = tk.Button(progress_window, text="취소")
+		cancel_button.pack(pady=5)
+		progress_window.grab_set()
+		return progress_window, progress_label, progress_bar, cancel_button
+	def show_canvas_image(self, image):
+		"""PIL 원본 이미지를 현재 줌으로 캔버스에 표시합니다 (보이는 영역만 렌더링)."""
+		self.viewport_renderer.set_image(image, self.zoom_ratio)
 	def reset_data(self):
 		self.ci = 0
 		self.pi = -1
 		self.im_fn = None
 		self.gt_fn = None
 		self.imlist = []
+		self.frame_buffer.clear()
 		self.bbox = []
 		self.selid = -1
 		self.canvas.delete("all")
@@ -2008,6 +2702,7 @@ class MainApp:
 		self.canvas.create_text([23,17], font='Arial\ Black 8', fill='white', text=judge_string[c][0], tags='img')
 		return
 	def load_new_folder(self):
+		self.flush_label_writes()
 		try:
 			a = tk.Tk()
 			a.withdraw()
@@ -2140,6 +2835,7 @@ class MainApp:
 			messagebox.showerror("Error", f"Failed to load list: {e}")
 	def delete_range(self):
 		"""지정된 범위의 이미지와 라벨 파일을 삭제합니다"""
+		self.flush_label_writes()
 		# 시작 및 종료 프레임 번호 가져오기
 		try:
 			start_frame = int(self.delete_start_frame_entry.get())
@@ -2243,6 +2939,9 @@ class MainApp:
 		# 진행 창 닫기
 		progress_window.destroy()
 		
+		# 목록이 바뀌었으므로 미리 디코딩한 프레임 폐기
+		self.frame_buffer.clear()
+		
 		# 현재 인덱스 조정
 		if current_idx < 0:
 			current_idx = 0
@@ -2453,6 +3152,7 @@ class MainApp:
 
 		# 현재 라벨 저장
 		self.write_bbox()
+		self.flush_label_writes()
 
 		# 복사할 라벨 정보 준비 (절대 좌표로 저장)
 		source_bboxes = []  # 절대 좌표 bbox 리스트
@@ -2476,164 +3176,144 @@ class MainApp:
 				if idx < len(self.bbox):
 					source_bboxes.append(self.bbox[idx])
 		
-		# 진행 상황 창 생성
-		progress_window = tk.Toplevel(self.master)
-		progress_window.title("라벨 복사 중...")
-		progress_window.geometry("300x100")
-		progress_window.transient(self.master)
-		
-		progress_label = tk.Label(progress_window, text="라벨을 복사 중입니다...", pady=10)
-		progress_label.pack()
-		
-		progress_bar = tk.ttk.Progressbar(progress_window, orient="horizontal", 
-										length=250, mode="determinate")
-		progress_bar.pack(pady=10)
-		
-		# 프로그레스 바 설정
-		total_frames = end_frame - start_frame + 1
-		progress_bar["maximum"] = total_frames
-		progress_bar["value"] = 0
-		
-		# 첫 번째 이미지에 적용
-		self.master.update()
-		
-		# 지정된 범위의 이미지에 라벨 적용
-		success_count = 0
-		for i in range(start_frame - 1, end_frame):
-			# 프로그레스 바 업데이트
-			progress_bar["value"] = i - (start_frame - 1) + 1
-			progress_label.config(text=f"처리 중: {i+1}/{end_frame} ({int(progress_bar['value']/total_frames*100)}%)")
-			self.master.update()
-
-			# 현재 이미지 건너뛰기
-			if i == current_idx:
-				continue
-
-			try:
-				# 대상 파일 경로 계산
-				target_img_path = self.imlist[i]
-				target_label_path = target_img_path.replace('JPEGImages', 'labels')
-				target_label_path = target_label_path.replace('.jpg', '.txt')
-				target_label_path = target_label_path.replace('.png', '.txt')
-
-				# 타겟 이미지의 해상도 읽기 (선택/다중 선택 모드일 때만)
-				if not use_file_content:
-					try:
-						target_img = Image.open(target_img_path)
-						target_size = target_img.size  # (width, height)
-						target_img.close()
-
-						# 타겟 이미지 해상도로 bbox 변환
-						copytext = []
-						for bbox in source_bboxes:
-							# bbox: [sel, clsname, info, x1, y1, x2, y2] 형태 (절대 좌표)
-							# 현재 이미지 크기에서 타겟 이미지 크기로 스케일 조정
-							scale_x = target_size[0] / self.imsize[0]
-							scale_y = target_size[1] / self.imsize[1]
-
-							# 절대 좌표 스케일링
-							x1 = bbox[3] * scale_x
-							y1 = bbox[4] * scale_y
-							x2 = bbox[5] * scale_x
-							y2 = bbox[6] * scale_y
-
-							# YOLO 상대 좌표로 변환
-							cx = 0.5 * (x1 + x2) / target_size[0]
-							cy = 0.5 * (y1 + y2) / target_size[1]
-							w = abs(x2 - x1) / target_size[0]
-							h = abs(y2 - y1) / target_size[1]
-
-							class_idx = bbox[2]  # class_id
-							rel_coords = [class_idx, cx, cy, w, h]
-							copytext.append(' '.join(str(e) for e in rel_coords) + '\n')
-
-					except Exception as e:
-						print(f"타겟 이미지 해상도 읽기 오류: {e}")
-						continue
-
-				# 디렉토리 확인/생성은 별도 try 블록
-				try:
-					target_dir = os.path.dirname(target_label_path)
-					if not os.path.exists(target_dir):
-						os.makedirs(target_dir)
-				except Exception as e:
-					print(f"디렉토리 생성 오류: {e}")
-					continue
-
-				# 기존 라벨 읽기는 별도 try 블록
-				existing_labels = []
+		source_size = tuple(self.imsize)
+		imlist = list(self.imlist)
+		backup_dir = 'original_backup/labels/'
+		os.makedirs(backup_dir, exist_ok=True)
+
+		def copy_frame(i):
+			"""프레임 하나에 라벨 복사 (작업자 스레드)"""
+			# 대상 파일 경로 계산
+			target_img_path = imlist[i]
+			target_label_path = target_img_path.replace('JPEGImages', 'labels')
+			target_label_path = target_label_path.replace('.jpg', '.txt')
+			target_label_path = target_label_path.replace('.png', '.txt')
+
+			# 타겟 이미지의 해상도 읽기 (선택/다중 선택 모드일 때만)
+			if use_file_content:
+				frame_text = copytext
+			else:
+				# 헤더만 읽어 해상도 확인 (픽셀 디코딩 없음)
+				with Image.open(target_img_path) as target_img:
+					target_size = target_img.size  # (width, height)
+
+				# 타겟 이미지 해상도로 bbox 변환
+				frame_text = []
+				scale_x = target_size[0] / source_size[0]
+				scale_y = target_size[1] / source_size[1]
+				for bbox in source_bboxes:
+					# bbox: [sel, clsname, info, x1, y1, x2, y2] 형태 (절대 좌표)
+					x1 = bbox[3] * scale_x
+					y1 = bbox[4] * scale_y
+					x2 = bbox[5] * scale_x
+					y2 = bbox[6] * scale_y
+
+					# YOLO 상대 좌표로 변환
+					cx = 0.5 * (x1 + x2) / target_size[0]
+					cy = 0.5 * (y1 + y2) / target_size[1]
+					w = abs(x2 - x1) / target_size[0]
+					h = abs(y2 - y1) / target_size[1]
+
+					rel_coords = [bbox[2], cx, cy, w, h]
+					frame_text.append(' '.join(str(e) for e in rel_coords) + '\n')
+
+			os.makedirs(os.path.dirname(target_label_path), exist_ok=True)
+
+			# 기존 라벨 읽기
+			label_exists = os.path.exists(target_label_path)
+			existing_labels = []
+			if label_exists:
 				try:
-					if os.path.exists(target_label_path):
-						with open(target_label_path, 'r', encoding='utf-8') as f:
-							existing_labels = f.readlines()
+					with open(target_label_path, 'r', encoding='utf-8') as f:
+						existing_labels = f.readlines()
 				except Exception as e:
 					print(f"라벨 읽기 오류: {e}")
-					# 읽기 실패 시 결정: 계속 진행 또는 건너뛰기
 
-				# 백업 생성은 별도 try 블록
+			if preserve_mode == "preserve":
+				# 기존 라벨 유지하고 새 라벨 추가
+				new_labels = list(existing_labels)
+				if copy_mode == "selected":
+					# 중복이 아닌 경우에만 새 라벨 추가
+					if not any(line.strip() == frame_text[0].strip() for line in existing_labels):
+						new_labels.extend(frame_text)
+				else:
+					# 다중 선택 또는 전체 복사 시 중복 검사 없이 추가
+					new_labels.extend(frame_text)
+			else:
+				# replace 모드: 기존 라벨 지우고 새 라벨만 쓰기
+				new_labels = list(frame_text)
+
+			# 내용이 같으면 파일을 다시 쓰지 않음
+			if label_exists and new_labels == existing_labels:
+				return 'unchanged'
+
+			# 백업 생성
+			backup_path = backup_dir + self.make_path(target_label_path)
+			if label_exists:
 				try:
-					if os.path.exists(target_label_path):
-						backup_dir = 'original_backup/labels/'
-						if not os.path.isdir(backup_dir):
-							os.makedirs(backup_dir)
-
-						backup_path = backup_dir + self.make_path(target_label_path)
-						if not os.path.exists(backup_path):
-							shutil.copyfile(target_label_path, backup_path)
+					if not os.path.exists(backup_path):
+						shutil.copyfile(target_label_path, backup_path)
 				except Exception as e:
 					print(f"백업 생성 오류: {e}")
 
-				# 라벨 쓰기는 별도 try 블록
+			try:
+				with open(target_label_path, 'w', encoding='utf-8') as f:
+					f.writelines(new_labels)
+			except Exception:
+				# 쓰기 실패 시 백업에서 복원 시도
 				try:
-					with open(target_label_path, 'w', encoding='utf-8') as f:
-						if preserve_mode == "preserve":
-							# 기존 라벨 유지하고 새 라벨 추가
-							f.writelines(existing_labels)
-
-							if copy_mode == "selected":
-								# 중복 검사
-								is_duplicate = False
-								for existing_label in existing_labels:
-									if existing_label.strip() == copytext[0].strip():
-										is_duplicate = True
-										break
-
-								# 중복이 아닌 경우 새 라벨 추가
-								if not is_duplicate:
-									f.writelines(copytext)
-							else:
-								# 다중 선택 또는 전체 복사 시 중복 검사 없이 추가
-								f.writelines(copytext)
-						else:
-							# replace 모드: 기존 라벨 지우고 새 라벨만 쓰기
-							f.writelines(copytext)
-				except Exception as e:
-					print(f"라벨 쓰기 오류: {e}")
-					# 쓰기 실패 시 백업에서 복원 시도
-					try:
-						if os.path.exists(backup_path):
-							shutil.copyfile(backup_path, target_label_path)
-					except:
-						print("백업 복원 실패")
-						
+					if label_exists and os.path.exists(backup_path):
+						shutil.copyfile(backup_path, target_label_path)
+				except Exception:
+					print("백업 복원 실패")
+				raise
+			return 'written'
+
+		# 진행 상황 창 생성
+		frames = [i for i in range(start_frame - 1, end_frame) if i != current_idx]  # 현재 이미지 건너뛰기
+		progress_window, progress_label, progress_bar, cancel_button = self.open_range_progress(
+			"라벨 복사 중...", "라벨을 복사 중입니다...", len(frames))
+
+		def on_progress(done, total):
+			progress_bar["value"] = done
+			progress_label.config(text=f"처리 중: {done}/{total} ({int(done / max(1, total) * 100)}%)")
+
+		def on_done(results, cancelled):
+			success_count = 0
+			for i, result in results:
+				if isinstance(result, Exception):
+					print(f"이미지 {i+1} 라벨 처리 중 오류 발생: {result}")
+					continue
 				success_count += 1
-					
-			except Exception as e:
-				print(f"이미지 {i+1} 라벨 처리 중 오류 발생: {e}")
-		
-		# 진행 창 닫기
-		progress_window.destroy()
-		
-		# 완료 메시지
-		if copy_mode == "all":
-			messagebox.showinfo("완료", f"모든 라벨 복사가 완료되었습니다. {success_count}개의 이미지에 성공적으로 적용되었습니다.")
-		elif preserve_mode == "preserve":
-			messagebox.showinfo("완료", f"선택 라벨 추가가 완료되었습니다. {success_count}개의 이미지에 성공적으로 적용되었습니다.")
-		else:  # replace
-			messagebox.showinfo("완료", f"선택 라벨 복사가 완료되었습니다. {success_count}개의 이미지에 성공적으로 적용되었습니다.")
 
-		# 현재 이미지 다시 표시
-		self.draw_image()
+			# 진행 창 닫기
+			progress_window.grab_release()
+			progress_window.destroy()
+
+			# 완료 메시지
+			if cancelled:
+				messagebox.showinfo("취소", f"라벨 복사가 취소되었습니다. 취소 전까지 {success_count}개의 이미지에 적용되었습니다.")
+			elif copy_mode == "all":
+				messagebox.showinfo("완료", f"모든 라벨 복사가 완료되었습니다. {success_count}개의 이미지에 성공적으로 적용되었습니다.")
+			elif preserve_mode == "preserve":
+				messagebox.showinfo("완료", f"선택 라벨 추가가 완료되었습니다. {success_count}개의 이미지에 성공적으로 적용되었습니다.")
+			else:  # replace
+				messagebox.showinfo("완료", f"선택 라벨 복사가 완료되었습니다. {success_count}개의 이미지에 성공적으로 적용되었습니다.")
+
+			# 현재 이미지 다시 표시
+			self.draw_image()
+
+		# 작업자 풀에서 프레임 처리 (동시 처리 프레임 수 제한)
+		runner = RangeJobRunner(self.master, copy_frame, frames, on_progress, on_done,
+								workers=min(4, os.cpu_count() or 1))
+
+		def cancel():
+			runner.cancel()
+			cancel_button.config(state=tk.DISABLED)
+			progress_label.config(text="취소 중... (처리 중인 이미지 마무리)")
+		cancel_button.config(command=cancel)
+		progress_window.protocol("WM_DELETE_WINDOW", cancel)
+		runner.start()
 
 	def show_temporary_status(self, message, duration=2000, bg_color='#4CAF50'):
 		"""화면 하단에 일시 상태 메시지 표시"""
@@ -2673,6 +3353,8 @@ class MainApp:
 		try:
 			if self.ci == self.pi: return
 			self.pi = self.ci
+			# 프레임 전환 - 이전 프레임의 대기 중 라벨 저장을 바로 시작 (완료는 기다리지 않음)
+			label_writer.flush(wait=False)
 
 			# 페이지 전환 시 pending 작업 카운터 및 작업 내역 초기화
 			self.pending_operation_count = 0
@@ -2701,7 +3383,8 @@ class MainApp:
 				return
 			if ext!='':
 				try:
-					im = Image.open(self.im_fn)
+					# 미리 디코딩된 프레임 사용 (없으면 여기서 디코딩)
+					frame = self.frame_buffer.get(self.im_fn)
 				except (IOError, OSError, FileNotFoundError) as e:
 					messagebox.showerror("Image Load Error", f"Failed to open image: {self.im_fn}\nError: {e}")
 					print(f"ERROR: Failed to open image {self.im_fn}: {e}")
@@ -2709,18 +3392,13 @@ class MainApp:
 				
 			# === 새로운 마스킹 메모리 관리 코드 추가 ===
 			# 새 이미지 로드 시 배열 초기화
-			self.original_img_array = array(im.copy())  # 원본 백업
-			self.current_img_array = array(im.copy())   # 작업용 복사본
+			self.mask_layer = MaskOverlay(frame['array'])  # 원본은 버퍼와 공유, 편집은 오버레이에만 기록
 			self.is_masking_dirty = False  # 새 이미지이므로 더티 플래그 초기화
 
 			# 마스킹 자동 로드 제거 - s/l 키로만 복사/붙여넣기 가능
-			self.imsize = im.size
-			self.imsize = [(int)(i * self.zoom_ratio) for i in im.size]
-			self.original_width = im.width
-			self.original_height = im.height
+			self.imsize = [(int)(i * self.zoom_ratio) for i in frame['size']]
+			self.original_width, self.original_height = frame['size']
 
-			# 원본 이미지만 표시 (마스킹 자동 표시하지 않음)
-			im = im.resize(self.imsize, Image.LANCZOS)
 
 			if os.path.exists(self.gt_fn):
 				filesize = os.path.getsize(self.gt_fn)
@@ -2729,8 +3407,8 @@ class MainApp:
 
 			self.canvas.config(width=min(self.imsize[0], 1200), height=min(self.imsize[1], 800))
 			self.canvas.config(scrollregion=(0, 0, self.imsize[0], self.imsize[1]))
-			self.canvas.image = ImageTk.PhotoImage(im)
-			self.canvas.create_image(0, 0, image=self.canvas.image, anchor='nw', tags="img")
+			# 원본 이미지만 표시 (마스킹 자동 표시하지 않음)
+			self.viewport_renderer.set_levels(frame['levels'], self.zoom_ratio)
 			self.master.title('[%d/%d] %s' % (self.ci+1, len(self.imlist), self.im_fn))
 			if self.CLASSIFY_TPFP: self.draw_criteria()
 
@@ -2748,6 +3426,9 @@ class MainApp:
 					rc = self.convert_abs2rel(self.bbox[self.selid])
 					self.pre_rc = self.convert_rel2abs(rc)
 			self.canvas.focus_set()
+
+			# 다음/이전 프레임 미리 디코딩 예약
+			self.frame_buffer.schedule(self.imlist, self.ci)
 		except Exception as e:
 			print(f"ERROR in draw_image: {e}")
 			messagebox.showerror("Error", f"An error occurred while drawing image:\n{e}\n\nPlease check image path.")
@@ -2966,6 +3647,28 @@ class MainApp:
 		
 		selected_indices = self.label_listbox.curselection()
 		return list(selected_indices)
+	def label_list_item_text(self, index, bbox):
+		"""라벨 리스트 항목 텍스트"""
+		width = int(bbox[5] - bbox[3])
+		height = int(bbox[6] - bbox[4])
+		# 선택된 라벨 표시용 마커
+		marker = "●" if bbox[0] else "○"
+		return f"{marker} {index+1:2d}. {bbox[1]} ({width}x{height})"
+
+	def update_label_list_item(self, index):
+		"""라벨 리스트에서 bbox 하나의 항목만 갱신 (방향키 이동/크기 조절 시)"""
+		if not hasattr(self, 'label_listbox') or not self.show_label_list.get():
+			return
+		listbox_index = next((k for k, v in getattr(self, 'listbox_to_bbox_map', {}).items() if v == index), None)
+		if listbox_index is None:
+			return
+		bbox = self.bbox[index]
+		self.label_listbox.delete(listbox_index)
+		self.label_listbox.insert(listbox_index, self.label_list_item_text(index, bbox))
+		if bbox[0]:
+			self.label_listbox.select_set(listbox_index)
+			self.label_listbox.itemconfig(listbox_index, {'bg': 'lightblue'})
+
 	def update_label_list(self):
 		"""전체 라벨 리스트 업데이트 - 개선된 버전"""
 		if not hasattr(self, 'label_listbox') or not self.show_label_list.get():
@@ -3001,8 +3704,6 @@ class MainApp:
 				continue
 
 			class_name_str = bbox[1]
-			width = int(bbox[5] - bbox[3])
-			height = int(bbox[6] - bbox[4])
 
 			# 클래스별 개수 카운트
 			if class_name_str in class_counts:
@@ -3010,11 +3711,7 @@ class MainApp:
 			else:
 				class_counts[class_name_str] = 1
 
-			# 선택된 라벨 표시용 마커
-			marker = "●" if bbox[0] else "○"
-
-			# 리스트 항목 텍스트 생성 (더 간결하게)
-			item_text = f"{marker} {i+1:2d}. {class_name_str} ({width}x{height})"
+			item_text = self.label_list_item_text(i, bbox)
 
 			self.label_listbox.insert(tk.END, item_text)
 
@@ -3062,59 +3759,18 @@ class MainApp:
 
 		try:
 			bbox = self.bbox[self.selid]
-			x1, y1, x2, y2 = bbox[3:7]
-
-			# 원본 이미지 좌표로 변환 (줌 비율 고려)
-			orig_x1 = x1 / self.zoom_ratio
-			orig_y1 = y1 / self.zoom_ratio
-			orig_x2 = x2 / self.zoom_ratio
-			orig_y2 = y2 / self.zoom_ratio
-
-			# 이미지 경계 크기 확보
-			if hasattr(self, 'original_width') and hasattr(self, 'original_height'):
-				img_w = self.original_width
-				img_h = self.original_height
-			else:
-				img_w = int(self.imsize[0] / self.zoom_ratio)
-				img_h = int(self.imsize[1] / self.zoom_ratio)
-
-			# 40% 패딩 계산 (최소 5픽셀)
-			pad_x = max(5, int((orig_x2 - orig_x1) * 0.40))
-			pad_y = max(5, int((orig_y2 - orig_y1) * 0.40))
-
-			crop_x1 = max(0.0, orig_x1 - pad_x)
-			crop_y1 = max(0.0, orig_y1 - pad_y)
-			crop_x2 = min(float(img_w), orig_x2 + pad_x)
-			crop_y2 = min(float(img_h), orig_y2 + pad_y)
-
-			if crop_x2 <= crop_x1 or crop_y2 <= crop_y1:
+			# 이미 디코딩된 현재 프레임에서 크롭 (패딩 포함, 캐시 재사용)
+			frame_key, image = self.crop_preview_source()
+			rect = CropPreviewCache.crop_rect(bbox[3:7], self.zoom_ratio, image.size)
+			if rect is None:
 				self.crop_canvas.create_text(130, 150, text="Invalid crop area",
 											 fill="red", font=("Arial", 12))
 				return
+			crop_x1, crop_y1, crop_x2, crop_y2 = rect
 
-			# 원본 이미지에서 크롭 (패딩 포함)
-			original_img = Image.open(self.im_fn)
-			cropped_img = original_img.crop((int(crop_x1), int(crop_y1),
-											 int(crop_x2), int(crop_y2)))
-
-			canvas_width  = 260
-			canvas_height = 300
-			img_ratio    = cropped_img.width / cropped_img.height
-			canvas_ratio = canvas_width / canvas_height
-			max_width    = canvas_width  - 6
-			max_height   = canvas_height - 6
-
-			if img_ratio > canvas_ratio:
-				new_width  = max_width
-				new_height = int(max_width / img_ratio)
-			else:
-				new_height = max_height
-				new_width  = int(max_height * img_ratio)
-
-			new_width  = max(1, new_width)
-			new_height = max(1, new_height)
-
-			resized_img = cropped_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+			canvas_width, canvas_height = self.CROP_CANVAS_SIZE
+			resized_img = self.crop_cache.get(frame_key, image, rect, self.CROP_CANVAS_SIZE)
+			new_width, new_height = resized_img.size
 			self.crop_image_tk = ImageTk.PhotoImage(resized_img)
 
 			x_offset = (canvas_width  - new_width)  // 2
@@ -3137,6 +3793,9 @@ class MainApp:
 			# bbox overlay + 8개 앵커 핸들 그리기
 			self._update_crop_canvas_overlay()
 
+			# Tab 순서상 다음 라벨들의 프리뷰를 유휴 시간에 미리 만들어 둠
+			self.schedule_crop_prerender()
+
 		except Exception as e:
 			print(f"Error updating crop preview: {e}")
 			self.crop_canvas.delete("all")
@@ -3144,6 +3803,45 @@ class MainApp:
 										 fill="red", font=("Arial", 10))
 			self.crop_transform = None
 
+	def crop_preview_source(self):
+		"""크롭 프리뷰용 (프레임 키, 원본 PIL 이미지) - draw_image가 디코딩해 둔 프레임을 재사용"""
+		frame = self.frame_buffer.get(self.im_fn)
+		return (self.im_fn, frame['signature']), frame['levels'][0][1]
+
+	def schedule_crop_prerender(self):
+		"""선택 라벨 다음 CROP_PRERENDER_AHEAD개(Tab 순서)와 직전 1개의 프리뷰 생성을 예약합니다."""
+		if self.crop_prerender_job is not None:
+			self.master.after_cancel(self.crop_prerender_job)
+			self.crop_prerender_job = None
+		count = len(self.bbox)
+		if count <= 1 or self.selid < 0:
+			return
+		order = [(self.selid + step) % count for step in range(1, self.CROP_PRERENDER_AHEAD + 1)]
+		order.append((self.selid - 1) % count)
+		pending = []
+		for index in order:
+			if index != self.selid and index not in pending:
+				pending.append(index)
+		self.crop_prerender_job = self.master.after_idle(self.prerender_next_crop, pending, self.im_fn)
+
+	def prerender_next_crop(self, pending, im_fn):
+		"""유휴 시간에 프리뷰 하나를 만들고, 남은 항목은 다음 유휴 시간으로 넘깁니다 (키 입력이 밀리지 않도록)."""
+		self.crop_prerender_job = None
+		if im_fn != self.im_fn or not self.show_label_list.get() or not pending:
+			return
+		index = pending.pop(0)
+		try:
+			if index < len(self.bbox):
+				frame_key, image = self.crop_preview_source()
+				rect = CropPreviewCache.crop_rect(self.bbox[index][3:7], self.zoom_ratio, image.size)
+				if rect is not None:
+					self.crop_cache.get(frame_key, image, rect, self.CROP_CANVAS_SIZE)
+		except Exception as e:
+			print(f"Error prerendering crop preview: {e}")
+			return
+		if pending:
+			self.crop_prerender_job = self.master.after_idle(self.prerender_next_crop, pending, im_fn)
+
 	def on_label_list_select(self, event):
 		"""라벨 리스트에서 항목 선택 시"""
 		selection = self.label_listbox.curselection()
@@ -3359,11 +4057,9 @@ class MainApp:
 		im = Image.open(self.im_fn)
 		self.imsize = im.size
 		self.imsize = [(int)(i * self.zoom_ratio) for i in im.size]
-		im = im.resize(self.imsize, Image.LANCZOS)
 		
 		self.canvas.config(width=self.imsize[0], height=self.imsize[1])
-		self.canvas.image = ImageTk.PhotoImage(im)
-		self.canvas.create_image(0, 0, image=self.canvas.image, anchor='nw', tags="img")
+		self.show_canvas_image(im)
 		self.master.title('[%d/%d] %s' % (self.ci+1, len(self.imlist), self.im_fn))
 
 		if self.CLASSIFY_TPFP: self.draw_criteria()
@@ -3372,6 +4068,7 @@ class MainApp:
 		return
 	def copy_masking_to_range(self):
 		"""현재 저장된 마스킹을 지정된 범위의 이미지들에 복사"""
+		self.flush_label_writes()
 		# 저장된 마스킹이 없으면 경고 메시지 표시하고 종료
 		if not hasattr(self, 'masking') or not self.has_saved_masking:
 			messagebox.showwarning("경고", "저장된 마스킹이 없습니다. 먼저 마스킹을 생성하고 저장해주세요.")
@@ -3401,209 +4098,208 @@ class MainApp:
 		if not messagebox.askyesno("확인", confirm_msg):
 			return
 		
-		# 진행 상황 창 생성
-		progress_window = tk.Toplevel(self.master)
-		progress_window.title("마스킹 복사 중...")
-		progress_window.geometry("300x100")
-		progress_window.transient(self.master)
-		
-		progress_label = tk.Label(progress_window, text="마스킹을 복사 중입니다...", pady=10)
-		progress_label.pack()
-		
-		progress_bar = tk.ttk.Progressbar(progress_window, orient="horizontal", 
-										length=250, mode="determinate")
-		progress_bar.pack(pady=10)
-		
 		# 마스킹 크기 확인
 		mask_width = self.maskingframewidth
 		mask_height = self.maskingframeheight
-		
-		# 프로그레스 바 설정
-		total_frames = end_frame - start_frame + 1
-		progress_bar["maximum"] = total_frames
-		progress_bar["value"] = 0
-		
-		# 첫 번째 이미지에 적용
-		self.master.update()
-		
-		# 폴리곤 포인트 정보 저장 여부 확인
-		has_polygon = hasattr(self, 'saved_polygon_points') and self.saved_polygon_points
-		
-		# 지정된 범위의 이미지에 마스킹 적용
-		success_count = 0
-		total_labels_deleted = 0  # 전체 삭제된 라벨 개수 추적
-		modified_label_files = []  # 수정된 라벨 파일 목록
+		mask = self.masking
+		remove_labels = self.remove_overlapping_labels.get()
+		imlist = list(self.imlist)
 
-		for i in range(start_frame - 1, end_frame):
-			# 프로그레스 바 업데이트
-			progress_bar["value"] = i - (start_frame - 1) + 1
-			progress_label.config(text=f"처리 중: {i+1}/{end_frame} ({int(progress_bar['value']/total_frames*100)}%)")
-			self.master.update()
+		# 마스킹 영역 계산 - 모든 프레임에 같으므로 한 번만 계산
+		mask_area = None
+		has_polygon = hasattr(self, 'saved_polygon_points') and self.saved_polygon_points
+		if has_polygon:
+			# 폴리곤 마스킹의 경우 저장된 폴리곤 좌표 사용
+			min_x = min(p[0] for p in self.saved_polygon_points)
+			min_y = min(p[1] for p in self.saved_polygon_points)
+			max_x = max(p[0] for p in self.saved_polygon_points)
+			max_y = max(p[1] for p in self.saved_polygon_points)
+
+			mask_area = [min_x, min_y, max_x, max_y]
+			print(f"[MaskCopy] 폴리곤 마스킹 영역: {mask_area}")
+		else:
+			# 일반 마스킹의 경우 마스킹된 픽셀 영역 계산
+			mask_bounds = mask.bounds()
+			if mask_bounds is not None:  # 마스킹된 픽셀이 있는 경우
+				mask_x1, mask_y1, mask_x2, mask_y2 = mask_bounds
 
-			# 현재 이미지 건너뛰기
-			if i == current_idx:
-				continue
+				# 원본 이미지 좌표를 캔버스 좌표로 변환
+				view_x1, view_y1 = self.convert_original_to_view(mask_x1, mask_y1)
+				view_x2, view_y2 = self.convert_original_to_view(mask_x2, mask_y2)
 
-			try:
-				# 대상 이미지 로드
-				target_img_path = self.imlist[i]
-				target_img = Image.open(target_img_path)
+				mask_area = [view_x1, view_y1, view_x2, view_y2]
+				print(f"[MaskCopy] 일반 마스킹 영역: {mask_area}")
 
+		# 백업 폴더 확인
+		d_path = 'original_backup/JPEGImages/'
+		backup_dir = 'original_backup/labels/'
+		os.makedirs(d_path, exist_ok=True)
+		os.makedirs(backup_dir, exist_ok=True)
+
+		def mask_frame(i):
+			"""프레임 하나에 마스킹 적용 (작업자 스레드)"""
+			target_img_path = imlist[i]
+			with Image.open(target_img_path) as target_img:
 				# 이미지 크기 확인
 				if target_img.width != mask_width or target_img.height != mask_height:
 					print(f"이미지 {i+1}의 크기가 마스킹과 일치하지 않습니다. 건너뜁니다.")
-					continue
+					return {'status': 'size_mismatch'}
+				target_img_array = array(target_img)
 
-				# 백업 폴더 및 파일 확인
-				d_path = 'original_backup/JPEGImages/'
-				if not(os.path.isdir(d_path)):
-					os.makedirs(os.path.join(d_path))
+			result = {'status': 'skipped', 'deleted': 0, 'label_path': None}
 
+			# 같은 마스킹이 이미 칠해진 프레임은 이미지 저장 생략
+			if not mask.is_applied(target_img_array):
 				img_path = d_path + self.make_path(target_img_path)
 				if not os.path.exists(img_path):
 					shutil.copyfile(target_img_path, img_path)
 
-				# 마스킹 적용
-				target_img_array = array(target_img)
-				target_img_array[self.masking] = [255, 0, 255]
-				target_img = Image.fromarray(target_img_array)
-
-				# 이미지 저장
-				target_img.save(target_img_path)
-
-				# 마스킹과 겹치는 라벨 삭제 옵션이 켜져 있는 경우
-				if self.remove_overlapping_labels.get():
-					try:
-						# 대상 라벨 파일 경로
-						target_label_path = target_img_path.replace('JPEGImages', 'labels')
-						target_label_path = target_label_path.replace('.jpg', '.txt')
-						target_label_path = target_label_path.replace('.png', '.txt')
-
-						# 라벨 디렉토리 확인
-						label_dir = os.path.dirname(target_label_path)
-						if not os.path.exists(label_dir):
-							os.makedirs(label_dir)
-
-						# 백업 생성
-						if os.path.exists(target_label_path):
-							backup_dir = 'original_backup/labels/'
-							if not os.path.isdir(backup_dir):
-								os.makedirs(backup_dir)
+				# 마스킹 적용 및 이미지 저장
+				mask.apply(target_img_array)
+				Image.fromarray(target_img_array).save(target_img_path)
+				result['status'] = 'masked'
 
+			# 마스킹과 겹치는 라벨 삭제 옵션이 켜져 있는 경우
+			if remove_labels and mask_area is not None:
+				try:
+					# 대상 라벨 파일 경로
+					target_label_path = target_img_path.replace('JPEGImages', 'labels')
+					target_label_path = target_label_path.replace('.jpg', '.txt')
+					target_label_path = target_label_path.replace('.png', '.txt')
+
+					# 라벨 디렉토리 확인
+					os.makedirs(os.path.dirname(target_label_path), exist_ok=True)
+
+					# 기존 라벨 로드
+					labels_to_keep = []
+					original_label_count = 0
+					deleted_label_count = 0
+					label_exists = os.path.exists(target_label_path)
+
+					if label_exists:
+						with open(target_label_path, 'r') as f:
+							lines = f.readlines()
+							original_label_count = len(lines)
+
+							for line in lines:
+								values = line.strip().split()
+								if len(values) >= 5:
+									cls_id, cx, cy, w, h = map(float, values[:5])
+
+									# YOLO 형식에서 절대 좌표 계산 (픽셀 단위)
+									abs_x1 = int((cx - w/2) * mask_width)
+									abs_y1 = int((cy - h/2) * mask_height)
+									abs_x2 = int((cx + w/2) * mask_width)
+									abs_y2 = int((cy + h/2) * mask_height)
+
+									# 캔버스 좌표로 변환
+									view_x1, view_y1 = self.convert_original_to_view(abs_x1, abs_y1)
+									view_x2, view_y2 = self.convert_original_to_view(abs_x2, abs_y2)
+
+									# 바운딩 박스 (캔버스 좌표)
+									bbox = [False, class_name[int(cls_id)], int(cls_id), view_x1, view_y1, view_x2, view_y2]
+
+									# 바운딩 박스가 마스킹 영역과 겹치는지 확인 (면적 기반)
+									if self.check_bbox_mask_overlap(mask_area, bbox):
+										deleted_label_count += 1
+										continue
+								labels_to_keep.append(line)
+
+					# 바뀐 경우에만 라벨 파일 다시 쓰기 (백업 후)
+					if deleted_label_count > 0 or not label_exists:
+						if label_exists:
 							backup_path = backup_dir + self.make_path(target_label_path)
 							if not os.path.exists(backup_path):
 								shutil.copyfile(target_label_path, backup_path)
-
-						# 마스킹 영역 계산 (원본 이미지 기준)
-						if has_polygon:
-							# 폴리곤 마스킹의 경우 저장된 폴리곤 좌표 사용
-							min_x = min(p[0] for p in self.saved_polygon_points)
-							min_y = min(p[1] for p in self.saved_polygon_points)
-							max_x = max(p[0] for p in self.saved_polygon_points)
-							max_y = max(p[1] for p in self.saved_polygon_points)
-
-							mask_area = [min_x, min_y, max_x, max_y]
-							print(f"[MaskCopy] 폴리곤 마스킹 영역: {mask_area}")
-						else:
-							# 일반 마스킹의 경우 마스킹된 픽셀 영역 계산
-							if len(self.masking[0]) > 0:  # 마스킹된 픽셀이 있는 경우
-								mask_y1 = min(self.masking[0]) if len(self.masking[0]) > 0 else 0
-								mask_y2 = max(self.masking[0]) if len(self.masking[0]) > 0 else 0
-								mask_x1 = min(self.masking[1]) if len(self.masking[1]) > 0 else 0
-								mask_x2 = max(self.masking[1]) if len(self.masking[1]) > 0 else 0
-
-								# 원본 이미지 좌표를 캔버스 좌표로 변환
-								view_x1, view_y1 = self.convert_original_to_view(mask_x1, mask_y1)
-								view_x2, view_y2 = self.convert_original_to_view(mask_x2, mask_y2)
-
-								mask_area = [view_x1, view_y1, view_x2, view_y2]
-								print(f"[MaskCopy] 일반 마스킹 영역: {mask_area}")
-
-						# 기존 라벨 로드
-						labels_to_keep = []
-						original_label_count = 0
-						deleted_label_count = 0
-
-						if os.path.exists(target_label_path):
-							with open(target_label_path, 'r') as f:
-								lines = f.readlines()
-								original_label_count = len(lines)
-
-								for line in lines:
-									values = line.strip().split()
-									if len(values) >= 5:
-										cls_id, cx, cy, w, h = map(float, values)
-
-										# YOLO 형식에서 절대 좌표 계산 (픽셀 단위)
-										abs_x1 = int((cx - w/2) * mask_width)
-										abs_y1 = int((cy - h/2) * mask_height)
-										abs_x2 = int((cx + w/2) * mask_width)
-										abs_y2 = int((cy + h/2) * mask_height)
-
-										# 캔버스 좌표로 변환
-										view_x1, view_y1 = self.convert_original_to_view(abs_x1, abs_y1)
-										view_x2, view_y2 = self.convert_original_to_view(abs_x2, abs_y2)
-
-										# 바운딩 박스 (캔버스 좌표)
-										bbox = [False, class_name[int(cls_id)], int(cls_id), view_x1, view_y1, view_x2, view_y2]
-
-										# 바운딩 박스가 마스킹 영역과 겹치는지 확인 (면적 기반)
-										if not self.check_bbox_mask_overlap(mask_area, bbox):
-											# 겹치지 않는 경우 (유지)
-											labels_to_keep.append(line)
-										else:
-											# 겹치는 경우 삭제
-											deleted_label_count += 1
-
-						# 라벨 파일 다시 쓰기
 						with open(target_label_path, 'w') as f:
 							f.writelines(labels_to_keep)
 
-						if deleted_label_count > 0:
-							print(f"[MaskCopy] 프레임 {i+1}: {original_label_count}개 라벨 중 {deleted_label_count}개 삭제됨 (면적 기반)")
-							total_labels_deleted += deleted_label_count
-							modified_label_files.append(target_label_path)
+					if deleted_label_count > 0:
+						print(f"[MaskCopy] 프레임 {i+1}: {original_label_count}개 라벨 중 {deleted_label_count}개 삭제됨 (면적 기반)")
+						result['deleted'] = deleted_label_count
+						result['label_path'] = target_label_path
 
-					except Exception as e:
-						print(f"라벨 처리 중 오류 발생: {e}")
-				
+				except Exception as e:
+					print(f"라벨 처리 중 오류 발생: {e}")
+			return result
+
+		# 진행 상황 창 생성
+		frames = [i for i in range(start_frame - 1, end_frame) if i != current_idx]  # 현재 이미지 건너뛰기
+		progress_window, progress_label, progress_bar, cancel_button = self.open_range_progress(
+			"마스킹 복사 중...", "마스킹을 복사 중입니다...", len(frames))
+
+		def on_progress(done, total):
+			progress_bar["value"] = done
+			progress_label.config(text=f"처리 중: {done}/{total} ({int(done / max(1, total) * 100)}%)")
+
+		def on_done(results, cancelled):
+			success_count = 0
+			skipped_count = 0
+			total_labels_deleted = 0  # 전체 삭제된 라벨 개수 추적
+			modified_label_files = []  # 수정된 라벨 파일 목록
+			for i, result in results:
+				if isinstance(result, Exception):
+					print(f"이미지 {i+1} 처리 중 오류 발생: {result}")
+					continue
+				if result['status'] == 'size_mismatch':
+					continue
 				success_count += 1
-				
-			except Exception as e:
-				print(f"이미지 {i+1} 처리 중 오류 발생: {e}")
-		
-		# 진행 창 닫기
-		progress_window.destroy()
+				if result['status'] == 'skipped':
+					skipped_count += 1
+				if result['deleted']:
+					total_labels_deleted += result['deleted']
+					modified_label_files.append(result['label_path'])
 
-		# 캔버스에서 폴리곤 및 마스킹 관련 요소들 삭제
-		self.canvas.delete("polygon")
-		self.canvas.delete("polygon_point")
-		self.canvas.delete("temp_line")
-		self.canvas.delete("masking")
-		self.canvas.delete("masking_m")
+			# 진행 창 닫기
+			progress_window.grab_release()
+			progress_window.destroy()
 
-		# 폴리곤 마스킹 관련 변수 초기화
-		self.polygon_masking = False
-		self.polygon_points = []
-		self.is_polygon_closed = False
+			# 캔버스에서 폴리곤 및 마스킹 관련 요소들 삭제
+			self.canvas.delete("polygon")
+			self.canvas.delete("polygon_point")
+			self.canvas.delete("temp_line")
+			self.canvas.delete("masking")
+			self.canvas.delete("masking_m")
 
-		# 완료 메시지 (라벨 삭제 정보 포함)
-		completion_msg = f"마스킹 복사가 완료되었습니다.\n{success_count}개의 이미지에 성공적으로 적용되었습니다."
-		if total_labels_deleted > 0:
-			completion_msg += f"\n\n총 {total_labels_deleted}개의 라벨이 삭제되었습니다."
-			completion_msg += f"\n수정된 라벨 파일: {len(modified_label_files)}개"
-			completion_msg += "\n\n✓ 파일에 저장 완료 (다른 페이지 방문 시 자동 반영됨)"
-			print(f"\n[CacheOptimization] 마스킹 복사 완료 - 총 {total_labels_deleted}개 라벨 삭제, {len(modified_label_files)}개 파일 수정 (캐시 업데이트 생략)")
-		else:
-			print(f"[CacheOptimization] 마스킹 복사 완료 - {success_count}개 이미지 처리 (캐시 업데이트 생략)")
+			# 폴리곤 마스킹 관련 변수 초기화
+			self.polygon_masking = False
+			self.polygon_points = []
+			self.is_polygon_closed = False
 
-		messagebox.showinfo("완료", completion_msg)
+			# 완료 메시지 (라벨 삭제 정보 포함)
+			completion_msg = f"마스킹 복사가 완료되었습니다.\n{success_count}개의 이미지에 성공적으로 적용되었습니다."
+			if cancelled:
+				completion_msg = f"마스킹 복사가 취소되었습니다.\n취소 전까지 {success_count}개의 이미지에 적용되었습니다."
+			if skipped_count > 0:
+				completion_msg += f"\n(이미 같은 마스킹이 적용된 {skipped_count}개 이미지는 저장 생략)"
+			if total_labels_deleted > 0:
+				completion_msg += f"\n\n총 {total_labels_deleted}개의 라벨이 삭제되었습니다."
+				completion_msg += f"\n수정된 라벨 파일: {len(modified_label_files)}개"
+				completion_msg += "\n\n✓ 파일에 저장 완료 (다른 페이지 방문 시 자동 반영됨)"
+				print(f"\n[CacheOptimization] 마스킹 복사 완료 - 총 {total_labels_deleted}개 라벨 삭제, {len(modified_label_files)}개 파일 수정 (캐시 업데이트 생략)")
+			else:
+				print(f"[CacheOptimization] 마스킹 복사 완료 - {success_count}개 이미지 처리 (캐시 업데이트 생략)")
 
-		# 현재 이미지 다시 표시
-		self.draw_image()
+			messagebox.showinfo("완료", completion_msg)
+
+			# 현재 이미지 다시 표시
+			self.draw_image()
+
+		# 작업자 풀에서 프레임 처리 (동시 처리 프레임 수 제한)
+		runner = RangeJobRunner(self.master, mask_frame, frames, on_progress, on_done,
+								workers=min(4, os.cpu_count() or 1))
+
+		def cancel():
+			runner.cancel()
+			cancel_button.config(state=tk.DISABLED)
+			progress_label.config(text="취소 중... (처리 중인 이미지 마무리)")
+		cancel_button.config(command=cancel)
+		progress_window.protocol("WM_DELETE_WINDOW", cancel)
+		runner.start()
 		# rel: [clsidx, cx, cy, w, h]
 	# abs: [sel, clsname, info, x1, y1, x2, y2]
 	def crop_img(self):		
+		self.flush_label_writes()
 		minx = 100000
 		miny = 100000
 		maxx = 0
@@ -3635,15 +4331,13 @@ class MainApp:
 		self.l_region = False
 		self.imsize = cropped_img.size
 		self.imsize = [(int)(i * self.zoom_ratio) for i in cropped_img.size]
-		im = cropped_img.resize(self.imsize, Image.LANCZOS)
 		if os.path.exists(self.gt_fn):
 			filesize = os.path.getsize(self.gt_fn)
 		else:
 			filesize = 0
 
 		self.canvas.config(width=self.imsize[0], height=self.imsize[1])
-		self.canvas.image = ImageTk.PhotoImage(cropped_img)
-		self.canvas.create_image(0, 0, image=self.canvas.image, anchor='nw', tags="img")
+		self.show_canvas_image(cropped_img)
 		self.master.title('[%d/%d] %s' % (self.ci+1, len(self.imlist), self.im_fn))
 
 		self.canvas.delete("bbox")
@@ -3723,24 +4417,22 @@ class MainApp:
 		# print(f"보정 후 좌표 - minx:{orig_minx}, miny:{orig_miny}, maxx:{orig_maxx}, maxy:{orig_maxy}")
 
 
-		self.current_img_array[orig_miny:orig_maxy, orig_minx:orig_maxx, :] = [255, 0, 255]
+		self.mask_layer.paint_rect(orig_minx, orig_miny, orig_maxx, orig_maxy)
 		
 
 		self.maskingframewidth = self.original_width
 		self.maskingframeheight = self.original_height
-		self.masking = np.where((self.current_img_array==[255,0,255]).all(axis=2))
+		self.masking = self.mask_layer.to_packed()
 		self.has_saved_masking = True
 		self.is_masking_dirty = True  # 저장 필요 플래그 설정
 
-		display_img = Image.fromarray(self.current_img_array)
+		display_img = Image.fromarray(self.mask_layer.composite())
 		if self.remove_overlapping_labels.get():
 			self.remove_labels_overlapping_with_mask(self.m_area)
 
 		self.canvas.delete("masking")
 		self.bbox_masking = False
-		resized_img = display_img.resize(self.imsize, Image.LANCZOS)
-		self.canvas.image = ImageTk.PhotoImage(resized_img)
-		self.canvas.create_image(0, 0, image=self.canvas.image, anchor='nw', tags="img")
+		self.show_canvas_image(display_img)
 
 		# # 원본 이미지에 마스킹 적용
 		# self.img[orig_miny:orig_maxy, orig_minx:orig_maxx, :] = [255, 0, 255]
@@ -3824,33 +4516,11 @@ class MainApp:
 		y_max = min(self.original_height, orig_y + mask_size)
 		
 		# 메모리상에서만 마스킹 적용 (파일 저장 안함)
-		self.current_img_array[y_min:y_max, x_min:x_max, :] = [255, 0, 255]
+		self.mask_layer.paint_rect(x_min, y_min, x_max, y_max)
 		self.is_masking_dirty = True  # 저장 필요 플래그 설정
 	def convert_rel2abs(self, rc):
 		try:
-			w = rc[3] * self.imsize[0]
-			h = rc[4] * self.imsize[1]
-			x = (rc[1] - rc[3]/2) * self.imsize[0]
-			y = (rc[2] - rc[4]/2) * self.imsize[1]
-			if x<0:
-				x=0
-			if y<0:
-				y=0
-			if x+w>self.imsize[0]:
-				w=self.imsize[0]-x-1
-			if y+h>self.imsize[1]:
-				h=self.imsize[1]-y-1
-
-			# 클래스 인덱스 범위 체크 - 원본 ID 유지
-			class_idx = int(rc[0])
-			if 0 <= class_idx < len(class_name):
-				name = class_name[class_idx]
-			else:
-				# 설정에 없는 클래스는 원본 ID를 유지하고 Unknown으로 표시
-				print(f"WARNING: Class index {class_idx} not in config, keeping original ID")
-				name = f"Unknown({class_idx})"
-
-			return [False, name, class_idx, (x), (y), (x+w), (y+h)]
+			return rel_to_abs_bbox(rc, self.imsize, class_name)
 		except (IndexError, ValueError, TypeError) as e:
 			print(f"ERROR in convert_rel2abs: {e}, rc={rc}")
 			return [False, class_name[0] if class_name else "unknown", 0, 0, 0, 10, 10]
@@ -3889,6 +4559,9 @@ class MainApp:
 		self.selid = -1
 		self.bbox = []
 
+		# 이 파일의 저장이 대기 중이면 끝난 뒤 읽음
+		label_writer.flush(self.gt_fn)
+
 		try:
 			with open(self.gt_fn, 'r') as f:
 				for l in f.readlines():
@@ -3933,7 +4606,8 @@ class MainApp:
 		if self.exclusion_zone_enabled and self.exclusion_zone_manager:
 			before_count = len(self.bbox)
 			print(f"[DEBUG] 제외 영역 필터링 시작: {before_count}개 라벨 검사")
-			self.bbox = [bbox for bbox in self.bbox if not self.exclusion_zone_manager.is_bbox_in_exclusion_zone(bbox, zoom_ratio=self.zoom_ratio)]
+			hits = self.exclusion_zone_manager.find_bboxes_in_exclusion_zone(self.bbox, zoom_ratio=self.zoom_ratio)
+			self.bbox = [bbox for bbox, hit in zip(self.bbox, hits) if not hit]
 			deleted_count = before_count - len(self.bbox)
 			print(f"[DEBUG] 제외 영역 필터링 완료: {deleted_count}개 삭제됨")
 			if deleted_count > 0:
@@ -3967,15 +4641,33 @@ class MainApp:
 			print("WARNING: gt_fn is None, cannot write bbox")
 			return
 
-		try:
-			with open(self.gt_fn, 'wt') as f:
-				for rc in self.bbox:
-					f.write(' '.join(str(e) for e in self.convert_abs2rel(rc)) + '\n')
-		except (IOError, PermissionError) as e:
-			print(f"ERROR: Failed to write bbox to {self.gt_fn}: {e}")
-			messagebox.showerror("File Write Error", f"Failed to save labels:\n{e}")
+		# 실제 쓰기는 label_writer가 연속 편집을 합쳐 백그라운드에서 원자적으로 수행
+		text = ''.join(' '.join(str(e) for e in self.convert_abs2rel(rc)) + '\n' for rc in self.bbox)
+		label_writer.submit(self.gt_fn, text)
+		if self.label_writes_job is None:
+			self.update_pending_writes()
 		return
 
+	def update_pending_writes(self):
+		"""라벨 저장 대기 표시를 갱신하고, 대기 중이면 다시 확인을 예약합니다. 실패한 저장은 여기서 알림"""
+		self.label_writes_job = None
+		for path, e in label_writer.pop_errors():
+			print(f"ERROR: Failed to write bbox to {path}: {e}")
+			messagebox.showerror("File Write Error", f"Failed to save labels:\n{e}")
+		count = label_writer.pending_count()
+		if hasattr(self, 'pendingWriteLabel'):
+			self.pendingWriteLabel.config(text=f"저장 대기: {count}" if count else "")
+		if count:
+			self.label_writes_job = self.master.after(200, self.update_pending_writes)
+
+	def flush_label_writes(self):
+		"""대기 중인 라벨 저장을 모두 마침 (라벨 파일을 직접 읽고 쓰는 작업 전에 호출)"""
+		label_writer.flush()
+		if self.label_writes_job is not None:
+			self.master.after_cancel(self.label_writes_job)
+			self.label_writes_job = None
+		self.update_pending_writes()
+
 	def toggle_auto_copy_labels(self):
 		"""라벨 자동 복사 기능 활성화/비활성화"""
 		self.auto_copy_labels_enabled = self.auto_copy_labels_var.get()
@@ -4121,6 +4813,7 @@ class MainApp:
 		self.canvas.delete("bbox")
 		self.canvas.delete("anchor")
 		self.canvas.delete("clsname")
+		self.selected_bbox_items = None
 
 		# 디버깅: draw_bbox 호출 시 필터 상태 출력
 		print(f"\n[FILTER DEBUG] draw_bbox() called - Total bboxes: {len(self.bbox)}")
@@ -4135,27 +4828,22 @@ class MainApp:
 				# 클래스 필터 체크 - 필터에 의해 숨겨진 클래스는 표시 안함
 				selected_class_id = int(self.bbox[self.selid][2])
 				if self.class_filter_manager.is_class_visible(selected_class_id):
-					self.draw_bbox_rc(self.bbox[self.selid])
-					rc = self.bbox[self.selid]
-					s = str(rc[5]-rc[3]) + 'x' + str(rc[6]-rc[4])
-					self.canvas.create_text(rc[5]-3,rc[6]+14, font='Arial 7', fill='black', text=s, anchor='se', tags='bbox')
+					self.selected_bbox_items = self.draw_bbox_rc(self.bbox[self.selid])
+					self.selected_bbox_items['dim_text'] = self.draw_bbox_dim_text(self.bbox[self.selid])
 		elif self.onlyselect is True:
 			# selid 범위 체크
 			if 0 <= self.selid < len(self.bbox):
 				# 클래스 필터 체크 - 필터에 의해 숨겨진 클래스는 표시 안함
 				selected_class_id = int(self.bbox[self.selid][2])
 				if self.class_filter_manager.is_class_visible(selected_class_id):
-					self.draw_bbox_rc(self.bbox[self.selid])
-					rc = self.bbox[self.selid]
-					s = str(rc[5]-rc[3]) + 'x' + str(rc[6]-rc[4])
-					self.canvas.create_text(rc[5]-3,rc[6]+14, font='Arial 7', fill='black', text=s, anchor='se', tags='bbox')
+					self.selected_bbox_items = self.draw_bbox_rc(self.bbox[self.selid])
+					self.selected_bbox_items['dim_text'] = self.draw_bbox_dim_text(self.bbox[self.selid])
 		else:
 			labellst = []
 			drawn_count = 0
 			for i, rc in enumerate(self.bbox):
 				# 클래스 필터 적용 - 필터에 해당하는 클래스만 표시
 				class_id = int(rc[2])
-				print(f"[FILTER DEBUG] draw_bbox: bbox[{i}] class_id={class_id}, class_name={rc[1]}")
 				if not self.class_filter_manager.is_class_visible(class_id):
 					continue
 
@@ -4230,7 +4918,7 @@ class MainApp:
 				selected_class_id = int(selected_bbox[2])
 				# 클래스 필터 체크 - 필터에 의해 숨겨진 클래스면 그리지 않음
 				if self.class_filter_manager.is_class_visible(selected_class_id):
-					self.draw_bbox_rc(self.bbox[self.selid])
+					self.selected_bbox_items = self.draw_bbox_rc(self.bbox[self.selid])
 			if hasattr(self, 'show_label_list') and self.show_label_list.get():
 				self.update_label_list()
 				self.update_crop_preview()
@@ -4242,10 +4930,59 @@ class MainApp:
 		self.draw_class_change_zones()
 
 		# 삭제/변환된 라벨에 동그라미 표시
-		self.draw_pending_operation_markers()
+		marker_items = self.draw_pending_operation_markers()
+		if self.selected_bbox_items is not None:
+			# 좌표 갱신 때 표시가 바뀌었거나 지워졌는지 비교 (그러면 전체 다시 그리기)
+			self.selected_bbox_items['markers'] = marker_items
+			self.selected_bbox_items['pending'] = self.pending_marker_key()
 		return
 
+	def draw_bbox_dim_text(self, rc):
+		"""선택만 보기/이동/크기 조절 중 선택 bbox 오른쪽 아래의 'WxH' 크기 표시"""
+		layout = self.bbox_item_layout(rc)
+		return self.canvas.create_text(layout['dim_text'], font='Arial 7', fill='black', text=layout['dim_info'], anchor='se', tags='bbox')
+
+	def bbox_item_layout(self, rc):
+		"""bbox 한 개를 이루는 캔버스 항목들의 좌표 (새로 그리기/좌표 갱신 공용)"""
+		x1, y1, x2, y2 = rc[3:7]
+		layout = {'rect': [x1, y1, x2, y2]}
+
+		# 크기 정보 표시 체크박스가 켜져 있을 때만 크기 정보 표시
+		if self.show_size_info.get():
+			# 바운딩 박스 크기 정보 계산
+			width_px = x2 - x1  # 픽셀 단위 가로 길이
+			height_px = y2 - y1  # 픽셀 단위 세로 길이
+
+			# 정규화된 값 계산
+			width_norm = width_px / self.imsize[0]
+			height_norm = height_px / self.imsize[1]
+
+			# 크기 정보 텍스트 생성
+			size_info = f"{int(width_px)}x{int(height_px)} px | {width_norm:.3f}x{height_norm:.3f}"
+			text_width = len(size_info) * 5  # 텍스트 길이에 따른 대략적인 너비
+			layout['size_info'] = size_info
+			layout['size_bg'] = [x2-3-text_width, y2+4, x2-3, y2+18]
+			layout['size_text'] = [x2-3, y2+14]
+
+		# 선택만 보기/이동/크기 조절 중 크기 표시 (draw_bbox_dim_text)
+		layout['dim_info'] = str(x2-x1) + 'x' + str(y2-y1)
+		layout['dim_text'] = [x2-3, y2+14]
+
+		# 클래스 이름 표시
+		layout['label_bg'] = [x1-3, y1-10, x1+(len(rc[1])*6)+2, y1]
+		layout['label_text'] = [x1, y1-10]
+
+		# 앵커 8개 ('nw', 'n', ... 순서)
+		margin = [-3,-3,3,3]
+		anchor_rc = [
+			[x1,y1], [(x1+x2)/2,y1], [x2,y1], [x2,(y1+y2)/2],
+			[x2,y2], [(x1+x2)/2,y2], [x1,y2], [x1,(y1+y2)/2]
+		]
+		layout['anchors'] = [[a + b for a, b in zip(e*2, margin)] for e in anchor_rc]
+		return layout
+
 	def draw_bbox_rc(self, rc, index=None):
+		"""bbox 한 개 그리기. 만든 캔버스 항목 id를 dict로 반환"""
 		# 색상과 스타일 결정
 		if rc[0]:  # 현재 선택된 라벨
 			color = 'red'
@@ -4269,66 +5006,93 @@ class MainApp:
 				color = 'white'
 			width = 1
 			dash = None
-		
+
+		layout = self.bbox_item_layout(rc)
+		items = {}
+
 		# 바운딩 박스 그리기
 		if dash:
-			self.canvas.create_rectangle(rc[3:], outline=color, width=width, dash=dash, tags="bbox")
+			items['rect'] = self.canvas.create_rectangle(layout['rect'], outline=color, width=width, dash=dash, tags="bbox")
 		else:
-			self.canvas.create_rectangle(rc[3:], outline=color, width=width, tags="bbox")
-		
-		# 크기 정보 표시 체크박스가 켜져 있을 때만 크기 정보 표시
-		if self.show_size_info.get():
-			# 바운딩 박스 크기 정보 계산
-			width_px = rc[5] - rc[3]  # 픽셀 단위 가로 길이
-			height_px = rc[6] - rc[4]  # 픽셀 단위 세로 길이
-			
-			# 정규화된 값 계산
-			width_norm = width_px / self.imsize[0]
-			height_norm = height_px / self.imsize[1]
-			
-			# 크기 정보 텍스트 생성
-			size_info = f"{int(width_px)}x{int(height_px)} px | {width_norm:.3f}x{height_norm:.3f}"
-			
-			# 텍스트 배경 생성
-			text_width = len(size_info) * 5  # 텍스트 길이에 따른 대략적인 너비
-			self.canvas.create_rectangle(
-				rc[5]-3-text_width, rc[6]+4, 
-				rc[5]-3, rc[6]+18, 
-				fill='black', outline='', tags='bbox'
-			)
-			
-			# 크기 정보 표시
-			self.canvas.create_text(rc[5]-3, rc[6]+14, font='Arial 7', fill='white', text=size_info, anchor='se', tags='bbox')
-	
+			items['rect'] = self.canvas.create_rectangle(layout['rect'], outline=color, width=width, tags="bbox")
+
+		# 크기 정보 표시 (텍스트 배경 + 텍스트)
+		if 'size_info' in layout:
+			items['size_bg'] = self.canvas.create_rectangle(layout['size_bg'], fill='black', outline='', tags='bbox')
+			items['size_text'] = self.canvas.create_text(layout['size_text'], font='Arial 7', fill='white', text=layout['size_info'], anchor='se', tags='bbox')
+
 		if self.bbox_resize_anchor == None and self.bbox_move == False and self.viewclass == True:
-			self.canvas.create_rectangle([rc[3]-3,rc[4]-10,rc[3]+(len(rc[1])*6)+2,rc[4]], fill=color, outline='', tags='clsname')
+			items['label_bg'] = self.canvas.create_rectangle(layout['label_bg'], fill=color, outline='', tags='clsname')
 			c = 'black' if color not in anchor_color else anchor_color[color]
-			self.canvas.create_text(rc[3],rc[4]-10, font='Arial 6 bold', fill=c, text=rc[1].upper(), anchor='nw', tags='clsname')
+			items['label_text'] = self.canvas.create_text(layout['label_text'], font='Arial 6 bold', fill=c, text=rc[1].upper(), anchor='nw', tags='clsname')
 
 		# 선택된 라벨에는 항상 앵커 표시 (onlybox와 무관)
 		if rc[0]:
 			print(f"[ANCHOR DEBUG] Drawing anchors for selected bbox - rc[0]={rc[0]}, selid={self.selid}")
-			self.draw_bbox_anchor(rc, color)
+			items['anchors'] = self.draw_bbox_anchor(rc, color)
+		return items
 
 	def draw_bbox_anchor(self, rc, color):
 		print(f"[ANCHOR DEBUG] draw_bbox_anchor called - rc[0]={rc[0]}, onlybox={self.onlybox}, color={color}")
-		margin = [-3,-3,3,3]
-		x1,y1,x2,y2 = rc[3:]
-		print(f"[ANCHOR DEBUG] bbox coords: x1={x1}, y1={y1}, x2={x2}, y2={y2}")
-		anchor_rc = [
-			[x1,y1], [(x1+x2)/2,y1], [x2,y1], [x2,(y1+y2)/2],
-			[x2,y2], [(x1+x2)/2,y2], [x1,y2], [x1,(y1+y2)/2]
-		]
-		anchor_rc = [ e*2 for e in anchor_rc ]
-		anchor_rc = zip(anchor_name, anchor_rc)
 		# [ ['nw', [x1, y1, x2, y2], .. ]
-		anchor_count = 0
+		anchor_rc = zip(anchor_name, self.bbox_item_layout(rc)['anchors'])
+		anchor_items = []
 		for r in anchor_rc:
 			c = 'black' if color not in anchor_color else anchor_color[color]
-			self.canvas.create_rectangle([a + b for a, b in zip(r[1], margin)], outline=c, fill=color, width=1, tags=("anchor", r[0]))
-			anchor_count += 1
-		print(f"[ANCHOR DEBUG] Drew {anchor_count} anchors")
-		return
+			anchor_items.append(self.canvas.create_rectangle(r[1], outline=c, fill=color, width=1, tags=("anchor", r[0])))
+		return anchor_items
+
+	def redraw_selected_bbox(self):
+		"""선택 bbox 이동/크기 조절 후 화면 갱신 예약 (키 반복 입력은 한 번으로 합침)"""
+		if self.bbox_redraw_job is None:
+			self.bbox_redraw_job = self.master.after(self.BBOX_REDRAW_MS, self.flush_bbox_redraw)
+
+	def bbox_items_alive(self, items):
+		"""draw_bbox가 기록한 캔버스 항목이 모두 남아 있는지 (다른 곳에서 지웠으면 False)"""
+		for key, value in items.items():
+			if key == 'pending':
+				continue
+			for item in (value if isinstance(value, list) else [value]):
+				if not self.canvas.type(item):
+					return False
+		return True
+
+	def flush_bbox_redraw(self):
+		"""예약된 갱신 실행: 선택 bbox의 캔버스 항목 좌표만 바꾸고, 불가능하면 전체 다시 그리기"""
+		self.bbox_redraw_job = None
+		items = self.selected_bbox_items
+		if (items is None or not 0 <= self.selid < len(self.bbox) or not self.bbox[self.selid][0]
+				or self.bbox_resize_anchor is not None or self.bbox_move
+				or not self.bbox_items_alive(items)):
+			self.draw_bbox()
+			return
+
+		rc = self.bbox[self.selid]
+		layout = self.bbox_item_layout(rc)
+		# 표시 옵션이나 삭제/변환 표시가 바뀌어 항목 구성이 다르면 전체 다시 그리기
+		if (('size_info' in layout) != ('size_text' in items) or self.viewclass != ('label_text' in items)
+				or (self.onlyselect is True) != ('dim_text' in items)
+				or items.get('pending') != self.pending_marker_key()):
+			self.draw_bbox()
+			return
+
+		self.canvas.coords(items['rect'], *layout['rect'])
+		if 'size_text' in items:
+			self.canvas.coords(items['size_bg'], *layout['size_bg'])
+			self.canvas.coords(items['size_text'], *layout['size_text'])
+			self.canvas.itemconfig(items['size_text'], text=layout['size_info'])
+		if 'label_text' in items:
+			self.canvas.coords(items['label_bg'], *layout['label_bg'])
+			self.canvas.coords(items['label_text'], *layout['label_text'])
+		if 'dim_text' in items:
+			self.canvas.coords(items['dim_text'], *layout['dim_text'])
+			self.canvas.itemconfig(items['dim_text'], text=layout['dim_info'])
+		for item, anchor_box in zip(items.get('anchors', []), layout['anchors']):
+			self.canvas.coords(item, *anchor_box)
+
+		if hasattr(self, 'show_label_list') and self.show_label_list.get():
+			self.update_label_list_item(self.selid)
+			self.update_crop_preview()
 
 	def draw_exclusion_zones(self):
 		"""제외 영역 표시"""
@@ -4420,9 +5184,16 @@ class MainApp:
 				x, y = point
 				self.canvas.create_oval(x-4, y-4, x+4, y+4, fill='magenta', outline='white', width=2, tags="class_change_zone")
 
+	def pending_marker_key(self):
+		"""삭제/변환 동그라미 표시 상태 (선택 bbox 좌표 갱신 시 변경 여부 확인용)"""
+		return tuple((label_info['x1'], label_info['y1'], label_info['x2'], label_info['y2'])
+					 for labels in (self.pending_deleted_labels, self.pending_masked_labels)
+					 for label_info in labels) + (len(self.pending_deleted_labels),)
+
 	def draw_pending_operation_markers(self):
-		"""삭제/변환된 라벨에 동그라미 표시"""
+		"""삭제/변환된 라벨에 동그라미 표시. 만든 캔버스 항목 id 리스트를 반환"""
 		self.canvas.delete("pending_marker")
+		marker_items = []
 
 		# 삭제된 라벨에 빨간색 동그라미 표시
 		for label_info in self.pending_deleted_labels:
@@ -4432,12 +5203,12 @@ class MainApp:
 			radius = 10
 
 			# 빨간색 동그라미
-			self.canvas.create_oval(
+			marker_items.append(self.canvas.create_oval(
 				center_x - radius, center_y - radius,
 				center_x + radius, center_y + radius,
 				outline='red', fill='red', width=3,
 				tags="pending_marker"
-			)
+			))
 
 		# 마스킹으로 변환된 라벨에 노란색 동그라미 표시
 		for label_info in self.pending_masked_labels:
@@ -4447,12 +5218,13 @@ class MainApp:
 			radius = 10
 
 			# 노란색 동그라미
-			self.canvas.create_oval(
+			marker_items.append(self.canvas.create_oval(
 				center_x - radius, center_y - radius,
 				center_x + radius, center_y + radius,
 				outline='yellow', fill='yellow', width=3,
 				tags="pending_marker"
-			)
+			))
+		return marker_items
 
 	def on_viewclass(self, event):
 		if self.viewclass is True : self.viewclass = False
@@ -4492,10 +5264,8 @@ class MainApp:
 		im = Image.open(self.im_fn)
 		self.imsize = im.size
 		self.imsize = [(int)(i * self.zoom_ratio) for i in im.size]
-		im = im.resize(self.imsize, Image.LANCZOS)		
 		self.canvas.config(width=self.imsize[0], height=self.imsize[1])
-		self.canvas.image = ImageTk.PhotoImage(im)
-		self.canvas.create_image(0, 0, image=self.canvas.image, anchor='nw', tags="img")
+		self.show_canvas_image(im)
 		self.master.title('[%d/%d] %s' % (self.ci+1, len(self.imlist), self.im_fn))		
 		self.load_bbox()		
 		self.draw_bbox()
@@ -4558,7 +5328,7 @@ class MainApp:
 			self.bbox[self.selid][1:] = rc[1:]
 			if   self.ci >= len(self.imlist) : self.ci = len(self.imlist) - 1
 			if   self.ci < 0                 : self.ci = 0
-			if   self.ci == self.pi          : self.draw_bbox()
+			if   self.ci == self.pi          : self.redraw_selected_bbox()
 			else                             : self.write_bbox(); self.draw_image()
 			self.pre_rc = rc
 		except Exception as e:
@@ -4584,7 +5354,7 @@ class MainApp:
 			self.bbox[self.selid][1:] = rc[1:]
 			if   self.ci >= len(self.imlist) : self.ci = len(self.imlist) - 1
 			if   self.ci < 0                 : self.ci = 0
-			if   self.ci == self.pi          : self.draw_bbox()
+			if   self.ci == self.pi          : self.redraw_selected_bbox()
 			else                             : self.write_bbox(); self.draw_image()
 			self.pre_rc = rc
 		except Exception as e:
@@ -4610,7 +5380,7 @@ class MainApp:
 			self.bbox[self.selid][1:] = rc[1:]
 			if   self.ci >= len(self.imlist) : self.ci = len(self.imlist) - 1
 			if   self.ci < 0                 : self.ci = 0
-			if   self.ci == self.pi          : self.draw_bbox()
+			if   self.ci == self.pi          : self.redraw_selected_bbox()
 			else                             : self.write_bbox(); self.draw_image()
 			self.pre_rc = rc
 		except Exception as e:
@@ -4636,7 +5406,7 @@ class MainApp:
 			self.bbox[self.selid][1:] = rc[1:]
 			if   self.ci >= len(self.imlist) : self.ci = len(self.imlist) - 1
 			if   self.ci < 0                 : self.ci = 0
-			if   self.ci == self.pi          : self.draw_bbox()
+			if   self.ci == self.pi          : self.redraw_selected_bbox()
 			else                             : self.write_bbox(); self.draw_image()
 			self.pre_rc = rc
 		except Exception as e:
@@ -4656,7 +5426,7 @@ class MainApp:
 
 		if   self.ci >= len(self.imlist) : self.ci = len(self.imlist) - 1
 		if   self.ci < 0                 : self.ci = 0
-		if   self.ci == self.pi          : self.draw_bbox()
+		if   self.ci == self.pi          : self.redraw_selected_bbox()
 		else                             : self.write_bbox(); self.draw_image()
 		self.pre_rc = rc
 		return
@@ -4675,7 +5445,7 @@ class MainApp:
 		
 		if   self.ci >= len(self.imlist) : self.ci = len(self.imlist) - 1
 		if   self.ci < 0                 : self.ci = 0
-		if   self.ci == self.pi          : self.draw_bbox()
+		if   self.ci == self.pi          : self.redraw_selected_bbox()
 		else                             : self.write_bbox(); self.draw_image()
 		self.pre_rc = rc
 		return
@@ -4693,7 +5463,7 @@ class MainApp:
 		
 		if   self.ci >= len(self.imlist) : self.ci = len(self.imlist) - 1
 		if   self.ci < 0                 : self.ci = 0
-		if   self.ci == self.pi          : self.draw_bbox()
+		if   self.ci == self.pi          : self.redraw_selected_bbox()
 		else                             : self.write_bbox(); self.draw_image()
 		self.pre_rc = rc
 		return
@@ -4711,7 +5481,7 @@ class MainApp:
 		
 		if   self.ci >= len(self.imlist) : self.ci = len(self.imlist) - 1
 		if   self.ci < 0                 : self.ci = 0
-		if   self.ci == self.pi          : self.draw_bbox()
+		if   self.ci == self.pi          : self.redraw_selected_bbox()
 		else                             : self.write_bbox(); self.draw_image()
 		self.pre_rc = rc
 		return
@@ -4729,7 +5499,7 @@ class MainApp:
 
 		if   self.ci >= len(self.imlist) : self.ci = len(self.imlist) - 1
 		if   self.ci < 0                 : self.ci = 0
-		if   self.ci == self.pi          : self.draw_bbox()
+		if   self.ci == self.pi          : self.redraw_selected_bbox()
 		else                             : self.write_bbox(); self.draw_image()
 		self.pre_rc = rc
 		return
@@ -4746,7 +5516,7 @@ class MainApp:
 		self.bbox[self.selid][1:] = rc[1:]
 		if   self.ci >= len(self.imlist) : self.ci = len(self.imlist) - 1
 		if   self.ci < 0                 : self.ci = 0
-		if   self.ci == self.pi          : self.draw_bbox()
+		if   self.ci == self.pi          : self.redraw_selected_bbox()
 		else                             : self.write_bbox(); self.draw_image()
 		self.pre_rc = rc
 		return
@@ -4763,7 +5533,7 @@ class MainApp:
 		self.bbox[self.selid][1:] = rc[1:]
 		if   self.ci >= len(self.imlist) : self.ci = len(self.imlist) - 1
 		if   self.ci < 0                 : self.ci = 0
-		if   self.ci == self.pi          : self.draw_bbox()
+		if   self.ci == self.pi          : self.redraw_selected_bbox()
 		else                             : self.write_bbox(); self.draw_image()
 		self.pre_rc = rc
 		return
@@ -4780,7 +5550,7 @@ class MainApp:
 		self.bbox[self.selid][1:] = rc[1:]
 		if   self.ci >= len(self.imlist) : self.ci = len(self.imlist) - 1
 		if   self.ci < 0                 : self.ci = 0
-		if   self.ci == self.pi          : self.draw_bbox()
+		if   self.ci == self.pi          : self.redraw_selected_bbox()
 		else                             : self.write_bbox(); self.draw_image()
 		self.pre_rc = rc
 		return
@@ -4890,6 +5660,7 @@ class MainApp:
 		self.draw_bbox()
 
 	def goodbye():
+		label_writer.close()  # 대기 중인 라벨 저장 마무리
 		fname, ext = os.path.splitext(_dir_goodbye)
 		if ext == '.txt' :
 			with open(self._dir, "r") as infile:
@@ -4911,7 +5682,6 @@ class MainApp:
 			# UAC 거부 또는 권한 문제 시 무시하고 계속 진행
 			print(f"RemoveDefaultdll.exe 실행 실패 (무시됨): {e}")
 		return
-	atexit.register(goodbye)
 	
 	def change_class(self, clsid):
 		if self.selid < 0:
@@ -4980,6 +5750,7 @@ class MainApp:
 		return
 
 	def change_criteria(self, c):
+		self.flush_label_writes()
 		_c = self.get_current_criteria()
 		if c == _c:
 			if self.ci==self.pi:
@@ -5009,6 +5780,7 @@ class MainApp:
 
 	def delete_current_file(self):
 		"""현재 파일 삭제 (연속 삭제 옵션 지원)"""
+		self.flush_label_writes()
 		# 삭제할 장 수 가져오기
 		delete_count = self.delete_count_var.get() if hasattr(self, 'delete_count_var') else 1
 
@@ -5087,6 +5859,9 @@ class MainApp:
 			# 리스트에서 제거
 			self.imlist = self.imlist[:self.ci] + self.imlist[self.ci+1:]
 
+		# 목록이 바뀌었으므로 미리 디코딩한 프레임 폐기
+		self.frame_buffer.clear()
+
 		# UI 업데이트
 		if self.ci >= len(self.imlist):
 			self.ci = len(self.imlist) - 1 if len(self.imlist) > 0 else 0
@@ -5167,25 +5942,22 @@ class MainApp:
 				if hasattr(self, 'img') and self.img is not None:
 					self.original_width = self.img.width
 					self.original_height = self.img.height
-				elif hasattr(self, 'current_img_array') and self.current_img_array is not None:
-					self.original_height, self.original_width = self.current_img_array.shape[:2]
+				elif self.mask_layer is not None:
+					self.original_height, self.original_width = self.mask_layer.height, self.mask_layer.width
 
 			# 마스킹 프레임 크기 설정
 			self.maskingframewidth = self.original_width
 			self.maskingframeheight = self.original_height
 			
 			# === 메모리상 마스킹 정보만 업데이트 (파일 저장 안함) ===
-			if self.current_img_array is not None:
-				# 현재 작업중인 배열에서 마스킹된 픽셀 좌표 찾기
-				self.masking = np.where((self.current_img_array==[255,0,255]).all(axis=2))
+			if self.mask_layer is not None:
+				# 원본 + 편집 오버레이에서 마스킹된 픽셀 찾기
+				self.masking = self.mask_layer.to_packed()
 				self.has_saved_masking = True
 				self.is_masking_dirty = True  # 저장 필요 플래그 설정
 				
 				# 화면 업데이트 (현재 줌 배율 유지)
-				display_img = Image.fromarray(self.current_img_array)
-				resized_img = display_img.resize([(int)(i * self.zoom_ratio) for i in display_img.size], Image.LANCZOS)
-				self.canvas.image = ImageTk.PhotoImage(resized_img)
-				self.canvas.create_image(0, 0, image=self.canvas.image, anchor='nw', tags="img")
+				self.show_canvas_image(Image.fromarray(self.mask_layer.composite()))
 			# === 메모리상 마스킹 처리 끝 ===
 			
 			# 캔버스에서 마스킹 관련 요소들 삭제
@@ -5212,18 +5984,20 @@ class MainApp:
 			messagebox.showwarning("경고", "저장된 마스킹이 없습니다. 먼저 마스킹을 생성하고 저장해주세요.")
 			return
 		
-		im = Image.open(self.im_fn)
+		# 현재 프레임 오버레이 (없으면 버퍼에서 디코딩된 원본으로 생성)
+		if self.mask_layer is None:
+			self.mask_layer = MaskOverlay(self.frame_buffer.get(self.im_fn)['array'])
+		layer = self.mask_layer
 
-		current_img = Image.open(self.im_fn)
 		print(f"=== 마스킹 복사 디버깅 ===")
-		print(f"현재 이미지: {current_img.width}x{current_img.height}")
+		print(f"현재 이미지: {layer.width}x{layer.height}")
 		print(f"저장된 마스킹: {self.maskingframewidth}x{self.maskingframeheight}")
 		print(f"현재 줌 비율: {self.zoom_ratio}")
 
 	
 		# 마스킹 크기와 현재 이미지 크기 확인
 		if (not hasattr(self, 'maskingframewidth') or not hasattr(self, 'maskingframeheight') or
-			im.height != self.maskingframeheight or im.width != self.maskingframewidth):
+			layer.height != self.maskingframeheight or layer.width != self.maskingframewidth):
 			print("Size Not Match")
 			messagebox.showwarning("경고", "저장된 마스킹과 현재 이미지의 크기가 일치하지 않습니다.")
 			return
@@ -5247,23 +6021,17 @@ class MainApp:
 				shutil.copyfile(self.gt_fn, gt_path)
 			
 			# === 메모리상에서 마스킹 적용 ===
-			# 현재 이미지를 배열로 변환하여 작업 배열 생성
-			self.original_img_array = array(im.copy())
-			self.current_img_array = array(im.copy())
-			
-			# 저장된 마스킹 정보 적용
-			self.current_img_array[self.masking] = [255, 0, 255]
+			# 저장된 마스킹 정보를 오버레이에 적용
+			layer.paint_packed(self.masking)
 			self.is_masking_dirty = True  # 저장 필요 플래그 설정
 			
 			# 마스킹과 겹치는 라벨 삭제 옵션이 켜져 있는 경우
 			if self.remove_overlapping_labels.get():
 				print(f"[AutoCopy] 마스킹과 겹치는 라벨 삭제 시작 - 현재 라벨 수: {len(self.bbox)}")
 				# 마스킹 영역 계산 (마스킹된 픽셀의 최소/최대 좌표)
-				if len(self.masking[0]) > 0:  # 마스킹된 픽셀이 있는 경우
-					mask_y1 = min(self.masking[0]) if len(self.masking[0]) > 0 else 0
-					mask_y2 = max(self.masking[0]) if len(self.masking[0]) > 0 else 0
-					mask_x1 = min(self.masking[1]) if len(self.masking[1]) > 0 else 0
-					mask_x2 = max(self.masking[1]) if len(self.masking[1]) > 0 else 0
+				mask_bounds = self.masking.bounds()
+				if mask_bounds is not None:  # 마스킹된 픽셀이 있는 경우
+					mask_x1, mask_y1, mask_x2, mask_y2 = mask_bounds
 
 					# 원본 이미지 좌표를 캔버스 좌표로 변환
 					view_x1, view_y1 = self.convert_original_to_view(mask_x1, mask_y1)
@@ -5284,19 +6052,17 @@ class MainApp:
 			
 			# === 화면 업데이트 ===
 			# 마스킹이 적용된 이미지로 화면 표시
-			display_img = Image.fromarray(self.current_img_array)
+			display_img = Image.fromarray(layer.composite())
 			
-			# 현재 zoom_ratio에 맞게 이미지 리사이즈
+			# 현재 zoom_ratio 기준 표시 크기
 			self.imsize = [(int)(i * self.zoom_ratio) for i in display_img.size]
-			resized_img = display_img.resize(self.imsize, Image.LANCZOS)
 			
-			# 캔버스 업데이트 (줌 상태 유지)
-			self.canvas.image = ImageTk.PhotoImage(resized_img)
-			self.canvas.create_image(0, 0, image=self.canvas.image, anchor='nw', tags="img")
+			# 캔버스 업데이트 (줌 상태 유지, 보이는 영역만 렌더링)
+			self.show_canvas_image(display_img)
 			self.master.title('[%d/%d] %s' % (self.ci+1, len(self.imlist), self.im_fn))
 
 			# === 이미지 파일에 마스킹 저장 (중요!) ===
-			img_to_save = Image.fromarray(self.current_img_array)
+			img_to_save = display_img
 			if self.im_fn.lower().endswith('.jpg') or self.im_fn.lower().endswith('.jpeg'):
 				img_to_save.save(self.im_fn, quality=95, optimize=True)
 			else:
@@ -5389,12 +6155,8 @@ class MainApp:
 			# 마스킹 정보 파일 경로
 			mask_info_file = self.im_fn.replace('.jpg', '_mask.npz').replace('.png', '_mask.npz')
 			
-			# numpy 형식으로 마스킹 정보 저장
-			np.savez_compressed(mask_info_file, 
-							masking_y=self.masking[0],
-							masking_x=self.masking[1],
-							width=self.maskingframewidth,
-							height=self.maskingframeheight)
+			# 비트 압축 형식으로 마스킹 정보 저장
+			self.masking.save(mask_info_file)
 			print(f"마스킹 정보 저장됨: {mask_info_file}")
 			
 		except Exception as e:
@@ -5408,13 +6170,10 @@ class MainApp:
 			return False
 		
 		try:
-			# 마스킹 정보 로드
-			data = np.load(mask_info_file)
-			
-			# 마스킹 정보 복원
-			self.masking = (data['masking_y'], data['masking_x'])
-			self.maskingframewidth = int(data['width'])
-			self.maskingframeheight = int(data['height'])
+			# 마스킹 정보 로드 (이전 좌표 형식 파일도 지원)
+			self.masking = PackedMask.load(mask_info_file)
+			self.maskingframewidth = self.masking.width
+			self.maskingframeheight = self.masking.height
 			self.has_saved_masking = True
 			
 			print(f"마스킹 정보 로드됨: {mask_info_file}")
@@ -5424,15 +6183,16 @@ class MainApp:
 			print(f"마스킹 정보 로드 오류: {e}")
 			return False
 	def save_masking_if_dirty(self):
-		if self.is_masking_dirty and self.current_img_array is not None:
+		if self.is_masking_dirty and self.mask_layer is not None:
 			try:
-				# 현재 작업중인 이미지를 파일에 저장
-				masked_img = Image.fromarray(self.current_img_array)
-				
-				if self.im_fn.lower().endswith('.jpg'):
-					masked_img.save(self.im_fn, quality=95, optimize=True)
-				else:
-					masked_img.save(self.im_fn)
+				# 편집이 있을 때만 오버레이를 픽셀로 합성해 파일에 저장
+				if self.mask_layer.edited:
+					masked_img = Image.fromarray(self.mask_layer.composite())
+					
+					if self.im_fn.lower().endswith('.jpg'):
+						masked_img.save(self.im_fn, quality=95, optimize=True)
+					else:
+						masked_img.save(self.im_fn)
 				
 				# print(f"마스킹이 저장됨: {self.im_fn}")
 				
@@ -5447,9 +6207,8 @@ class MainApp:
 		# 더티 플래그만 초기화
 		self.is_masking_dirty = False
 		
-		# 이미지 배열 메모리만 해제 (용량이 큰 부분)
-		self.original_img_array = None
-		self.current_img_array = None
+		# 마스킹 오버레이 메모리만 해제 (용량이 큰 부분)
+		self.mask_layer = None
 		
 		# 마스킹 정보는 복사 기능을 위해 보존
 		# self.masking - 보존
@@ -6211,24 +6970,24 @@ class MainApp:
 		print(f"라벨→마스크: 캔버스({view_x1},{view_y1},{view_x2},{view_y2}) → 원본({orig_x1},{orig_y1},{orig_x2},{orig_y2})")
 		print(f"마스킹 영역 크기: {orig_x2-orig_x1} x {orig_y2-orig_y1}")
 		
-		# 메모리상 마스킹 적용
-		self.original_img_array = array(self.img.copy())
-		self.current_img_array = array(self.img.copy())
+		# 메모리상 마스킹 적용 (현재 프레임 오버레이에 기록)
+		if self.mask_layer is None:
+			self.mask_layer = MaskOverlay(self.frame_buffer.get(self.im_fn)['array'])
 		
 		# 바운딩 박스 영역만 마스킹
-		self.current_img_array[orig_y1:orig_y2, orig_x1:orig_x2, :] = [255, 0, 255]
+		self.mask_layer.paint_rect(orig_x1, orig_y1, orig_x2, orig_y2)
 		
 		# 마스킹 정보 저장
-		self.masking = np.where((self.current_img_array==[255,0,255]).all(axis=2))
+		self.masking = self.mask_layer.to_packed()
 		self.maskingframewidth = self.original_width
 		self.maskingframeheight = self.original_height
 		self.has_saved_masking = True
 		self.is_masking_dirty = True
 		
 		# 디버깅: 마스킹된 픽셀 개수 확인
-		print(f"마스킹된 픽셀 개수: {len(self.masking[0])}")
+		print(f"마스킹된 픽셀 개수: {self.masking.count()}")
 
-		if len(self.masking[0]) == 0:
+		if not self.masking:
 			print("경고: 마스킹이 적용되지 않았습니다!")
 			return
 
@@ -6247,7 +7006,7 @@ class MainApp:
 		self.write_bbox()
 
 		# === 이미지 파일에 마스킹 저장 (중요!) ===
-		img_to_save = Image.fromarray(self.current_img_array)
+		img_to_save = Image.fromarray(self.mask_layer.composite())
 		if self.im_fn.lower().endswith('.jpg') or self.im_fn.lower().endswith('.jpeg'):
 			img_to_save.save(self.im_fn, quality=95, optimize=True)
 		else:
@@ -6657,12 +7416,12 @@ class MainApp:
 		cv2.fillPoly(mask, cv_polygon_points, 255)
 		
 		# 현재 작업중인 배열에 마스킹 적용 (파일 저장 안함)
-		self.current_img_array[mask == 255] = [255, 0, 255]  # 마젠타 색상
+		self.mask_layer.paint_mask(mask == 255)  # 마젠타 색상
 		
 		# 마스킹 정보 저장
 		self.maskingframewidth = self.original_width
 		self.maskingframeheight = self.original_height
-		self.masking = np.where((self.current_img_array==[255,0,255]).all(axis=2))
+		self.masking = self.mask_layer.to_packed()
 		self.has_saved_masking = True
 		self.is_masking_dirty = True  # 저장 필요 플래그 설정
 		
@@ -6682,10 +7441,7 @@ class MainApp:
 		
 		# === 화면 업데이트만 (파일 저장 안함) ===
 		# 마스킹이 적용된 이미지로 화면 업데이트
-		display_img = Image.fromarray(self.current_img_array)
-		resized_img = display_img.resize([(int)(i * self.zoom_ratio) for i in display_img.size], Image.LANCZOS)
-		self.canvas.image = ImageTk.PhotoImage(resized_img)
-		self.canvas.create_image(0, 0, image=self.canvas.image, anchor='nw', tags="img")
+		self.show_canvas_image(Image.fromarray(self.mask_layer.composite()))
 		# === 화면 업데이트 끝 ===
 		
 		print("폴리곤 마스킹이 적용되었습니다.")
@@ -7731,6 +8487,7 @@ class MainApp:
 
 	def copy_selected_classes(self, selected_classes, window=None):
 		"""Opens dialog to copy selected classes to a range of images"""
+		self.flush_label_writes()
 		if not selected_classes:
 			messagebox.showinfo("Information", "No classes selected")
 			return
@@ -8108,10 +8865,8 @@ class MainApp:
 
 		# 2. 제외 영역 확인 (화면 좌표 사용)
 		if self.exclusion_zone_enabled and self.exclusion_zone_manager:
-			in_exclusion_count = 0
-			for bbox in screen_bboxes:
-				if self.exclusion_zone_manager.is_bbox_in_exclusion_zone(bbox, zoom_ratio=self.zoom_ratio):
-					in_exclusion_count += 1
+			in_exclusion_count = int(self.exclusion_zone_manager.find_bboxes_in_exclusion_zone(
+				screen_bboxes, zoom_ratio=self.zoom_ratio).sum())
 
 			if in_exclusion_count > 0:
 				warning_messages.append(f"제외 영역 내 라벨: {in_exclusion_count}개")
@@ -8187,7 +8942,224 @@ class MainApp:
 		
 		# 입력 필드 초기화
 		self.page_entry.delete(0, tk.END)
+# === 규칙 일괄 적용 (GUI 없이 라벨 파일 정리) ===
+# 페이지 이동 시 load_bbox가 적용하는 자동 삭제/제외 영역/클래스 변경 규칙을
+# 이미지 리스트 전체에 프로세스 풀로 적용합니다.
+#   GTGEN.exe --apply-rules <이미지 폴더 또는 리스트.txt> [--dry-run] [--report 파일] [--workers N]
+
+class LabelRuleSet:
+	"""load_bbox 자동 필터링 규칙 묶음 (작업 디렉토리의 설정 파일에서 로드)"""
+
+	def __init__(self, base_dir, class_name_list):
+		self.class_names = class_name_list
+		self.auto_delete_manager = AutoDeleteClassManager(base_dir)
+		self.exclusion_zone_manager = ExclusionZoneManager(base_dir)
+		self.exclusion_zone_enabled = self.exclusion_zone_manager.load_enabled_state()
+		self.class_change_zone_manager = ClassChangeZoneManager(base_dir)
+
+	def needs_image_size(self):
+		"""영역 규칙이 있으면 bbox를 픽셀 좌표로 만들기 위해 이미지 크기가 필요"""
+		return bool((self.exclusion_zone_enabled and self.exclusion_zone_manager.global_zones)
+					or self.class_change_zone_manager.zones)
+
+	def apply(self, bbox_list):
+		"""load_bbox와 같은 순서로 규칙 적용
+		Returns:
+			tuple: (남은 bbox 리스트, {'auto_deleted', 'zone_deleted', 'class_changed'} 개수)
+		"""
+		stats = {'auto_deleted': 0, 'zone_deleted': 0, 'class_changed': 0}
+
+		# 1. 클래스 자동 삭제 (mode="auto"인 클래스만)
+		if self.auto_delete_manager.delete_class_config:
+			before_count = len(bbox_list)
+			bbox_list = self.auto_delete_manager.filter_bboxes(bbox_list, self.class_names, mode_filter="auto")
+			stats['auto_deleted'] = before_count - len(bbox_list)
+
+		# 2. 제외 영역 필터링
+		if self.exclusion_zone_enabled:
+			hits = self.exclusion_zone_manager.find_bboxes_in_exclusion_zone(bbox_list)
+			stats['zone_deleted'] = int(hits.sum())
+			bbox_list = [bbox for bbox, hit in zip(bbox_list, hits) if not hit]
+
+		# 3. 클래스 변경 영역
+		if self.class_change_zone_manager.zones:
+			bbox_list, stats['class_changed'] = self.class_change_zone_manager.apply_class_changes(
+				bbox_list, self.class_names)
+
+		return bbox_list, stats
+
+	def apply_to_label_file(self, image_path, dry_run=False):
+		"""이미지 하나의 라벨 파일에 규칙 적용 (바뀐 경우에만 원자적으로 다시 씀)
+
+		바뀌지 않은 라벨 줄과 읽을 수 없는 줄은 원문 그대로 유지하고,
+		클래스가 바뀐 줄은 클래스 ID만 교체합니다.
+		"""
+		label_path = image_to_label_path(image_path)
+		result = {'image': image_path, 'label': label_path, 'auto_deleted': 0, 'zone_deleted': 0, 'class_changed': 0}
+		try:
+			with open(label_path, 'r') as f:
+				lines = f.readlines()
+		except FileNotFoundError:
+			return result
+
+		imsize = (1, 1)
+		if self.needs_image_size():
+			with Image.open(image_path) as im:  # 헤더만 읽음
+				imsize = im.size
+
+		bbox_list = []
+		for line_index, l in enumerate(lines):
+			if not l.strip():
+				continue
+			try:
+				gt = [float(c) for c in l.replace('\r','').replace('\n','').split(' ')]
+				gt[0] = int(gt[0])
+				bbox_list.append(rel_to_abs_bbox(gt, imsize, self.class_names) + [line_index])
+			except (ValueError, IndexError):
+				continue  # 읽을 수 없는 줄은 그대로 유지
+
+		kept, stats = self.apply(bbox_list)
+		result.update(stats)
+		if not any(stats.values()):
+			return result
+
+		# 줄 번호 -> 남은 bbox (삭제된 줄은 빠짐)
+		kept_by_line = {bbox[7]: bbox for bbox in kept}
+		parsed_lines = {bbox[7] for bbox in bbox_list}
+		new_lines = []
+		for line_index, l in enumerate(lines):
+			if line_index not in parsed_lines:
+				new_lines.append(l)
+				continue
+			bbox = kept_by_line.get(line_index)
+			if bbox is None:
+				continue
+			values = l.split()
+			if int(float(values[0])) != bbox[2]:
+				l = ' '.join([str(bbox[2])] + values[1:]) + '\n'
+			new_lines.append(l if l.endswith('\n') else l + '\n')
+
+		if not dry_run:
+			write_text_atomic(label_path, ''.join(new_lines))
+		result['written'] = not dry_run
+		return result
+
+# 작업 프로세스별 규칙 (apply_rules_worker_init에서 생성)
+_worker_rules = None
+
+def apply_rules_worker_init(base_dir, class_name_list):
+	global _worker_rules
+	_worker_rules = LabelRuleSet(base_dir, class_name_list)
+
+def apply_rules_chunk(image_paths, dry_run=False):
+	"""작업 프로세스: 이미지 묶음의 라벨 파일에 규칙 적용"""
+	results = []
+	for image_path in image_paths:
+		try:
+			results.append(_worker_rules.apply_to_label_file(image_path, dry_run))
+		except Exception as e:
+			results.append({'image': image_path, 'error': str(e)})
+	return results
+
+def load_image_list(source):
+	"""이미지 폴더 또는 이미지 경로 리스트(.txt)에서 이미지 경로 읽기 (GUI와 같은 규칙)"""
+	if os.path.isdir(source):
+		cdir = os.path.abspath(source)
+		return [cdir + '/' + f for f in natsort.natsorted(os.listdir(cdir)) if f.find('.jpg') >= 0 or f.find('.png') >= 0]
+
+	for encoding in ['utf-8', 'cp949', 'euc-kr', 'latin-1', 'shift-jis']:
+		try:
+			with open(source, "rt", encoding=encoding) as file:
+				image_paths = []
+				for line in file:
+					line = line.strip()
+					line = line.replace('/s_mnt/253/','//192.168.79.253/')
+					if line:
+						image_paths.append(line)
+				return image_paths
+		except UnicodeDecodeError:
+			continue
+	raise ValueError(f"지원되는 인코딩으로 파일을 읽을 수 없습니다: {source}")
+
+def apply_rules_batch(source, base_dir=None, class_config=None, workers=None,
+					  dry_run=False, report_path=None, chunk_size=256):
+	"""자동 삭제/제외 영역/클래스 변경 규칙을 이미지 리스트 전체 라벨에 적용하고 변경 리포트 저장
+	Args:
+		source: 이미지 폴더 또는 이미지 경로 리스트(.txt)
+		base_dir: 규칙 설정 파일(.global_exclusion_zones.json 등)이 있는 폴더 (기본: 작업 디렉토리)
+		class_config: 클래스 설정 파일명 (기본: 마지막으로 사용한 설정)
+		workers: 작업 프로세스 수 (기본: CPU 수)
+		dry_run: True면 파일은 수정하지 않고 리포트만 작성
+		report_path: 리포트 JSON 경로 (기본: base_dir/rules_report_<시각>_<마이크로초>_<PID>.json)
+	Returns:
+		dict: 리포트 요약
+	"""
+	base_dir = base_dir or os.getcwd()
+
+	# 클래스 이름 (GUI와 같은 클래스 설정 사용, 없으면 기본 class_name)
+	class_name_list = list(class_name)
+	config_manager = ClassConfigManager(base_dir=base_dir)
+	config_file = class_config or config_manager.load_last_config()
+	# GUI 사용자의 마지막 사용 설정은 바꾸지 않음
+	if config_file and config_manager.load_config(config_file, remember=False):
+		class_name_list = config_manager.get_class_names()
+	print(f"[ApplyRules] 클래스 설정: {config_file or '기본값'} ({len(class_name_list)}개 클래스)")
+
+	image_paths = load_image_list(source)
+	chunks = [image_paths[i:i + chunk_size] for i in range(0, len(image_paths), chunk_size)]
+	print(f"[ApplyRules] 이미지 {len(image_paths)}개, 작업 {len(chunks)}개")
+
+	results = []
+	start = time.time()
+	with ProcessPoolExecutor(max_workers=workers, initializer=apply_rules_worker_init,
+							 initargs=(base_dir, class_name_list)) as executor:
+		for done, chunk_results in enumerate(executor.map(apply_rules_chunk, chunks, [dry_run] * len(chunks)), 1):
+			results.extend(chunk_results)
+			print(f"[ApplyRules] 처리 중: {done}/{len(chunks)} ({len(results)}개 이미지)")
+
+	changed = [r for r in results if r.get('auto_deleted') or r.get('zone_deleted') or r.get('class_changed')]
+	errors = [r for r in results if 'error' in r]
+	summary = {
+		'source': os.path.abspath(source),
+		'dry_run': dry_run,
+		'images': len(image_paths),
+		'changed_files': len(changed),
+		'auto_deleted': sum(r['auto_deleted'] for r in changed),
+		'zone_deleted': sum(r['zone_deleted'] for r in changed),
+		'class_changed': sum(r['class_changed'] for r in changed),
+		'errors': len(errors),
+		'seconds': round(time.time() - start, 2),
+	}
+
+	if report_path is None:
+		# 같은 초에 끝난 실행끼리 리포트를 덮어쓰지 않도록 마이크로초와 PID를 붙임
+		now = time.time()
+		report_path = os.path.join(base_dir, "rules_report_%s_%06d_%d.json" % (
+			time.strftime("%Y%m%d_%H%M%S", time.localtime(now)), int(now * 1e6) % 1000000, os.getpid()))
+	write_text_atomic(report_path, json.dumps({'summary': summary, 'changed': changed, 'errors': errors},
+											  indent=2, ensure_ascii=False))
+	print(f"[ApplyRules] 완료: {summary}")
+	print(f"[ApplyRules] 리포트 저장: {report_path}")
+	return summary
+
+def apply_rules_main(argv):
+	parser = argparse.ArgumentParser(prog="GTGEN --apply-rules",
+									 description="자동 삭제/제외 영역/클래스 변경 규칙을 라벨 파일에 일괄 적용")
+	parser.add_argument("source", help="이미지 폴더 또는 이미지 경로 리스트(.txt)")
+	parser.add_argument("--base-dir", default=None, help="규칙 설정 파일 폴더 (기본: 작업 디렉토리)")
+	parser.add_argument("--class-config", default=None, help="클래스 설정 파일명 (기본: 마지막 사용 설정)")
+	parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수")
+	parser.add_argument("--report", default=None, help="변경 리포트 JSON 경로")
+	parser.add_argument("--dry-run", action="store_true", help="파일 수정 없이 리포트만 작성")
+	args = parser.parse_args(argv)
+	apply_rules_batch(args.source, base_dir=args.base_dir, class_config=args.class_config,
+					  workers=args.workers, dry_run=args.dry_run, report_path=args.report)
+
 def main():
+    # 규칙 일괄 적용 모드 (GUI 없이 실행)
+    if len(sys.argv) >= 2 and sys.argv[1] == '--apply-rules':
+        apply_rules_main(sys.argv[2:])
+        return
     print("objmk version 2017-10-27")
     wdir = sys.argv[1] if len(sys.argv) == 2 else None
     # RemoveDefaultdll.exe 실행은 여기서 한 번만 실행
@@ -8196,10 +9168,13 @@ def main():
     except (OSError, PermissionError) as e:
         # UAC 거부 또는 권한 문제 시 무시하고 계속 진행
         print(f"RemoveDefaultdll.exe 실행 실패 (무시됨): {e}")
+    # 종료 처리는 GUI 실행 시에만 등록 (--apply-rules 모드와 작업 프로세스에서는 실행 안 함)
+    atexit.register(MainApp.goodbye)
     app = MainApp(wdir)
     return
 
 if __name__=="__main__":
+    multiprocessing.freeze_support()  # PyInstaller 빌드에서 작업 프로세스 실행 지원
     # 여기서 RemoveDefaultdll.exe 실행 코드 제거
     # os.startfile(BASE_DIR + "RemoveDefaultdll.exe") <- 이 줄 제거
     main()
@@ -13,18 +13,1480 @@ import time
 from collections import Counter, defaultdict,OrderedDict
 import random
 import gc
+import io
+import bisect
 import shutil
 import numpy as np
 import copy
 import threading
 import queue
 import logging
+import json
+import hashlib
+import sqlite3
+import multiprocessing
+from array import array
+from stat import S_ISREG
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
 try:
     import psutil
 except ImportError:
     pass  # psutil은 선택적 의존성
 
+
+def parse_label_lines(lines):
+    """
+    라벨 라인을 클래스 히스토그램과 박스 배열로 변환합니다.
+
+    Args:
+        lines: 라벨 파일의 라인 목록
+
+    Returns:
+        tuple: (클래스 토큰별 박스 개수 Counter,
+                (N, 6) float32 배열 [line_idx, class, x_center, y_center, width, height])
+    """
+    histogram = Counter()
+    boxes = []
+    for line_idx, line in enumerate(lines):
+        parts = line.split()
+        if not parts:
+            continue
+        try:
+            class_index_int = int(float(parts[0]))
+        except ValueError:
+            continue
+        if class_index_int < 0 or class_index_int >= 100:
+            continue
+        histogram[parts[0]] += 1
+        if len(parts) >= 5:
+            try:
+                boxes.append((line_idx, class_index_int, float(parts[1]), float(parts[2]),
+                              float(parts[3]), float(parts[4])))
+            except ValueError:
+                continue
+    return histogram, np.asarray(boxes, dtype=np.float32).reshape(-1, 6)
+
+
+LABEL_ENCODINGS = ('utf-8', 'cp949', 'euc-kr', 'latin-1')
+
+
+class LabelReader:
+    """
+    라벨 파일을 바이트로 한 번만 읽어 줄 목록으로 디코딩하는 리더
+
+    인코딩은 파일마다 여러 번 열어 보지 않고 데이터셋 단위로 한 번 정합니다.
+    처음 만난 비 ASCII 파일에서 LABEL_ENCODINGS 순서로 성공한 인코딩을 고정하고,
+    이후 파일은 그 인코딩을 먼저 시도합니다. 대부분의 라벨은 ASCII이므로
+    메모리에서 바로 변환됩니다.
+    """
+
+    def __init__(self, encoding=None):
+        self.encoding = encoding
+
+    def decode(self, data):
+        """바이트를 텍스트로 변환합니다 (BOM 우선, ASCII는 바로 변환)."""
+        if data.startswith(b'\xef\xbb\xbf'):
+            return data.decode('utf-8-sig', errors='replace')
+        if data.startswith(b'\xff\xfe') or data.startswith(b'\xfe\xff'):
+            return data.decode('utf-16', errors='replace')
+        if data.isascii():
+            return data.decode('ascii')
+
+        encodings = LABEL_ENCODINGS
+        if self.encoding is not None:
+            encodings = (self.encoding,) + tuple(enc for enc in LABEL_ENCODINGS if enc != self.encoding)
+        for enc in encodings:
+            try:
+                text = data.decode(enc)
+            except UnicodeDecodeError:
+                continue
+            if self.encoding is None:
+                self.encoding = enc
+                print(f"라벨 인코딩 결정: {enc}")
+            return text
+        return data.decode('utf-8', errors='replace')
+
+    def read_bytes(self, label_path):
+        with open(label_path, 'rb') as f:
+            return f.read()
+
+    def split_lines(self, data):
+        """바이트를 readlines()와 같은 형태(줄바꿈 포함, 유니버설 개행)의 줄 목록으로 변환합니다."""
+        if not data:
+            return []
+        return io.StringIO(self.decode(data), newline=None).readlines()
+
+    def read_lines(self, label_path):
+        return self.split_lines(self.read_bytes(label_path))
+
+
+def boxes_to_xyxy(boxes):
+    """(N, 6) 박스 배열의 정규화 중심좌표/크기를 (N, 4) x1y1x2y2로 변환합니다."""
+    xc, yc, w, h = boxes[:, 2], boxes[:, 3], boxes[:, 4], boxes[:, 5]
+    return np.stack([xc - w / 2, yc - h / 2, xc + w / 2, yc + h / 2], axis=1)
+
+
+def pairwise_iou(boxes_a, boxes_b, epsilon=1e-6):
+    """
+    두 박스 집합 간의 IoU 행렬을 브로드캐스팅으로 계산합니다.
+    ImageViewer.calculate_iou와 같은 규칙(좌표 정렬, 퇴화 박스는 0)을 따릅니다.
+
+    Args:
+        boxes_a: (N, 4) x1y1x2y2 박스
+        boxes_b: (M, 4) x1y1x2y2 박스
+
+    Returns:
+        np.ndarray: (N, M) IoU 행렬 (0~1)
+    """
+    a = np.asarray(boxes_a, dtype=np.float64).reshape(-1, 4)
+    b = np.asarray(boxes_b, dtype=np.float64).reshape(-1, 4)
+    ax1, ax2 = np.minimum(a[:, 0], a[:, 2]), np.maximum(a[:, 0], a[:, 2])
+    ay1, ay2 = np.minimum(a[:, 1], a[:, 3]), np.maximum(a[:, 1], a[:, 3])
+    bx1, bx2 = np.minimum(b[:, 0], b[:, 2]), np.maximum(b[:, 0], b[:, 2])
+    by1, by2 = np.minimum(b[:, 1], b[:, 3]), np.maximum(b[:, 1], b[:, 3])
+
+    area_a = (ax2 - ax1) * (ay2 - ay1)
+    area_b = (bx2 - bx1) * (by2 - by1)
+    valid_a = (ax2 - ax1 > epsilon) & (ay2 - ay1 > epsilon) & (area_a > epsilon)
+    valid_b = (bx2 - bx1 > epsilon) & (by2 - by1 > epsilon) & (area_b > epsilon)
+
+    inter_w = np.minimum(ax2[:, None], bx2[None, :]) - np.maximum(ax1[:, None], bx1[None, :])
+    inter_h = np.minimum(ay2[:, None], by2[None, :]) - np.maximum(ay1[:, None], by1[None, :])
+    intersection = np.where((inter_w > 0) & (inter_h > 0), inter_w * inter_h, 0.0)
+    union = area_a[:, None] + area_b[None, :] - intersection
+
+    iou = np.where(union > epsilon, intersection / np.maximum(union, epsilon), 0.0)
+    iou[~valid_a, :] = 0.0
+    iou[:, ~valid_b] = 0.0
+    return np.clip(iou, 0.0, 1.0)
+
+
+def compute_box_overlap(boxes, main_class_idx, target_class_idx, iou_threshold):
+    """
+    한 라벨 파일의 박스 배열에서 주 클래스 박스별 대상 클래스 겹침 정보를 계산합니다.
+
+    Args:
+        boxes: (N, 6) 박스 배열 [line_idx, class, x_center, y_center, width, height]
+        main_class_idx: 주 클래스
+        target_class_idx: 대상 클래스 (같으면 자기 자신과의 비교는 제외)
+        iou_threshold: 겹침으로 판단할 최소 IoU
+
+    Returns:
+        tuple: ImageViewer.check_box_overlap과 같은
+               (any_overlap, max_iou, detailed_overlap_info, all_boxes_overlap_info)
+    """
+    main_class_idx = int(main_class_idx)
+    target_class_idx = int(target_class_idx)
+    if not len(boxes):
+        return False, 0.0, [], []
+
+    # 정규화 좌표 범위(0~1)를 벗어난 박스는 제외
+    coords = boxes[:, 2:6]
+    boxes = boxes[((coords >= 0) & (coords <= 1)).all(axis=1)]
+    classes = boxes[:, 1].astype(np.int64)
+    main = boxes[classes == main_class_idx]
+    if not len(main):
+        return False, 0.0, [], []
+    target = boxes[classes == target_class_idx]
+
+    iou = pairwise_iou(boxes_to_xyxy(main), boxes_to_xyxy(target))
+    if main_class_idx == target_class_idx:
+        np.fill_diagonal(iou, -1.0)  # 같은 박스끼리는 비교하지 않음
+    hits = iou >= iou_threshold
+
+    main_lines = main[:, 0].astype(np.int64).tolist()
+    target_lines = target[:, 0].astype(np.int64).tolist()
+    all_boxes_overlap_info = []
+    detailed_overlap_info = []
+    max_overall_iou = 0.0
+    for i in range(len(main)):
+        hit_idx = np.flatnonzero(hits[i])
+        overlapping_boxes = [{
+            'target_box_index': int(j),
+            'original_line_index': target_lines[j],
+            'iou': float(iou[i, j])
+        } for j in hit_idx]
+        max_iou = max(0.0, float(iou[i, hit_idx].max())) if len(hit_idx) else 0.0
+        box_overlap_info = {
+            'box_index': i,
+            'original_line_index': main_lines[i],
+            'has_overlap': bool(len(hit_idx)),
+            'max_iou': max_iou,
+            'overlapping_boxes': overlapping_boxes
+        }
+        all_boxes_overlap_info.append(box_overlap_info)
+        max_overall_iou = max(max_overall_iou, max_iou)
+        if box_overlap_info['has_overlap']:
+            detailed_overlap_info.append({
+                'main_box_index': i,
+                'max_iou': max_iou,
+                'overlapping_boxes': overlapping_boxes
+            })
+
+    return bool(detailed_overlap_info), max_overall_iou, detailed_overlap_info, all_boxes_overlap_info
+
+
+class BoxSpatialIndex:
+    """
+    데이터셋 전체 박스에 대한 균일 격자 해시 (정규화 중심 좌표 기준)
+
+    라벨 파일별로 파싱된 박스를 한 번만 모아 두고, "이 위치의 박스 찾기"를
+    주변 격자 칸 조회 + 소수 후보 검사로 처리합니다. 파일별 mtime/size를 기억해
+    update() 때 바뀐 파일만 다시 읽습니다. image_size_of를 넘기면 박스가 있는 파일의
+    이미지 크기도 함께 기억하고 최소 (폭, 높이)를 유지합니다 (픽셀 허용 오차 조회용).
+    """
+
+    def __init__(self, cell_size=1.0 / 64):
+        self.cell_size = cell_size
+        self.grid_n = int(np.ceil(1.0 / cell_size))
+        self.signatures = {}  # label_path -> (mtime_ns, size)
+        self.file_boxes = {}  # label_path -> (N, 6) 박스 배열
+        self.paths = []
+        self.boxes = np.empty((0, 6), dtype=np.float32)
+        self.file_ids = np.empty(0, dtype=np.int32)
+        self.cells = {}
+        self.built = False
+        self.file_sizes = {}  # label_path -> (폭, 높이) 또는 None (박스가 있는 파일만)
+        self.min_size = None  # file_sizes 중 최소 (폭, 높이)
+        self._min_stale = False
+
+    def __len__(self):
+        return len(self.boxes)
+
+    def update(self, label_paths, read_boxes, progress=None, image_size_of=None):
+        """
+        라벨 목록과 인덱스를 동기화합니다. stat이 바뀐 파일만 read_boxes로 다시 읽습니다.
+
+        Args:
+            label_paths: 인덱스에 포함할 라벨 경로 목록
+            read_boxes: 라벨 경로 -> (N, 6) 박스 배열을 반환하는 함수
+            progress: (처리 수, 전체 수)를 받는 진행 콜백 (선택)
+            image_size_of: 라벨 경로 -> (폭, 높이) 또는 None 을 반환하는 함수 (선택).
+                           다시 읽은 파일과 아직 크기를 모르는 파일만 조회합니다.
+
+        Returns:
+            int: 다시 읽은 파일 수
+        """
+        total = len(label_paths)
+        live = set()
+        changed = 0
+        for i, label_path in enumerate(label_paths):
+            if progress is not None and i % 500 == 0:
+                progress(i, total)
+            try:
+                st = os.stat(label_path)
+            except OSError:
+                continue
+            live.add(label_path)
+            signature = (st.st_mtime_ns, st.st_size)
+            if self.signatures.get(label_path) == signature:
+                if (image_size_of is not None and label_path not in self.file_sizes
+                        and len(self.file_boxes[label_path])):
+                    self._set_size(label_path, image_size_of(label_path))
+                continue
+            try:
+                boxes = read_boxes(label_path)
+            except (OSError, ValueError) as e:
+                print(f"공간 인덱스 라벨 읽기 오류 ({label_path}): {e}")
+                continue
+            self.file_boxes[label_path] = boxes
+            self.signatures[label_path] = signature
+            if not len(boxes):
+                self._drop_size(label_path)
+            elif image_size_of is not None:
+                self._set_size(label_path, image_size_of(label_path))
+            else:
+                self._drop_size(label_path)  # 다음 크기 조회 때 다시 확인
+            changed += 1
+
+        removed = [path for path in self.file_boxes if path not in live]
+        for path in removed:
+            del self.file_boxes[path]
+            self.signatures.pop(path, None)
+            self._drop_size(path)
+
+        if self._min_stale:
+            # 최소값이던 파일이 빠졌을 때만 메모리의 크기 목록에서 다시 계산 (파일은 읽지 않음)
+            sizes = [size for size in self.file_sizes.values() if size]
+            self.min_size = (min(w for w, h in sizes), min(h for w, h in sizes)) if sizes else None
+            self._min_stale = False
+        if changed or removed or not self.built:
+            self._rebuild()
+        if progress is not None:
+            progress(total, total)
+        return changed
+
+    def _set_size(self, label_path, size):
+        self._drop_size(label_path)
+        self.file_sizes[label_path] = size
+        if size:
+            if self.min_size is None:
+                self.min_size = tuple(size)
+            else:
+                self.min_size = (min(self.min_size[0], size[0]), min(self.min_size[1], size[1]))
+
+    def _drop_size(self, label_path):
+        size = self.file_sizes.pop(label_path, None)
+        if size and self.min_size and (size[0] == self.min_size[0] or size[1] == self.min_size[1]):
+            self._min_stale = True
+
+    def discard(self, label_path):
+        """라벨 파일이 수정되었음을 표시합니다 (다음 update에서 다시 읽음)."""
+        self.signatures.pop(label_path, None)
+
+    def _rebuild(self):
+        self.paths = list(self.file_boxes)
+        arrays = [self.file_boxes[path] for path in self.paths]
+        counts = [len(boxes) for boxes in arrays]
+        if arrays and sum(counts):
+            self.boxes = np.concatenate(arrays).astype(np.float32, copy=False)
+        else:
+            self.boxes = np.empty((0, 6), dtype=np.float32)
+        self.file_ids = np.repeat(np.arange(len(self.paths), dtype=np.int32), counts)
+
+        keys = self._cell_of(self.boxes[:, 2], self.boxes[:, 3])
+        order = np.argsort(keys, kind='stable')
+        unique_keys, starts = np.unique(keys[order], return_index=True)
+        ends = np.append(starts[1:], len(order))
+        self.cells = {int(key): order[start:end] for key, start, end in zip(unique_keys, starts, ends)}
+        self.built = True
+
+    def _cell_range(self, low, high):
+        first = int(np.clip(np.floor(low / self.cell_size), 0, self.grid_n - 1))
+        last = int(np.clip(np.floor(high / self.cell_size), 0, self.grid_n - 1))
+        return range(first, last + 1)
+
+    def _cell_of(self, x, y):
+        gx = np.clip(np.floor(x / self.cell_size), 0, self.grid_n - 1).astype(np.int64)
+        gy = np.clip(np.floor(y / self.cell_size), 0, self.grid_n - 1).astype(np.int64)
+        return gx * self.grid_n + gy
+
+    def query_center(self, x_center, y_center, radius_x, radius_y, classes=None):
+        """
+        중심 좌표가 (x_center ± radius_x, y_center ± radius_y) 안에 있는 박스의 행 번호를 반환합니다.
+
+        Args:
+            classes: 허용할 클래스 목록 (None이면 전체)
+        """
+        candidates = [self.cells[gx * self.grid_n + gy]
+                      for gx in self._cell_range(x_center - radius_x, x_center + radius_x)
+                      for gy in self._cell_range(y_center - radius_y, y_center + radius_y)
+                      if gx * self.grid_n + gy in self.cells]
+        if not candidates:
+            return np.empty(0, dtype=np.int64)
+        rows = np.concatenate(candidates)
+        boxes = self.boxes[rows]
+        mask = (np.abs(boxes[:, 2] - x_center) <= radius_x) & (np.abs(boxes[:, 3] - y_center) <= radius_y)
+        if classes is not None:
+            mask &= np.isin(boxes[:, 1].astype(np.int64), list(classes))
+        return np.sort(rows[mask])
+
+    def query_pixel_center(self, x_center, y_center, pixel_tolerance, classes=None):
+        """
+        중심이 자기 이미지의 픽셀 기준 ±pixel_tolerance 안에 있는 박스의 행 번호를 반환합니다.
+
+        이미지마다 해상도가 다르므로 가장 작은 이미지로 정한(가장 넓은) 정규화 반경으로 후보를 조회하고,
+        후보마다 update() 때 기억한 이미지 크기로 다시 확인합니다 (크기를 모르는 파일은 제외).
+
+        Args:
+            classes: 허용할 클래스 목록 (None이면 전체)
+        """
+        min_size = self.min_size
+        if min_size is None:
+            return np.empty(0, dtype=np.int64)
+        radius_x = pixel_tolerance / max(min_size[0], 1) + 1e-6
+        radius_y = pixel_tolerance / max(min_size[1], 1) + 1e-6
+        keep = []
+        for row in self.query_center(x_center, y_center, radius_x, radius_y, classes):
+            size = self.file_sizes.get(self.paths[self.file_ids[row]])
+            if size is None:
+                continue
+            box = self.boxes[row]
+            if (abs(x_center - float(box[2])) * size[0] <= pixel_tolerance and
+                    abs(y_center - float(box[3])) * size[1] <= pixel_tolerance):
+                keep.append(row)
+        return np.asarray(keep, dtype=np.int64)
+
+    def row_info(self, row):
+        """행 번호를 (label_path, line_idx, class, x_center, y_center, width, height)로 변환합니다."""
+        box = self.boxes[row]
+        return (self.paths[self.file_ids[row]], int(box[0]), int(box[1]),
+                float(box[2]), float(box[3]), float(box[4]), float(box[5]))
+
+
+class LabelIndex:
+    """
+    리스트 파일 옆에 저장되는 영구 라벨 인덱스 (SQLite)
+
+    라벨 경로별 mtime/size, 클래스 히스토그램, 파싱된 박스를 보관합니다.
+    리스트를 다시 열 때 stat이 바뀐 파일만 다시 파싱하면 됩니다.
+    """
+    SCHEMA_VERSION = "1"
+    INDEX_SUFFIX = ".labelindex.db"
+
+    def __init__(self, list_path):
+        self.db_path = list_path + self.INDEX_SUFFIX
+        self.lock = threading.Lock()
+        self.conn = None
+        self.entries = {}  # label_path -> (mtime_ns, size, status, histogram)
+        self.pending = {}  # label_path -> 저장 대기 중인 행
+
+    def open(self):
+        """인덱스 DB를 열고 박스를 제외한 항목을 메모리로 읽어옵니다."""
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        row = self.conn.execute("SELECT value FROM meta WHERE key='schema'").fetchone()
+        if row is None or row[0] != self.SCHEMA_VERSION:
+            self.conn.execute("DROP TABLE IF EXISTS labels")
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('schema', ?)",
+                              (self.SCHEMA_VERSION,))
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS labels ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, "
+            "status TEXT, histogram TEXT, boxes BLOB)"
+        )
+        self.conn.commit()
+
+        for path, mtime_ns, size, status, histogram in self.conn.execute(
+                "SELECT path, mtime_ns, size, status, histogram FROM labels"):
+            self.entries[path] = (mtime_ns, size, status, self._decode_histogram(histogram))
+        return self
+
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+    @staticmethod
+    def _encode_histogram(histogram):
+        return " ".join(f"{token}:{count}" for token, count in histogram.items())
+
+    @staticmethod
+    def _decode_histogram(text):
+        histogram = Counter()
+        for item in (text or "").split():
+            token, _, count = item.rpartition(":")
+            histogram[token] = int(count)
+        return histogram
+
+    def lookup(self, label_path, st):
+        """stat이 일치하면 (status, histogram)을, 아니면 None을 반환합니다."""
+        entry = self.pending.get(label_path) or self.entries.get(label_path)
+        if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+            return None
+        return entry[2], entry[3]
+
+    def put(self, label_path, st, status, histogram, boxes):
+        """새로 파싱한 결과를 저장 대기열에 추가합니다 (작업자 스레드에서 호출 가능)."""
+        self.put_values(label_path, st.st_mtime_ns, st.st_size, status, histogram, boxes)
+
+    def put_values(self, label_path, mtime_ns, size, status, histogram, boxes):
+        with self.lock:
+            self.pending[label_path] = (mtime_ns, size, status, histogram,
+                                        np.ascontiguousarray(boxes, dtype=np.float32))
+
+    def get_boxes(self, label_path, st=None):
+        """
+        인덱스에 저장된 박스 배열을 반환합니다.
+
+        st가 주어지면 stat이 일치하는 경우에만 반환하고, 없으면 None을 반환합니다.
+        """
+        with self.lock:
+            entry = self.pending.get(label_path)
+            if entry is not None:
+                if st is None or (entry[0] == st.st_mtime_ns and entry[1] == st.st_size):
+                    return entry[4]
+                return None
+            if self.conn is None:
+                return None
+            row = self.conn.execute("SELECT mtime_ns, size, boxes FROM labels WHERE path=?",
+                                    (label_path,)).fetchone()
+        if row is None:
+            return None
+        if st is not None and (row[0] != st.st_mtime_ns or row[1] != st.st_size):
+            return None
+        return np.frombuffer(row[2] or b"", dtype=np.float32).reshape(-1, 6)
+
+    def commit(self, live_paths=None):
+        """
+        대기 중인 항목을 한 트랜잭션으로 기록합니다.
+
+        live_paths가 주어지면 현재 리스트에 없는 항목은 인덱스에서 제거합니다.
+        """
+        with self.lock:
+            if self.conn is None:
+                return 0, 0
+            rows = [(path, e[0], e[1], e[2], self._encode_histogram(e[3]), e[4].tobytes())
+                    for path, e in self.pending.items()]
+            stale = []
+            if live_paths is not None:
+                live = set(live_paths)
+                stale = [(path,) for path in self.entries if path not in live]
+            with self.conn:
+                self.conn.executemany("INSERT OR REPLACE INTO labels VALUES (?, ?, ?, ?, ?, ?)", rows)
+                if stale:
+                    self.conn.executemany("DELETE FROM labels WHERE path=?", stale)
+            for path, e in self.pending.items():
+                self.entries[path] = e[:4]
+            for (path,) in stale:
+                self.entries.pop(path, None)
+            self.pending = {}
+        return len(rows), len(stale)
+
+
+def scan_label_chunk(chunk_start, label_paths, cached_entries):
+    """
+    (프로세스 풀 작업자) 라벨 파일 묶음에서 클래스 정보를 수집합니다.
+
+    결과는 파일 경로 대신 전체 목록 기준 파일 번호 배열로 돌려주어 프로세스 간
+    전송량을 줄입니다. stat이 일치하는 라벨 인덱스 항목은 파싱하지 않습니다.
+
+    Args:
+        chunk_start: 묶음 첫 파일의 전체 목록 기준 번호
+        label_paths: 라벨 경로 목록
+        cached_entries: 라벨 인덱스 항목 {label_path: (mtime_ns, size, status, histogram)}
+
+    Returns:
+        dict: 'class_files' {클래스 토큰: 파일 번호 array (박스 수만큼 반복)},
+              'valid' 유효 파일 수, 'error_stats' {오류 종류: 개수},
+              'parsed' 새로 파싱한 [(파일 번호, mtime_ns, size, status, histogram, boxes 바이트)],
+              'mtimes'/'sizes' 파일별 stat array (없는 파일은 -1)
+    """
+    reader = LabelReader()
+    class_files = {}
+    error_stats = Counter()
+    parsed = []
+    valid = 0
+    mtimes = array('q', [-1]) * len(label_paths)
+    sizes = array('q', [-1]) * len(label_paths)
+    for offset, label_path in enumerate(label_paths):
+        file_id = chunk_start + offset
+        try:
+            st = os.stat(label_path)
+        except OSError:
+            st = None
+        if st is None or not S_ISREG(st.st_mode):
+            error_stats["파일 없음"] += 1
+            continue
+        mtimes[offset] = st.st_mtime_ns
+        sizes[offset] = st.st_size
+
+        cached = cached_entries.get(label_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            status, histogram = cached[2], cached[3]
+        else:
+            try:
+                lines = reader.read_lines(label_path)
+                histogram, boxes = parse_label_lines(lines)
+                if not lines:
+                    status = "빈 파일"
+                elif histogram:
+                    status = "성공"
+                else:
+                    status = "유효 라벨 없음"
+                parsed.append((file_id, st.st_mtime_ns, st.st_size, status, dict(histogram), boxes.tobytes()))
+            except (OSError, ValueError) as e:
+                status, histogram = f"오류: {e}", {}
+
+        for class_index, count in histogram.items():
+            class_files.setdefault(class_index, array('i')).extend([file_id] * count)
+        if histogram:
+            valid += 1
+        elif status.startswith("오류:"):
+            error_stats["읽기 오류"] += 1
+        else:
+            error_stats[status] += 1
+    return {'class_files': class_files, 'valid': valid, 'error_stats': dict(error_stats), 'parsed': parsed,
+            'mtimes': mtimes, 'sizes': sizes}
+
+
+def stat_label_files(label_paths, workers=4):
+    """
+    라벨 파일들의 (mtime_ns, size)를 디렉터리 목록 단위로 한 번에 읽습니다.
+
+    파일마다 os.stat을 부르는 대신 디렉터리별 os.scandir 결과를 쓰고 (Windows에서는
+    목록에 stat이 포함됨), 여러 디렉터리는 스레드 풀에서 동시에 읽습니다.
+    목록에서 찾지 못한 이름(대소문자 차이 등)만 개별 stat으로 확인하며, 없는 파일은 결과에서 빠집니다.
+
+    Returns:
+        dict: {label_path: (mtime_ns, size)}
+    """
+    by_dir = defaultdict(dict)
+    for label_path in label_paths:
+        directory, name = os.path.split(label_path)
+        by_dir[directory][name] = label_path
+
+    def scan_dir(item):
+        directory, names = item
+        found = {}
+        try:
+            with os.scandir(directory or ".") as it:
+                for entry in it:
+                    label_path = names.get(entry.name)
+                    if label_path is None:
+                        continue
+                    try:
+                        if entry.is_file():
+                            st = entry.stat()
+                            found[label_path] = (st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        if len(found) < len(names):
+            for label_path in names.values():
+                if label_path in found:
+                    continue
+                try:
+                    st = os.stat(label_path)
+                except OSError:
+                    continue
+                if S_ISREG(st.st_mode):
+                    found[label_path] = (st.st_mtime_ns, st.st_size)
+        return found
+
+    signatures = {}
+    if len(by_dir) <= 1 or workers <= 1:
+        for item in by_dir.items():
+            signatures.update(scan_dir(item))
+        return signatures
+    with ThreadPoolExecutor(max_workers=min(workers, len(by_dir)), thread_name_prefix="LabelStat") as executor:
+        for found in executor.map(scan_dir, by_dir.items()):
+            signatures.update(found)
+    return signatures
+
+
+class ThumbnailCache:
+    """
+    디스크 기반 썸네일 캐시 (메모리 LRU + SQLite)
+
+    이미지 경로, mtime, 목표 크기를 키로 미리 축소한 JPEG를 로컬 디스크에 보관합니다.
+    캐시 미스는 PIL JPEG draft 모드로 축소 디코딩하므로 원본 전체를 풀지 않습니다.
+    메모리 캐시는 프리페치 작업자 스레드와 UI 스레드가 함께 쓰므로 반드시 아래 메서드(lock 보유)로만 접근합니다.
+    """
+    DEFAULT_DIR = os.path.join(os.path.expanduser("~"), ".label_check_cache")
+
+    def __init__(self, memory_limit=2000, cache_dir=None,
+                 max_entries=300000, commit_interval=50):
+        self.memory_cache = OrderedDict()
+        self.memory_limit = memory_limit
+        self.max_entries = max_entries
+        self.commit_interval = commit_interval
+        self.lock = threading.RLock()
+        self.stats = {'memory': 0, 'disk': 0, 'decode': 0}
+        self.uncommitted = 0
+        self.inserted = 0
+        self.conn = None
+        try:
+            cache_dir = cache_dir or self.DEFAULT_DIR
+            os.makedirs(cache_dir, exist_ok=True)
+            self.conn = sqlite3.connect(os.path.join(cache_dir, "thumbnails.db"), check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS thumbs (key TEXT PRIMARY KEY, data BLOB, created REAL)")
+            self.conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            print(f"썸네일 디스크 캐시를 사용할 수 없습니다 (메모리 캐시만 사용): {e}")
+            self.conn = None
+
+    @staticmethod
+    def make_key(img_path, mtime_ns, size):
+        return f"{img_path}|{mtime_ns}|{size[0]}x{size[1]}"
+
+    def get(self, img_path, size=(200, 200)):
+        """
+        축소된 썸네일을 반환합니다. 호출자가 그림을 그려도 되도록 항상 복사본을 반환합니다.
+
+        Raises:
+            OSError: 이미지를 열거나 디코딩할 수 없는 경우
+        """
+        key = self.make_key(img_path, os.stat(img_path).st_mtime_ns, size)
+
+        with self.lock:
+            thumb = self.memory_cache.get(key)
+            if thumb is not None:
+                self.memory_cache.move_to_end(key)
+                self.stats['memory'] += 1
+                return thumb.copy()
+
+            row = None
+            if self.conn is not None:
+                row = self.conn.execute("SELECT data FROM thumbs WHERE key=?", (key,)).fetchone()
+
+        if row is not None:
+            thumb = Image.open(io.BytesIO(row[0]))
+            thumb.load()
+            self.stats['disk'] += 1
+        else:
+            thumb = self.decode(img_path, size)
+            self.stats['decode'] += 1
+            self._store_disk(key, thumb)
+
+        self.put(key, thumb)
+        return thumb.copy()
+
+    def __len__(self):
+        with self.lock:
+            return len(self.memory_cache)
+
+    def put(self, key, thumb):
+        """메모리 캐시에 항목을 넣고 상한을 넘으면 오래된 항목부터 제거합니다."""
+        with self.lock:
+            self.memory_cache[key] = thumb
+            self.memory_cache.move_to_end(key)
+            while len(self.memory_cache) > self.memory_limit:
+                self.memory_cache.popitem(last=False)
+
+    def touch(self, key):
+        """항목을 가장 최근 사용으로 옮깁니다 (없으면 무시)."""
+        with self.lock:
+            if key in self.memory_cache:
+                self.memory_cache.move_to_end(key)
+
+    def trim(self, target_size):
+        """메모리 캐시를 target_size개 이하로 줄이고 제거한 개수를 반환합니다."""
+        removed = 0
+        with self.lock:
+            while len(self.memory_cache) > target_size:
+                self.memory_cache.popitem(last=False)
+                removed += 1
+        return removed
+
+    def discard_where(self, predicate):
+        """predicate(key)가 참인 메모리 캐시 항목을 제거하고 제거한 개수를 반환합니다."""
+        with self.lock:
+            keys = [key for key in self.memory_cache if predicate(key)]
+            for key in keys:
+                del self.memory_cache[key]
+        return len(keys)
+
+    @staticmethod
+    def decode(img_path, size):
+        """JPEG draft 모드로 목표 크기에 가깝게 축소 디코딩한 뒤 리사이즈합니다."""
+        with Image.open(img_path) as img:
+            if img.format == 'JPEG':
+                img.draft('RGB', size)
+            if img.mode not in ('RGB', 'L'):
+                img = img.convert('RGB')
+            return img.resize(size)
+
+    def _store_disk(self, key, thumb):
+        if self.conn is None:
+            return
+        buffer = io.BytesIO()
+        thumb.save(buffer, format='JPEG', quality=90)
+        with self.lock:
+            try:
+                self.conn.execute("INSERT OR REPLACE INTO thumbs VALUES (?, ?, ?)",
+                                  (key, buffer.getvalue(), time.time()))
+                self.uncommitted += 1
+                self.inserted += 1
+                if self.uncommitted >= self.commit_interval:
+                    self.flush()
+                if self.inserted % 1000 == 0:
+                    self.prune()
+            except sqlite3.Error as e:
+                print(f"썸네일 캐시 저장 오류: {e}")
+
+    def flush(self):
+        """대기 중인 디스크 기록을 커밋합니다."""
+        with self.lock:
+            if self.conn is not None and self.uncommitted:
+                self.conn.commit()
+                self.uncommitted = 0
+
+    def prune(self):
+        """항목 수가 상한을 넘으면 오래된 썸네일부터 삭제합니다."""
+        with self.lock:
+            if self.conn is None:
+                return
+            count = self.conn.execute("SELECT COUNT(*) FROM thumbs").fetchone()[0]
+            excess = count - int(self.max_entries * 0.9)
+            if count > self.max_entries and excess > 0:
+                self.conn.execute(
+                    "DELETE FROM thumbs WHERE key IN (SELECT key FROM thumbs ORDER BY created LIMIT ?)",
+                    (excess,))
+                self.conn.commit()
+                self.uncommitted = 0
+
+
+PERFORMANCE_SETTINGS_PATH = os.path.join(ThumbnailCache.DEFAULT_DIR, "performance.json")
+
+
+def load_performance_settings(path=PERFORMANCE_SETTINGS_PATH):
+    """
+    사용자 성능 설정 파일(JSON)을 읽습니다. 파일이 없거나 잘못되었으면 빈 사전을 반환합니다.
+
+    예: {"prefetch_depth": 2}
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            settings = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"성능 설정 파일을 읽을 수 없습니다 (기본값 사용): {path} - {e}")
+        return {}
+    return settings if isinstance(settings, dict) else {}
+
+
+class GridItem:
+    """
+    이미지 그리드 한 칸의 페이지 모델 항목
+
+    위젯과 분리된 표시 정보입니다. box가 있으면 정규화 좌표 (x, y, w, h)의 박스 크롭,
+    없으면 전체 이미지 썸네일을 표시하며, 이미지는 셀에 연결될 때 그립니다.
+    """
+    __slots__ = ("label_path", "img_path", "row", "col", "number", "class_idx",
+                 "line_idx", "box_idx", "box", "image", "border")
+
+    def __init__(self, label_path, img_path, row, col, number, class_idx=None,
+                 line_idx=None, box_idx=None, box=None, image=None):
+        self.label_path = label_path
+        self.img_path = img_path
+        self.row = row
+        self.col = col
+        self.number = number        # 화면 표시 번호
+        self.class_idx = class_idx
+        self.line_idx = line_idx    # 라벨 파일의 실제 라인 인덱스 (전체 이미지는 None)
+        self.box_idx = box_idx      # 같은 클래스 내 박스 순번 (주석 표시용)
+        self.box = box
+        self.image = image          # 미리 만든 크롭/대체 이미지 (없으면 표시 시점에 로드)
+        self.border = "white"       # 선택되지 않았을 때의 테두리 색
+
+    @property
+    def key(self):
+        """선택 상태 키 (label_path, line_idx)"""
+        return (self.label_path, self.line_idx)
+
+    @property
+    def size(self):
+        return PagePrefetcher.CROP_SIZE if self.box is not None else PagePrefetcher.THUMB_SIZE
+
+
+def grid_layout(items, pad=10, border=4):
+    """
+    항목의 (row, col)과 표시 크기로 셀 영역을 계산합니다 (tk grid와 같은 배치, 빈 행/열은 0).
+
+    Returns:
+        tuple: (positions, row_spans, width, height)
+            positions: 항목별 (x, y, w, h) 셀 영역
+            row_spans: [(top, bottom, [항목 인덱스])] 위에서부터 정렬
+    """
+    extra = 2 * (pad + border)
+    col_widths = {}
+    row_heights = {}
+    for item in items:
+        w, h = item.size
+        col_widths[item.col] = max(col_widths.get(item.col, 0), w + extra)
+        row_heights[item.row] = max(row_heights.get(item.row, 0), h + extra)
+
+    col_x = {}
+    width = 0
+    for col in sorted(col_widths):
+        col_x[col] = width
+        width += col_widths[col]
+    row_y = {}
+    height = 0
+    for row in sorted(row_heights):
+        row_y[row] = height
+        height += row_heights[row]
+
+    positions = []
+    members = defaultdict(list)
+    for index, item in enumerate(items):
+        positions.append((col_x[item.col], row_y[item.row], col_widths[item.col], row_heights[item.row]))
+        members[item.row].append(index)
+    row_spans = [(row_y[row], row_y[row] + row_heights[row], members[row]) for row in sorted(row_heights)]
+    return positions, row_spans, width, height
+
+
+def visible_grid_items(row_spans, top, bottom, margin=1):
+    """보이는 영역 [top, bottom)에 걸친 행과 위아래 margin개 행의 항목 인덱스 집합"""
+    if not row_spans:
+        return set()
+    first = bisect.bisect_right([span[1] for span in row_spans], top)
+    last = bisect.bisect_left([span[0] for span in row_spans], bottom) - 1
+    first = max(0, first - margin)
+    last = min(len(row_spans) - 1, max(last, first) + margin)
+    return {index for span in row_spans[first:last + 1] for index in span[2]}
+
+
+def grid_pool_capacity(row_spans, view_height, margin=1):
+    """보이는 행 수(부분 표시 포함) + 위아래 margin행을 담을 수 있는 셀 수"""
+    if not row_spans:
+        return 0
+    min_height = min(bottom - top for top, bottom, _ in row_spans)
+    max_columns = max(len(members) for _, _, members in row_spans)
+    rows = -(-max(view_height, 1) // min_height) + 1 + 2 * margin
+    return min(rows, len(row_spans)) * max_columns
+
+
+class CellPool:
+    """
+    이미지 그리드 셀(tk.Label) 고정 크기 풀
+
+    셀 수는 화면에 보이는 행 기준 capacity로 제한되며, 셀은 파괴/생성하지 않고
+    숨겨 두었다가 다른 항목의 이미지와 바인딩만 교체하여 다시 배치합니다.
+    """
+    CELL_EVENTS = ("<ButtonPress-1>", "<B1-Motion>", "<ButtonRelease-1>", "<Button-3>", "<Enter>", "<Leave>")
+    CELL_ATTRS = ("image", "label_path", "line_idx", "item")
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.capacity = 0
+        self.cells = []
+        self.free = []
+
+    def resize(self, capacity):
+        """풀 크기를 바꿉니다. 줄일 때는 쉬고 있는 셀만 파괴합니다."""
+        self.capacity = capacity
+        while len(self.cells) > capacity and self.free:
+            cell = self.free.pop()
+            self.cells.remove(cell)
+            cell.destroy()
+
+    def acquire(self):
+        """쉬고 있는 셀을 꺼내거나, capacity 안에서 새 셀을 만듭니다. 풀이 가득 차면 None."""
+        if self.free:
+            return self.free.pop()
+        if len(self.cells) >= self.capacity:
+            return None
+        cell = tk.Label(self.parent, bg="white", bd=0, relief="solid", highlightthickness=4)
+        self.cells.append(cell)
+        return cell
+
+    def release(self, cell):
+        """셀을 숨기고 이벤트, 이미지, 항목 정보를 지운 뒤 풀로 되돌립니다."""
+        cell.place_forget()
+        for child in cell.winfo_children():
+            child.destroy()
+        for event in self.CELL_EVENTS:
+            cell.unbind(event)
+        # bind로 등록된 Tcl 콜백 정리 (재사용 셀에 누적되지 않도록)
+        for name in list(cell._tclCommands or []):
+            cell.deletecommand(name)
+        cell.config(image="", bg="white", highlightbackground="white")
+        for attr in self.CELL_ATTRS:
+            cell.__dict__.pop(attr, None)
+        self.free.append(cell)
+
+
+class VirtualGrid:
+    """
+    가상화된 이미지 그리드
+
+    페이지 항목(GridItem)과 선택 상태((label_path, line_idx) 키)는 모델로만 보관하고,
+    캔버스에 보이는 행과 위아래 한 행의 항목에만 고정 크기 풀의 셀을 연결합니다.
+    스크롤이나 창 크기 변경 시 보이는 항목으로 셀을 다시 연결하므로
+    페이지 크기를 늘려도 위젯 수는 화면 크기만큼으로 유지됩니다.
+    """
+    CELL_PAD = 10
+    CELL_BORDER = 4
+    MARGIN_ROWS = 1
+
+    def __init__(self, canvas, frame, bind_cells):
+        self.canvas = canvas
+        self.frame = frame
+        self.bind_cells = bind_cells  # [(cell, item), ...]의 이미지와 이벤트를 채우는 콜백
+        self.pool = CellPool(frame)
+        self.items = []
+        self.positions = []
+        self.row_spans = []
+        self.index_of = {}
+        self.bound = {}         # 항목 인덱스 -> 셀
+        self.checked = set()    # 선택된 항목 키
+        self.reference_key = None
+        self.refresh_pending = None
+
+    def set_items(self, items):
+        """페이지 항목을 교체합니다. 새 페이지에도 있는 항목의 선택 상태만 유지합니다."""
+        self.clear()
+        self.items = list(items)
+        self.index_of = {item.key: index for index, item in enumerate(self.items)}
+        self.checked.intersection_update(self.index_of)
+        if self.reference_key not in self.index_of:
+            self.reference_key = None
+        self.positions, self.row_spans, width, height = grid_layout(
+            self.items, self.CELL_PAD, self.CELL_BORDER)
+        if self.items:
+            # 보이지 않는 행도 자리를 차지하도록 프레임 크기를 직접 지정
+            self.frame.grid_propagate(False)
+            self.frame.config(width=width, height=height)
+        self.refresh()
+
+    def clear(self):
+        """모든 셀을 풀로 돌려보내고 항목과 안내 메시지 등 풀 밖의 위젯을 지웁니다."""
+        for cell in self.bound.values():
+            self.pool.release(cell)
+        self.bound = {}
+        self.items = []
+        self.positions = []
+        self.row_spans = []
+        self.index_of = {}
+        pooled = set(self.pool.cells)
+        for widget in self.frame.winfo_children():
+            if widget not in pooled:
+                widget.destroy()
+        self.frame.config(width=1, height=1)
+        self.frame.grid_propagate(True)
+
+    def schedule_refresh(self):
+        if self.refresh_pending is None:
+            self.refresh_pending = self.canvas.after_idle(self.refresh)
+
+    def refresh(self):
+        """보이는 행 범위를 다시 계산해 벗어난 셀은 풀로 돌려보내고 새로 보이는 항목에 셀을 연결합니다."""
+        self.refresh_pending = None
+        if not self.items:
+            return
+        top = self.canvas.canvasy(0)
+        view_height = self.canvas.winfo_height()
+        wanted = visible_grid_items(self.row_spans, top, top + view_height, self.MARGIN_ROWS)
+        for index in [index for index in self.bound if index not in wanted]:
+            self.pool.release(self.bound.pop(index))
+        self.pool.resize(grid_pool_capacity(self.row_spans, view_height, self.MARGIN_ROWS))
+
+        pairs = []
+        for index in sorted(wanted.difference(self.bound)):
+            cell = self.pool.acquire()
+            if cell is None:
+                break
+            x, y, w, h = self.positions[index]
+            cell.place(x=x + w // 2, y=y + h // 2, anchor="center")
+            cell.item = self.items[index]
+            self.bound[index] = cell
+            pairs.append((cell, self.items[index]))
+        if pairs:
+            self.bind_cells(pairs)
+            for cell, item in pairs:
+                self.paint(cell, item)
+
+    def cells(self):
+        """현재 셀이 연결된 (셀, 항목) 목록"""
+        return [(cell, self.items[index]) for index, cell in sorted(self.bound.items())]
+
+    def cell_of(self, key):
+        index = self.index_of.get(key)
+        return self.bound.get(index) if index is not None else None
+
+    def paint(self, cell, item):
+        """모델의 선택/기준 상태에 맞게 셀 테두리와 배경을 칠합니다."""
+        if item.key in self.checked:
+            cell.config(highlightbackground="red", bg="#ffdddd")
+        elif item.key == self.reference_key:
+            cell.config(highlightbackground="blue", bg="white")
+        else:
+            cell.config(highlightbackground=item.border, bg="white")
+
+    def repaint(self, key=None):
+        """key 항목(없으면 연결된 모든 셀)을 다시 칠합니다."""
+        if key is not None:
+            cell = self.cell_of(key)
+            if cell is not None:
+                self.paint(cell, cell.item)
+            return
+        for cell, item in self.cells():
+            self.paint(cell, item)
+
+    def set_checked(self, key, checked=True):
+        if checked:
+            self.checked.add(key)
+        else:
+            self.checked.discard(key)
+        self.repaint(key)
+
+    def set_reference(self, key):
+        old_key, self.reference_key = self.reference_key, key
+        if old_key is not None:
+            self.repaint(old_key)
+        if key is not None:
+            self.repaint(key)
+
+    def update_line_indices(self, label_path, new_index_of):
+        """
+        라벨 파일 라인이 지워진 뒤 항목의 line_idx를 고칩니다.
+
+        Args:
+            new_index_of: 이전 line_idx -> 새 line_idx (None이면 삭제된 라인)
+
+        Returns:
+            int: 고친 항목 수
+        """
+        updated = 0
+        for index, item in enumerate(self.items):
+            if item.label_path != label_path or item.line_idx is None:
+                continue
+            updated += 1
+            old_key = item.key
+            item.line_idx = new_index_of(item.line_idx)
+            if old_key in self.checked:
+                self.checked.discard(old_key)
+                if item.line_idx is not None:
+                    self.checked.add(item.key)
+            cell = self.bound.get(index)
+            if cell is not None:
+                if item.line_idx is None:
+                    cell.__dict__.pop('line_idx', None)
+                else:
+                    cell.line_idx = item.line_idx
+        self.index_of = {item.key: index for index, item in enumerate(self.items)}
+        return updated
+
+
+class PagePrefetcher:
+    """
+    다음 페이지 미리 디코딩 파이프라인
+
+    예측한 페이지의 박스 크롭(100x100)과 전체 이미지 썸네일(200x200)을 작업자 스레드에서
+    디코딩/리사이즈하고, 크기 제한이 있는 큐를 통해 UI 스레드로 넘깁니다.
+    박스 주석(텍스트, 선택 표시)은 Tk 상태에 의존하므로 표시 시점에 UI 스레드에서 그립니다.
+    """
+    CROP_SIZE = (100, 100)
+    THUMB_SIZE = (200, 200)
+
+    def __init__(self, thumbnail_cache, read_boxes, depth=1, memory_budget_mb=256,
+                 workers=4, queue_size=64):
+        self.thumbnail_cache = thumbnail_cache
+        self.read_boxes = read_boxes  # label_path -> (N, 6) 박스 배열
+        self.depth = depth
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="Prefetch")
+        self.ready_queue = queue.Queue(maxsize=queue_size)
+        self.generation = 0
+        self.closed = False
+        self.futures = []
+        self.plan_key = None
+        self.planned_pages = set()
+        self.store = OrderedDict()  # (img_path, label mtime_ns, class_idx) -> {line_idx: crop}
+        self.store_bytes = 0
+
+    def is_planned(self, plan_key, page):
+        return plan_key == self.plan_key and page in self.planned_pages
+
+    def cancel(self):
+        """진행 중인 프리페치를 취소합니다. 실행 중인 작업은 다음 확인 지점에서 중단됩니다."""
+        self.generation += 1
+        for future in self.futures:
+            future.cancel()
+        self.futures = []
+        self.plan_key = None
+        self.planned_pages = set()
+        try:
+            while True:
+                self.ready_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def schedule(self, plan_key, pages):
+        """
+        예측한 페이지들의 디코딩을 예약합니다.
+
+        Args:
+            plan_key: 필터 조건 식별 튜플 (클래스, 겹침 필터, 박스 모드, 페이지 크기 등)
+            pages: {page_number: [(img_path, label_path, class_idx, box_mode), ...]}
+        """
+        self.cancel()
+        if self.closed or self.depth <= 0:
+            return
+        self.plan_key = plan_key
+        self.planned_pages = set(pages)
+        generation = self.generation
+        for page in sorted(pages, key=lambda p: abs(p - min(pages))):
+            for item in pages[page]:
+                self.futures.append(self.executor.submit(self._work, generation, *item))
+
+    def _work(self, generation, img_path, label_path, class_idx, box_mode):
+        if generation != self.generation or self.closed:
+            return
+        try:
+            result = self._decode(img_path, label_path, class_idx, box_mode)
+        except Exception as e:
+            print(f"프리페치 디코딩 오류 ({img_path}): {e}")
+            return
+        if result is None:
+            return
+        # UI 스레드가 큐를 비울 때까지 대기 (취소되면 결과 폐기)
+        while generation == self.generation and not self.closed:
+            try:
+                self.ready_queue.put((generation,) + result, timeout=0.2)
+                return
+            except queue.Full:
+                continue
+
+    def _decode(self, img_path, label_path, class_idx, box_mode):
+        if not box_mode:
+            # 전체 이미지 모드: 썸네일 캐시를 미리 채움
+            self.thumbnail_cache.get(img_path, self.THUMB_SIZE)
+            return None
+
+        st = os.stat(label_path)
+        boxes = self.read_boxes(label_path)
+        rows = boxes[boxes[:, 1] == class_idx] if len(boxes) else boxes
+        if not len(rows):
+            # 박스가 없으면 전체 이미지가 표시되므로 썸네일만 준비
+            self.thumbnail_cache.get(img_path, self.THUMB_SIZE)
+            return None
+
+        crops = {}
+        with Image.open(img_path) as img:
+            for line_idx, _, x, y, w, h in rows.tolist():
+                left = int((x - w / 2) * img.width)
+                top = int((y - h / 2) * img.height)
+                right = int((x + w / 2) * img.width)
+                bottom = int((y + h / 2) * img.height)
+                crops[int(line_idx)] = img.crop((left, top, right, bottom)).resize(self.CROP_SIZE)
+        nbytes = sum(crop.width * crop.height * len(crop.getbands()) for crop in crops.values())
+        return (img_path, st.st_mtime_ns, class_idx), crops, nbytes
+
+    def drain(self):
+        """작업자 결과를 저장소로 옮기고 메모리 한도를 넘으면 오래된 항목부터 버립니다 (UI 스레드)."""
+        try:
+            while True:
+                generation, key, crops, nbytes = self.ready_queue.get_nowait()
+                if generation != self.generation:
+                    continue
+                old = self.store.pop(key, None)
+                if old is not None:
+                    self.store_bytes -= old[1]
+                self.store[key] = (crops, nbytes)
+                self.store_bytes += nbytes
+        except queue.Empty:
+            pass
+        while self.store_bytes > self.memory_budget and self.store:
+            _, (_, nbytes) = self.store.popitem(last=False)
+            self.store_bytes -= nbytes
+
+    def take_crops(self, img_path, label_path, class_idx):
+        """미리 만든 크롭 {line_idx: PIL.Image}를 꺼냅니다. 없거나 라벨이 바뀌었으면 None."""
+        self.drain()
+        try:
+            key = (img_path, os.stat(label_path).st_mtime_ns, class_idx)
+        except OSError:
+            return None
+        entry = self.store.pop(key, None)
+        if entry is None:
+            return None
+        self.store_bytes -= entry[1]
+        return entry[0]
+
+    def shutdown(self):
+        self.closed = True
+        self.cancel()
+        self.executor.shutdown(wait=False)
+
+
+class LabelEditEngine:
+    """
+    라벨 박스 삭제/클래스 변경 일괄 편집 엔진
+
+    선택 정보를 파일 단위로 묶어 파일마다 한 번만 읽고-수정하고-쓰며,
+    임시 파일에 쓴 뒤 os.replace로 교체합니다. 파일들은 작업자 스레드 풀에서 처리합니다.
+    전체 백업 대신 바뀐 라인만 실행 기록(JSON Lines)에 남겨 undo()로 되돌릴 수 있습니다.
+    더 이상 되돌리지 않을 기록은 discard()로 지우고, 비정상 종료로 남은 오래된 기록은
+    새 기록을 쓸 때 정리합니다.
+    """
+    JOURNAL_PREFIX = "label_edit_"
+    JOURNAL_MAX_AGE = 7 * 24 * 3600  # 이전 세션이 남긴 실행 기록 보관 기간 (초)
+
+    def __init__(self, journal_dir, reader=None, workers=4):
+        self.journal_dir = journal_dir
+        self.reader = reader or LabelReader()
+        self.workers = max(1, workers)
+
+    @staticmethod
+    def group_operations(selected_label_info, delete=False, target_class=None):
+        """
+        selected_label_info를 파일별 편집 목록으로 묶습니다.
+
+        Returns:
+            dict: label_path -> {'delete': 삭제할 line_idx 집합, 'change': {line_idx: 새 클래스}}
+        """
+        operations = {}
+        for info in selected_label_info:
+            entry = operations.setdefault(info['path'], {'delete': set(), 'change': {}})
+            for box in info['boxes']:
+                if 'line_idx' not in box:
+                    continue
+                if delete:
+                    entry['delete'].add(box['line_idx'])
+                else:
+                    entry['change'][box['line_idx']] = target_class
+        return operations
+
+    def apply(self, operations, progress=None):
+        """
+        파일별 편집을 적용합니다.
+
+        Args:
+            operations: group_operations()의 결과
+            progress: (처리 수, 전체 수, 파일 결과)를 받는 콜백 (호출한 스레드에서 실행)
+
+        Returns:
+            tuple: (파일별 결과 목록, 실행 기록 경로 또는 None)
+                   결과는 {'path', 'deleted', 'changed', 'remaining', 'error'} 사전입니다.
+        """
+        results = []
+        records = []
+        total = len(operations)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="LabelEdit") as executor:
+            futures = [executor.submit(self._apply_file, path, op) for path, op in operations.items()]
+            for done, future in enumerate(as_completed(futures), 1):
+                result, record = future.result()
+                results.append(result)
+                if record is not None:
+                    records.append(record)
+                if progress is not None:
+                    progress(done, total, result)
+        journal_path = self._write_journal(records) if records else None
+        return results, journal_path
+
+    def _apply_file(self, label_path, op):
+        result = {'path': label_path, 'deleted': [], 'changed': [], 'remaining': None, 'error': None}
+        try:
+            lines = self.reader.split_lines(self.reader.read_bytes(label_path))
+            deleted = sorted(idx for idx in op['delete'] if 0 <= idx < len(lines))
+            deleted_set = set(deleted)
+            new_lines = []
+            undo_changed = []  # (새 파일에서의 위치, 변경 전 라인)
+            for line_idx, line in enumerate(lines):
+                if line_idx in deleted_set:
+                    continue
+                new_class = op['change'].get(line_idx)
+                if new_class is not None:
+                    parts = line.strip().split()
+                    if parts:  # 빈 라인은 그대로 유지
+                        # 클래스 ID만 변경하고 나머지는 유지
+                        parts[0] = str(new_class)
+                        undo_changed.append((len(new_lines), line))
+                        line = " ".join(parts) + "\n"
+                        result['changed'].append(line_idx)
+                new_lines.append(line)
+
+            result['deleted'] = deleted
+            result['remaining'] = len(new_lines)
+            if not deleted and not undo_changed:
+                return result, None
+
+            written = self._atomic_write(label_path, new_lines)
+            record = {
+                'path': label_path,
+                'sha1': hashlib.sha1(written).hexdigest(),
+                'deleted': [(idx, lines[idx]) for idx in deleted],
+                'changed': undo_changed,
+            }
+            return result, record
+        except (OSError, UnicodeError) as e:
+            result['error'] = str(e)
+            return result, None
+
+    @staticmethod
+    def _atomic_write(label_path, lines):
+        """같은 디렉토리의 임시 파일에 쓴 뒤 원본과 교체합니다. 기록한 바이트를 반환합니다."""
+        text = "".join(lines)
+        if os.linesep != "\n":  # 텍스트 모드 쓰기와 같은 줄바꿈
+            text = text.replace("\n", os.linesep)
+        data = text.encode('utf-8')
+        temp_path = f"{label_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            if os.path.exists(label_path):
+                shutil.copymode(label_path, temp_path)  # 원본 권한 유지
+            os.replace(temp_path, label_path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return data
+
+    def _write_journal(self, records):
+        os.makedirs(self.journal_dir, exist_ok=True)
+        name = f"{self.JOURNAL_PREFIX}{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.jsonl"
+        journal_path = os.path.join(self.journal_dir, name)
+        with open(journal_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.prune_stale(keep=journal_path)
+        return journal_path
+
+    def prune_stale(self, keep=None, now=None):
+        """JOURNAL_MAX_AGE보다 오래된 실행 기록을 삭제합니다. 삭제한 개수를 반환합니다."""
+        now = time.time() if now is None else now
+        stale = []
+        try:
+            with os.scandir(self.journal_dir) as entries:
+                for entry in entries:
+                    if (entry.name.startswith(self.JOURNAL_PREFIX) and entry.name.endswith(".jsonl")
+                            and entry.path != keep and now - entry.stat().st_mtime > self.JOURNAL_MAX_AGE):
+                        stale.append(entry.path)
+        except OSError:
+            return 0
+        return self.discard(stale)
+
+    @staticmethod
+    def discard(journal_paths):
+        """되돌리지 않을 실행 기록을 삭제하고 비게 된 기록 디렉토리를 정리합니다. 삭제한 개수를 반환합니다."""
+        removed = 0
+        journal_dirs = set()
+        for journal_path in journal_paths:
+            journal_dirs.add(os.path.dirname(journal_path))
+            try:
+                os.remove(journal_path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"실행 기록 삭제 실패 ({journal_path}): {e}")
+        for journal_dir in journal_dirs:
+            try:
+                os.rmdir(journal_dir)
+            except OSError:
+                pass  # 다른 기록이 남아 있음
+        return removed
+
+    def undo(self, journal_path):
+        """
+        실행 기록의 편집을 되돌립니다. 편집 후 다시 수정된 파일은 건너뜁니다.
+
+        Returns:
+            tuple: (복원된 라벨 경로 목록, 건너뛴 (경로, 사유) 목록)
+        """
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f if line.strip()]
+
+        restored = []
+        skipped = []
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="LabelUndo") as executor:
+            for record, error in zip(records, executor.map(self._undo_file, records)):
+                if error is None:
+                    restored.append(record['path'])
+                else:
+                    skipped.append((record['path'], error))
+
+        if not skipped:
+            os.remove(journal_path)
+        return restored, skipped
+
+    def _undo_file(self, record):
+        label_path = record['path']
+        try:
+            data = self.reader.read_bytes(label_path)
+            if hashlib.sha1(data).hexdigest() != record['sha1']:
+                return "편집 이후 파일이 변경됨"
+            lines = self.reader.split_lines(data)
+            for position, old_line in record['changed']:
+                lines[position] = old_line
+            for line_idx, old_line in record['deleted']:  # 오름차순으로 원래 위치에 삽입
+                lines.insert(line_idx, old_line)
+            self._atomic_write(label_path, lines)
+            return None
+        except (OSError, UnicodeError, IndexError) as e:
+            return str(e)
+
+
 class ImageViewer:
     def __init__(self, root):
         self.root = root
@@ -42,8 +1504,7 @@ class ImageViewer:
         self.selid = -1
 
         # OrderedDict로 LRU 캐시 구현 (O(1) move_to_end 성능)
-        self.label_cache = OrderedDict()  # 라벨 데이터 캐시
-        self.image_cache = OrderedDict()  # 썸네일 이미지 캐시
+        self.label_cache = OrderedDict()  # 라벨 데이터 캐시 (썸네일은 setup_caching의 thumbnail_cache)
         self.cache_limit = 2000  # 최대 캐시 항목 수
 
         # 마스킹 관련 변수 추가
@@ -60,7 +1521,6 @@ class ImageViewer:
         self.labels = []
         self.labelsdata = [[] for _ in range(100)]
         self.selected_image_labels = []
-        self.checklist = []
 
         # Initialize box image checkbox as checked
         self.box_image_var = tk.IntVar(value=1)
@@ -90,8 +1550,13 @@ class ImageViewer:
         self.tooltip_window = None
         self.tooltip_timer = None
 
-        self.file_encoding_cache = {}
-        self.default_encoding = 'utf-8'
+        self.label_reader = LabelReader()  # 라벨 인코딩은 데이터셋 단위로 결정
+        self.label_index = None  # 리스트 파일별 영구 라벨 인덱스
+        self.label_signatures = {}  # 마지막 스캔 시점의 라벨 경로 -> (mtime_ns, size)
+        self.edit_journals = []  # 되돌리기용 일괄 편집 실행 기록 (최근 것이 마지막)
+        self.edit_journal_limit = 20  # 되돌리기 가능한 최대 편집 수 (초과분 기록은 삭제)
+        self.box_spatial_index = BoxSpatialIndex()  # 데이터셋 전체 박스 위치 인덱스
+        self.image_size_cache = {}  # 이미지 경로 -> (width, height)
         self.changing_class = False  # 클래스 변경 작업 여부
         self.strict_class_filtering = True  # 클래스 필터링 강제 여부
 
@@ -123,6 +1588,7 @@ class ImageViewer:
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
         self.setup_memory_monitoring()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_app_close)
 
 
     def setup_ui(self):
@@ -220,6 +1686,12 @@ class ImageViewer:
                                         command=self.change_class_labels)
         self.change_class_button.pack(side=tk.LEFT, padx=1)
 
+        # 편집 취소 버튼 (Ctrl+Z: 마지막 삭제/클래스 변경 되돌리기)
+        self.undo_edit_button = tk.Button(control_frame, text="편집 취소", 
+                                        command=self.undo_last_edit)
+        self.undo_edit_button.pack(side=tk.LEFT, padx=1)
+        self.root.bind("<Control-z>", lambda e: self.undo_last_edit())
+
         self.label_to_mask_button = tk.Button(control_frame, text="Label→Mask", 
                                         command=self.convert_label_to_mask)
         self.label_to_mask_button.pack(side=tk.LEFT, padx=1)
@@ -323,9 +1795,10 @@ class ImageViewer:
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
         
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.configure(yscrollcommand=self.on_canvas_yscroll)
         self.frame = tk.Frame(self.canvas)
         self.canvas_window = self.canvas.create_window((0, 0), window=self.frame, anchor="nw")
+        self.grid_view = VirtualGrid(self.canvas, self.frame, self.bind_grid_cells)
         
         # UI 업데이트 중복 방지 플래그
         self._updating_display = False
@@ -465,6 +1938,9 @@ class ImageViewer:
             else:  # 16GB 이상
                 self.page_size = 500
                 self.cache_limit = 5000
+
+            # 다음 페이지 프리페치 메모리 한도 (MB)
+            self.prefetch_memory_mb = max(64, int(total_mem_gb * 16))
             
             # 로그 메시지 (logger가 설정된 경우)
             if hasattr(self, 'logger'):
@@ -475,17 +1951,32 @@ class ImageViewer:
             # 기본값 사용
             self.page_size = 200
             self.cache_limit = 1000
+            self.prefetch_memory_mb = 128
             print("기본 설정 사용: 페이지 크기=200, 캐시 제한=1000")
         
+        # 현재 페이지 다음으로 미리 디코딩할 페이지 수 (0이면 프리페치 끔, performance.json으로 변경 가능)
+        performance_settings = load_performance_settings()
+        try:
+            self.prefetch_depth = max(0, int(performance_settings.get('prefetch_depth', 1)))
+        except (TypeError, ValueError):
+            self.prefetch_depth = 1
+        if hasattr(self, 'logger'):
+            self.logger.info(f"프리페치 페이지 수: {self.prefetch_depth}")
+        else:
+            print(f"프리페치 페이지 수: {self.prefetch_depth}")
+
         # 파이썬 GC 설정 조정
         gc.set_threshold(100, 5, 5)  # GC 임계값 조정하여 더 자주 수집하도록 설정
         
         # 멀티스레딩을 위한 스레드 수 계산
         try:
-            import multiprocessing
             self.worker_threads = max(1, multiprocessing.cpu_count() - 1)  # UI 스레드용으로 하나 남김
         except:
             self.worker_threads = 2  # 기본값
+
+        # 클래스 스캔 프로세스 풀 (파일 수가 적으면 프로세스 시작 비용 때문에 스레드 사용)
+        self.class_scan_processes = self.worker_threads
+        self.class_scan_process_min_files = 20000
         
         # 로그 메시지
         if hasattr(self, 'logger'):
@@ -497,7 +1988,16 @@ class ImageViewer:
         """캐시 시스템 설정"""
         # 캐시 딕셔너리 생성 - OrderedDict로 LRU 캐시 구현
         self.label_cache = OrderedDict()
-        self.image_cache = OrderedDict()
+
+        # 썸네일은 메모리 LRU와 로컬 디스크 캐시를 함께 사용 (작업자 스레드와 공유하므로 메서드로만 접근)
+        self.thumbnail_cache = ThumbnailCache(memory_limit=self.cache_limit)
+
+        # 다음 페이지 프리페치 (작업자 스레드에서 디코딩, UI 스레드에서 표시)
+        self.page_prefetcher = PagePrefetcher(
+            self.thumbnail_cache, self.read_label_boxes,
+            depth=self.prefetch_depth, memory_budget_mb=self.prefetch_memory_mb,
+            workers=min(4, self.worker_threads))
+        self.root.after(100, self.poll_prefetch)
         
         # 캐시 통계
         self.cache_hits = {'label': 0, 'image': 0}
@@ -516,7 +2016,8 @@ class ImageViewer:
         if total_accesses > 0:
             hit_rate = total_hits / total_accesses * 100
             self.logger.info(f"캐시 통계: 적중={total_hits}, 미스={total_misses}, 적중률={hit_rate:.2f}%")
-            self.logger.info(f"캐시 크기: 라벨={len(self.label_cache)}, 이미지={len(self.image_cache)}")
+            self.logger.info(f"캐시 크기: 라벨={len(self.label_cache)}, 이미지={len(self.thumbnail_cache)}")
+            self.logger.info(f"썸네일 캐시: {self.thumbnail_cache.stats}")
         
         # 다음 로깅 일정 설정
         self.root.after(300000, self.log_cache_stats)  # 5분마다 반복
@@ -535,26 +2036,20 @@ class ImageViewer:
             self.label_cache.popitem(last=False)
             removed_label_count += 1
 
-        # 이미지 캐시 정리 (OrderedDict의 popitem(last=False) 사용)
-        while len(self.image_cache) > target_size:
-            self.image_cache.popitem(last=False)
-            removed_image_count += 1
+        # 이미지 캐시 정리 (작업자 스레드와 공유하므로 lock을 잡는 trim 사용)
+        removed_image_count = self.thumbnail_cache.trim(target_size)
         
         # 2. 미사용 데이터 정리
         # 현재 표시되지 않은 이미지 관련 데이터 정리
         current_display_paths = set()
         
-        # 현재 화면에 표시된 라벨 경로 수집
-        for widget in self.frame.winfo_children():
-            if hasattr(widget, 'label_path'):
-                current_display_paths.add(widget.label_path)
+        # 현재 페이지의 라벨 경로 수집
+        for item in self.grid_view.items:
+            current_display_paths.add(item.label_path)
         
         # 표시되지 않는 이미지 캐시 정리 (현재 페이지에 없는 이미지)
-        cleaned_paths = 0
-        for key in list(self.image_cache.keys()):
-            if isinstance(key, str) and not any(path in key for path in current_display_paths):
-                del self.image_cache[key]
-                cleaned_paths += 1
+        cleaned_paths = self.thumbnail_cache.discard_where(
+            lambda key: isinstance(key, str) and not any(path in key for path in current_display_paths))
         
         # 3. 명시적 가비지 컬렉션 수행
         gc.collect()
@@ -580,8 +2075,8 @@ class ImageViewer:
         try:
             if cache_type == 'label' and key in self.label_cache:
                 self.label_cache.move_to_end(key)
-            elif cache_type == 'image' and key in self.image_cache:
-                self.image_cache.move_to_end(key)
+            elif cache_type == 'image':
+                self.thumbnail_cache.touch(key)
         except KeyError:
             # 키가 없는 경우 무시
             pass
@@ -593,9 +2088,7 @@ class ImageViewer:
                 # popitem(last=False)로 가장 오래된 항목 제거 (O(1))
                 self.label_cache.popitem(last=False)
         elif cache_type == 'image':
-            while len(self.image_cache) > self.cache_limit:
-                # popitem(last=False)로 가장 오래된 항목 제거 (O(1))
-                self.image_cache.popitem(last=False)
+            self.thumbnail_cache.trim(self.cache_limit)
     def initial_setup(self, file_path):
         """Initialize/reset all instance variables when loading new data"""
         # Reset paths and file info
@@ -610,27 +2103,117 @@ class ImageViewer:
         
         # Reset selection state
         self.selected_image_labels = []
-        for widget in self.checklist:
-            if widget.winfo_exists():
-                widget.destroy()
-        self.checklist = []
+        self.grid_view.checked.clear()
         
         # Reset pagination
         self.current_page = 0
         self.total_pages = 0
 
         self.overlap_cache = {}
+        self.box_spatial_index = BoxSpatialIndex()
+        self.image_size_cache = {}
+        self.label_reader = LabelReader()
+        self.label_signatures = {}
+
+        # 리스트 파일 옆의 라벨 인덱스 열기
+        self.open_label_index(file_path)
         
         # Reset filter stats
         self.filter_stats = {"total": 0, "overlapping": 0, "non_overlapping": 0}
         self.filter_info_label.config(text="")
         
         # Clear display
-        for widget in self.frame.winfo_children():
-            widget.destroy()
+        self.release_grid_cells()
         
         # Force garbage collection
         gc.collect()
+    def open_label_index(self, file_path):
+        """리스트 파일에 대응하는 영구 라벨 인덱스를 엽니다. 실패하면 인덱스 없이 동작합니다."""
+        if self.label_index is not None:
+            self.label_index.close()
+            self.label_index = None
+        try:
+            self.label_index = LabelIndex(file_path).open()
+            print(f"라벨 인덱스 로드: {len(self.label_index.entries)}개 항목 ({self.label_index.db_path})")
+        except (sqlite3.Error, OSError) as e:
+            print(f"라벨 인덱스를 열 수 없습니다 (전체 스캔으로 진행): {e}")
+            self.label_index = None
+    def on_app_close(self):
+        """메인 창 종료 시 백그라운드 작업과 캐시를 정리합니다."""
+        try:
+            self.page_prefetcher.shutdown()
+            self.thumbnail_cache.flush()
+            if self.label_index is not None:
+                self.label_index.close()
+            # 정상 종료 시 되돌리기 목록이 사라지므로 실행 기록도 삭제
+            LabelEditEngine.discard(self.edit_journals)
+            self.edit_journals = []
+        except Exception as e:
+            print(f"종료 정리 중 오류: {e}")
+        self.root.destroy()
+    def poll_prefetch(self):
+        """프리페치 결과 큐를 주기적으로 비웁니다 (작업자가 큐에서 막히지 않도록)."""
+        try:
+            self.page_prefetcher.drain()
+        finally:
+            self.root.after(100, self.poll_prefetch)
+    def read_label_boxes(self, label_path):
+        """라벨 파일의 박스 배열 (N, 6)을 반환합니다. 인덱스가 최신이면 파싱을 생략합니다."""
+        if self.label_index is not None:
+            try:
+                boxes = self.label_index.get_boxes(label_path, os.stat(label_path))
+            except (OSError, sqlite3.Error):
+                boxes = None
+            if boxes is not None:
+                return boxes
+        return parse_label_lines(self.read_label_file(label_path))[1]
+    def get_box_spatial_index(self, progress=None, with_sizes=False):
+        """
+        현재 라벨 목록과 동기화된 박스 공간 인덱스를 반환합니다 (바뀐 파일만 다시 읽음).
+        with_sizes가 True면 픽셀 단위 조회를 위해 이미지 크기(헤더)도 같은 진행 표시 안에서 채웁니다.
+        """
+        image_size_of = self.get_label_image_size if with_sizes else None
+        changed = self.box_spatial_index.update(self.labels, self.read_label_boxes, progress, image_size_of)
+        if changed:
+            print(f"공간 인덱스 갱신: {changed}개 파일, 전체 박스 {len(self.box_spatial_index)}개")
+        return self.box_spatial_index
+    def get_label_image_size(self, label_path):
+        """라벨 파일에 해당하는 이미지의 (width, height). 실패하면 None."""
+        return self.get_image_size(self.get_image_path_from_label(label_path))
+    def get_image_size(self, img_path):
+        """이미지 크기 (width, height)를 헤더만 읽어 캐시합니다. 실패하면 None."""
+        size = self.image_size_cache.get(img_path)
+        if size is None:
+            try:
+                with Image.open(img_path) as img:
+                    size = img.size
+            except (OSError, ValueError):
+                return None
+            self.image_size_cache[img_path] = size
+        return size
+    def schedule_page_prefetch(self, plan_key, class_images, class_idx):
+        """현재 페이지 다음(및 이전) 페이지의 이미지를 프리페치 대상으로 예약합니다."""
+        depth = self.prefetch_depth
+        if depth <= 0 or not class_images:
+            return
+        box_mode = bool(self.box_image_var.get())
+        full_view = getattr(self, 'current_full_view', None)
+        pages = {}
+        candidates = [self.current_page + i for i in range(1, depth + 1)] + [self.current_page - 1]
+        for page in candidates:
+            if page < 0 or page >= self.total_pages:
+                continue
+            start = page * self.page_size
+            items = []
+            for label_path in class_images[start:start + self.page_size]:
+                img_path = self.get_image_path_from_label(label_path)
+                items.append((img_path, label_path, class_idx, box_mode and img_path != full_view))
+            pages[page] = items
+        if pages:
+            self.page_prefetcher.schedule(plan_key, pages)
+    def release_grid_cells(self):
+        """그리드 셀을 풀로 반환하고 페이지 항목을 비웁니다 (선택 상태는 다음 페이지 항목 기준으로 정리)."""
+        self.grid_view.clear()
     def flash_widget(self, widget, color, times=3, delay=50):
         """위젯에 깜빡임 효과를 적용합니다."""
         if times <= 0:
@@ -709,6 +2292,16 @@ class ImageViewer:
                 
             total_lines = len(lines)
             progress_bar['maximum'] = total_lines
+
+            # 라벨 인덱스가 있으면 경로 존재 확인을 생략 (라벨 변경 여부는 클래스 스캔에서 stat으로 검증)
+            if self.label_index is not None and self.label_index.entries:
+                self.image_paths = lines
+                self.labels = [self.convert_jpegimages_to_labels(line) for line in lines]
+                progress_bar['value'] = total_lines
+                status_label.config(text=f"라벨 인덱스 사용: {total_lines}개 파일")
+                progress_window.update()
+                self.finalize_data_loading(progress_window)
+                return
             
             # 작업 대기열 및 결과 대기열 생성
             task_queue = queue.Queue()
@@ -1008,14 +2601,8 @@ class ImageViewer:
                         cache_key = f"{img_path}_{size}" if size else img_path
                         
                         if result is not None:
-                            self.image_cache[cache_key] = result
-                            
-                            # LRU 캐시 업데이트
-                            self.image_cache_ordered[cache_key] = None
-                            if len(self.image_cache) > self.cache_limit:
-                                oldest = next(iter(self.image_cache_ordered))
-                                del self.image_cache_ordered[oldest]
-                                del self.image_cache[oldest]
+                            # LRU 갱신/상한 관리는 thumbnail_cache가 lock을 잡고 처리
+                            self.thumbnail_cache.put(cache_key, result)
                     
                     elif result_type.startswith("batch_"):
                         # 배치 처리 결과 처리
@@ -1410,8 +2997,7 @@ class ImageViewer:
                         print(f"라벨 백업 실패: {str(backup_error)}")
                 
                 # 라벨 파일 읽기
-                with open(label_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
+                lines = self.label_reader.read_lines(label_path)
                 
                 # 마스킹할 박스 정보 추출
                 mask_boxes = []
@@ -1513,8 +3099,7 @@ class ImageViewer:
         self.deselect_all_images()
 
         # 화면의 모든 썸네일 제거 (UI 클리어)
-        for widget in self.frame.winfo_children():
-            widget.destroy()
+        self.release_grid_cells()
 
         # [SpeedOptimization] 즉시 완료 처리 (비동기 작업 및 캐시 갱신 제거)
         # 플래그 설정하여 trace_add 중복 호출 방지
@@ -1739,35 +3324,34 @@ class ImageViewer:
                 # 바운딩 박스 정보 가져오기
                 boxes_info = []
                 if os.path.isfile(label_path):
-                    with open(label_path, 'r', encoding='utf-8') as f:
-                        for line_idx, line in enumerate(f):
-                            parts = line.strip().split()
-                            if len(parts) >= 5:
-                                try:
-                                    class_id = int(float(parts[0]))
-                                    x_center = float(parts[1])
-                                    y_center = float(parts[2])
-                                    width = float(parts[3])
-                                    height = float(parts[4])
-                                    
-                                    # 박스 좌표 계산
-                                    x1 = int((x_center - width/2) * new_width)
-                                    y1 = int((y_center - height/2) * new_height)
-                                    x2 = int((x_center + width/2) * new_width)
-                                    y2 = int((y_center + height/2) * new_height)
-                                    
-                                    # 클래스별 색상
-                                    color = ["red", "green", "blue", "cyan", "magenta", "yellow", 
-                                            "orange", "purple", "brown", "gray"][class_id % 10]
-                                    
-                                    boxes_info.append({
-                                        'class_id': class_id, 
-                                        'coords': (x1, y1, x2, y2),
-                                        'color': color,
-                                        'line_idx': line_idx
-                                    })
-                                except (ValueError, IndexError):
-                                    continue
+                    for line_idx, line in enumerate(self.read_label_file(label_path)):
+                        parts = line.strip().split()
+                        if len(parts) >= 5:
+                            try:
+                                class_id = int(float(parts[0]))
+                                x_center = float(parts[1])
+                                y_center = float(parts[2])
+                                width = float(parts[3])
+                                height = float(parts[4])
+                                
+                                # 박스 좌표 계산
+                                x1 = int((x_center - width/2) * new_width)
+                                y1 = int((y_center - height/2) * new_height)
+                                x2 = int((x_center + width/2) * new_width)
+                                y2 = int((y_center + height/2) * new_height)
+                                
+                                # 클래스별 색상
+                                color = ["red", "green", "blue", "cyan", "magenta", "yellow", 
+                                        "orange", "purple", "brown", "gray"][class_id % 10]
+                                
+                                boxes_info.append({
+                                    'class_id': class_id, 
+                                    'coords': (x1, y1, x2, y2),
+                                    'color': color,
+                                    'line_idx': line_idx
+                                })
+                            except (ValueError, IndexError):
+                                continue
                 
                 # 박스 그리기
                 for box in boxes_info:
@@ -1891,6 +3475,40 @@ class ImageViewer:
                 self.preview_window.destroy()
                 self.preview_window = None
 
+    def update_class_menus(self, sorted_classes):
+        """클래스 드롭다운과 겹침 필터 드롭다운 메뉴를 현재 labelsdata 개수로 다시 만듭니다."""
+        # 메인 클래스 드롭다운 메뉴 업데이트
+        menu = self.class_dropdown["menu"]
+        menu.delete(0, "end")
+
+        for class_index in sorted_classes:
+            class_index_int = int(float(class_index))
+            label_count = len(self.labelsdata[class_index_int])
+            label_text = f"Class {class_index} ({label_count})"
+            menu.add_command(
+                label=label_text,
+                command=lambda idx=class_index: self.class_selector.set(idx)
+            )
+
+        # 겹침 필터 드롭다운 메뉴 업데이트
+        overlap_menu = self.overlap_class_dropdown["menu"]
+        overlap_menu.delete(0, "end")
+
+        # 먼저 "선택 안함" 옵션 추가
+        overlap_menu.add_command(
+            label="선택 안함",
+            command=lambda: self.overlap_class_selector.set("선택 안함")
+        )
+
+        # 각 클래스 옵션 추가
+        for class_index in sorted_classes:
+            class_index_int = int(float(class_index))
+            label_count = len(self.labelsdata[class_index_int])
+            label_text = f"Class {class_index} ({label_count})"
+            overlap_menu.add_command(
+                label=label_text,
+                command=lambda idx=class_index: self.overlap_class_selector.set(idx)
+            )
     def update_class_dropdown(self, existing_progress_window=None, completion_callback=None):
         """Update class dropdown with available classes from label files - 병렬 처리 및 오류 복구 강화"""
         # 상태 메시지 표시
@@ -1956,12 +3574,15 @@ class ImageViewer:
             import queue
             import threading
 
+            label_index = self.label_index
+            label_signatures = {}  # 증분 리프레시 기준이 되는 파일별 stat
             task_queue = queue.Queue()
             result_queue = queue.Queue()
+            threads = []
             
-            # 모든 작업 추가
-            for label_path in self.labels:
-                task_queue.put(label_path)
+            # 목록이 크면 프로세스 풀로 파싱 (GIL 회피), 작으면 스레드 사용
+            use_processes = (self.class_scan_processes > 1 and
+                             total_files >= self.class_scan_process_min_files)
             
             # 작업자 스레드 함수
             def worker():
@@ -1973,44 +3594,41 @@ class ImageViewer:
                         file_labels = defaultdict(list)
                         file_valid = False
                         
-                        # 파일 존재 여부 확인
-                        if not os.path.isfile(label_path):
+                        # 파일 존재 여부 확인 (stat은 인덱스 검증에도 사용)
+                        try:
+                            st = os.stat(label_path)
+                        except OSError:
+                            st = None
+                        if st is None or not os.path.isfile(label_path):
                             result_queue.put((label_path, file_classes, file_labels, file_valid, "파일 없음"))
                             task_queue.task_done()
                             continue
+                        label_signatures[label_path] = (st.st_mtime_ns, st.st_size)
                         
                         try:
-                            # 파일 읽기 (개선된 파일 읽기 함수 사용)
-                            lines = self.read_label_file(label_path)
-                            
-                            if not lines:
-                                result_queue.put((label_path, file_classes, file_labels, file_valid, "빈 파일"))
-                                task_queue.task_done()
-                                continue
-                            
-                            for line in lines:
-                                try:
-                                    parts = line.split()
-                                    if not parts:
-                                        continue
-                                    class_index = parts[0]
-                                    class_index_int = int(float(class_index))  # 부동 소수점으로 먼저 변환 후 정수로 변환
-
-                                    # 클래스 인덱스 유효성 검사
-                                    if class_index_int < 0 or class_index_int >= 100:
-                                        continue
-
-                                    file_classes.add(class_index)  # 문자열 버전 저장
-                                    file_labels[class_index_int].append(label_path)
-                                    file_valid = True
-                                except (IndexError, ValueError):
-                                    continue
-
-                            # 파일을 읽었지만 유효한 라벨이 없는 경우
-                            if file_valid:
-                                result_queue.put((label_path, file_classes, file_labels, file_valid, "성공"))
+                            # 인덱스에 stat이 일치하는 항목이 있으면 파싱 생략
+                            cached = label_index.lookup(label_path, st) if label_index is not None else None
+                            if cached is not None:
+                                status, histogram = cached
                             else:
-                                result_queue.put((label_path, file_classes, file_labels, file_valid, "유효 라벨 없음"))
+                                # 파일 읽기 (개선된 파일 읽기 함수 사용)
+                                lines = self.read_label_file(label_path)
+                                histogram, boxes = parse_label_lines(lines)
+                                if not lines:
+                                    status = "빈 파일"
+                                elif histogram:
+                                    status = "성공"
+                                else:
+                                    # 파일을 읽었지만 유효한 라벨이 없는 경우
+                                    status = "유효 라벨 없음"
+                                if label_index is not None:
+                                    label_index.put(label_path, st, status, histogram, boxes)
+
+                            for class_index, count in histogram.items():
+                                file_classes.add(class_index)  # 문자열 버전 저장
+                                file_labels[int(float(class_index))].extend([label_path] * count)
+                            file_valid = bool(histogram)
+                            result_queue.put((label_path, file_classes, file_labels, file_valid, status))
                             
                         except Exception as e:
                             result_queue.put((label_path, file_classes, file_labels, file_valid, f"오류: {str(e)}"))
@@ -2020,15 +3638,98 @@ class ImageViewer:
                     except queue.Empty:
                         break
             
-            # 작업자 스레드 시작
-            num_threads = min(20, max(4, os.cpu_count() or 4))
-            threads = []
-
-            for i in range(num_threads):
-                t = threading.Thread(target=worker, name=f"ClassWorker-{i}")
-                t.daemon = True
-                t.start()
-                threads.append(t)
+            # 스레드 스캔 시작
+            def start_thread_scan():
+                # 모든 작업 추가
+                for label_path in self.labels:
+                    task_queue.put(label_path)
+                
+                # 작업자 스레드 시작
+                num_threads = min(20, max(4, os.cpu_count() or 4))
+                for i in range(num_threads):
+                    t = threading.Thread(target=worker, name=f"ClassWorker-{i}")
+                    t.daemon = True
+                    t.start()
+                    threads.append(t)
+                
+                self.root.after(100, process_results)
+            
+            # 프로세스 풀 스캔 시작 - 목록을 묶음으로 나눠 작업자 프로세스에 전달
+            def start_process_scan():
+                workers = self.class_scan_processes
+                chunk_size = max(500, min(20000, (total_files + workers * 8 - 1) // (workers * 8)))
+                entries = label_index.entries if label_index is not None else {}
+                try:
+                    executor = ProcessPoolExecutor(max_workers=workers)
+                    chunks = []
+                    for chunk_start in range(0, total_files, chunk_size):
+                        chunk = self.labels[chunk_start:chunk_start + chunk_size]
+                        cached = {path: entries[path] for path in chunk if path in entries}
+                        future = executor.submit(scan_label_chunk, chunk_start, chunk, cached)
+                        chunks.append((chunk_start, len(chunk), future))
+                except (OSError, RuntimeError, ValueError) as e:
+                    print(f"프로세스 풀을 시작할 수 없습니다 (스레드 스캔 사용): {e}")
+                    self.class_scan_processes = 1
+                    start_thread_scan()
+                    return
+                status_label.config(text=f"{workers}개 프로세스로 {len(chunks)}개 묶음 분석 중...")
+                self.root.after(50, lambda: process_chunk_results(executor, chunks, {}))
+            
+            # 프로세스 풀 결과 처리 - 완료된 묶음으로 진행률 갱신, 끝나면 목록 순서대로 병합
+            def process_chunk_results(executor, chunks, chunk_results):
+                nonlocal processed_files, valid_files, invalid_files
+                
+                try:
+                    for i, (_, chunk_len, future) in enumerate(chunks):
+                        if i in chunk_results or not future.done():
+                            continue
+                        result = future.result()
+                        chunk_results[i] = result
+                        processed_files += chunk_len
+                        valid_files += result['valid']
+                        invalid_files += chunk_len - result['valid']
+                        for error_type, count in result['error_stats'].items():
+                            error_stats[error_type] = error_stats.get(error_type, 0) + count
+                    
+                    progress = (processed_files / total_files) * 100 if total_files else 100
+                    progress_bar["value"] = processed_files
+                    status_label.config(text=f"처리 중: {processed_files}/{total_files} 파일 ({progress:.1f}%), 유효: {valid_files}, 오류: {invalid_files}")
+                    
+                    if len(chunk_results) < len(chunks):
+                        self.root.after(50, lambda: process_chunk_results(executor, chunks, chunk_results))
+                        return
+                    executor.shutdown(wait=False)
+                    
+                    labels = self.labels
+                    for i in range(len(chunks)):
+                        result = chunk_results[i]
+                        for class_index, file_ids in result['class_files'].items():
+                            classes.add(class_index)
+                            labelsdata_new[int(float(class_index))].extend([labels[j] for j in file_ids])
+                        chunk_start = chunks[i][0]
+                        for offset, (mtime_ns, size) in enumerate(zip(result['mtimes'], result['sizes'])):
+                            if mtime_ns >= 0:
+                                label_signatures[labels[chunk_start + offset]] = (mtime_ns, size)
+                        if label_index is not None:
+                            for file_id, mtime_ns, size, status, histogram, boxes in result['parsed']:
+                                label_index.put_values(
+                                    labels[file_id], mtime_ns, size, status, Counter(histogram),
+                                    np.frombuffer(boxes, dtype=np.float32).reshape(-1, 6))
+                    finalize_update()
+                    
+                except Exception as e:
+                    # 프로세스 풀을 쓸 수 없는 환경이면 스레드 스캔으로 다시 수행
+                    print(f"프로세스 클래스 스캔 실패, 스레드 스캔으로 전환: {e}")
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    self.class_scan_processes = 1
+                    processed_files = valid_files = invalid_files = 0
+                    for error_type in error_stats:
+                        error_stats[error_type] = 0
+                    for class_paths in labelsdata_new:
+                        class_paths.clear()
+                    classes.clear()
+                    label_signatures.clear()
+                    start_thread_scan()
 
             # 결과 처리 함수
             def process_results():
@@ -2141,43 +3842,21 @@ class ImageViewer:
 
                     # labelsdata 업데이트
                     self.labelsdata = labelsdata_new
+                    self.label_signatures = label_signatures
+
+                    # 새로 파싱한 결과를 라벨 인덱스에 기록
+                    if label_index is not None:
+                        try:
+                            written, pruned = label_index.commit(live_paths=self.labels)
+                            print(f"라벨 인덱스 갱신: {written}개 기록, {pruned}개 제거")
+                        except sqlite3.Error as e:
+                            print(f"라벨 인덱스 저장 오류: {e}")
 
                     # 클래스 정렬 및 메뉴 업데이트
                     sorted_classes = sorted(list(classes), key=lambda x: int(float(x)))
 
-                    # 메인 클래스 드롭다운 메뉴 업데이트
-                    menu = self.class_dropdown["menu"]
-                    menu.delete(0, "end")
-
-                    for class_index in sorted_classes:
-                        class_index_int = int(float(class_index))
-                        label_count = len(self.labelsdata[class_index_int])
-                        label_text = f"Class {class_index} ({label_count})"
-                        menu.add_command(
-                            label=label_text,
-                            command=lambda idx=class_index: self.class_selector.set(idx)
-                        )
-                    
-                    # 겹침 필터 드롭다운 메뉴 업데이트
-                    overlap_menu = self.overlap_class_dropdown["menu"]
-                    overlap_menu.delete(0, "end")
-                    
-                    # 먼저 "선택 안함" 옵션 추가
-                    overlap_menu.add_command(
-                        label="선택 안함",
-                        command=lambda: self.overlap_class_selector.set("선택 안함")
-                    )
-                    
-                    # 각 클래스 옵션 추가
-                    for class_index in sorted_classes:
-                        class_index_int = int(float(class_index))
-                        label_count = len(self.labelsdata[class_index_int])
-                        label_text = f"Class {class_index} ({label_count})"
-                        overlap_menu.add_command(
-                            label=label_text,
-                            command=lambda idx=class_index: self.overlap_class_selector.set(idx)
-                        )
-                    
+                    self.update_class_menus(sorted_classes)
+
                     # 페이지 초기화 및 첫 번째 클래스 선택 (클래스가 있는 경우)
                     if sorted_classes:
                         self.current_page = 0
@@ -2247,7 +3926,10 @@ class ImageViewer:
                     close_button.pack(pady=10)
             
             # 결과 처리 시작
-            self.root.after(100, process_results)
+            if use_processes:
+                start_process_scan()
+            else:
+                start_thread_scan()
             
         except Exception as e:
             print(f"클래스 드롭다운 업데이트 오류: {e}")
@@ -2381,134 +4063,25 @@ class ImageViewer:
             else:
                 print(f"IoU 계산 중 오류: {e}")
             return 0.0
-    def check_box_overlap(self, label_path, main_class_idx, target_class_idx):
-        """
-        특정 클래스의 각 박스별로 겹침 정보를 분석합니다.
-        """
-        # 캐시 키 생성
-        cache_key = (label_path, main_class_idx, target_class_idx, self.iou_threshold_var.get())
-        if cache_key in self.overlap_cache:
-            return self.overlap_cache[cache_key]
-
-        if not os.path.isfile(label_path):
-            return False, 0.0, [], []
-
-        try:
-            # 라벨 파일에서 박스 정보 읽기
-            boxes_by_class = {}
-            original_line_indices = {}  # 원본 라인 인덱스 저장
-
-            with open(label_path, 'r', encoding='utf-8') as f:
-                for line_idx, line in enumerate(f):
-                    parts = line.strip().split()
-                    # 안전한 입력 확인
-                    if not parts or len(parts) < 5:
-                        continue
-
-                    try:
-                        # 안전한 형변환 처리
-                        box_class = int(float(parts[0]))
-                        x_center = float(parts[1])
-                        y_center = float(parts[2])
-                        width = float(parts[3])
-                        height = float(parts[4])
-                        
-                        # 값 범위 검증 (정규화된 좌표는 0~1 사이)
-                        if not (0 <= x_center <= 1 and 0 <= y_center <= 1 and 
-                                0 <= width <= 1 and 0 <= height <= 1):
-                            print(f"경고: 범위를 벗어난 좌표 값 무시: {line}")
-                            continue
-                        
-                        # 박스 좌표 계산 (normalized coordinates)
-                        x1 = x_center - width/2
-                        y1 = y_center - height/2
-                        x2 = x_center + width/2
-                        y2 = y_center + height/2
-
-                        if box_class not in boxes_by_class:
-                            boxes_by_class[box_class] = []
-                            original_line_indices[box_class] = []
-
-                        boxes_by_class[box_class].append({
-                            'coords': (x1, y1, x2, y2),
-                            'class': box_class,
-                            'center': (x_center, y_center),
-                            'size': (width, height)
-                        })
-                        original_line_indices[box_class].append(line_idx)
-                    except (IndexError, ValueError):
-                        continue
-
-                # 지정된 클래스들의 박스 정보 확인
-                if int(main_class_idx) not in boxes_by_class:
-                    result = (False, 0.0, [], [])  # 각 박스별 정보 추가
-                    self.overlap_cache[cache_key] = result
-                    return result
-
-                # 선택한 클래스의 모든 박스에 대한 겹침 정보를 저장
-                # 각 박스별로 정보를 저장하기 위해 배열 구조 변경
-                all_boxes_overlap_info = []
-                any_overlap = False
-                max_overall_iou = 0.0
-
-                # 선택한 클래스의 모든 박스에 대해 정보 분석
-                for i, main_box in enumerate(boxes_by_class[int(main_class_idx)]):
-                    # 이 박스의 겹침 정보
-                    box_overlap_info = {
-                        'box_index': i,
-                        'original_line_index': original_line_indices[int(main_class_idx)][i],
-                        'has_overlap': False,
-                        'max_iou': 0.0,
-                        'overlapping_boxes': []
-                    }
-                    
-                    # 대상 클래스가 존재하는 경우에만 겹침 검사
-                    if int(target_class_idx) in boxes_by_class:
-                        for j, target_box in enumerate(boxes_by_class[int(target_class_idx)]):
-                            # 같은 클래스인 경우 같은 박스끼리는 비교하지 않음
-                            if int(main_class_idx) == int(target_class_idx) and i == j:
-                                continue
-                                
-                            iou = self.calculate_iou(main_box['coords'], target_box['coords'])
-                            
-                            # IoU 임계값 이상인 경우 겹침으로 간주
-                            if iou >= self.iou_threshold_var.get():
-                                box_overlap_info['has_overlap'] = True
-                                any_overlap = True
-                                
-                                # 최대 IoU 값 업데이트
-                                if iou > box_overlap_info['max_iou']:
-                                    box_overlap_info['max_iou'] = iou
-                                    
-                                # 겹치는 박스 정보 저장
-                                box_overlap_info['overlapping_boxes'].append({
-                                    'target_box_index': j,
-                                    'original_line_index': original_line_indices[int(target_class_idx)][j],
-                                    'iou': iou
-                                })
-                    
-                    # 전체 최대 IoU 업데이트
-                    if box_overlap_info['max_iou'] > max_overall_iou:
-                        max_overall_iou = box_overlap_info['max_iou']
-                        
-                    # 이 박스 정보 추가
-                    all_boxes_overlap_info.append(box_overlap_info)
-
-                # 각 박스별 상세 겹침 정보를 분석하여 기존 형식의 정보도 생성
-                detailed_overlap_info = []
-                for box_info in all_boxes_overlap_info:
-                    if box_info['has_overlap']:
-                        detail_info = {
-                            'main_box_index': box_info['box_index'],  # 주 클래스의 박스 인덱스
-                            'max_iou': box_info['max_iou'],          # 최대 IoU 값
-                            'overlapping_boxes': box_info['overlapping_boxes']  # 겹치는 대상 박스 정보
-                        }
-                        detailed_overlap_info.append(detail_info)
+    def check_box_overlap(self, label_path, main_class_idx, target_class_idx):
+        """
+        특정 클래스의 각 박스별로 겹침 정보를 분석합니다.
+        박스는 float32 배열로 읽고 IoU는 compute_box_overlap으로 일괄 계산합니다.
+        """
+        # 캐시 키 생성
+        cache_key = (label_path, main_class_idx, target_class_idx, self.iou_threshold_var.get())
+        if cache_key in self.overlap_cache:
+            return self.overlap_cache[cache_key]
 
-                # 결과 반환 및 캐싱 (기존 호환성 유지 + 박스별 정보 추가)
-                result = (any_overlap, max_overall_iou, detailed_overlap_info, all_boxes_overlap_info)
-                self.overlap_cache[cache_key] = result
-                return result
+        if not os.path.isfile(label_path):
+            return False, 0.0, [], []
+
+        try:
+            boxes = self.read_label_boxes(label_path)
+            result = compute_box_overlap(boxes, main_class_idx, target_class_idx,
+                                         self.iou_threshold_var.get())
+            self.overlap_cache[cache_key] = result
+            return result
 
         except Exception as e:
             print(f"Error checking box overlap in {label_path}: {e}")
@@ -2593,11 +4166,9 @@ class ImageViewer:
                         progress_window.update()
             
             # Reset selection state
-            for label in self.checklist:
-                if label.winfo_exists():
-                    label.config(highlightbackground="white", highlightthickness=4)
             self.selected_image_labels.clear()
-            self.checklist.clear()
+            self.grid_view.checked.clear()
+            self.grid_view.repaint()
             self.update_selection_info()
             
             # Show completion
@@ -2665,9 +4236,12 @@ class ImageViewer:
         stats = {"total": len(class_images), "overlapping": 0, "non_overlapping": 0}
         
         for i, label_path in enumerate(class_images):
-            # 진행 상황 업데이트
-            progress_bar["value"] = i + 1
-            status_label.config(text=f"{i+1}/{len(class_images)} 분석 완료")
+            # 진행 상황 업데이트 (UI 갱신은 일정 간격으로만)
+            if i % 200 == 0 or i == len(class_images) - 1:
+                progress_bar["value"] = i + 1
+                status_label.config(text=f"{i+1}/{len(class_images)} 분석 완료")
+                result_label.config(text=f"발견된 겹침: {stats['overlapping']}, 겹치지 않음: {stats['non_overlapping']}")
+                progress_window.update()
             
             # 박스 겹침 확인 - 수정된 버전 사용
             has_overlap, max_iou, detailed_info, all_boxes_info = self.check_box_overlap(
@@ -2696,12 +4270,6 @@ class ImageViewer:
                 else:
                     stats["non_overlapping"] += 1
                     filtered_images.append((label_path, 0.0))
-                        
-                result_label.config(text=f"발견된 겹침: {stats['overlapping']}, 겹치지 않음: {stats['non_overlapping']}")
-                
-                # UI 업데이트 (10개 이미지마다)
-                if i % 10 == 0 or i == len(class_images) - 1:
-                    progress_window.update()
             
         # 결과 요약 표시
         progress_label.config(text="필터링 완료!")
@@ -2723,6 +4291,13 @@ class ImageViewer:
         """Update the scroll region when the canvas size changes"""
         # Update the scrollable region to include all content
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        # 보이는 행 수가 바뀌므로 셀 풀 크기와 연결 범위 다시 계산
+        self.grid_view.schedule_refresh()
+
+    def on_canvas_yscroll(self, first, last):
+        """스크롤 위치가 바뀌면 스크롤바를 갱신하고 보이는 항목으로 셀을 다시 연결합니다."""
+        self.scrollbar.set(first, last)
+        self.grid_view.schedule_refresh()
 
     def on_mousewheel(self, event):
         """Handle mouse wheel scrolling"""
@@ -2743,42 +4318,6 @@ class ImageViewer:
         end_idx = min(start_idx + self.page_size, len(self.image_paths))
         return self.image_paths[start_idx:end_idx], self.labels[start_idx:end_idx]
 
-    def process_boxed_image(self, image, label_path, class_idx, row, col, img_index):
-        """Process image with cropped boxes for specific class. Returns next column position."""
-        try:
-            with open(label_path, "r", encoding='utf-8') as f:
-                boxes = [line.strip().split() for line in f]
-            
-            has_boxes = False
-            current_col = col
-            
-            for box in boxes:
-                if int(box[0]) != class_idx:
-                    continue
-                    
-                # Extract box coordinates
-                x, y, w, h = map(float, box[1:])
-                left = int((x - w/2) * image.width)
-                top = int((y - h/2) * image.height)
-                right = int((x + w/2) * image.width)
-                bottom = int((y + h/2) * image.height)
-                
-                # Crop and resize
-                cropped = image.crop((left, top, right, bottom)).resize((100, 100))
-                self.draw_boxes_on_image_corp(cropped, label_path, row, current_col, class_idx, img_index)
-                
-                has_boxes = True
-                current_col += 1
-                if current_col >= 12:
-                    current_col = 0
-                    row += 2
-            
-            # Return original column if no boxes were processed
-            return current_col if has_boxes else col
-                
-        except Exception as e:
-            print(f"Error in process_boxed_image for {label_path}: {e}")
-            return col  # Return original column on error
     def toggle_image_view(self, img_path, label_path):
         """Show full view of the image in the main window"""
         if not hasattr(self, 'current_full_view'):
@@ -2798,110 +4337,41 @@ class ImageViewer:
         self.update_display()
 
     def read_label_file(self, label_path, max_retries=3):
-        """효율적인 인코딩 감지로 라벨 파일 읽기 - 오류 처리 강화"""
+        """라벨 파일을 바이트로 한 번 읽어 데이터셋 인코딩으로 디코딩합니다 (readlines 형태 반환)."""
         if not label_path:
             return []
-            
-        # 파일 존재 여부 확인
-        if not os.path.isfile(label_path):
-            if hasattr(self, 'logger'):
-                self.logger.warning(f"라벨 파일이 존재하지 않습니다: {label_path}")
-            else:
-                print(f"라벨 파일이 존재하지 않습니다: {label_path}")
-            return []
-
-        # 파일 크기 확인
-        try:
-            file_size = os.path.getsize(label_path)
-            if file_size == 0:
-                # 빈 파일은 경고만 하고 빈 리스트 반환 (에러는 아님)
-                # print(f"빈 라벨 파일입니다: {label_path}")
-                return []
-
-            # 지나치게 큰 파일 확인 (100MB 이상)
-            if file_size > 100_000_000:
-                print(f"경고: 라벨 파일이 너무 큽니다 ({file_size / 1024 / 1024:.2f}MB): {label_path}")
-        except OSError as e:
-            print(f"파일 크기 확인 중 오류: {label_path}, error: {e}")
-            return []
         
-        # 재시도 로직 추가
+        # I/O 오류만 재시도 (인코딩은 LabelReader가 메모리에서 처리)
         retry_count = 0
         last_error = None
         
         while retry_count < max_retries:
             try:
-                # 1. 캐시된 인코딩 확인
-                if label_path in self.file_encoding_cache:
-                    try:
-                        with open(label_path, 'r', encoding=self.file_encoding_cache[label_path]) as f:
-                            return f.readlines()
-                    except UnicodeDecodeError:
-                        # 캐시된 인코딩이 더이상 유효하지 않으면 캐시에서 제거
-                        del self.file_encoding_cache[label_path]
-                
-                # 2. 파일 형식 체크 - 바이너리 모드로 헤더 읽기
-                with open(label_path, 'rb') as f:
-                    header = f.read(4)
-                    
-                    # BOM 확인
-                    if header.startswith(b'\xef\xbb\xbf'):
-                        encoding = 'utf-8-sig'
-                    elif header.startswith(b'\xff\xfe'):
-                        encoding = 'utf-16-le'
-                    elif header.startswith(b'\xfe\xff'):
-                        encoding = 'utf-16-be'
-                    else:
-                        # 3. 일반적인 인코딩 시도
-                        encodings_to_try = ['utf-8', 'cp949', 'euc-kr', 'latin-1']
-                        for enc in encodings_to_try:
-                            try:
-                                with open(label_path, 'r', encoding=enc) as f:
-                                    lines = f.readlines()
-                                    # 성공한 인코딩 캐시에 저장
-                                    self.file_encoding_cache[label_path] = enc
-                                    return lines
-                            except UnicodeDecodeError:
-                                continue
-                        
-                        # 모든 인코딩 실패 시 기본 인코딩으로 바이너리 모드 사용
-                        with open(label_path, 'rb') as f:
-                            binary_data = f.read()
-                            try:
-                                text = binary_data.decode(self.default_encoding, errors='replace')
-                                lines = text.splitlines(keepends=True)
-                                return lines
-                            except:
-                                print(f"모든 인코딩 실패: {label_path}")
-                                # 마지막 재시도가 아니면 재시도
-                                if retry_count < max_retries - 1:
-                                    retry_count += 1
-                                    time.sleep(0.1)
-                                    continue
-                                return []
+                data = self.label_reader.read_bytes(label_path)
+                
+                # 지나치게 큰 파일 확인 (100MB 이상)
+                if len(data) > 100_000_000:
+                    print(f"경고: 라벨 파일이 너무 큽니다 ({len(data) / 1024 / 1024:.2f}MB): {label_path}")
+                return self.label_reader.split_lines(data)
+                
+            except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+                if hasattr(self, 'logger'):
+                    self.logger.warning(f"라벨 파일이 존재하지 않습니다: {label_path}")
+                else:
+                    print(f"라벨 파일이 존재하지 않습니다: {label_path}")
+                return []
                 
-                # BOM이 있는 경우 처리
-                try:
-                    with open(label_path, 'r', encoding=encoding) as f:
-                        lines = f.readlines()
-                        self.file_encoding_cache[label_path] = encoding
-                        return lines
-                except Exception as bom_error:
-                    last_error = bom_error
-                    retry_count += 1
-                    time.sleep(0.1)
-                    continue
-                    
             except PermissionError as e:
                 # 파일 접근 권한 오류
                 print(f"파일 접근 권한 오류 ({label_path}): {e}")
                 return []
                 
-            except (IOError, OSError) as e:
+            except OSError as e:
                 # 파일 I/O 오류는 재시도
                 last_error = e
                 retry_count += 1
-                time.sleep(0.5)  # 0.5초 대기 후 재시도
+                if retry_count < max_retries:
+                    time.sleep(0.5)  # 0.5초 대기 후 재시도
                 
             except Exception as e:
                 print(f"파일 읽기 중 예상치 못한 오류 ({label_path}): {e}")
@@ -2931,9 +4401,8 @@ class ImageViewer:
             self.root.config(cursor="watch")  # 커서 변경으로 처리 중임을 표시
             self.root.update_idletasks()  # UI 즉시 업데이트    
 
-            for widget in self.frame.winfo_children():
-                widget.destroy()
-            gc.collect()
+            # 셀 위젯은 파괴하지 않고 풀로 반환하여 재사용
+            self.release_grid_cells()
 
 
             if hasattr(self, 'show_only_similar') and self.show_only_similar and hasattr(self, 'current_filtered_labels'):
@@ -2955,9 +4424,11 @@ class ImageViewer:
                 # 페이지네이션 컨트롤 업데이트
                 self.update_pagination_controls()
                 
-                # 이미지 및 라벨 표시
+                # 이미지 및 라벨 표시 (페이지 항목만 만들고 이미지는 셀이 연결될 때 그림)
+                items = []
                 current_row = 0
                 current_col = 0
+                selected_class = int(self.class_selector.get())
                 
                 for idx, label_path in enumerate(current_page_images):
                     img_path = self.get_image_path_from_label(label_path)
@@ -2967,97 +4438,63 @@ class ImageViewer:
                         continue
                         
                     try:
-                            # 이미지 로드 및 처리
-                        with Image.open(img_path) as img:
-                                selected_class = int(self.class_selector.get())
+                        boxes_processed = False
+                        
+                        # Box 이미지 모드인 경우
+                        if self.box_image_var.get():
+                            # 특정 박스만 표시 (주요 수정 사항)
+                            similar_line_indices = None
+                            if hasattr(self, 'filtered_similar_label_info'):
+                                # 현재 라벨의 박스 정보 찾기
+                                label_info = next((info for info in self.filtered_similar_label_info 
+                                                if info['path'] == label_path), None)
+                                if label_info:
+                                    # 유사한 박스 라인 인덱스 목록
+                                    similar_line_indices = [box['line_idx'] for box in label_info['boxes']]
+                            
+                            # 라벨 파일에서 클래스 박스 정보 읽기 (파싱된 박스 배열 사용)
+                            box_idx = -1  # 같은 클래스 내 박스 인덱스
+                            for line_idx, class_index, x_center, y_center, width, height in self.read_label_boxes(label_path).tolist():
+                                if int(class_index) != selected_class:
+                                    continue
+                                line_idx = int(line_idx)
+                                box_idx += 1
                                 
-                                # Box 이미지 모드인 경우
-                                if self.box_image_var.get():
-                                    boxes_processed = False
-                                    
-                                    # 라벨 파일에서 클래스 박스 정보 읽기
-                                    with open(label_path, "r", encoding='utf-8') as f:
-                                        lines = f.readlines()
-                                        for line_idx, line in enumerate(lines):
-                                            try:
-                                                class_index, x_center, y_center, width, height = map(float, line.split())
-                                                if int(class_index) != selected_class:
-                                                    continue
-                                                    
-                                                # 특정 박스만 표시 (주요 수정 사항)
-                                                if hasattr(self, 'filtered_similar_label_info'):
-                                                    # 현재 라벨의 박스 정보 찾기
-                                                    label_info = next((info for info in self.filtered_similar_label_info 
-                                                                    if info['path'] == label_path), None)
-                                                    
-                                                    if label_info:
-                                                        # 유사한 박스 라인 인덱스 목록
-                                                        similar_line_indices = [box['line_idx'] for box in label_info['boxes']]
-                                                        
-                                                        # 현재 라인이 유사 박스가 아니면 건너뛰기
-                                                        if line_idx not in similar_line_indices:
-                                                            continue
-                                                
-                                                left = int((float(x_center) - float(width)/2) * img.width)
-                                                top = int((float(y_center) - float(height)/2) * img.height)
-                                                right = int((float(x_center) + float(width)/2) * img.width)
-                                                bottom = int((float(y_center) + float(height)/2) * img.height)
-                                                
-                                                # 박스 이미지 자르기
-                                                cropped = img.crop((left, top, right, bottom)).resize((100, 100))
-                                                # 박스 그리기 - 정확한 라인 인덱스 전달
-                                                self.draw_boxes_on_image_corp(
-                                                    cropped, label_path, current_row, current_col, 
-                                                    selected_class, start_idx + idx, line_idx  # line_idx 전달
-                                                )
-                                                
-                                                boxes_processed = True
-                                                current_col += 1
-                                                if current_col >= 12:
-                                                    current_col = 0
-                                                    current_row += 2
-                                            except (ValueError, IndexError) as e:
-                                                print(f"Error processing line in {label_path}: {e}")
-                                                continue
-                                    
-                                    # 박스가 없는 경우 전체 이미지 표시
-                                    if not boxes_processed:
-                                        img_resized = img.resize((200, 200))
-                                        self.draw_boxes_on_image(img_resized, label_path, current_row, current_col, start_idx + idx)
-                                        current_col += 1
-                                        if current_col >= 5:
-                                            current_col = 0
-                                            current_row += 2
-                                else:
-                                    # 전체 이미지 모드일 때
-                                    img_resized = img.resize((200, 200))
-                                    self.draw_boxes_on_image(img_resized, label_path, current_row, current_col, start_idx + idx)
-                                    current_col += 1
-                                    if current_col >= 5:
-                                        current_col = 0
-                                        current_row += 2
-                    except (FileNotFoundError, IOError) as e:
-                        print(f"이미지 파일 로드 실패 ({img_path}): {e}")
-                        # 오류 이미지 대체 표시
-                        placeholder = Image.new('RGB', (200, 200), color=(240, 240, 240))
-                        draw = ImageDraw.Draw(placeholder)
-                        draw.text((40, 80), f"이미지 로드 오류", fill=(0, 0, 0))
-                        draw.text((40, 100), f"{os.path.basename(img_path)}", fill=(255, 0, 0))
-                        self.draw_boxes_on_image(placeholder, label_path, current_row, current_col, start_idx + idx)
-                        current_col += 1
-                        if current_col >= 5:
-                            current_col = 0
-                            current_row += 2
-                        continue
+                                # 현재 라인이 유사 박스가 아니면 건너뛰기
+                                if similar_line_indices is not None and line_idx not in similar_line_indices:
+                                    continue
+                                
+                                items.append(GridItem(
+                                    label_path, img_path, current_row, current_col, start_idx + idx,
+                                    class_idx=selected_class, line_idx=line_idx, box_idx=box_idx,
+                                    box=(x_center, y_center, width, height)))
+                                
+                                boxes_processed = True
+                                current_col += 1
+                                if current_col >= 12:
+                                    current_col = 0
+                                    current_row += 2
+                        
+                        # 전체 이미지 모드이거나 박스가 없는 경우 전체 이미지 표시
+                        if not boxes_processed:
+                            items.append(GridItem(label_path, img_path, current_row, current_col, start_idx + idx))
+                            current_col += 1
+                            if current_col >= 5:
+                                current_col = 0
+                                current_row += 2
                     except Exception as e:
                         print(f"이미지 처리 중 오류 발생 ({img_path}): {e}")
                         import traceback
                         traceback.print_exc()
                         continue
                 
+                # 보이는 행에만 셀 연결
+                self.grid_view.set_items(items)
+                
                 # 프레임 업데이트
                 self.frame.update_idletasks()
                 self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+                self.thumbnail_cache.flush()
                 return  # 유사 라벨 모드일 때는 여기서 리턴
             selected_class = self.class_selector.get()
             if selected_class == "Select Class":
@@ -3071,10 +4508,17 @@ class ImageViewer:
             selected_class = self.class_selector.get()
             overlap_class = self.overlap_class_selector.get()
             overlap_filter = self.overlap_filter_var.get()
+
+            # 예측하지 않은 곳으로 이동했으면 진행 중인 프리페치 취소
+            plan_key = (class_idx, overlap_class, overlap_filter, self.iou_threshold_var.get(),
+                        bool(self.box_image_var.get()), self.page_size)
+            if not self.page_prefetcher.is_planned(plan_key, self.current_page):
+                self.page_prefetcher.cancel()
             
             print(f"Number of images for class {class_idx}: {len(self.labelsdata[class_idx])}")
             # Get all images for selected class
-            class_images = [path for path in self.labels if path in self.labelsdata[class_idx]]
+            class_label_set = set(self.labelsdata[class_idx])
+            class_images = [path for path in self.labels if path in class_label_set]
             if not class_images:
                 print(f"No images found for class {class_idx}")
                 return
@@ -3097,7 +4541,7 @@ class ImageViewer:
             if total_class_images == 0:
                 # 필터링된 이미지가 없는 경우 메시지 표시
                 message_label = tk.Label(self.frame, text="필터 조건에 맞는 이미지가 없습니다.", font=("Arial", 16))
-                message_label.pack(pady=50)
+                message_label.grid(row=0, column=0, pady=50)
                 return
             
             # 여기서부터 이미지를 실제로 표시하는 코드 추가
@@ -3113,6 +4557,8 @@ class ImageViewer:
             # Update pagination display
             self.update_pagination_controls()
             
+            # 페이지 항목만 만들고 이미지는 셀이 연결될 때 그림
+            items = []
             current_row = 0
             current_col = 0
             
@@ -3122,117 +4568,62 @@ class ImageViewer:
                 if not os.path.isfile(img_path) or not os.path.isfile(label_path):
                     print(f"File not found: {img_path} or {label_path}")
                     continue
-                cache_key = f"{img_path}_{200}"  # 200px 크기 썸네일
-                if cache_key in self.image_cache:
-                    img_resized = self.image_cache[cache_key]
-                    img = Image.open(img_path)  # 원본 이미지도 필요한 경우
-                else:
-                    try:
-                        img = Image.open(img_path)
-                        img_resized = img.resize((200, 200))
-                        
-                        # 캐시 크기 제한 확인
-                        if len(self.image_cache) >= self.cache_limit:
-                            # 가장 오래된 항목 제거 (간단한 LRU 전략)
-                            self.image_cache.pop(next(iter(self.image_cache)))
-                            
-                        # 캐시에 저장
-                        self.image_cache[cache_key] = img_resized
-                    except Exception as e:
-                        print(f"이미지 로드 오류 ({img_path}): {e}")
-                        continue
                 show_full = hasattr(self, 'current_full_view') and img_path == self.current_full_view
 
                 try:
-                    # Load and process image
-                    with Image.open(img_path) as img:
-                        show_full = hasattr(self, 'current_full_view') and img_path == self.current_full_view
-                        
-                        if self.box_image_var.get() and not show_full:
-                            # Process boxes
-                            boxes_processed = False
-                            try:
-                                # 라벨 파일에서 클래스 박스 정보 읽기
-                                box_idx = 0  # 같은 클래스 내 박스 인덱스
-                                with open(label_path, "r", encoding='utf-8') as f:
-                                    lines = f.readlines()
-                                    for line_idx, line in enumerate(lines):
-                                        try:
-                                            class_index, x_center, y_center, width, height = map(float, line.split())
-                                            if int(class_index) != class_idx:
-                                                continue
-                                                
-                                            left = int((float(x_center) - float(width)/2) * img.width)
-                                            top = int((float(y_center) - float(height)/2) * img.height)
-                                            right = int((float(x_center) + float(width)/2) * img.width)
-                                            bottom = int((float(y_center) + float(height)/2) * img.height)
-                                            
-                                            # 겹침 정보 확인
-                                            show_box = True
-                                            if overlap_class != "선택 안함":
-                                                # 박스별 겹침 정보 확인
-                                                has_overlap, max_iou, detail_info, all_boxes_info = self.check_box_overlap(
-                                                    label_path, class_idx, int(overlap_class))
-                                                
-                                                # 해당 박스의 겹침 정보 찾기
-                                                current_box_overlap = False
-                                                for box_info in all_boxes_info:
-                                                    if box_info['box_index'] == box_idx:
-                                                        current_box_overlap = box_info['has_overlap']
-                                                        break
-                                                        
-                                                # 필터 조건에 따라 박스 표시 여부 결정
-                                                if overlap_filter == "겹치는 것만" and not current_box_overlap:
-                                                    show_box = False
-                                                elif overlap_filter == "겹치지 않는 것만" and current_box_overlap:
-                                                    show_box = False
-                                            
-                                            # 표시 조건을 만족하는 경우만 박스 처리
-                                            if show_box:
-                                                # 박스 이미지 자르기
-                                                cropped = img.crop((left, top, right, bottom)).resize((100, 100))
-                                                # 박스 그리기
-                                                self.draw_boxes_on_image_corp(
-                                                    cropped, label_path, current_row, current_col, 
-                                                    class_idx, start_idx + idx, box_idx
-                                                )
-                                                
-                                                boxes_processed = True
-                                                current_col += 1
-                                                if current_col >= 12:
-                                                    current_col = 0
-                                                    current_row += 2
-                                            
-                                            # 박스 인덱스 증가
-                                            box_idx += 1
-                                            
-                                        except (ValueError, IndexError) as e:
-                                            print(f"Error processing line in {label_path}: {e}")
-                                            continue
-                            except Exception as e:
-                                print(f"Error reading label file {label_path}: {e}")
-                            
-                            # If no boxes were processed, show full image
-                            if not boxes_processed:
-                                show_image = True
+                    if self.box_image_var.get() and not show_full:
+                        prefetched_crops = self.page_prefetcher.take_crops(img_path, label_path, class_idx)
+                        # Process boxes
+                        boxes_processed = False
+                        try:
+                            # 라벨 파일에서 클래스 박스 정보 읽기
+                            box_idx = 0  # 같은 클래스 내 박스 인덱스
+                            for line_idx, class_index, x_center, y_center, width, height in self.read_label_boxes(label_path).tolist():
+                                line_idx = int(line_idx)
+                                if int(class_index) != class_idx:
+                                    continue
+                                    
+                                # 겹침 정보 확인
+                                show_box = True
                                 if overlap_class != "선택 안함":
-                                    has_overlap, _, _, _ = self.check_box_overlap(
+                                    # 박스별 겹침 정보 확인
+                                    has_overlap, max_iou, detail_info, all_boxes_info = self.check_box_overlap(
                                         label_path, class_idx, int(overlap_class))
                                     
-                                    if overlap_filter == "겹치는 것만" and not has_overlap:
-                                        show_image = False
-                                    elif overlap_filter == "겹치지 않는 것만" and has_overlap:
-                                        show_image = False
+                                    # 해당 박스의 겹침 정보 찾기
+                                    current_box_overlap = False
+                                    for box_info in all_boxes_info:
+                                        if box_info['box_index'] == box_idx:
+                                            current_box_overlap = box_info['has_overlap']
+                                            break
+                                            
+                                    # 필터 조건에 따라 박스 표시 여부 결정
+                                    if overlap_filter == "겹치는 것만" and not current_box_overlap:
+                                        show_box = False
+                                    elif overlap_filter == "겹치지 않는 것만" and current_box_overlap:
+                                        show_box = False
                                 
-                                if show_image:
-                                    img_resized = img.resize((200, 200))
-                                    self.draw_boxes_on_image(img_resized, label_path, current_row, current_col, start_idx + idx)
+                                # 표시 조건을 만족하는 경우만 박스 항목 추가 (프리페치된 크롭이 있으면 함께 보관)
+                                if show_box:
+                                    items.append(GridItem(
+                                        label_path, img_path, current_row, current_col, start_idx + idx,
+                                        class_idx=class_idx, line_idx=line_idx, box_idx=box_idx,
+                                        box=(x_center, y_center, width, height),
+                                        image=prefetched_crops.get(line_idx) if prefetched_crops else None))
+                                    
+                                    boxes_processed = True
                                     current_col += 1
-                                    if current_col >= 5:
+                                    if current_col >= 12:
                                         current_col = 0
                                         current_row += 2
-                        else:
-                            # Show full image
+                                
+                                # 박스 인덱스 증가
+                                box_idx += 1
+                        except Exception as e:
+                            print(f"Error reading label file {label_path}: {e}")
+                        
+                        # If no boxes were processed, show full image
+                        if not boxes_processed:
                             show_image = True
                             if overlap_class != "선택 안함":
                                 has_overlap, _, _, _ = self.check_box_overlap(
@@ -3244,19 +4635,43 @@ class ImageViewer:
                                     show_image = False
                             
                             if show_image:
-                                img_resized = img.resize((200, 200))
-                                self.draw_boxes_on_image(img_resized, label_path, current_row, current_col, start_idx + idx)
+                                items.append(GridItem(label_path, img_path, current_row, current_col, start_idx + idx))
                                 current_col += 1
                                 if current_col >= 5:
                                     current_col = 0
                                     current_row += 2
+                    else:
+                        # Show full image
+                        show_image = True
+                        if overlap_class != "선택 안함":
+                            has_overlap, _, _, _ = self.check_box_overlap(
+                                label_path, class_idx, int(overlap_class))
+                            
+                            if overlap_filter == "겹치는 것만" and not has_overlap:
+                                show_image = False
+                            elif overlap_filter == "겹치지 않는 것만" and has_overlap:
+                                show_image = False
+                        
+                        if show_image:
+                            items.append(GridItem(label_path, img_path, current_row, current_col, start_idx + idx))
+                            current_col += 1
+                            if current_col >= 5:
+                                current_col = 0
+                                current_row += 2
                         
                 except Exception as e:
                     print(f"Error processing image {img_path}: {e}")
                     continue
 
+            # 보이는 행(+위아래 한 행)에만 풀의 셀을 연결
+            self.grid_view.set_items(items)
+
             self.root.config(cursor="")  # 기본 커서로 복원
             self.update_dataset_info()
+            self.thumbnail_cache.flush()
+
+            # 다음 페이지 미리 디코딩 예약
+            self.schedule_page_prefetch(plan_key, class_images, class_idx)
 
             self.canvas.configure(scrollregion=self.canvas.bbox("all"))
             self.root.after(100, self.refresh_bindings)
@@ -3300,12 +4715,6 @@ class ImageViewer:
         특정 라벨을 기준 라벨로 선택하고 해당 라벨의 정보를 저장합니다.
         """
         try:
-            # 이미 선택된 라벨이 있는지 확인
-            if hasattr(self, 'reference_label') and self.reference_label:
-                # 기존 참조 라벨의 하이라이트 제거
-                if hasattr(self, 'reference_label_widget') and self.reference_label_widget and self.reference_label_widget.winfo_exists():
-                    self.reference_label_widget.config(highlightbackground="white", highlightthickness=4)
-            
             # 현재 선택된 클래스
             selected_class = self.class_selector.get()
             if selected_class == "Select Class":
@@ -3323,38 +4732,37 @@ class ImageViewer:
                 specific_line_idx = label.line_idx
                 print(f"특정 박스 선택 (라인 인덱스: {specific_line_idx})")
             
-            with open(label_path, 'r', encoding='utf-8') as f:
-                for line_idx, line in enumerate(f):
-                    if specific_line_idx is not None and line_idx != specific_line_idx:
-                        continue
-                    parts = line.strip().split()
-                    if not parts:
+            for line_idx, line in enumerate(self.read_label_file(label_path)):
+                if specific_line_idx is not None and line_idx != specific_line_idx:
+                    continue
+                parts = line.strip().split()
+                if not parts:
+                    continue
+                    
+                try:
+                    box_class = int(float(parts[0]))
+                    if box_class != class_idx:
                         continue
                         
-                    try:
-                        box_class = int(float(parts[0]))
-                        if box_class != class_idx:
-                            continue
-                            
-                        # 박스 좌표 정보 저장 (정규화된 좌표)
-                        x_center = float(parts[1])
-                        y_center = float(parts[2])
-                        width = float(parts[3])
-                        height = float(parts[4])
-                        
-                        reference_boxes.append({
-                            'class': box_class,
-                            'x': x_center,
-                            'y': y_center,
-                            'w': width,
-                            'h': height,
-                            'line_idx': line_idx
-                        })
-                        if specific_line_idx is not None:
-                            break
-                    except (ValueError, IndexError) as e:
-                        print(f"Error parsing line in reference label {label_path}: {e}")
-                        continue
+                    # 박스 좌표 정보 저장 (정규화된 좌표)
+                    x_center = float(parts[1])
+                    y_center = float(parts[2])
+                    width = float(parts[3])
+                    height = float(parts[4])
+                    
+                    reference_boxes.append({
+                        'class': box_class,
+                        'x': x_center,
+                        'y': y_center,
+                        'w': width,
+                        'h': height,
+                        'line_idx': line_idx
+                    })
+                    if specific_line_idx is not None:
+                        break
+                except (ValueError, IndexError) as e:
+                    print(f"Error parsing line in reference label {label_path}: {e}")
+                    continue
             
             if not reference_boxes:
                 tk.messagebox.showwarning("선택 오류", f"선택한 이미지에서 클래스 {class_idx}의 박스를 찾을 수 없습니다.")
@@ -3367,9 +4775,8 @@ class ImageViewer:
                 'boxes': reference_boxes
             }
             
-            # 기준 라벨 위젯 저장 및 하이라이트
-            self.reference_label_widget = label
-            self.reference_label_widget.config(highlightbackground="blue", highlightthickness=4)
+            # 기준 라벨 항목 하이라이트 (기존 기준 라벨의 하이라이트는 제거)
+            self.grid_view.set_reference(label.item.key)
             
             # 기준 라벨 상태 정보 업데이트
             if hasattr(self, 'ref_label_status'):
@@ -3486,13 +4893,16 @@ class ImageViewer:
                 search_scope = scope_var.get()
                 include_reference = include_ref_var.get()
                 
-                # 라벨 파일 리스트
-                label_files = [path for path in self.labels if os.path.isfile(path)]
-                total_files = len(label_files)
-                
-                # 진행 상황 설정
-                progress_bar["maximum"] = total_files
-                progress_bar["value"] = 0
+                # 데이터셋 전체 박스 공간 인덱스 (바뀐 파일만 다시 읽음)
+                def report_index_progress(done, total):
+                    progress_bar["maximum"] = max(total, 1)
+                    progress_bar["value"] = done
+                    status_label.config(text=f"박스 인덱스 준비 중: {done}/{total}")
+                    progress_window.update()
+
+                spatial_index = self.get_box_spatial_index(report_index_progress, with_sizes=True)
+                total_files = len(spatial_index.paths)
+                allowed_classes = [class_idx] if search_scope == "current_class" else None
                 
                 # 필터링된 라벨 저장 변수
                 similar_labels = []
@@ -3509,109 +4919,45 @@ class ImageViewer:
                         'boxes': self.reference_label['boxes']
                     })
                 
-                # 각 라벨 파일 처리
-                for i, label_path in enumerate(label_files):
-                    # 진행 상황 업데이트
-                    progress_bar["value"] = i + 1
-                    status_label.config(text=f"처리 중: {i+1}/{total_files}")
-                    result_label.config(text=f"찾은 유사 라벨: {len(similar_labels)}개")
-                    progress_window.update()
-                    
-                    # 자기 자신은 이미 추가했으므로 건너뛰기
-                    if label_path == self.reference_label['path']:
-                        continue
+                # 허용 오차(±5 픽셀)는 이미지마다 실제 크기로 확인
+                # (후보 조회는 가장 작은 이미지 기준의 넓은 반경으로 수행)
+                pixel_tolerance = 5
+
+                matched_boxes = defaultdict(dict)  # label_path -> {line_idx: box}
+                status_label.config(text="위치 조회 중...")
+                progress_window.update()
+                
+                for ref_box in reference_boxes:
+                    rows = spatial_index.query_pixel_center(ref_box['x'], ref_box['y'], pixel_tolerance,
+                                                            allowed_classes)
                     
-                    # 라벨 파일 처리
-                    try:
-                        with open(label_path, 'r', encoding='utf-8') as f:
-                            lines = f.readlines()
-                        
-                        # 해당 클래스의 박스 추출
-                        similar_boxes = []  # 유사한 박스 정보 저장 (주요 수정 사항)
-                        is_similar = False
+                    for row in rows:
+                        label_path, line_idx, box_class, x, y, w, h = spatial_index.row_info(row)
                         
-                        for line_idx, line in enumerate(lines):
-                            parts = line.strip().split()
-                            if not parts:
-                                continue
-                                
-                            try:
-                                box_class = int(float(parts[0]))
-                                
-                                # 검색 범위에 따라 클래스 필터링
-                                if search_scope == "current_class" and box_class != class_idx:
-                                    continue
-                                    
-                                x = float(parts[1])
-                                y = float(parts[2])
-                                w = float(parts[3])
-                                h = float(parts[4])
-                                
-                                # 현재 박스 정보
-                                current_box = {
-                                    'class': box_class,
-                                    'x': x,
-                                    'y': y,
-                                    'w': w,
-                                    'h': h,
-                                    'line_idx': line_idx  # 라인 인덱스 저장
-                                }
-                                
-                                # 모든 참조 박스와 비교
-                                for ref_box in reference_boxes:
-                                    # 이미지 경로 가져오기
-                                    img_path = self.get_image_path_from_label(label_path)
-                                    
-                                    # 이미지 사이즈 확인 (실제 픽셀 좌표 계산을 위해)
-                                    try:
-                                        # 이미지가 존재하는지 확인
-                                        if not os.path.isfile(img_path):
-                                            continue
-                                            
-                                        # 이미지 크기 가져오기
-                                        with Image.open(img_path) as img:
-                                            img_width, img_height = img.size
-                                        
-                                        # 정규화된 좌표를 픽셀 좌표로 변환
-                                        ref_x_px = ref_box['x'] * img_width
-                                        ref_y_px = ref_box['y'] * img_height
-                                        cur_x_px = x * img_width
-                                        cur_y_px = y * img_height
-                                        
-                                        # 픽셀 단위로 차이 계산
-                                        x_diff_px = abs(ref_x_px - cur_x_px)
-                                        y_diff_px = abs(ref_y_px - cur_y_px)
-                                        
-                                        # 5픽셀 오차 범위 내에 있는지 확인
-                                        if x_diff_px <= 5 and y_diff_px <= 5:
-                                            # 유사한 박스 발견
-                                            is_similar = True
-                                            # 유사한 박스 정보 저장 (주요 수정 사항)
-                                            if current_box not in similar_boxes:
-                                                similar_boxes.append(current_box)
-                                    except Exception as e:
-                                        print(f"Error comparing image dimensions: {e}")
-                                        continue
-                            except Exception as e:
-                                print(f"Error comparing image dimensions: {e}")
-                                continue
+                        # 자기 자신은 이미 추가했으므로 건너뛰기
+                        if label_path == self.reference_label['path'] or line_idx in matched_boxes[label_path]:
+                            continue
                         
-                        # 유사한 라벨이 발견되면 목록에 추가
-                        if is_similar:
-                            similar_labels.append(label_path)
-                            # 유사한 박스 정보도 저장 (주요 수정 사항)
-                            similar_label_info.append({
-                                'path': label_path,
-                                'boxes': similar_boxes
-                            })
-                    
-                    except Exception as e:
-                        print(f"Error processing label {label_path}: {e}")
-                        continue
-                    
-                    # 주기적으로 UI 업데이트
-                    if i % 10 == 0 or i == total_files - 1:
-                        progress_window.update()
+                        matched_boxes[label_path][line_idx] = {
+                            'class': box_class,
+                            'x': x,
+                            'y': y,
+                            'w': w,
+                            'h': h,
+                            'line_idx': line_idx  # 라인 인덱스 저장
+                        }
+                
+                # 라벨 목록 순서대로 결과 정리
+                label_order = {path: i for i, path in enumerate(self.labels)}
+                for label_path in sorted((path for path, boxes in matched_boxes.items() if boxes),
+                                         key=lambda path: label_order.get(path, len(label_order))):
+                    boxes = matched_boxes[label_path]
+                    similar_labels.append(label_path)
+                    # 유사한 박스 정보도 저장 (주요 수정 사항)
+                    similar_label_info.append({
+                        'path': label_path,
+                        'boxes': [boxes[line_idx] for line_idx in sorted(boxes)]
+                    })
                 
                 # 필터링 완료
                 progress_bar["value"] = total_files
@@ -3712,8 +5058,7 @@ class ImageViewer:
         if hasattr(self, 'reference_label'):
             delattr(self, 'reference_label')
             
-        if hasattr(self, 'reference_label_widget') and self.reference_label_widget and self.reference_label_widget.winfo_exists():
-            self.reference_label_widget.config(highlightbackground="white", highlightthickness=4)
+        self.grid_view.set_reference(None)
             
         if hasattr(self, 'filtered_similar_labels'):
             delattr(self, 'filtered_similar_labels')
@@ -3761,21 +5106,16 @@ class ImageViewer:
         else:
             # 기존 기능 유지
             try:
-                if label in self.checklist:
+                key = label.item.key
+                if key in self.grid_view.checked:
                     # 선택 해제 시
-                    label.config(bd=0, highlightbackground="white", highlightthickness=4)
-                    label.config(bg="white")
                     if label_path in self.selected_image_labels:
                         self.selected_image_labels.remove(label_path)
-                    if label in self.checklist:
-                        self.checklist.remove(label)
+                    self.grid_view.set_checked(key, False)
                 else:
                     # 선택 시
-                    label.config(bd=0, highlightbackground="red", highlightthickness=4)
-                    label.config(bg="#ffdddd")  # 연한 빨간색 배경
                     self.selected_image_labels.append(label_path)
-                    if label not in self.checklist:
-                        self.checklist.append(label)
+                    self.grid_view.set_checked(key)
                 
                 self.update_selection_info()
                 
@@ -3867,18 +5207,19 @@ class ImageViewer:
             # 동그라미 그리기 (채워진 원)
             draw.ellipse(circle_bbox, fill=color, outline='white', width=2)
 
-    def draw_boxes_on_image_corp(self, image, label_path, row, col, class_index, img_index, line_idx=None):
+    def draw_boxes_on_image_corp(self, image, label_path, class_index, img_index, line_idx=None):
         """
         크롭된 이미지에 정보를 그리고, 대상 클래스 박스도 함께 표시합니다.
         
         Parameters:
-            image (PIL.Image): 처리할 이미지
+            image (PIL.Image): 처리할 이미지 (직접 그림)
             label_path (str): 라벨 파일 경로
-            row (int): 그리드 행 위치
-            col (int): 그리드 열 위치
             class_index (int): 현재 선택된 클래스 인덱스
             img_index (int): 이미지 인덱스 (표시용)
             line_idx (int, optional): 같은 클래스 내에서의 박스 인덱스
+
+        Returns:
+            str: 셀 테두리 색 (라벨을 읽지 못하면 None)
         """
         draw = ImageDraw.Draw(image)
         overlap_class = self.overlap_class_selector.get()
@@ -3892,23 +5233,22 @@ class ImageViewer:
 
         # 라벨 데이터 읽기
         try:
-            with open(label_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                for i, line in enumerate(lines):
-                    parts = line.strip().split()
-                    if len(parts) >= 5:
-                        box_class = int(float(parts[0]))
-                        box_info = {
-                            'line_idx': i,  # 실제 파일 라인 인덱스
-                            'class': box_class,
-                            'x': float(parts[1]),
-                            'y': float(parts[2]),
-                            'w': float(parts[3]),
-                            'h': float(parts[4])
-                        }
-                        all_boxes.append(box_info)
-                        if box_class == class_index:
-                            same_class_boxes.append(box_info)
+            lines = self.read_label_file(label_path)
+            for i, line in enumerate(lines):
+                parts = line.strip().split()
+                if len(parts) >= 5:
+                    box_class = int(float(parts[0]))
+                    box_info = {
+                        'line_idx': i,  # 실제 파일 라인 인덱스
+                        'class': box_class,
+                        'x': float(parts[1]),
+                        'y': float(parts[2]),
+                        'w': float(parts[3]),
+                        'h': float(parts[4])
+                    }
+                    all_boxes.append(box_info)
+                    if box_class == class_index:
+                        same_class_boxes.append(box_info)
         except Exception as e:
             print(f"라벨 파일 읽기 오류: {e}")
             return None
@@ -3980,44 +5320,7 @@ class ImageViewer:
         # 작업 상태 indicator 표시
         bind_line_idx = current_box['line_idx'] if current_box else line_idx
         self.draw_status_indicator(image, label_path, bind_line_idx)
-
-        # 라벨 생성 및 이미지 표시
-        try:
-            photo = ImageTk.PhotoImage(image)
-            label = tk.Label(self.frame, image=photo, bg="white")
-            label.image = photo
-            label.label_path = label_path
-
-            # 라벨 위젯에 라인 인덱스 저장
-            if current_box:
-                # 실제 파일의 라인 인덱스 저장
-                label.line_idx = current_box['line_idx']
-            elif line_idx is not None:
-                # 전달받은 라인 인덱스 사용 (백업)
-                label.line_idx = line_idx
-
-            label.config(relief="solid", bd=0, highlightbackground=border_color, highlightthickness=4)
-            label.grid(row=row, column=col, padx=10, pady=10)
-
-            img_path = self.get_image_path_from_label(label_path)
-
-            # 이벤트 바인딩 - 현재 박스의 실제 라인 인덱스 또는 전달받은 인덱스
-            bind_line_idx = current_box['line_idx'] if current_box else line_idx
-
-            # 드래그 선택 이벤트 바인딩 (Shift + 클릭/드래그 포함)
-            self.setup_drag_select_events(label, label_path)
-
-            label.bind("<Button-3>", lambda event, img_p=img_path, lbl_p=label_path, ln_idx=bind_line_idx:
-                    self.show_full_image(img_p, lbl_p, ln_idx))
-            label.bind("<Enter>", lambda event, l=label:
-                    self.show_box_tooltip(l, label_path, bind_line_idx))
-            label.bind("<Leave>", lambda event:
-                    self.remove_tooltip())
-
-            return label
-        except Exception as e:
-            print(f"이미지 라벨 생성 실패 ({label_path}): {e}")
-            return None
+        return border_color
 
     def show_box_tooltip(self, label_widget, label_path, line_idx):
         """
@@ -4059,44 +5362,6 @@ class ImageViewer:
                     self.create_tooltip(label_widget, tooltip_text)
         except Exception as e:
             print(f"툴팁 표시 오류: {e}")
-    def process_boxed_image(self, image, label_path, class_idx, row, col, img_index):
-        """Process image with cropped boxes for specific class. Returns next column position."""
-
-        try:
-            with open(label_path, "r", encoding='utf-8') as f:
-                # 读取文件中的每一行，并分割成列表
-                boxes = [line.strip().split() for line in f]
-            
-            # 保存原始列位置，以便在出现异常时返回
-            orig_col = col
-            # 遍历所有的框
-            for box in boxes:
-                # 如果框的类别索引不匹配，跳过该框
-                # if int(box[0]) != class_idx:
-                #     continue
-                if int(float(box[0])) != class_idx:
-                    continue
-                    
-                # Extract box coordinates
-                x, y, w, h = map(float, box[1:])
-                left = int((x - w/2) * image.width)
-                top = int((y - h/2) * image.height)
-                right = int((x + w/2) * image.width)
-                bottom = int((y + h/2) * image.height)
-                
-                # Crop and resize
-                cropped = image.crop((left, top, right, bottom)).resize((100, 100))
-                self.draw_boxes_on_image_corp(cropped, label_path, row, col, class_idx, img_index)
-                
-                col += 1
-                if col == 12:
-                    col = 0
-                    
-            return col
-                
-        except Exception as e:
-            print(f"Error processing boxes in {label_path}: {e}")
-            return orig_col
     def setup_keyboard_events(self):
     
         self.ctrl_pressed = False
@@ -4227,16 +5492,16 @@ class ImageViewer:
         print("Drag selection started")  # 디버깅용
     def find_similar_boxes(self, iou_threshold=0.97):
         """
-        현재 페이지에서 IoU가 97% 이상인 서로 다른 클래스의 바운딩 박스들을 찾습니다.
+        데이터셋 전체에서 IoU가 임계값 이상인 서로 다른 클래스의 바운딩 박스들을 찾습니다.
+        박스는 공간 인덱스에 모아 둔 파싱 결과를 사용하므로 라벨 파일을 다시 읽지 않습니다.
         
         Returns:
             list: 유사한 바운딩 박스 그룹 목록. 각 그룹은 바운딩 박스 정보 사전의 목록입니다.
         """
-        # 현재 페이지의 이미지 목록 가져오기
-        current_page_images = self.get_current_page_images()
-        
         # 유사한 박스 그룹 저장 리스트
         similar_box_groups = []
+        group_of_box = {}  # (label_path, line_idx) -> 처음 포함된 그룹 번호
+        group_keys = []  # 그룹별 (label_path, line_idx) 집합
         
         # 진행 창 생성
         progress_window = tk.Toplevel(self.root)
@@ -4252,13 +5517,8 @@ class ImageViewer:
         )
         progress_label.pack(pady=(15, 5))
         
-        # 진행 상황 표시 요소
-        progress_label = tk.Label(progress_window, text="유사한 바운딩 박스 찾는 중...", font=("Arial", 10, "bold"))
-        progress_label.pack(pady=(15, 5))
-        
         progress_bar = ttk.Progressbar(progress_window, length=400)
         progress_bar.pack(pady=10)
-        progress_bar["maximum"] = len(current_page_images)
         
         status_label = tk.Label(progress_window, text="0/0 처리 완료")
         status_label.pack(pady=5)
@@ -4268,90 +5528,81 @@ class ImageViewer:
         
         progress_window.update()
         
-        # 각 이미지 처리
-        for i, img_path in enumerate(current_page_images):
-            # 진행 상황 업데이트
-            progress_bar["value"] = i + 1
-            status_label.config(text=f"{i+1}/{len(current_page_images)} 처리 중")
+        def report_index_progress(done, total):
+            progress_bar["maximum"] = max(total, 1)
+            progress_bar["value"] = done
+            status_label.config(text=f"박스 인덱스 준비 중: {done}/{total}")
             progress_window.update()
-            
-            # 라벨 파일 경로
-            label_path = self.convert_jpegimages_to_labels(img_path)
-            
-            if not os.path.isfile(label_path):
+        
+        spatial_index = self.get_box_spatial_index(report_index_progress)
+        label_paths = spatial_index.paths
+        progress_bar["maximum"] = max(len(label_paths), 1)
+        
+        # 각 라벨 파일 처리
+        for i, label_path in enumerate(label_paths):
+            boxes = spatial_index.file_boxes.get(label_path)
+            if boxes is None or len(boxes) < 2:
                 continue
-                
-            # 모든 바운딩 박스 정보 읽기
-            boxes = []
-            try:
-                with open(label_path, 'r', encoding='utf-8') as f:
-                    for line_idx, line in enumerate(f):
-                        parts = line.strip().split()
-                        if len(parts) >= 5:
-                            class_idx = int(float(parts[0]))
-                            x_center = float(parts[1])
-                            y_center = float(parts[2])
-                            width = float(parts[3])
-                            height = float(parts[4])
-                            
-                            box_info = {
-                                'label_path': label_path,
-                                'img_path': img_path,
-                                'class': class_idx,
-                                'line_idx': line_idx,
-                                'x_center': x_center,
-                                'y_center': y_center,
-                                'width': width,
-                                'height': height,
-                                'coords': (
-                                    x_center - width/2,
-                                    y_center - height/2,
-                                    x_center + width/2,
-                                    y_center + height/2
-                                )
-                            }
-                            boxes.append(box_info)
-            except Exception as e:
-                print(f"라벨 파일 읽기 오류 ({label_path}): {e}")
+            
+            # 서로 다른 클래스 박스 쌍 중 IoU가 임계값 이상인 것 (j < k)
+            classes = boxes[:, 1].astype(np.int64)
+            iou = pairwise_iou(boxes_to_xyxy(boxes), boxes_to_xyxy(boxes))
+            hits = np.triu((iou >= iou_threshold) & (classes[:, None] != classes[None, :]), k=1)
+            if not hits.any():
                 continue
-                
-            # 모든 박스 쌍에 대해 IoU 계산
-            for j in range(len(boxes)):
-                for k in range(j+1, len(boxes)):
-                    box1 = boxes[j]
-                    box2 = boxes[k]
-                    
-                    # 같은 클래스면 건너뛰기
-                    if box1['class'] == box2['class']:
-                        continue
-                        
-                    # IoU 계산
-                    iou = self.calculate_iou(box1['coords'], box2['coords'])
-                    
-                    # IoU가 97% 이상이면 유사한 박스로 간주
-                    if iou >= iou_threshold:
-                        # 이미 유사한 그룹에 포함되어 있는지 확인
-                        found_group = False
-                        for group in similar_box_groups:
-                            if any(box['label_path'] == box1['label_path'] and 
-                                box['line_idx'] == box1['line_idx'] for box in group):
-                                # 기존 그룹에 추가
-                                if not any(box['label_path'] == box2['label_path'] and 
-                                        box['line_idx'] == box2['line_idx'] for box in group):
-                                    group.append(box2)
-                                found_group = True
-                                break
-                        
-                        if not found_group:
-                            # 새 그룹 생성
-                            similar_box_groups.append([box1, box2])
+            
+            img_path = self.get_image_path_from_label(label_path)
+            box_infos = {}
+            
+            def box_info(j):
+                if j not in box_infos:
+                    line_idx, class_idx, x_center, y_center, width, height = boxes[j].tolist()
+                    box_infos[j] = {
+                        'label_path': label_path,
+                        'img_path': img_path,
+                        'class': int(class_idx),
+                        'line_idx': int(line_idx),
+                        'x_center': x_center,
+                        'y_center': y_center,
+                        'width': width,
+                        'height': height,
+                        'coords': (
+                            x_center - width/2,
+                            y_center - height/2,
+                            x_center + width/2,
+                            y_center + height/2
+                        )
+                    }
+                return box_infos[j]
+            
+            for j, k in zip(*np.nonzero(hits)):
+                key1 = (label_path, int(boxes[j, 0]))
+                key2 = (label_path, int(boxes[k, 0]))
+                group_idx = group_of_box.get(key1)
+                if group_idx is not None:
+                    # 기존 그룹에 추가
+                    if key2 not in group_keys[group_idx]:
+                        similar_box_groups[group_idx].append(box_info(k))
+                        group_keys[group_idx].add(key2)
+                        group_of_box.setdefault(key2, group_idx)
+                else:
+                    # 새 그룹 생성
+                    group_idx = len(similar_box_groups)
+                    similar_box_groups.append([box_info(j), box_info(k)])
+                    group_keys.append({key1, key2})
+                    group_of_box[key1] = group_idx
+                    group_of_box.setdefault(key2, group_idx)
             
             # 주기적으로 UI 업데이트
-            if i % 10 == 0 or i == len(current_page_images) - 1:
+            if i % 200 == 0:
+                progress_bar["value"] = i + 1
+                status_label.config(text=f"{i+1}/{len(label_paths)} 처리 중")
                 result_label.config(text=f"발견된 유사 박스 그룹: {len(similar_box_groups)}개")
                 progress_window.update()
         
         # 완료 메시지
+        progress_bar["value"] = len(label_paths)
+        status_label.config(text=f"{len(label_paths)}/{len(label_paths)} 처리 완료")
         progress_label.config(text="유사한 바운딩 박스 탐색 완료!")
         result_label.config(text=f"총 {len(similar_box_groups)}개의 유사 박스 그룹 발견")
         
@@ -4426,7 +5677,7 @@ class ImageViewer:
         similar_box_groups = self.find_similar_boxes()
         
         if not similar_box_groups:
-            tk.messagebox.showinfo("알림", "현재 페이지에서 유사한 바운딩 박스를 찾지 못했습니다.")
+            tk.messagebox.showinfo("알림", "유사한 바운딩 박스를 찾지 못했습니다.")
             return
         
         # 선택 창 생성
@@ -4625,8 +5876,7 @@ class ImageViewer:
             for box_path, box_line_idx in selected_for_deletion:
                 # 라벨 파일 정보 읽기
                 try:
-                    with open(box_path, 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
+                    lines = self.read_label_file(box_path)
                         
                     if 0 <= box_line_idx < len(lines):
                         line = lines[box_line_idx]
@@ -4680,29 +5930,23 @@ class ImageViewer:
                 except Exception as e:
                     print(f"라벨 정보 처리 오류 ({os.path.basename(box_path)}): {e}")
             
-            # 중요: 현재 페이지의 위젯들을 직접 업데이트
-            label_widgets = [widget for widget in self.frame.winfo_children() 
-                        if isinstance(widget, tk.Label) and hasattr(widget, 'label_path')]
+            # 중요: 현재 페이지 항목의 선택 상태를 업데이트 (보이는 셀은 바로 다시 칠함)
+            page_items = self.grid_view.items
             
-            print(f"현재 페이지의 위젯 수: {len(label_widgets)}")
+            print(f"현재 페이지의 항목 수: {len(page_items)}")
             
-            # 위젯을 순회하며 선택 대상인지 확인하고 시각적으로 표시
-            for widget in label_widgets:
-                if not hasattr(widget, 'label_path') or not hasattr(widget, 'line_idx'):
+            # 항목을 순회하며 선택 대상인지 확인하고 시각적으로 표시
+            for item in page_items:
+                if item.line_idx is None:
                     continue
                     
                 for box_path, box_line_idx in selected_for_deletion:
                     # 경로와 라인 인덱스 비교 (경로 정규화)
-                    if (os.path.normpath(widget.label_path) == os.path.normpath(box_path) and 
-                        widget.line_idx == box_line_idx):
-                        # 이 위젯은 삭제 대상 - 빨간색으로 표시
-                        print(f"위젯 시각적 표시: {os.path.basename(widget.label_path)}, 라인 {widget.line_idx}")
-                        widget.config(highlightbackground="red", highlightthickness=4)
-                        widget.config(bg="#ffdddd")  # 연한 빨간색 배경
-                        
-                        # checklist에 추가
-                        if widget not in self.checklist:
-                            self.checklist.append(widget)
+                    if (os.path.normpath(item.label_path) == os.path.normpath(box_path) and 
+                        item.line_idx == box_line_idx):
+                        # 이 항목은 삭제 대상 - 빨간색으로 표시
+                        print(f"항목 시각적 표시: {os.path.basename(item.label_path)}, 라인 {item.line_idx}")
+                        self.grid_view.set_checked(item.key)
             
             # 위젯 업데이트 강제 실행
             self.root.update_idletasks()
@@ -4713,7 +5957,7 @@ class ImageViewer:
             print(f"박스 선택 완료: {success_count}개")
             print(f"selected_image_labels 크기: {len(self.selected_image_labels)}")
             print(f"selected_label_info 크기: {len(self.selected_label_info)}")
-            print(f"위젯 강조 표시: {len(self.checklist)}개")
+            print(f"항목 강조 표시: {len(self.grid_view.checked)}개")
             
             if success_count > 0:
                 tk.messagebox.showinfo(
@@ -4762,7 +6006,7 @@ class ImageViewer:
         similar_box_groups = self.find_similar_boxes(iou_threshold)
         
         if not similar_box_groups:
-            tk.messagebox.showinfo("알림", f"현재 페이지에서 IoU {iou_threshold:.2f} 이상인 유사한 바운딩 박스를 찾지 못했습니다.")
+            tk.messagebox.showinfo("알림", f"IoU {iou_threshold:.2f} 이상인 유사한 바운딩 박스를 찾지 못했습니다.")
             return
         
         # 선택 창 생성
@@ -5041,55 +6285,46 @@ class ImageViewer:
             # 처리 과정 최적화 - 미리 선택된 경로 확인
             already_selected_paths = set(self.selected_image_labels)
                 
-        # 현재 페이지의 모든 이미지 라벨 위젯 가져오기
-        label_widgets = [widget for widget in self.frame.winfo_children() 
-                    if isinstance(widget, tk.Label) and hasattr(widget, 'label_path')]
+        # 현재 페이지의 모든 항목 가져오기 (화면 밖 행의 항목 포함)
+        page_items = self.grid_view.items
         
-        print(f"현재 페이지의 위젯 수: {len(label_widgets)}")
+        print(f"현재 페이지의 항목 수: {len(page_items)}")
         
         # 보다 상세한 디버깅 정보
-        for i, widget in enumerate(label_widgets[:5]):
-            if hasattr(widget, 'label_path'):
-                label_path = widget.label_path
-                line_idx = widget.line_idx if hasattr(widget, 'line_idx') else "없음"
-                print(f"위젯 {i}: 경로={os.path.basename(label_path)}, 라인={line_idx}")
+        for i, item in enumerate(page_items[:5]):
+            line_idx = item.line_idx if item.line_idx is not None else "없음"
+            print(f"항목 {i}: 경로={os.path.basename(item.label_path)}, 라인={line_idx}")
         
         selected_count = 0
         
-        # 각 위젯에 대해 확인
-        for widget in label_widgets:
-            if not hasattr(widget, 'label_path'):
-                continue
-                
+        # 각 항목에 대해 확인
+        for item in page_items:
             # 정규화된 경로로 확인
-            norm_label_path = os.path.normpath(widget.label_path)
+            norm_label_path = os.path.normpath(item.label_path)
             
-            # 이 위젯이 특정 박스를 표시하는지 확인
-            if norm_label_path in path_line_map and hasattr(widget, 'line_idx'):
-                # 현재 위젯의 라인 인덱스
-                current_line_idx = widget.line_idx
+            # 이 항목이 특정 박스를 표시하는지 확인
+            if norm_label_path in path_line_map and item.line_idx is not None:
+                # 현재 항목의 라인 인덱스
+                current_line_idx = item.line_idx
                 
                 # 라인 인덱스가 선택 대상인지 확인
                 if current_line_idx in path_line_map[norm_label_path]:
                     # 박스 선택 처리
-                    print(f"박스 선택 시도: {os.path.basename(widget.label_path)}, 라인 {current_line_idx}")
+                    print(f"박스 선택 시도: {os.path.basename(item.label_path)}, 라인 {current_line_idx}")
                     
                     try:
-                        # 시각적 선택 처리
-                        widget.config(highlightbackground="red", highlightthickness=4)
-                        widget.config(bg="#ffdddd")  # 연한 빨간색 배경
-                        
                         # 선택 목록에 추가
-                        if widget.label_path not in self.selected_image_labels:
-                            self.selected_image_labels.append(widget.label_path)
+                        if item.label_path not in self.selected_image_labels:
+                            self.selected_image_labels.append(item.label_path)
                             print(f"  - selected_image_labels에 추가됨")
                         
-                        if widget not in self.checklist:
-                            self.checklist.append(widget)
-                            print(f"  - checklist에 추가됨")
+                        # 시각적 선택 처리 (보이는 셀이면 바로 다시 칠함)
+                        if item.key not in self.grid_view.checked:
+                            self.grid_view.set_checked(item.key)
+                            print(f"  - 선택 항목에 추가됨")
                         
                         # 박스 정보 캐시된 방식으로 가져오기
-                        lines = self._get_label_data(widget.label_path)
+                        lines = self._get_label_data(item.label_path)
                         
                         if lines and 0 <= current_line_idx < len(lines):
                             line = lines[current_line_idx]
@@ -5114,7 +6349,7 @@ class ImageViewer:
                                 }
                                 
                                 # selected_label_info 업데이트 - 기존 항목 확인
-                                self.update_label_info(widget.label_path, box_info)
+                                self.update_label_info(item.label_path, box_info)
                                 
                                 print(f"  - 박스 정보 저장됨: 클래스 {class_id}")
                                 selected_count += 1
@@ -5197,7 +6432,8 @@ class ImageViewer:
         class_idx = int(float(selected_class))
         
         # 해당 클래스의 모든 이미지 가져오기
-        class_images = [path for path in self.labels if path in self.labelsdata[class_idx]]
+        class_label_set = set(self.labelsdata[class_idx])
+        class_images = [path for path in self.labels if path in class_label_set]
         
         # 겹침 필터가 적용된 경우 필터링
         overlap_class = self.overlap_class_selector.get()
@@ -5286,20 +6522,15 @@ class ImageViewer:
 
                     if is_in_drag_area:
                         # 드래그 영역 내: 색상 미리보기
-                        if widget in self.checklist:
+                        if widget.item.key in self.grid_view.checked:
                             # 현재 선택된 것 -> 해제될 예정: 주황색
                             widget.config(highlightbackground="orange", highlightthickness=4)
                         else:
                             # 현재 미선택 -> 선택될 예정: 파란색
                             widget.config(highlightbackground="blue", highlightthickness=4)
                     else:
-                        # 드래그 영역 밖: 원래 상태로 복원
-                        if widget in self.checklist:
-                            # 선택된 상태 유지
-                            widget.config(highlightbackground="red", highlightthickness=4)
-                        else:
-                            # 미선택 상태 유지
-                            widget.config(highlightbackground="white", highlightthickness=4)
+                        # 드래그 영역 밖: 모델 상태로 복원
+                        self.grid_view.paint(widget, widget.item)
                 except TclError:
                     # 위젯이 이미 삭제되었을 경우 무시
                     continue
@@ -5379,89 +6610,17 @@ class ImageViewer:
         self.update_selection_info()
 
     def _toggle_widget_selection(self, widget):
-        """위젯의 선택 상태를 토글합니다."""
-        if widget in self.checklist:
+        """위젯이 표시하는 항목의 선택 상태를 토글합니다."""
+        key = widget.item.key
+        if key in self.grid_view.checked:
             # 선택 해제
-            widget.config(highlightbackground="white", highlightthickness=4)
-            widget.config(bg="white")
             if widget.label_path in self.selected_image_labels:
                 self.selected_image_labels.remove(widget.label_path)
-            if widget in self.checklist:
-                self.checklist.remove(widget)
+            self.grid_view.set_checked(key, False)
         else:
             # 선택
-            widget.config(highlightbackground="red", highlightthickness=4)
-            widget.config(bg="#ffdddd")  # 연한 빨간색 배경
             self.selected_image_labels.append(widget.label_path)
-            if widget not in self.checklist:
-                self.checklist.append(widget)
-    def process_full_image(self, image, label_path, row, col, idx, class_idx=None):
-        """
-        전체 이미지를 처리하고 바운딩 박스를 표시합니다.
-        
-        Parameters:
-            image (PIL.Image): 처리할 이미지
-            label_path (str): 라벨 파일 경로
-            row (int): 그리드 행 위치
-            col (int): 그리드 열 위치
-            idx (int): 이미지 인덱스
-            class_idx (int, optional): 특정 클래스 인덱스 (바운딩 박스 필터링용)
-        
-        Returns:
-            int: 업데이트된 열 위치
-        """
-        # 전체 이미지 표시
-        image_resized = image.resize((200, 200))
-        self.draw_boxes_on_image(image_resized, label_path, row, col, idx)
-        
-        # class_idx가 제공된 경우에만 박스 처리
-        if class_idx is not None:
-            try:
-                # 캐싱된 라벨 데이터 사용
-                lines = self._get_label_data(label_path)
-                boxes = [line.strip().split() for line in lines if line.strip()]
-                
-                boxes_processed = False
-                current_col = col
-                
-                for line_idx, box in enumerate(boxes):
-                    if len(box) < 5:  # 유효한 박스 데이터 확인
-                        continue
-                        
-                    try:
-                        box_class = int(float(box[0]))  # 일관된 방식으로 변환
-                        if box_class != class_idx:
-                            continue
-                            
-                        # Extract box coordinates
-                        x, y, w, h = map(float, box[1:])
-                        left = int((x - w/2) * image.width)
-                        top = int((y - h/2) * image.height)
-                        right = int((x + w/2) * image.width)
-                        bottom = int((y + h/2) * image.height)
-                        
-                        # Crop and resize
-                        cropped = image.crop((left, top, right, bottom)).resize((100, 100))
-                        self.draw_boxes_on_image_corp(cropped, label_path, row, current_col, class_idx, idx, line_idx)
-                        
-                        boxes_processed = True
-                        current_col += 1
-                        if current_col >= 12:  # 한 행에 최대 12개 이미지
-                            current_col = 0
-                            row += 2  # 다음 행으로 이동
-                    except (ValueError, IndexError) as e:
-                        print(f"박스 데이터 처리 오류 (라인 {line_idx}): {e}")
-                        continue
-                        
-                # 처리된 박스가 있으면 업데이트된 열 위치 반환, 없으면 원래 위치 반환
-                return current_col if boxes_processed else col
-                    
-            except Exception as e:
-                print(f"Error processing boxes in {label_path}: {e}")
-                self.show_status_message(f"박스 처리 오류: {os.path.basename(label_path)}")
-                return col  # 오류 발생 시 원래 열 위치 반환
-        
-        return col + 1  # 다음 열 위치 반환
+            self.grid_view.set_checked(key)
     def _get_label_data(self, label_path):
         """
         라벨 파일 데이터를 가져오고, 가능하면 캐시에서 읽습니다.
@@ -5489,15 +6648,8 @@ class ImageViewer:
         # 파일에서 읽기
         lines = []  # 기본값 초기화
         try:
-            # 다양한 인코딩 시도
-            encodings_to_try = ['utf-8', 'cp949', 'euc-kr', 'latin-1']
-            for encoding in encodings_to_try:
-                try:
-                    with open(label_path, 'r', encoding=encoding) as f:
-                        lines = [line.strip() for line in f.readlines()]
-                    break  # 성공하면 반복 중단
-                except UnicodeDecodeError:
-                    continue
+            # 인코딩은 LabelReader가 데이터셋 단위로 결정
+            lines = [line.strip() for line in self.label_reader.read_lines(label_path)]
             
             # 캐시 시스템이 있는 경우, 캐시에 저장
             if hasattr(self, 'label_cache'):
@@ -5520,13 +6672,12 @@ class ImageViewer:
         except Exception as e:
             print(f"라벨 파일 읽기 오류 ({label_path}): {e}")
             return []        
-    def draw_boxes_on_image(self, image, label_path, row, col, image_index):
+    def draw_boxes_on_image(self, image, label_path, image_index):
         """
         Draw bounding boxes on full image with improved visualization for overlapping boxes.
         겹치는 박스 간의 관계를 더 명확하게 시각화합니다.
         """
         draw = ImageDraw.Draw(image)
-        img_path = self.get_image_path_from_label(label_path)
         
         # 선택된 클래스와 겹침 클래스 정보 가져오기
         selected_class = int(self.class_selector.get())
@@ -5560,35 +6711,34 @@ class ImageViewer:
             # 라벨 파일에서 모든 박스 정보 읽기
             boxes_by_class = defaultdict(list)
             
-            with open(label_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                for i, line in enumerate(lines):
-                    parts = line.split()
-                    if not parts:
-                        continue
-                        
-                    class_index, x_center, y_center, width, height = map(float, parts)
-                    
-                    # Convert normalized coordinates to pixel coordinates
-                    width_px = width * image.width
-                    height_px = height * image.height
-                    x_center_px = x_center * image.width
-                    y_center_px = y_center * image.height
-                    
-                    # Calculate box coordinates
-                    x0 = x_center_px - (width_px / 2)
-                    y0 = y_center_px - (height_px / 2)
-                    x1 = x_center_px + (width_px / 2)
-                    y1 = y_center_px + (height_px / 2)
+            lines = self.read_label_file(label_path)
+            for i, line in enumerate(lines):
+                parts = line.split()
+                if not parts:
+                    continue
                     
-                    # 박스 정보 저장
-                    box_info = {
-                        "coords": [x0, y0, x1, y1],
-                        "class": int(class_index),
-                        "index": i,
-                        "center": (x_center_px, y_center_px)
-                    }
-                    boxes_by_class[int(class_index)].append(box_info)
+                class_index, x_center, y_center, width, height = map(float, parts)
+                
+                # Convert normalized coordinates to pixel coordinates
+                width_px = width * image.width
+                height_px = height * image.height
+                x_center_px = x_center * image.width
+                y_center_px = y_center * image.height
+                
+                # Calculate box coordinates
+                x0 = x_center_px - (width_px / 2)
+                y0 = y_center_px - (height_px / 2)
+                x1 = x_center_px + (width_px / 2)
+                y1 = y_center_px + (height_px / 2)
+                
+                # 박스 정보 저장
+                box_info = {
+                    "coords": [x0, y0, x1, y1],
+                    "class": int(class_index),
+                    "index": i,
+                    "center": (x_center_px, y_center_px)
+                }
+                boxes_by_class[int(class_index)].append(box_info)
             
             # 모든 박스 그리기 - 박스별로 겹침 정보 시각화
             for class_id, boxes in boxes_by_class.items():
@@ -5709,24 +6859,76 @@ class ImageViewer:
 
         # 작업 상태 indicator 표시 (전체 이미지는 line_idx=None)
         self.draw_status_indicator(image, label_path, None)
+    def render_grid_item(self, item, open_images):
+        """
+        그리드 항목의 표시 이미지를 만들고 주석을 그립니다 (셀에 연결될 때 호출).
+        
+        Parameters:
+            item (GridItem): 표시할 항목
+            open_images (dict): 이번 연결에서 연 원본 이미지 (같은 이미지의 박스들은 한 번만 디코딩)
+        
+        Returns:
+            PIL.Image: 셀에 표시할 이미지
+        """
+        try:
+            if item.box is None:
+                image = item.image.copy() if item.image is not None else \
+                    self.thumbnail_cache.get(item.img_path, PagePrefetcher.THUMB_SIZE)
+                self.draw_boxes_on_image(image, item.label_path, item.number)
+                return image
+            
+            if item.image is None:
+                source = open_images.get(item.img_path)
+                if source is None:
+                    source = open_images[item.img_path] = Image.open(item.img_path)
+                x_center, y_center, width, height = item.box
+                left = int((x_center - width / 2) * source.width)
+                top = int((y_center - height / 2) * source.height)
+                right = int((x_center + width / 2) * source.width)
+                bottom = int((y_center + height / 2) * source.height)
+                # 다시 스크롤해 왔을 때 원본을 다시 열지 않도록 주석 없는 크롭을 항목에 보관
+                item.image = source.crop((left, top, right, bottom)).resize(PagePrefetcher.CROP_SIZE)
+            image = item.image.copy()
+            border = self.draw_boxes_on_image_corp(image, item.label_path, item.class_idx, item.number, item.box_idx)
+            if border is not None:
+                item.border = border
+            return image
+        except (OSError, ValueError) as e:
+            print(f"이미지 파일 로드 실패 ({item.img_path}): {e}")
+            # 오류 이미지 대체 표시
+            placeholder = Image.new('RGB', item.size, color=(240, 240, 240))
+            draw = ImageDraw.Draw(placeholder)
+            draw.text((5, item.size[1] // 2 - 10), "이미지 로드 오류", fill=(0, 0, 0))
+            draw.text((5, item.size[1] // 2 + 10), os.path.basename(item.img_path), fill=(255, 0, 0))
+            return placeholder
+
+    def bind_grid_cells(self, pairs):
+        """풀에서 꺼낸 셀을 그리드 항목에 연결합니다 (이미지 교체와 이벤트 바인딩)."""
+        open_images = {}
+        try:
+            for cell, item in pairs:
+                photo = ImageTk.PhotoImage(self.render_grid_item(item, open_images))
+                cell.config(image=photo)
+                cell.image = photo
+                cell.label_path = item.label_path
+                if item.line_idx is not None:
+                    cell.line_idx = item.line_idx
 
-        # Create photo image and label
-        photo = ImageTk.PhotoImage(image)
-        label = tk.Label(self.frame, image=photo, bg="white")
-        label.image = photo
-        label.label_path = label_path  # 라벨에 label_path 속성 추가
-        label.config(relief="solid", bd=0)  # relief 타입을 명확히 지정
-        label.grid(row=row, column=col, padx=10, pady=10)
-
-        # 드래그 선택 이벤트 바인딩 (Shift + 클릭/드래그 포함)
-        self.setup_drag_select_events(label, label_path)
+                # 드래그 선택 이벤트 바인딩 (Shift + 클릭/드래그 포함)
+                self.setup_drag_select_events(cell, item.label_path)
 
-        # 오른쪽 클릭 - 전체 이미지 보기
-        label.bind("<Button-3>", lambda event,
-                img_path=img_path,
-                label_path=label_path: self.show_full_image(img_path, label_path, None))
+                # 오른쪽 클릭 - 전체 이미지 보기
+                cell.bind("<Button-3>", lambda event, item=item:
+                        self.show_full_image(item.img_path, item.label_path, item.line_idx))
+                if item.box is not None:
+                    cell.bind("<Enter>", lambda event, l=cell, item=item:
+                            self.show_box_tooltip(l, item.label_path, item.line_idx))
+                    cell.bind("<Leave>", lambda event:
+                            self.remove_tooltip())
+        finally:
+            for source in open_images.values():
+                source.close()
 
-        return label
     def get_image_path_from_label(self, label_path):
         """라벨 경로로부터 이미지 경로를 안전하게 생성합니다."""
         if not label_path:
@@ -6028,36 +7230,35 @@ class ImageViewer:
             boxes_by_class = {}
             
             if os.path.isfile(label_path):
-                with open(label_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    for i, line in enumerate(lines):
-                        parts = line.split()
-                        if not parts:
-                            continue
+                lines = self.read_label_file(label_path)
+                for i, line in enumerate(lines):
+                    parts = line.split()
+                    if not parts:
+                        continue
+                    
+                    try:
+                        class_index = int(float(parts[0]))
+                        x_center, y_center, width, height = map(float, parts[1:5])
                         
-                        try:
-                            class_index = int(float(parts[0]))
-                            x_center, y_center, width, height = map(float, parts[1:5])
-                            
-                            # 이미지 기준 픽셀 좌표로 변환
-                            x1 = int((x_center - width/2) * image.width)
-                            y1 = int((y_center - height/2) * image.height)
-                            x2 = int((x_center + width/2) * image.width)
-                            y2 = int((y_center + height/2) * image.height)
+                        # 이미지 기준 픽셀 좌표로 변환
+                        x1 = int((x_center - width/2) * image.width)
+                        y1 = int((y_center - height/2) * image.height)
+                        x2 = int((x_center + width/2) * image.width)
+                        y2 = int((y_center + height/2) * image.height)
+                        
+                        # 클래스별 박스 정보 저장
+                        if class_index not in boxes_by_class:
+                            boxes_by_class[class_index] = []
                             
-                            # 클래스별 박스 정보 저장
-                            if class_index not in boxes_by_class:
-                                boxes_by_class[class_index] = []
-                                
-                            boxes_by_class[class_index].append({
-                                "coords": [x1, y1, x2, y2],
-                                "class": class_index,
-                                "center": (x_center, y_center),
-                                "size": (width, height),
-                                "index": i
-                            })
-                        except:
-                            continue
+                        boxes_by_class[class_index].append({
+                            "coords": [x1, y1, x2, y2],
+                            "class": class_index,
+                            "center": (x_center, y_center),
+                            "size": (width, height),
+                            "index": i
+                        })
+                    except:
+                        continue
             
             # 박스 그리기
             for class_id, boxes in boxes_by_class.items():
@@ -6254,14 +7455,12 @@ class ImageViewer:
                 
             # Caps Lock 키가 눌려진 경우 - 범위 선택 모드
             elif self.caps_locked:
-                # 현재 페이지의 모든 라벨 찾기
-                page_labels = [widget for widget in self.frame.winfo_children() 
-                            if isinstance(widget, tk.Label) and hasattr(widget, 'label_path')]
+                # 현재 페이지의 모든 항목 (화면 밖 행 포함)
+                page_items = self.grid_view.items
                 
                 # 현재 이미지의 인덱스 찾기
-                if label in page_labels:
-                    current_index = page_labels.index(label)
-                else:
+                current_index = self.grid_view.index_of.get(label.item.key)
+                if current_index is None:
                     # 라벨이 리스트에 없는 경우 일반 클릭으로 처리
                     self._toggle_image_selection(label, label_path, line_idx)
                     return
@@ -6275,38 +7474,24 @@ class ImageViewer:
                 start, end = sorted([self.multi_select_start, current_index])
                 
                 # 이전 선택 해제
-                for l in page_labels:
-                    if l in self.checklist:
-                        l.config(highlightbackground="white", highlightthickness=4)
-                        l.config(bg="white")
-                        if hasattr(l, 'label_path') and l.label_path in self.selected_image_labels:
-                            self.selected_image_labels.remove(l.label_path)
-                        if l in self.checklist:
-                            self.checklist.remove(l)
+                for item in page_items:
+                    if item.key in self.grid_view.checked:
+                        if item.label_path in self.selected_image_labels:
+                            self.selected_image_labels.remove(item.label_path)
+                        self.grid_view.checked.discard(item.key)
                 
                 # 범위 내 모든 이미지/박스의 선택 정보 초기화
                 self.selected_label_info = []
                 
                 # 새 범위 선택
-                for i in range(start, end + 1):
-                    if i < len(page_labels):
-                        l = page_labels[i]
-                        if hasattr(l, 'label_path'):
-                            # 선택 로직
-                            l.config(highlightbackground="red", highlightthickness=4)
-                            l.config(bg="#ffdddd")
-                            
-                            # 라인 인덱스가 있는 경우 (박스 뷰)
-                            if hasattr(l, 'line_idx'):
-                                self.save_selected_label_info(l.label_path, l.line_idx)
-                            else:
-                                # 전체 이미지인 경우
-                                self.save_selected_label_info(l.label_path)
-                            
-                            if l.label_path not in self.selected_image_labels:
-                                self.selected_image_labels.append(l.label_path)
-                            if l not in self.checklist:
-                                self.checklist.append(l)
+                for item in page_items[start:end + 1]:
+                    # 라인 인덱스가 있는 경우 (박스 뷰), 없으면 전체 이미지
+                    self.save_selected_label_info(item.label_path, item.line_idx)
+                    
+                    if item.label_path not in self.selected_image_labels:
+                        self.selected_image_labels.append(item.label_path)
+                    self.grid_view.checked.add(item.key)
+                self.grid_view.repaint()
                 
                 # 선택 정보 업데이트
                 self.update_selection_info()
@@ -6317,12 +7502,12 @@ class ImageViewer:
             
             # 일반 클릭 - 선택/해제 토글
             else:
-                is_selected = label in self.checklist
+                key = label.item.key
+                is_selected = key in self.grid_view.checked
                         
                 if is_selected:
                     # 선택 해제
-                    label.config(bd=0, highlightbackground="white", highlightthickness=4)
-                    label.config(bg="white")
+                    self.grid_view.set_checked(key, False)
                     
                     # 이미지 선택 목록에서 제거
                     if label_path in self.selected_image_labels:
@@ -6345,13 +7530,9 @@ class ImageViewer:
                         self.selected_label_info = [info for info in self.selected_label_info 
                                                 if info['path'] != label_path]
                     
-                    # 체크리스트에서 제거
-                    if label in self.checklist:
-                        self.checklist.remove(label)
                 if not is_selected:
                     # 선택
-                    label.config(bd=0, highlightbackground="red", highlightthickness=4)
-                    label.config(bg="#ffdddd")  # 연한 빨간색 배경
+                    self.grid_view.set_checked(key)
                     
                     # 박스 인덱스가 있으면 특정 박스만, 아니면 전체 이미지 선택
                     self.save_selected_label_info(label_path, line_idx)
@@ -6359,10 +7540,6 @@ class ImageViewer:
                     # 이미지 선택 목록에 추가
                     if label_path not in self.selected_image_labels:
                         self.selected_image_labels.append(label_path)
-                    
-                    # 체크리스트에 추가
-                    if label not in self.checklist:
-                        self.checklist.append(label)
                 
                 # 선택 정보 업데이트
                 self.update_selection_info()
@@ -6404,15 +7581,15 @@ class ImageViewer:
                 (f", line {line_idx}" if line_idx is not None else ""))
             
             # 이미 선택된 이미지인지 확인
-            is_selected = label in self.checklist
+            key = label.item.key
+            is_selected = key in self.grid_view.checked
             
             if is_selected:
                 # 선택 해제 프로세스
                 print(f"  - Deselecting {('box ' + str(line_idx)) if line_idx is not None else 'image'}")
                 
                 # 시각적 스타일 리셋
-                label.config(highlightbackground="white", highlightthickness=4)
-                label.config(bg="white")
+                self.grid_view.set_checked(key, False)
                 
                 # 모든 자식 위젯 제거 (체크마크 표시 등)
                 for child in label.winfo_children():
@@ -6446,16 +7623,13 @@ class ImageViewer:
                                                 if info['path'] != label_path]
                         print(f"  - Removed from selected_image_labels, new count: {len(self.selected_image_labels)}")
                 
-                if label in self.checklist:
-                    self.checklist.remove(label)
-                    print(f"  - Removed from checklist, new count: {len(self.checklist)}")
+                print(f"  - Removed from checked items, new count: {len(self.grid_view.checked)}")
             else:
                 # 선택 프로세스
                 print(f"  - Selecting {('box ' + str(line_idx)) if line_idx is not None else 'image'}")
                 
                 # 시각적 스타일 적용
-                label.config(highlightbackground="red", highlightthickness=4)
-                label.config(bg="#ffdddd")  # 연한 빨간색 배경
+                self.grid_view.set_checked(key)
                 
                 # 기존 체크마크 제거 (중복 방지)
                 for child in label.winfo_children():
@@ -6481,9 +7655,7 @@ class ImageViewer:
                     self.selected_image_labels.append(label_path)
                     print(f"  - Added to selected_image_labels, new count: {len(self.selected_image_labels)}")
                 
-                if label not in self.checklist:
-                    self.checklist.append(label)
-                    print(f"  - Added to checklist, new count: {len(self.checklist)}")
+                print(f"  - Added to checked items, new count: {len(self.grid_view.checked)}")
             
             # UI 피드백 - 깜빡임 효과
             if hasattr(self, 'flash_widget'):
@@ -6620,128 +7792,43 @@ class ImageViewer:
         
         progress_window.update()
         
-        # 삭제 작업 수행
-        deleted_count = 0
-        error_count = 0
-        deleted_boxes_count = 0
-        
-        # 처리된 파일 목록 관리 (추가된 부분)
-        processed_files = set()
-        
-        # 선택된 라벨 정보 별로 처리
-        for i, label_info in enumerate(self.selected_label_info):
-            try:
-                label_path = label_info['path']
-                
-                # 진행 상황 업데이트
-                progress_bar["value"] = i + 1
-                status_label.config(text=f"{i+1}/{len(self.selected_label_info)} 처리 완료")
-                result_label.config(text=f"삭제: {deleted_count}, 오류: {error_count}")
-                progress_window.update()
-                
-                # 파일 존재 확인 - 오류 메시지 추가
-                if not os.path.isfile(label_path):
-                    error_count += 1
-                    result_label.config(text=f"오류: 파일이 존재하지 않음 - {os.path.basename(label_path)}")
-                    progress_window.update()
-                    continue
-                
-                # 라벨 파일 읽기 - 인코딩 오류 처리 추가
-                try:
-                    with open(label_path, 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                except UnicodeDecodeError:
-                    try:
-                        with open(label_path, 'r', encoding='cp949') as f:
-                            lines = f.readlines()
-                    except Exception as enc_error:
-                        error_count += 1
-                        result_label.config(text=f"오류: 파일 인코딩 문제 - {os.path.basename(label_path)}")
-                        progress_window.update()
-                        continue
-                        
-                # 삭제할 라인 인덱스 목록 생성
-                lines_to_delete = []
-                for box in label_info['boxes']:
-                    if 'line_idx' in box:
-                        lines_to_delete.append(box['line_idx'])
-
-                # 디버깅 정보
-                print(f"\n파일: {os.path.basename(label_path)}")
-                print(f"삭제 요청된 라인 인덱스 (중복 포함): {lines_to_delete}")
-                print(f"파일 전체 라인 수: {len(lines)}")
-
-                # 중복 제거 및 정렬 (큰 인덱스부터 삭제해야 인덱스 변화 영향 없음)
-                lines_to_delete = sorted(set(lines_to_delete), reverse=True)
-
-                print(f"삭제할 라인 인덱스 (중복 제거 후): {lines_to_delete}")
-
-                # 파일 내용 수정이 필요한지 확인
-                if lines_to_delete:
-                    # 유효한 라인 인덱스 필터링
-                    valid_indices = [idx for idx in lines_to_delete if 0 <= idx < len(lines)]
-
-                    print(f"유효한 라인 인덱스: {valid_indices}")
-
-                    # 삭제된 박스 수 기록
-                    deleted_boxes_count += len(valid_indices)
-
-                    # 역순으로 해당 라인 삭제
-                    for idx in valid_indices:
-                        print(f"  라인 {idx} 삭제 중...")
-                        del lines[idx]
-                        # 삭제된 라벨 정보 기록
-                        label_key = (os.path.normpath(label_path), idx)
-                        self.modified_labels['deleted'].add(label_key)
-                        print(f"[StatusIndicator] 삭제 기록: {os.path.basename(label_path)}, line {idx}")
-
-                    print(f"삭제 후 남은 라인 수: {len(lines)}")
-
-                    # 수정된 내용으로 파일 다시 쓰기
-                    with open(label_path, 'w', encoding='utf-8') as f:
-                        f.writelines(lines)
-                        
-                    deleted_count += 1
-
-                    # [SpeedOptimization] 캐시 무효화 제거 - 즉시 저장, 나중에 갱신
-                    # 파일에는 이미 저장되었으므로, 페이지 전환/재방문 시 자동으로 최신 데이터 로드됨
-                    print(f"[SpeedOptimization] 파일 저장 완료 (캐시 갱신 생략): {os.path.basename(label_path)}")
-
-                    # 이 파일에 대한 인덱스 재계산 실행
-                    self.recalculate_indices(label_path, valid_indices)
-                    
-                    # 처리된 파일 추적 (추가된 부분)
-                    processed_files.add(label_path)
-                    
-                # 처리 상태 업데이트
-                result_label.config(text=f"삭제: {deleted_count}, 오류: {error_count}, 박스: {deleted_boxes_count}개")
-                
-            except Exception as e:
-                error_count += 1
-                print(f"라벨 삭제 중 오류 발생: {e}")
-                result_label.config(text=f"오류: {str(e)[:50]}...")
-                
-                # 상태 표시줄에 오류 메시지 표시
-                if hasattr(self, 'show_status_message'):
-                    self.show_status_message(f"라벨 삭제 오류: {str(e)}", duration=5000)
-                
-                import traceback
-                traceback.print_exc()
-                
+        # 삭제 작업 수행 - 파일별로 묶어 한 번씩 읽고 쓰기 (작업자 스레드 풀)
+        operations = LabelEditEngine.group_operations(self.selected_label_info, delete=True)
+        progress_bar["maximum"] = max(len(operations), 1)
+        counts = {'deleted': 0, 'error': 0, 'boxes': 0}
+        
+        def on_file_done(done, total, result):
+            if result['error']:
+                counts['error'] += 1
+                print(f"라벨 삭제 중 오류 발생 ({result['path']}): {result['error']}")
+            elif result['deleted']:
+                counts['deleted'] += 1
+                counts['boxes'] += len(result['deleted'])
             # 주기적으로 UI 업데이트
-            if i % 10 == 0 or i == len(self.selected_label_info) - 1:
+            if done % 50 == 0 or done == total:
+                progress_bar["value"] = done
+                status_label.config(text=f"{done}/{total} 파일 처리 완료")
+                result_label.config(text=f"삭제: {counts['deleted']}, 오류: {counts['error']}, 박스: {counts['boxes']}개")
                 progress_window.update()
         
-        # 인덱스 불일치 방지를 위한 후처리 (추가된 부분)
-        if processed_files:
-            # 처리된 파일의 인덱스 정보 업데이트
-            self.update_file_indices(processed_files)
-            
-            # 로그 메시지
-            if hasattr(self, 'logger'):
-                self.logger.info(f"{len(processed_files)}개 파일의 인덱스 정보 업데이트됨")
-            else:
-                print(f"{len(processed_files)}개 파일의 인덱스 정보 업데이트됨")
+        results, journal_path = self.run_label_edits(operations, on_file_done)
+        deleted_count = counts['deleted']
+        error_count = counts['error']
+        deleted_boxes_count = counts['boxes']
+        
+        # 삭제된 라벨 정보 기록 및 빈 파일 정리
+        processed_files = set()
+        emptied_files = set()
+        for result in results:
+            if not result['deleted']:
+                continue
+            label_path = result['path']
+            processed_files.add(label_path)
+            for idx in result['deleted']:
+                self.modified_labels['deleted'].add((os.path.normpath(label_path), idx))
+            if result['remaining'] == 0:
+                emptied_files.add(label_path)
+        print(f"[StatusIndicator] 삭제 기록: {len(processed_files)}개 파일, {deleted_boxes_count}개 박스")
         
         # 작업 완료 후 표시
         progress_label.config(text="바운딩 박스 삭제 완료!")
@@ -6756,8 +7843,7 @@ class ImageViewer:
         self.deselect_all_images()
 
         # 화면의 모든 썸네일 제거 (UI 클리어)
-        for widget in self.frame.winfo_children():
-            widget.destroy()
+        self.release_grid_cells()
 
         # [SpeedOptimization] 캐시 갱신 제거 - 페이지 전환 시 자동 갱신
         print(f"[SpeedOptimization] {len(processed_files)}개 파일 저장 완료 (캐시 갱신 생략)")
@@ -6766,20 +7852,13 @@ class ImageViewer:
         # 완료 후 처리
         def on_update_complete():
             """라벨 데이터 갱신 완료 후 호출"""
-            # 추가 검증 - 삭제된 라벨이 여전히 남아있는지 확인
-            for label_info in self.selected_label_info:
-                label_path = label_info['path']
-                if os.path.isfile(label_path):
-                    try:
-                        with open(label_path, 'r', encoding='utf-8') as f:
-                            lines = f.readlines()
-                            if not lines:  # 빈 파일은 클래스 데이터에서 제거
-                                for class_idx in range(len(self.labelsdata)):
-                                    if label_path in self.labelsdata[class_idx]:
-                                        self.labelsdata[class_idx].remove(label_path)
-                                        print(f"빈 파일 제거: {os.path.basename(label_path)}")
-                    except Exception as e:
-                        print(f"빈 파일 검증 중 오류: {e}")
+            # 모든 박스가 삭제된 빈 파일은 클래스 데이터에서 제거
+            if emptied_files:
+                for class_idx in range(len(self.labelsdata)):
+                    if self.labelsdata[class_idx]:
+                        self.labelsdata[class_idx] = [path for path in self.labelsdata[class_idx]
+                                                      if path not in emptied_files]
+                print(f"빈 파일 제거: {len(emptied_files)}개")
 
             print("라벨 데이터 갱신 완료")
 
@@ -6809,6 +7888,63 @@ class ImageViewer:
 
         # 즉시 완료 처리 (비동기 작업 없음)
         on_update_complete()
+    def run_label_edits(self, operations, progress=None):
+        """
+        파일별로 묶은 라벨 편집을 일괄 편집 엔진으로 적용하고 실행 기록을 되돌리기 목록에 추가합니다.
+
+        Returns:
+            tuple: (파일별 결과 목록, 실행 기록 경로 또는 None)
+        """
+        journal_dir = os.path.join(self.rootpath or os.getcwd(), "label_edit_journal")
+        engine = LabelEditEngine(journal_dir, self.label_reader, workers=min(8, self.worker_threads))
+        start_time = time.time()
+        results, journal_path = engine.apply(operations, progress)
+        if journal_path:
+            self.edit_journals.append(journal_path)
+            if len(self.edit_journals) > self.edit_journal_limit:
+                expired = self.edit_journals[:-self.edit_journal_limit]
+                del self.edit_journals[:-self.edit_journal_limit]
+                LabelEditEngine.discard(expired)
+        print(f"일괄 편집 완료: {len(operations)}개 파일, {time.time() - start_time:.2f}초 (실행 기록: {journal_path})")
+        return results, journal_path
+    def undo_last_edit(self):
+        """마지막 일괄 편집(삭제/클래스 변경)을 실행 기록으로 되돌립니다."""
+        if not self.edit_journals:
+            tk.messagebox.showinfo("편집 취소", "되돌릴 편집이 없습니다.")
+            return
+        journal_path = self.edit_journals[-1]
+        if not tk.messagebox.askyesno("편집 취소", f"마지막 편집을 되돌리시겠습니까?\n{os.path.basename(journal_path)}"):
+            return
+        
+        engine = LabelEditEngine(os.path.dirname(journal_path), self.label_reader,
+                                 workers=min(8, self.worker_threads))
+        try:
+            restored, skipped = engine.undo(journal_path)
+        except (OSError, ValueError) as e:
+            tk.messagebox.showerror("편집 취소 오류", f"실행 기록을 읽을 수 없습니다: {e}")
+            return
+        if not skipped:
+            self.edit_journals.pop()
+        
+        # 상태 표시 기록 정리
+        restored_keys = {os.path.normpath(path) for path in restored}
+        for key in self.modified_labels:
+            self.modified_labels[key] = {item for item in self.modified_labels[key] if item[0] not in restored_keys}
+        
+        for label_path in restored:
+            self.invalidate_caches_for_label(label_path)
+        self.refresh_label_data_cache(specific_paths=restored)
+        
+        self.deselect_all_images()
+        self.release_grid_cells()
+        self.refresh_current_view()
+        
+        message = f"{len(restored)}개 파일을 편집 전 상태로 되돌렸습니다."
+        if skipped:
+            message += f"\n{len(skipped)}개 파일은 이후 변경되어 건너뛰었습니다."
+            for label_path, reason in skipped[:5]:
+                print(f"되돌리기 건너뜀 ({label_path}): {reason}")
+        tk.messagebox.showinfo("편집 취소", message)
     def recalculate_indices(self, label_path, deleted_indices):
         """
         파일 수정 후 인덱스를 재계산하고 모든 참조를 업데이트합니다.
@@ -6820,25 +7956,15 @@ class ImageViewer:
         # 삭제된 인덱스를 내림차순으로 정렬 (이미 정렬되어 있을 수 있음)
         deleted_indices = sorted(deleted_indices, reverse=True)
         
-        # 1. 위젯의 라인 인덱스 업데이트
-        for widget in self.frame.winfo_children():
-            if isinstance(widget, tk.Label) and hasattr(widget, 'label_path') and widget.label_path == label_path:
-                if hasattr(widget, 'line_idx'):
-                    line_idx = widget.line_idx
-                    
-                    # 이 라인이 삭제된 경우 속성 제거
-                    if line_idx in deleted_indices:
-                        delattr(widget, 'line_idx')
-                        continue
-                    
-                    # 인덱스 조정 - 삭제된 각 라인에 대해 인덱스 조정
-                    new_idx = line_idx
-                    for del_idx in deleted_indices:
-                        if del_idx < line_idx:  # 현재 라인 이전에 삭제된 경우만 조정
-                            new_idx -= 1
-                    
-                    # 수정된 인덱스 저장
-                    widget.line_idx = new_idx
+        # 1. 페이지 항목(과 연결된 셀)의 라인 인덱스 업데이트
+        def shifted_index(line_idx):
+            # 이 라인이 삭제된 경우 None
+            if line_idx in deleted_indices:
+                return None
+            # 인덱스 조정 - 현재 라인 이전에 삭제된 라인 수만큼 감소
+            return line_idx - sum(1 for del_idx in deleted_indices if del_idx < line_idx)
+        
+        self.grid_view.update_line_indices(label_path, shifted_index)
         
         # 2. 선택된 라벨 정보 업데이트
         for info in self.selected_label_info[:]:
@@ -6885,41 +8011,25 @@ class ImageViewer:
         if deleted_line_indices is None:
             deleted_line_indices = {}
         
-        # 현재 표시된 위젯에서 수정된 파일과 관련된 위젯 찾기
-        affected_widgets = [widget for widget in self.frame.winfo_children() 
-                        if isinstance(widget, tk.Label) and 
-                        hasattr(widget, 'label_path') and 
-                        widget.label_path in file_paths]
-        
-        # 위젯의 라인 인덱스 정보 업데이트
-        for widget in affected_widgets:
-            if hasattr(widget, 'line_idx'):
-                label_path = widget.label_path
-                current_line_idx = widget.line_idx
-                
-                # 파일에서 해당 라인이 여전히 존재하는지 확인
-                file_lines = self._get_label_data(label_path)
-                
-                # 직접 삭제된 라인인 경우
-                if label_path in deleted_line_indices and current_line_idx in deleted_line_indices[label_path]:
-                    # 라인이 삭제되었으므로 위젯에서 line_idx 속성 제거
-                    delattr(widget, 'line_idx')
-                    continue
-                
-                # 삭제된 라인으로 인한 인덱스 조정
-                if label_path in deleted_line_indices:
-                    new_idx = current_line_idx
-                    # 현재 라인 이전에 삭제된 라인 수만큼 인덱스 감소
-                    for del_idx in deleted_line_indices[label_path]:
-                        if del_idx < current_line_idx:
-                            new_idx -= 1
-                    
-                    # 새 인덱스가 유효한지 확인
-                    if 0 <= new_idx < len(file_lines):
-                        widget.line_idx = new_idx
-                    else:
-                        # 유효하지 않은 인덱스가 되면 속성 제거
-                        delattr(widget, 'line_idx')
+        # 현재 페이지 항목(과 연결된 셀)에서 수정된 파일의 라인 인덱스 업데이트
+        affected_items = 0
+        for label_path in file_paths:
+            if label_path not in deleted_line_indices:
+                continue
+            deleted = deleted_line_indices[label_path]
+            # 파일에서 해당 라인이 여전히 존재하는지 확인하기 위한 라인 수
+            line_count = len(self._get_label_data(label_path))
+            
+            def shifted_index(line_idx, deleted=deleted, line_count=line_count):
+                # 직접 삭제된 라인이면 None
+                if line_idx in deleted:
+                    return None
+                # 현재 라인 이전에 삭제된 라인 수만큼 인덱스 감소
+                new_idx = line_idx - sum(1 for del_idx in deleted if del_idx < line_idx)
+                # 새 인덱스가 유효하지 않으면 None
+                return new_idx if 0 <= new_idx < line_count else None
+            
+            affected_items += self.grid_view.update_line_indices(label_path, shifted_index)
         
         # 메모리에 있는 선택된 라벨 정보 업데이트
         updated_label_info = []
@@ -6972,9 +8082,9 @@ class ImageViewer:
         
         # 로깅
         if hasattr(self, 'logger'):
-            self.logger.info(f"인덱스 업데이트: {len(affected_widgets)}개 위젯, {len(updated_label_info)}개 라벨 정보")
+            self.logger.info(f"인덱스 업데이트: {affected_items}개 항목, {len(updated_label_info)}개 라벨 정보")
         else:
-            print(f"인덱스 업데이트: {len(affected_widgets)}개 위젯, {len(updated_label_info)}개 라벨 정보")
+            print(f"인덱스 업데이트: {affected_items}개 항목, {len(updated_label_info)}개 라벨 정보")
     def update_selection_info(self):
         """Update the selection counter display with detailed information"""
         # 이미지 선택 개수
@@ -7123,30 +8233,26 @@ class ImageViewer:
             # 디스플레이 업데이트
             self.update_display()
     def select_all_images(self):
-        """현재 화면에 표시된 모든 이미지와 그 안의 모든 박스를 선택 상태로 변경"""
+        """현재 페이지의 모든 이미지와 그 안의 모든 박스를 선택 상태로 변경"""
         try:
-            # 현재 화면에 표시된 모든 이미지를 선택 상태로 변경
-            for widget in self.frame.winfo_children():
-                if isinstance(widget, tk.Label) and hasattr(widget, 'image'):
-                    # 이미 선택된 이미지는 건너뛰기
-                    if widget in self.checklist:
-                        continue
-                    
-                    # 이미지 테두리를 빨간색으로 변경
-                    widget.config(bd=0, highlightbackground="red", highlightthickness=4)
-                    widget.config(bg="#ffdddd")  # 연한 빨간색 배경
-                    
-                    # self.checklist에 위젯 추가
-                    self.checklist.append(widget)
+            # 현재 페이지의 모든 항목을 선택 상태로 변경 (화면 밖 행 포함)
+            for item in self.grid_view.items:
+                # 이미 선택된 항목은 건너뛰기
+                if item.key in self.grid_view.checked:
+                    continue
+                
+                self.grid_view.checked.add(item.key)
+                
+                if item.label_path not in self.selected_image_labels:
+                    label_path = item.label_path
+                    self.selected_image_labels.append(label_path)
                     
-                    # label_path 속성이 있다면 selected_image_labels에 추가
-                    if hasattr(widget, 'label_path') and widget.label_path not in self.selected_image_labels:
-                        label_path = widget.label_path
-                        self.selected_image_labels.append(label_path)
-                        
-                        # 중요: 라벨 내의 모든 박스 정보도 함께 저장
-                        # 여기가 기존 함수에서 누락된 부분
-                        self.save_all_boxes_info(label_path)
+                    # 중요: 라벨 내의 모든 박스 정보도 함께 저장
+                    # 여기가 기존 함수에서 누락된 부분
+                    self.save_all_boxes_info(label_path)
+            
+            # 보이는 셀의 테두리를 빨간색으로 변경
+            self.grid_view.repaint()
             
             # 선택 정보 업데이트
             self.update_selection_info()
@@ -7177,8 +8283,7 @@ class ImageViewer:
             selected_class = int(float(self.class_selector.get()))
             
             # 라벨 파일 읽기
-            with open(label_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            lines = self.read_label_file(label_path)
             
             # 해당 클래스의 모든 박스 정보 추출
             boxes_info = []
@@ -7247,15 +8352,10 @@ class ImageViewer:
     def deselect_all_images(self):
         """모든 선택된 이미지와 라벨 정보를 초기화합니다."""
         try:
-            # 모든 선택된 이미지 라벨의 스타일 초기화
-            for label in self.checklist:
-                if label.winfo_exists():
-                    label.config(bd=0, highlightbackground="white", highlightthickness=4)
-                    label.config(bg="white")
-            
-            # 선택 목록 초기화
+            # 선택 목록 초기화 후 보이는 셀의 스타일 초기화
             self.selected_image_labels.clear()
-            self.checklist.clear()
+            self.grid_view.checked.clear()
+            self.grid_view.repaint()
             
             # 선택된 라벨 정보도 초기화 (이 부분이 누락되어 있었음)
             if hasattr(self, 'selected_label_info'):
@@ -7382,12 +8482,6 @@ class ImageViewer:
                         if len(labels) > 3:
                             log_file.write(f"  - ... 외 {len(labels)-3}개\n")
                 
-                # 라벨 데이터 초기화 및 다시 로드
-                log_file.write("\n라벨 데이터 초기화 시작...\n")
-                self.labelsdata = [[] for _ in range(100)]
-                self.overlap_cache = {}
-                log_file.write("labelsdata 및 overlap_cache 초기화 완료\n")
-                
                 # 진행 상황 업데이트 (50%)
                 progress_bar["value"] = 50
                 status_label.config(text="클래스 정보 갱신 중...")
@@ -7398,10 +8492,29 @@ class ImageViewer:
                 log_file.write(f"라벨 파일 개수: {len(self.labels)}\n")
                 log_file.write(f"이미지 파일 개수: {len(self.image_paths)}\n")
                 
-                # 클래스 정보 업데이트
-                log_file.write("\n클래스 정보 업데이트 시작...\n")
-                self.update_class_dropdown()
-                log_file.write("클래스 정보 업데이트 완료\n")
+                if self.label_signatures:
+                    # 마지막 스캔 기록이 있으면 mtime/size가 바뀐 파일만 다시 반영
+                    log_file.write("\n증분 리프레시 시작 (변경 파일만 다시 파싱)...\n")
+                    status_label.config(text="변경된 라벨 파일 확인 중...")
+                    progress_window.update()
+                    changed_paths = self.refresh_label_data_cache()
+                    log_file.write(f"변경된 라벨 파일: {len(changed_paths)}개\n")
+                    for label_path in sorted(changed_paths)[:20]:
+                        log_file.write(f"  - {label_path}\n")
+                    if len(changed_paths) > 20:
+                        log_file.write(f"  - ... 외 {len(changed_paths)-20}개\n")
+                    log_file.write("증분 리프레시 완료\n")
+                else:
+                    # 라벨 데이터 초기화 및 다시 로드
+                    log_file.write("\n라벨 데이터 초기화 시작...\n")
+                    self.labelsdata = [[] for _ in range(100)]
+                    self.overlap_cache = {}
+                    log_file.write("labelsdata 및 overlap_cache 초기화 완료\n")
+                    
+                    # 클래스 정보 업데이트
+                    log_file.write("\n클래스 정보 업데이트 시작...\n")
+                    self.update_class_dropdown()
+                    log_file.write("클래스 정보 업데이트 완료\n")
                 
                 # 업데이트 후 라벨 데이터 상태 기록
                 log_file.write("\n업데이트 후 labelsdata 정보:\n")
@@ -7822,89 +8935,52 @@ class ImageViewer:
             # 진행 상황 표시를 위한 프로그레스바
             progress = ttk.Progressbar(change_dialog, orient="horizontal", length=350, mode="determinate")
             progress.pack(pady=10)
-            progress["maximum"] = len(self.selected_label_info)
             
-            # 변경 작업 실행
-            label_paths_to_refresh = []
-
-            # 변경 작업 실행
-            processed = 0
-            changed = 0
-            changed_boxes = 0
-
-            for i, label_info in enumerate(self.selected_label_info):
-                label_path = label_info['path']
-                
-                if not os.path.isfile(label_path):
-                    continue
-                
-                try:
-                    # 라벨 파일 읽기
-                    with open(label_path, 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                    
-                    # 변경될 라인 인덱스 목록 - 딕셔너리로 저장 (라인 인덱스: 새 클래스 ID)
-                    lines_to_change = {}
-                    
-                    # 선택된 박스의 라인 인덱스 수집
-                    for box in label_info['boxes']:
-                        if 'line_idx' in box:
-                            line_idx = box['line_idx']
-                            # 유효한 라인 인덱스인지 확인
-                            if 0 <= line_idx < len(lines):
-                                lines_to_change[line_idx] = tgt_class_idx
-                                # 내부 데이터 구조도 업데이트 (중요!)
-                                box['class_id'] = tgt_class_idx
-                    
-                    # 파일 내용 수정이 필요한지 확인
-                    if lines_to_change:
-                        # 새 내용 생성
-                        new_lines = []
-                        for line_idx, line in enumerate(lines):
-                            if line_idx in lines_to_change:
-                                # 선택된 박스의 라인만 변경
-                                parts = line.strip().split()
-                                if parts:  # 라인이 비어있지 않은지 확인
-                                    # 클래스 ID만 변경하고 나머지는 유지
-                                    parts[0] = str(lines_to_change[line_idx])
-                                    new_line = " ".join(parts) + "\n"
-                                    new_lines.append(new_line)
-                                    changed_boxes += 1
-                                    print(f"라인 {line_idx}의 클래스를 {parts[0]}로 변경")
-                                    # 클래스 변경된 라벨 정보 기록
-                                    label_key = (os.path.normpath(label_path), line_idx)
-                                    self.modified_labels['class_changed'].add(label_key)
-                                    print(f"[StatusIndicator] 클래스 변경 기록: {os.path.basename(label_path)}, line {line_idx}")
-                                else:
-                                    # 빈 라인은 그대로 유지
-                                    new_lines.append(line)
-                            else:
-                                # 선택되지 않은 라인은 그대로 유지
-                                new_lines.append(line)
-                        
-                        # 파일에 쓰기
-                        with open(label_path, 'w', encoding='utf-8') as f:
-                            f.writelines(new_lines)
-                        
-                        # 변경된 라벨 경로 추적
-                        label_paths_to_refresh.append(label_path)
-                        
-                        changed += 1
-                    
-                    processed += 1
-                    
-                    # 진행 상황 업데이트
-                    progress["value"] = i + 1
+            # 변경 작업 실행 - 파일별로 묶어 한 번씩 읽고 쓰기 (작업자 스레드 풀)
+            operations = LabelEditEngine.group_operations(
+                self.selected_label_info, target_class=tgt_class_idx)
+            progress["maximum"] = max(len(operations), 1)
+            counts = {'processed': 0, 'changed': 0}
+            
+            def on_file_done(done, total, result):
+                if result['error']:
+                    print(f"Error processing {result['path']}: {result['error']}")
+                else:
+                    counts['processed'] += 1
+                    if result['changed']:
+                        counts['changed'] += 1
+                # 주기적으로 UI 업데이트
+                if done % 50 == 0 or done == total:
+                    progress["value"] = done
                     result_label.config(
-                        text=f"처리 중: {processed}/{len(self.selected_label_info)}, 변경된 파일: {changed}",
+                        text=f"처리 중: {done}/{total}, 변경된 파일: {counts['changed']}",
                         foreground="blue"
                     )
                     change_dialog.update()
-                    
-                except Exception as e:
-                    print(f"Error processing {label_path}: {e}")
-                    import traceback
-                    traceback.print_exc()
+            
+            results, journal_path = self.run_label_edits(operations, on_file_done)
+            processed = counts['processed']
+            changed = counts['changed']
+            changed_boxes = 0
+            label_paths_to_refresh = []
+            
+            for result in results:
+                if not result['changed']:
+                    continue
+                label_path = result['path']
+                label_paths_to_refresh.append(label_path)
+                changed_boxes += len(result['changed'])
+                # 클래스 변경된 라벨 정보 기록
+                for line_idx in result['changed']:
+                    self.modified_labels['class_changed'].add((os.path.normpath(label_path), line_idx))
+            
+            # 내부 데이터 구조도 업데이트 (중요!)
+            changed_lines = {(result['path'], line_idx) for result in results for line_idx in result['changed']}
+            for label_info in self.selected_label_info:
+                for box in label_info['boxes']:
+                    if (label_info['path'], box.get('line_idx')) in changed_lines:
+                        box['class_id'] = tgt_class_idx
+            print(f"[StatusIndicator] 클래스 변경 기록: {len(label_paths_to_refresh)}개 파일, {changed_boxes}개 박스")
                 
             # 완료 메시지
             result_label.config(
@@ -7930,7 +9006,7 @@ class ImageViewer:
                 )
                 auto_close_label.pack(pady=(0, 10))
             # 캐시 무효화
-            for label_path in set(label_paths_to_refresh):
+            for label_path in label_paths_to_refresh:
                 self.invalidate_caches_for_label(label_path)
 
             # 라벨 데이터 캐시 갱신 - 부분 업데이트로 전환 (속도 개선)
@@ -7941,8 +9017,7 @@ class ImageViewer:
             self.deselect_all_images()
 
             # 화면의 모든 썸네일 제거 (UI 클리어)
-            for widget in self.frame.winfo_children():
-                widget.destroy()
+            self.release_grid_cells()
 
             # 완료 후 처리 - 즉시 실행 (비동기 작업 제거로 속도 개선)
             # 플래그 설정하여 trace_add 중복 호출 방지
@@ -7974,8 +9049,14 @@ class ImageViewer:
         """
         라벨 데이터 캐시를 갱신합니다.
         
+        specific_paths가 없으면 라벨 파일 stat을 디렉터리 목록 단위로 한 번에 읽어 마지막 스캔과
+        비교하고, mtime/size가 바뀐 파일만 다시 파싱해 labelsdata를 제자리에서 고칩니다.
+        
         Args:
             specific_paths (list, optional): 특정 경로만 갱신할 경우 경로 목록
+        
+        Returns:
+            set: 다시 반영한 라벨 경로
         """
         start_time = time.time()
         
@@ -7984,13 +9065,21 @@ class ImageViewer:
             if specific_paths:
                 self.logger.info(f"라벨 데이터 캐시 갱신 - {len(specific_paths)}개 파일")
             else:
-                self.logger.info("전체 라벨 데이터 캐시 갱신")
+                self.logger.info("전체 라벨 데이터 캐시 갱신 (변경 파일만)")
         
+        changed = set()
         try:
-            # 전체 갱신 또는 특정 파일만 갱신
-            paths_to_process = specific_paths if specific_paths else self.labels
-            processed_count = 0
-            updated_count = 0
+            # 갱신 대상 결정 - 특정 파일 또는 stat이 바뀐 파일
+            if specific_paths:
+                changed = set(specific_paths)
+                signatures = stat_label_files(changed, self.worker_threads)
+            else:
+                signatures = stat_label_files(self.labels, self.worker_threads)
+                previous = self.label_signatures
+                changed = {p for p in self.labels if signatures.get(p) != previous.get(p)}
+                for label_path in changed:
+                    self.invalidate_caches_for_label(label_path)
+            stat_time = time.time() - start_time
             
             # 클래스별 파일 개수 기록 (이전)
             before_counts = {}
@@ -7998,41 +9087,54 @@ class ImageViewer:
                 if paths:  # 비어있지 않은 경우만
                     before_counts[class_idx] = len(paths)
             
-            # 특정 파일만 갱신하는 경우 - 해당 파일 제거
-            if specific_paths:
-                # 기존 labelsdata에서 해당 파일 제거
-                for class_idx, paths in enumerate(self.labelsdata):
-                    self.labelsdata[class_idx] = [p for p in paths if p not in specific_paths]
-            
-            # 파일 처리
-            for label_path in paths_to_process:
-                if not os.path.isfile(label_path):
+            # 바뀐 파일만 다시 파싱 - 클래스별 {경로: 박스 수}
+            new_counts = defaultdict(dict)
+            for label_path in list(changed):
+                signature = signatures.get(label_path)
+                if signature is None:
+                    # 삭제된 파일은 모든 클래스에서 제거
+                    self.label_signatures.pop(label_path, None)
                     continue
-                    
-                processed_count += 1
-                
                 try:
-                    # 파일 읽기
-                    lines = self._get_label_data(label_path)
-                    
-                    for line in lines:
-                        parts = line.strip().split()
-                        if not parts:
-                            continue
-                            
-                        try:
-                            class_index = int(float(parts[0]))
-                            
-                            # 클래스 인덱스 유효성 확인
-                            if 0 <= class_index < len(self.labelsdata):
-                                # 중복 방지
-                                if label_path not in self.labelsdata[class_index]:
-                                    self.labelsdata[class_index].append(label_path)
-                                    updated_count += 1
-                        except (ValueError, IndexError):
-                            continue
-                except Exception as e:
+                    lines = self.label_reader.read_lines(label_path)
+                except OSError as e:
+                    # 읽지 못한 파일은 기존 항목을 유지하고 다음 리프레시에서 다시 시도
                     print(f"라벨 파일 처리 중 오류 ({label_path}): {e}")
+                    changed.discard(label_path)
+                    continue
+                histogram, boxes = parse_label_lines(lines)
+                self.label_signatures[label_path] = signature
+                if self.label_index is not None:
+                    status = "성공" if histogram else ("유효 라벨 없음" if lines else "빈 파일")
+                    self.label_index.put_values(label_path, signature[0], signature[1], status, histogram, boxes)
+                for class_index, count in histogram.items():
+                    new_counts[int(float(class_index))][label_path] = count
+            
+            # labelsdata 제자리 수정 - 바뀐 파일은 기존 위치에 새 박스 수만큼, 새 클래스는 끝에 추가
+            updated_count = 0
+            for class_idx, paths in enumerate(self.labelsdata):
+                wanted = new_counts.get(class_idx, {})
+                if not wanted and (not paths or changed.isdisjoint(paths)):
+                    continue
+                rebuilt = []
+                emitted = set()
+                for label_path in paths:
+                    if label_path not in changed:
+                        rebuilt.append(label_path)
+                    elif label_path not in emitted:
+                        emitted.add(label_path)
+                        rebuilt.extend([label_path] * wanted.get(label_path, 0))
+                for label_path, count in wanted.items():
+                    if label_path not in emitted:
+                        rebuilt.extend([label_path] * count)
+                self.labelsdata[class_idx] = rebuilt
+                updated_count += 1
+            
+            if self.label_index is not None:
+                try:
+                    self.label_index.commit()
+                except sqlite3.Error as e:
+                    print(f"라벨 인덱스 저장 오류: {e}")
             
             # 클래스별 파일 개수 변화 기록
             after_counts = {}
@@ -8048,15 +9150,19 @@ class ImageViewer:
                 if before != after:
                     changes.append(f"클래스 {class_idx}: {before} → {after}")
             
+            # 클래스 메뉴의 개수 표시 갱신
+            if updated_count:
+                self.update_class_menus([str(class_idx) for class_idx in sorted(after_counts)])
+            
             # 소요 시간 및 결과 로깅
             elapsed_time = time.time() - start_time
             
             if hasattr(self, 'logger'):
-                self.logger.info(f"라벨 데이터 캐시 갱신 완료: {elapsed_time:.3f}초, {processed_count}개 처리, {updated_count}개 추가/갱신")
+                self.logger.info(f"라벨 데이터 캐시 갱신 완료: {elapsed_time:.3f}초 (stat {stat_time:.3f}초), {len(changed)}개 파일 반영, {updated_count}개 클래스 갱신")
                 if changes:
                     self.logger.info(f"클래스별 변경: {', '.join(changes)}")
             
-            print(f"라벨 데이터 캐시 갱신 완료: {elapsed_time:.3f}초")
+            print(f"라벨 데이터 캐시 갱신 완료: {elapsed_time:.3f}초, 변경 파일 {len(changed)}개")
             if changes:
                 print(f"클래스별 변경: {', '.join(changes)}")
             
@@ -8067,6 +9173,7 @@ class ImageViewer:
             
             if hasattr(self, 'logger'):
                 self.logger.error(f"라벨 데이터 캐시 갱신 오류: {e}")
+        return changed
     # 변경 작업 완료 후 캐시 무효화 추가
     def invalidate_caches_for_label(self, label_path):
         """라벨 변경 후 관련 캐시를 무효화합니다."""
@@ -8087,9 +9194,9 @@ class ImageViewer:
             for key in keys_to_remove:
                 del self.overlap_cache[key]
         
-        # 인코딩 캐시 무효화
-        if hasattr(self, 'file_encoding_cache') and label_path in self.file_encoding_cache:
-            del self.file_encoding_cache[label_path]
+        # 공간 인덱스 항목 무효화
+        if hasattr(self, 'box_spatial_index'):
+            self.box_spatial_index.discard(label_path)
         
         # 로깅
         print(f"캐시 무효화 완료: {os.path.basename(label_path)}")
@@ -8157,6 +9264,7 @@ class ImageViewer:
         
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # PyInstaller 빌드에서 클래스 스캔 프로세스 풀 사용
     root = tk.Tk()
     app = ImageViewer(root)
     root.mainloop()
\ No newline at end of file
@@ -6,12 +6,55 @@ import time
 import gc
 import threading
 import queue
+from array import array
 from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from utils import (
     detect_file_encoding, convert_jpegimages_to_labels,
     read_label_file_lines, calculate_iou
 )
 
+# 이 개수 이상이면 클래스 스캔을 프로세스 풀로 수행 (적으면 프로세스 시작 비용이 더 큼)
+PROCESS_SCAN_MIN_FILES = 20000
+
+
+def scan_label_chunk(chunk_start, label_paths):
+    """
+    (프로세스 풀 작업자) 라벨 파일 묶음에서 클래스 정보를 수집합니다.
+    Args:
+        chunk_start: 묶음 첫 파일의 전체 목록 기준 번호
+        label_paths: 라벨 경로 목록
+    Returns:
+        tuple: (class_files, valid, invalid)
+               class_files는 {클래스 토큰: 파일 번호 array (박스 수만큼 반복)}
+    """
+    class_files = {}
+    valid = 0
+    invalid = 0
+    for offset, lp in enumerate(label_paths):
+        file_valid = False
+        if os.path.isfile(lp):
+            try:
+                for line in read_label_file_lines(lp):
+                    parts = line.split()
+                    if not parts:
+                        continue
+                    try:
+                        ci = int(float(parts[0]))
+                    except ValueError:
+                        continue
+                    if 0 <= ci < 100:
+                        class_files.setdefault(parts[0], array('i')).append(chunk_start + offset)
+                        file_valid = True
+            except Exception:
+                pass
+        if file_valid:
+            valid += 1
+        else:
+            invalid += 1
+    return class_files, valid, invalid
+
 
 class DataManager:
     """데이터 로딩, 캐싱, 라벨 데이터 관리를 담당하는 클래스"""
@@ -198,15 +241,24 @@ class DataManager:
 
         return image_paths, label_paths, len(lines)
 
-    def scan_classes(self, label_paths, progress_callback=None):
+    def scan_classes(self, label_paths, progress_callback=None, processes=None):
         """
         라벨 파일들에서 클래스 정보를 수집합니다.
         Args:
             label_paths: 라벨 파일 경로 목록
             progress_callback: (processed, total, valid, invalid) 콜백
+            processes: 프로세스 풀 크기 (None이면 파일 수에 따라 자동, 1이면 스레드 사용)
         Returns:
             tuple: (labelsdata, sorted_classes, valid_files, invalid_files)
         """
+        if processes is None:
+            processes = (os.cpu_count() or 1) if len(label_paths) >= PROCESS_SCAN_MIN_FILES else 1
+        if processes > 1:
+            try:
+                return self._scan_classes_processes(label_paths, processes, progress_callback)
+            except (OSError, RuntimeError, BrokenProcessPool) as e:
+                print(f"프로세스 클래스 스캔 실패, 스레드 스캔으로 전환: {e}")
+
         labelsdata_new = [[] for _ in range(100)]
         classes = set()
         valid_files = 0
@@ -300,6 +352,41 @@ class DataManager:
         sorted_classes = sorted(list(classes), key=lambda x: int(float(x)))
         return labelsdata_new, sorted_classes, valid_files, invalid_files
 
+    def _scan_classes_processes(self, label_paths, processes, progress_callback=None):
+        """scan_classes의 프로세스 풀 버전 - 묶음별 결과를 목록 순서대로 병합합니다."""
+        label_paths = list(label_paths)
+        total = len(label_paths)
+        chunk_size = max(500, min(20000, (total + processes * 8 - 1) // (processes * 8)))
+        chunk_results = {}
+        processed = 0
+        valid_files = 0
+        invalid_files = 0
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = {
+                executor.submit(scan_label_chunk, start, label_paths[start:start + chunk_size]): start
+                for start in range(0, total, chunk_size)
+            }
+            for future in as_completed(futures):
+                start = futures[future]
+                class_files, valid, invalid = future.result()
+                chunk_results[start] = class_files
+                processed += valid + invalid
+                valid_files += valid
+                invalid_files += invalid
+                if progress_callback:
+                    progress_callback(processed, total, valid_files, invalid_files)
+
+        labelsdata_new = [[] for _ in range(100)]
+        classes = set()
+        for start in sorted(chunk_results):
+            for class_token, file_ids in chunk_results[start].items():
+                classes.add(class_token)
+                labelsdata_new[int(float(class_token))].extend([label_paths[i] for i in file_ids])
+
+        sorted_classes = sorted(list(classes), key=lambda x: int(float(x)))
+        return labelsdata_new, sorted_classes, valid_files, invalid_files
+
     def refresh_label_data_cache(self, specific_paths=None):
         """라벨 데이터 캐시를 갱신합니다."""
         paths_to_process = specific_paths if specific_paths else self.labels
@@ -17,6 +17,7 @@ import random
 import gc
 import copy
 import threading
+import multiprocessing
 import queue
 
 try:
@@ -1377,6 +1378,7 @@ class ImageViewer:
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # PyInstaller 빌드에서 클래스 스캔 프로세스 풀 사용
     root = tk.Tk()
     app = ImageViewer(root)
     root.mainloop()
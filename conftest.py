@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+테스트 공용 픽스처
+
+06.label_check.py, 04.GTGEN_Tool_svms_v2.py 처럼 숫자로 시작하는 스크립트는
+일반 import가 되지 않으므로 파일 경로로 모듈을 불러옵니다.
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+_modules = {}
+
+
+def load_script(relative_path, module_name):
+    """스크립트 파일을 모듈로 한 번만 불러옵니다."""
+    if module_name not in _modules:
+        spec = importlib.util.spec_from_file_location(module_name, os.path.join(ROOT, relative_path))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[module_name] = module
+    return _modules[module_name]
+
+
+@pytest.fixture(scope="session")
+def label_check():
+    return load_script("06.label_check.py", "label_check")
+
+
+@pytest.fixture(scope="session")
+def gtgen():
+    """GTGEN은 import 시 pyautogui가 화면(DISPLAY)을 요구하므로 불러올 수 없는 환경에서는 건너뜁니다."""
+    try:
+        return load_script("04.GTGEN_Tool_svms_v2.py", "gtgen")
+    except Exception as e:
+        pytest.skip(f"04.GTGEN_Tool_svms_v2.py를 불러올 수 없음: {e!r}")
+
+
+@pytest.fixture(scope="session")
+def make_label_list():
+    return load_script(os.path.join("db_check_linux", "01.make_label_list.py"), "make_label_list")
@@ -7,7 +7,15 @@ import sys
 import os
 import re
 import logging
-from collections import defaultdict
+import gzip
+import json
+import hashlib
+import stat
+import time
+import atexit
+from collections import defaultdict, deque, Counter
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 
 # 리눅스에서 방향키, 백스페이스 등의 입력을 제대로 처리하기 위한 readline import
 try:
@@ -76,95 +84,481 @@ def get_default_output_path(input_path):
     """입력 경로 기반으로 기본 출력 경로 생성"""
     return os.path.join(input_path, 'output')
 
+class LabelPathResolver:
+    """
+    이미지 경로 -> 라벨 경로 변환기 (이미지 폴더별 라벨 폴더를 한 번만 찾아 기억)
+
+    JPEGImages 아래가 아닌 이미지는 상위 폴더로 올라가며 labels 폴더를 찾아야 하므로,
+    같은 폴더의 이미지마다 os.path.exists를 반복하지 않도록 결과를 폴더 단위로 저장합니다.
+    라벨 폴더를 새로 만들면 탐색 결과가 달라질 수 있어 저장된 결과를 비웁니다.
+    """
+
+    def __init__(self):
+        self.label_dirs = {}      # 이미지 폴더 -> 라벨 폴더
+        self.existing_dirs = set()  # 존재를 확인한(또는 만든) 폴더
+
+    def clear(self):
+        self.label_dirs.clear()
+        self.existing_dirs.clear()
+
+    @staticmethod
+    def _find_label_dir(directory):
+        """상위로 올라가며 labels 폴더를 찾아 라벨 폴더 반환 (없으면 같은 폴더 아래 labels)"""
+        # 방법 2: 상위 디렉토리의 labels 폴더 사용
+        current_dir = directory
+        while current_dir and current_dir != os.path.dirname(current_dir):
+            parent_dir = os.path.dirname(current_dir)
+            labels_dir = os.path.join(parent_dir, 'labels')
+
+            if os.path.exists(labels_dir):
+                # 원본 이미지의 하위 디렉토리 구조를 labels에도 반영
+                relative_path = os.path.relpath(directory, os.path.dirname(labels_dir))
+                if relative_path.startswith('JPEGImages'):
+                    relative_path = relative_path.replace('JPEGImages', 'labels', 1)
+                else:
+                    relative_path = os.path.join('labels', os.path.basename(directory))
+
+                return os.path.join(parent_dir, relative_path)
+
+            current_dir = parent_dir
+
+        # 방법 3: 같은 디렉토리에 labels 폴더 생성
+        return os.path.join(directory, 'labels')
+
+    def label_dir(self, directory):
+        """이미지 폴더의 라벨 폴더 (폴더당 한 번만 탐색)"""
+        label_dir = self.label_dirs.get(directory)
+        if label_dir is None:
+            label_dir = self._find_label_dir(directory)
+            self.label_dirs[directory] = label_dir
+        return label_dir
+
+    def resolve(self, image_path):
+        """이미지 경로에서 라벨 경로 생성"""
+        # 방법 1: JPEGImages -> labels 치환
+        if 'JPEGImages' in image_path:
+            return image_path.replace('JPEGImages', 'labels').replace('.jpg', '.txt')
+
+        directory, filename = os.path.split(image_path)
+        return os.path.join(self.label_dir(directory), os.path.splitext(filename)[0] + '.txt')
+
+    def resolve_many(self, image_paths):
+        """
+        여러 이미지 경로를 한 번에 라벨 경로로 변환 (폴더별 탐색은 한 번씩만 수행)
+
+        Returns:
+            list: 입력 순서와 같은 라벨 경로 리스트
+        """
+        by_dir = defaultdict(list)
+        label_paths = [None] * len(image_paths)
+        for index, image_path in enumerate(image_paths):
+            if 'JPEGImages' in image_path:
+                label_paths[index] = image_path.replace('JPEGImages', 'labels').replace('.jpg', '.txt')
+            else:
+                by_dir[os.path.dirname(image_path)].append(index)
+        for directory, indices in by_dir.items():
+            label_dir = self.label_dir(directory)
+            for index in indices:
+                filename = os.path.basename(image_paths[index])
+                label_paths[index] = os.path.join(label_dir, os.path.splitext(filename)[0] + '.txt')
+        return label_paths
+
+    def dir_exists(self, directory):
+        """폴더 존재 여부 (존재가 확인된 폴더는 다시 확인하지 않음)"""
+        if directory in self.existing_dirs:
+            return True
+        if os.path.isdir(directory):
+            self.existing_dirs.add(directory)
+            return True
+        return False
+
+    def ensure_dir(self, directory):
+        """
+        폴더가 없으면 생성
+        Returns:
+            bool: 새로 만들었으면 True
+        """
+        if self.dir_exists(directory):
+            return False
+        os.makedirs(directory, exist_ok=True)
+        self.existing_dirs.add(directory)
+        self.label_dirs.clear()  # 새 labels 폴더로 상위 탐색 결과가 바뀔 수 있음
+        return True
+
+# 모든 모드가 공유하는 라벨 경로 변환기 (탐색 한 번마다 초기화)
+label_path_resolver = LabelPathResolver()
+
 def get_label_path_from_image(image_path):
     """
     이미지 경로에서 라벨 경로를 생성하는 개선된 함수
-    다양한 디렉토리 구조를 지원
+    다양한 디렉토리 구조를 지원 (폴더별 결과는 label_path_resolver에 저장)
     """
-    # 방법 1: JPEGImages -> labels 치환
-    if 'JPEGImages' in image_path:
-        label_path = image_path.replace('JPEGImages', 'labels').replace('.jpg', '.txt')
-        return label_path
-    
-    # 방법 2: 상위 디렉토리의 labels 폴더 사용
-    directory = os.path.dirname(image_path)
-    filename = os.path.basename(image_path)
-    base_filename = os.path.splitext(filename)[0] + '.txt'
-    
-    # 현재 디렉토리에서 상위로 올라가면서 labels 디렉토리 찾기
-    current_dir = directory
-    while current_dir and current_dir != os.path.dirname(current_dir):
-        parent_dir = os.path.dirname(current_dir)
-        labels_dir = os.path.join(parent_dir, 'labels')
-        
-        if os.path.exists(labels_dir):
-            # 원본 이미지의 하위 디렉토리 구조를 labels에도 반영
-            relative_path = os.path.relpath(directory, os.path.dirname(labels_dir))
-            if relative_path.startswith('JPEGImages'):
-                relative_path = relative_path.replace('JPEGImages', 'labels', 1)
-            else:
-                relative_path = os.path.join('labels', os.path.basename(directory))
-            
-            final_label_dir = os.path.join(parent_dir, relative_path)
-            label_path = os.path.join(final_label_dir, base_filename)
-            return label_path
-        
-        current_dir = parent_dir
-    
-    # 방법 3: 같은 디렉토리에 labels 폴더 생성
-    labels_dir = os.path.join(directory, 'labels')
-    label_path = os.path.join(labels_dir, base_filename)
-    return label_path
+    return label_path_resolver.resolve(image_path)
+
+class ImageFileStream:
+    """
+    폴더(또는 .txt 파일 리스트)의 jpg 경로를 찾는 즉시 흘려보내는 스캐너
+
+    하위 폴더마다 os.scandir를 스레드 풀에서 병렬로 실행하고, 찾은 경로를 바로 yield 하므로
+    전체 목록을 만들기 전에 처리를 시작할 수 있습니다 (NFS 등 느린 저장소에서 탐색과 처리가 겹침).
+    순회 순서는 폴더 탐색 완료 순서를 따릅니다.
+
+    Attributes:
+        found        - 지금까지 찾은 이미지 수 (진행률 표시용)
+        filtered_cnt - 키워드 필터링으로 제외된 파일 수
+        done         - 탐색 완료 여부 (True면 found가 전체 개수)
+        errors       - 읽지 못한 폴더 [(경로, 예외)]
+    """
+
+    def __init__(self, input_source, keyword=None, workers=16, manifest=None):
+        self.input_source = input_source
+        self.keyword = keyword
+        self.workers = workers
+        self.manifest = manifest  # DatasetManifest - 있으면 mtime이 같은 폴더는 다시 읽지 않음
+        self.found = 0
+        self.filtered_cnt = 0
+        self.done = False
+        self.errors = []
+
+    def _accept(self, name):
+        """jpg 확장자 및 키워드 조건 확인"""
+        if not name.lower().endswith(('.jpg', '.jpeg')):
+            return False
+        if self.keyword and self.keyword not in name:
+            self.filtered_cnt += 1
+            return False
+        return True
+
+    @staticmethod
+    def scan_dir(path):
+        """폴더 하나를 읽어 (경로, 파일명 목록, 하위 폴더명 목록, 오류) 반환 - os.walk와 같이 심볼릭 링크 폴더는 내려가지 않음"""
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        files.append(entry.name)
+                    elif not entry.is_symlink():
+                        subdirs.append(entry.name)
+        except OSError as e:
+            return path, files, subdirs, e
+        return path, files, subdirs, None
+
+    def _iter_dir(self):
+        pending = deque([self.input_source])
+        running = set()
+        scan_dir = self.manifest.scan_dir if self.manifest is not None else self.scan_dir
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            def fill():
+                while pending and len(running) < self.workers * 2:
+                    running.add(executor.submit(scan_dir, pending.popleft()))
+
+            fill()
+            while running:
+                finished, running = wait(running, return_when=FIRST_COMPLETED)
+                batch = []
+                for future in finished:
+                    path, files, subdirs, error = future.result()
+                    if error is not None:
+                        self.errors.append((path, error))
+                        continue
+                    pending.extend(os.path.join(path, d) for d in subdirs)
+                    batch.extend(os.path.join(path, f) for f in files if self._accept(f))
+                # 처리하는 동안에도 탐색이 계속되도록 먼저 예약
+                fill()
+                if not running:
+                    self.found += len(batch)
+                    self.done = True
+                    if self.manifest is not None and not self.errors:
+                        self.manifest.prune()
+                    yield from batch
+                    continue
+                for image_path in batch:
+                    self.found += 1
+                    yield image_path
+
+    def _iter_list(self):
+        try:
+            with open(self.input_source, 'r', encoding='utf-8') as f:
+                for line in f:
+                    path = line.strip()
+                    if not path or path.startswith('#'):
+                        continue
+                    if self._accept(os.path.basename(path)):
+                        self.found += 1
+                        yield path
+        except Exception as e:
+            print(f"파일 리스트 읽기 오류: {e}")
+
+    def __iter__(self):
+        # 새 탐색마다 라벨 경로 변환 결과를 새로 계산 (이전 실행 이후 폴더 구조가 바뀌었을 수 있음)
+        label_path_resolver.clear()
+        if os.path.isdir(self.input_source):
+            yield from self._iter_dir()
+        elif os.path.isfile(self.input_source) and self.input_source.lower().endswith('.txt'):
+            yield from self._iter_list()
+        self.done = True
+
+    def progress_text(self, count):
+        """처리 개수 기준 진행률 문자열 (탐색 중이면 지금까지 찾은 개수 기준)"""
+        if self.done and self.found:
+            return f"{count / self.found * 100:.1f}% ({count}/{self.found})"
+        return f"탐색 중 ({count}/{self.found}+)"
+
+# 매니페스트 저장 폴더 (입력 경로별 파일 하나)
+MANIFEST_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'make_label_list')
+
+class DatasetManifest:
+    """
+    모든 모드가 공유하는 데이터셋 매니페스트 캐시
+
+    폴더별 jpg 목록(폴더 mtime 기준)과 이미지별 라벨 정보(라벨 경로, mtime/크기, 줄 수,
+    클래스별 박스 수)를 입력 경로마다 MANIFEST_DIR 아래 파일 하나로 저장합니다.
+    다음 실행에서는 mtime이 같은 폴더는 다시 읽지 않고, mtime/크기가 같은 라벨은 다시 파싱하지 않습니다.
+    cache_dir가 None이면 파일을 읽거나 저장하지 않습니다 (작업 프로세스용).
+    """
+
+    VERSION = 1
+
+    def __init__(self, input_source, cache_dir=MANIFEST_DIR):
+        self.input_source = os.path.abspath(input_source)
+        key = hashlib.sha1(self.input_source.encode('utf-8')).hexdigest()[:16]
+        self.cache_path = os.path.join(cache_dir, f"{key}.json.gz") if cache_dir else None
+        self.dirs = {}        # 폴더 -> [mtime_ns, 하위 폴더명 목록, jpg 파일명 목록]
+        self.labels = {}      # 이미지 경로 -> [라벨 경로, mtime_ns, 크기, 내용 있는 줄 수, [[클래스, 박스 수]], [[줄 번호, 잘못된 줄]]]
+        self.visited = set()  # 이번 실행에서 확인한 폴더
+        self.reused_labels = 0
+        self.parsed_labels = 0
+        self.dirty = False
+        if self.cache_path:
+            self._load()
+
+    def _load(self):
+        try:
+            with gzip.open(self.cache_path, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != self.VERSION or data.get('source') != self.input_source:
+            return
+        self.dirs = data.get('dirs', {})
+        self.labels = data.get('labels', {})
+
+    def scan_dir(self, path):
+        """ImageFileStream용 폴더 읽기 - 폴더 mtime이 저장된 값과 같으면 저장된 목록을 그대로 사용"""
+        self.visited.add(path)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError as e:
+            return path, [], [], e
+        cached = self.dirs.get(path)
+        if cached is not None and cached[0] == mtime:
+            return path, cached[2], cached[1], None
+        path, files, subdirs, error = ImageFileStream.scan_dir(path)
+        if error is None:
+            self.dirs[path] = [mtime, subdirs, [f for f in files if f.lower().endswith(('.jpg', '.jpeg'))]]
+            self.dirty = True
+        return path, files, subdirs, error
+
+    def prune(self):
+        """전체 폴더 탐색이 끝난 뒤 사라진 폴더/이미지 항목 제거"""
+        dirs = {path: entry for path, entry in self.dirs.items() if path in self.visited}
+        listings = {path: set(entry[2]) for path, entry in dirs.items()}
+        labels = {image_path: record for image_path, record in self.labels.items()
+                  if os.path.basename(image_path) in listings.get(os.path.dirname(image_path), ())}
+        if len(dirs) != len(self.dirs) or len(labels) != len(self.labels):
+            self.dirty = True
+        self.dirs = dirs
+        self.labels = labels
+
+    @staticmethod
+    def parse_label(label_path):
+        """라벨 파일을 읽어 [내용 있는 줄 수, [[클래스, 박스 수]], [[줄 번호, 잘못된 줄]]] 반환 (YOLO 형식은 최소 5개 값)"""
+        lines = 0
+        classes = Counter()
+        bad_lines = []
+        with open(label_path, 'r', encoding='utf-8') as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                lines += 1
+                split_line = line.split()
+                if len(split_line) < 5:
+                    bad_lines.append([line_num, line])
+                    continue
+                try:
+                    class_id = int(float(split_line[0]))
+                except (ValueError, OverflowError):
+                    bad_lines.append([line_num, line])
+                    continue
+                classes[class_id] += 1
+        return [lines, sorted([c, n] for c, n in classes.items()), bad_lines]
+
+    def label_info(self, image_path, label_path=None):
+        """
+        이미지의 라벨 정보 조회 (라벨 mtime/크기가 저장된 값과 같으면 파싱 결과 재사용)
+
+        Returns:
+            dict: label_path, exists, empty(0바이트 파일), lines(내용 있는 줄 수), boxes,
+                  classes({클래스 ID: 박스 수}, 범위 검사 전), bad_lines([(줄 번호, 내용)])
+        Raises:
+            OSError, UnicodeDecodeError: 라벨 파일을 읽지 못한 경우
+        """
+        if label_path is None:
+            label_path = get_label_path_from_image(image_path)
+        try:
+            st = os.stat(label_path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
+            return {'label_path': label_path, 'exists': False, 'empty': True, 'lines': 0,
+                    'boxes': 0, 'classes': {}, 'bad_lines': []}
+
+        record = self.labels.get(image_path)
+        if record is not None and record[0] == label_path and record[1] == st.st_mtime_ns and record[2] == st.st_size:
+            self.reused_labels += 1
+        else:
+            record = [label_path, st.st_mtime_ns, st.st_size] + self.parse_label(label_path)
+            self.labels[image_path] = record
+            self.parsed_labels += 1
+            self.dirty = True
+
+        classes = {class_id: count for class_id, count in record[4]}
+        return {'label_path': label_path, 'exists': True, 'empty': st.st_size == 0, 'lines': record[3],
+                'boxes': sum(classes.values()), 'classes': classes,
+                'bad_lines': [tuple(bad) for bad in record[5]]}
+
+    def merge(self, labels, reused, parsed):
+        """작업 프로세스에서 새로 읽은 라벨 항목과 재사용/파싱 수를 반영"""
+        if labels:
+            self.labels.update(labels)
+            self.dirty = True
+        self.reused_labels += reused
+        self.parsed_labels += parsed
+
+    def save(self, logger=None):
+        """변경이 있으면 임시 파일에 쓴 뒤 교체하여 저장 (실패해도 처리 결과에는 영향 없음)"""
+        if logger:
+            logger.info(f"매니페스트: 라벨 재사용 {self.reused_labels}개, 새로 읽음 {self.parsed_labels}개")
+        if not self.dirty or self.cache_path is None:
+            return
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=1) as f:
+                json.dump({'version': self.VERSION, 'source': self.input_source,
+                           'dirs': self.dirs, 'labels': self.labels},
+                          f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, self.cache_path)
+            self.dirty = False
+        except OSError as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            if logger:
+                logger.warning(f"매니페스트 저장 실패 {self.cache_path}: {e}")
+
+def class_count_vector(classes):
+    """{클래스 ID: 박스 수}를 [전체, 클래스0, ..., 클래스88] 형태의 90칸 배열로 변환 (범위 밖 클래스 제외)"""
+    annotation = np.zeros(90)
+    for class_id, count in classes.items():
+        if 0 <= class_id < 89:
+            annotation[0] += count
+            annotation[class_id + 1] += count
+    return annotation
+
+class OutputFiles:
+    """
+    처리 루프에서 여러 결과 리스트 파일에 한 줄씩 기록하기 위한 출력기
+
+    파일마다 '<경로>.tmp'를 큰 버퍼로 한 번만 열어 두고, 버퍼가 차거나
+    flush_interval초가 지나면 디스크로 내려씁니다. commit()에서 임시 파일을
+    원래 이름으로 교체하므로 중간에 중단되어도 train.txt / valid.txt 등이
+    반쯤 쓰인 상태로 남지 않습니다 (이전 결과 파일은 그대로 유지).
+    """
+    active = set()  # 프로그램 종료 시 정리할 미완료 출력기
+
+    def __init__(self, buffer_size=1 << 20, flush_interval=5.0):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.files = {}  # 경로 -> (임시 파일 경로, 파일 객체)
+        self.last_flush = time.monotonic()
+        OutputFiles.active.add(self)
+
+    def open(self, path, header=''):
+        """임시 파일을 열고 헤더 기록"""
+        path = str(path)
+        tmp_path = f"{path}.tmp"
+        f = open(tmp_path, 'w', encoding='utf-8', buffering=self.buffer_size)
+        if header:
+            f.write(header)
+        self.files[path] = (tmp_path, f)
+
+    def write(self, path, text):
+        self.files[str(path)][1].write(text)
+        if time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        for tmp_path, f in self.files.values():
+            f.flush()
+        self.last_flush = time.monotonic()
+
+    def commit(self):
+        """모든 파일을 닫고 임시 파일을 원래 이름으로 교체"""
+        for tmp_path, f in self.files.values():
+            f.close()
+        for path, (tmp_path, f) in self.files.items():
+            os.replace(tmp_path, path)
+        self.files = {}
+        OutputFiles.active.discard(self)
+
+    def abort(self):
+        """모든 파일을 닫고 임시 파일 삭제 (기존 결과 파일은 건드리지 않음)"""
+        for tmp_path, f in self.files.values():
+            f.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.files = {}
+        OutputFiles.active.discard(self)
+
+    @classmethod
+    def abort_all(cls):
+        for outputs in list(cls.active):
+            outputs.abort()
+
+atexit.register(OutputFiles.abort_all)
 
 def count_jpg_files(path):
     """입력 경로의 전체 jpg 파일 수를 계산"""
-    total = 0
-    for root, _, files in os.walk(path):
-        total += sum(1 for f in files if f.lower().endswith(('.jpg', '.jpeg')))
-    return total
+    return sum(1 for _ in ImageFileStream(path))
 
-def collect_image_files_from_source(input_source, keyword=None):
+def collect_image_files_from_source(input_source, keyword=None, manifest=None):
     """
     폴더 경로 또는 파일 리스트(.txt)에서 이미지 파일 목록 수집
+    (전체 목록이 필요한 샘플링 모드용 - 한 번만 순회하는 모드는 ImageFileStream을 직접 사용)
 
     Args:
         input_source: 폴더 경로 또는 이미지 경로가 담긴 .txt 파일 경로
         keyword: 파일명 필터링 키워드 (None이면 모든 파일 포함)
+        manifest: DatasetManifest (None이면 캐시 없이 탐색)
 
     Returns:
         (image_files, filtered_cnt):
-            image_files  - 수집된 이미지 경로 리스트
+            image_files  - 수집된 이미지 경로 리스트 (폴더 입력은 병렬 탐색 순서와 무관하게 정렬)
             filtered_cnt - 키워드 필터링으로 제외된 파일 수
     """
-    image_files = []
-    filtered_cnt = 0
-
+    stream = ImageFileStream(input_source, keyword, manifest=manifest)
+    image_files = list(stream)
     if os.path.isdir(input_source):
-        # 폴더 순회
-        for root, _, files in os.walk(input_source):
-            for file in files:
-                if file.lower().endswith(('.jpg', '.jpeg')):
-                    if keyword and keyword not in file:
-                        filtered_cnt += 1
-                        continue
-                    image_files.append(os.path.join(root, file))
-    elif os.path.isfile(input_source) and input_source.lower().endswith('.txt'):
-        # 파일 리스트 읽기
-        try:
-            with open(input_source, 'r', encoding='utf-8') as f:
-                for line in f:
-                    path = line.strip()
-                    if not path or path.startswith('#'):
-                        continue
-                    if path.lower().endswith(('.jpg', '.jpeg')):
-                        if keyword and keyword not in os.path.basename(path):
-                            filtered_cnt += 1
-                            continue
-                        image_files.append(path)
-        except Exception as e:
-            print(f"파일 리스트 읽기 오류: {e}")
+        image_files.sort()
 
-    return image_files, filtered_cnt
+    return image_files, stream.filtered_cnt
 
 def print_class_statistics(obj_annotation, title):
     """클래스별 통계 출력"""
@@ -177,7 +571,7 @@ def print_class_statistics(obj_annotation, title):
 def create_empty_label(label_path, logger=None):
     """빈 라벨 파일 생성"""
     try:
-        os.makedirs(os.path.dirname(label_path), exist_ok=True)
+        label_path_resolver.ensure_dir(os.path.dirname(label_path))
         with open(label_path, 'w', encoding='utf-8') as f:
             pass  # 빈 파일 생성
         if logger:
@@ -195,11 +589,13 @@ def validate_paths(image_path, label_path, logger=None):
     if not os.path.exists(image_path):
         issues.append(f"이미지 파일 없음: {image_path}")
     
-    if not os.path.exists(os.path.dirname(label_path)):
+    # 라벨 디렉토리는 폴더당 한 번만 확인
+    label_dir = os.path.dirname(label_path)
+    if not label_path_resolver.dir_exists(label_dir):
         try:
-            os.makedirs(os.path.dirname(label_path), exist_ok=True)
+            label_path_resolver.ensure_dir(label_dir)
             if logger:
-                logger.debug(f"라벨 디렉토리 생성: {os.path.dirname(label_path)}")
+                logger.debug(f"라벨 디렉토리 생성: {label_dir}")
         except Exception as e:
             issues.append(f"라벨 디렉토리 생성 실패: {e}")
     
@@ -251,31 +647,21 @@ def create_complete_dataset_list(input_path, output_path, keyword=None, output_p
         'filtered_cnt': 0,        # 키워드 필터링으로 제외된 파일 수
     }
     
-    # 파일 리스트 초기화
-    with open(complete_list_path, 'w', encoding='utf-8') as f:
-        pass  # 파일 초기화
-    
-    # 에러 로그 파일 초기화
-    with open(error_log_path, 'w', encoding='utf-8') as f:
-        f.write("에러 로그\n")
-        f.write("=" * 50 + "\n")
+    # 파일 리스트 / 에러 로그 파일 초기화 (완료 시 한 번에 교체)
+    outputs = OutputFiles()
+    outputs.open(complete_list_path)
+    outputs.open(error_log_path, "에러 로그\n" + "=" * 50 + "\n")
     
-    # 전체 파일 수 계산 (폴더 또는 파일 리스트 지원)
-    all_files, filtered_cnt = collect_image_files_from_source(input_path, keyword)
-    stats['filtered_cnt'] = filtered_cnt
-    total_files = len(all_files)
-    logger.info(f"입력 경로에서 총 {total_files}개의 이미지 파일 발견")
-
-    if total_files == 0:
-        logger.error("입력 경로에 이미지 파일이 없습니다.")
-        return None
+    # 이미지 스트림 (폴더 또는 파일 리스트 지원)
+    manifest = DatasetManifest(input_path)
+    all_files = ImageFileStream(input_path, keyword, manifest=manifest)
 
-    # 입력 경로 순회
-    logger.info(f"전체 {total_files}개 파일 처리 시작...")
+    # 입력 경로 순회 (탐색과 처리를 동시에 진행)
+    logger.info("이미지 파일 탐색 및 처리 시작...")
 
     for full_path in all_files:
         stats['total_cnt'] += 1
-        progress = (stats['total_cnt'] / total_files) * 100
+        progress = all_files.progress_text(stats['total_cnt'])
 
         label_path = get_label_path_from_image(full_path)
 
@@ -283,76 +669,65 @@ def create_complete_dataset_list(input_path, output_path, keyword=None, output_p
         path_issues = validate_paths(full_path, label_path, logger)
         if path_issues:
             stats['path_issues'].extend(path_issues)
-            with open(error_log_path, 'a', encoding='utf-8') as f:
-                f.write(f"경로 문제 - {full_path}:\n")
-                for issue in path_issues:
-                    f.write(f"  {issue}\n")
+            outputs.write(error_log_path, f"경로 문제 - {full_path}:\n")
+            for issue in path_issues:
+                outputs.write(error_log_path, f"  {issue}\n")
 
         # 라벨 파일 존재 확인 및 처리
-        if not os.path.isfile(label_path):
-            if create_empty_label(label_path, logger):
-                stats['created_labels'] += 1
-                stats['no_label_cnt'] += 1
-            else:
-                stats['error_cnt'] += 1
-                continue
-
-        # 어노테이션 처리
-        current_annotation = np.zeros(90)
         try:
-            with open(label_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                if not lines:  # 빈 파일 처리
-                    stats['empty_label_cnt'] += 1
+            label_info = manifest.label_info(full_path, label_path)
+            if not label_info['exists']:
+                if create_empty_label(label_path, logger):
+                    stats['created_labels'] += 1
+                    stats['no_label_cnt'] += 1
                 else:
-                    for line_num, line in enumerate(lines, 1):
-                        line = line.strip()
-                        if not line:
-                            continue
-
-                        split_line = line.split()
-                        if len(split_line) < 5:  # YOLO 형식은 최소 5개 값 필요
-                            logger.warning(f"잘못된 어노테이션 형식 {label_path}:{line_num} - {line}")
-                            continue
-
-                        try:
-                            class_id = int(float(split_line[0]))
-                            if class_id < 0 or class_id >= 89:  # 클래스 ID 범위 검증
-                                logger.warning(f"잘못된 클래스 ID {label_path}:{line_num} - {class_id}")
-                                continue
-
-                            current_annotation[0] += 1  # 전체 어노테이션 카운트
-                            current_annotation[class_id + 1] += 1  # 클래스별 카운트
-                        except (ValueError, IndexError) as e:
-                            logger.warning(f"어노테이션 파싱 오류 {label_path}:{line_num} - {e}")
-                            continue
+                    stats['error_cnt'] += 1
+                    continue
+                label_info = manifest.label_info(full_path, label_path)
+
+            # 어노테이션 처리 (매니페스트의 클래스별 박스 수 사용)
+            if label_info['empty']:  # 빈 파일 처리
+                stats['empty_label_cnt'] += 1
+            for line_num, line in label_info['bad_lines']:  # YOLO 형식은 최소 5개 값 필요
+                logger.warning(f"잘못된 어노테이션 형식 {label_path}:{line_num} - {line}")
+            for class_id in label_info['classes']:
+                if class_id < 0 or class_id >= 89:  # 클래스 ID 범위 검증
+                    logger.warning(f"잘못된 클래스 ID {label_path} - {class_id}")
+            current_annotation = class_count_vector(label_info['classes'])
 
         except Exception as e:
             logger.error(f"라벨 파일 처리 오류 {label_path}: {e}")
             stats['error_cnt'] += 1
-            with open(error_log_path, 'a', encoding='utf-8') as f:
-                f.write(f"라벨 처리 오류 - {label_path}: {e}\n")
+            outputs.write(error_log_path, f"라벨 처리 오류 - {label_path}: {e}\n")
             continue
 
         # 결과 저장 - UTF-8로 인코딩
-        with open(complete_list_path, 'a', encoding='utf-8') as f:
-            f.write(f"{full_path}\n")
+        outputs.write(complete_list_path, f"{full_path}\n")
 
         stats['obj_annotation'] += current_annotation
         stats['total_annotations'] += current_annotation[0]
 
         # 진행률 표시 (1000개마다 로그)
         if stats['total_cnt'] % 1000 == 0:
-            logger.info(f"진행률: {progress:.1f}% ({stats['total_cnt']}/{total_files})")
+            logger.info(f"진행률: {progress}")
 
-        print(f"\r진행률: {progress:.1f}% ({stats['total_cnt']}/{total_files}) | "
+        print(f"\r진행률: {progress} | "
               f"처리: {stats['total_cnt']} | "
               f"어노테이션: {stats['total_annotations']} | "
               f"라벨 없음: {stats['no_label_cnt']} | "
               f"빈 라벨: {stats['empty_label_cnt']}", end='')
     
     print("\n")  # 진행률 표시 줄바꿈
-    
+    stats['filtered_cnt'] = all_files.filtered_cnt
+    outputs.commit()
+
+    logger.info(f"입력 경로에서 총 {all_files.found}개의 이미지 파일 발견")
+    if all_files.found == 0:
+        logger.error("입력 경로에 이미지 파일이 없습니다.")
+        return None
+
+    manifest.save(logger)
+
     # 최종 통계 저장
     np.savetxt(complete_annotation_path, stats['obj_annotation'], fmt='%2d', 
                delimiter=',', header='complete dataset annotation')
@@ -420,26 +795,30 @@ def find_images_without_class(input_path, output_path, target_class):
         f.write("에러 로그\n")
         f.write("=" * 50 + "\n")
 
-    # 전체 파일 수 계산 (폴더 또는 파일 리스트 지원)
-    all_files, _ = collect_image_files_from_source(input_path)
-    total_files = len(all_files)
-    logger.info(f"입력 경로에서 총 {total_files}개의 이미지 파일 발견")
+    # 이미지 스트림 (폴더 또는 파일 리스트 지원)
+    manifest = DatasetManifest(input_path)
+    all_files = ImageFileStream(input_path, manifest=manifest)
 
-    if total_files == 0:
-        logger.error("입력 경로에 이미지 파일이 없습니다.")
-        return None
-
-    # 입력 경로 순회
-    logger.info(f"전체 {total_files}개 파일 처리 시작...")
+    # 입력 경로 순회 (탐색과 처리를 동시에 진행)
+    logger.info("이미지 파일 탐색 및 처리 시작...")
 
     for full_path in all_files:
         stats['total_cnt'] += 1
-        progress = (stats['total_cnt'] / total_files) * 100
+        progress = all_files.progress_text(stats['total_cnt'])
 
         label_path = get_label_path_from_image(full_path)
 
+        try:
+            label_info = manifest.label_info(full_path, label_path)
+        except Exception as e:
+            logger.error(f"라벨 파일 처리 오류 {label_path}: {e}")
+            stats['error_cnt'] += 1
+            with open(error_log_path, 'a', encoding='utf-8') as f:
+                f.write(f"라벨 처리 오류 - {label_path}: {e}\n")
+            continue
+
         # 라벨 파일 존재 확인
-        if not os.path.isfile(label_path):
+        if not label_info['exists']:
             stats['no_label_cnt'] += 1
             stats['missing_class_cnt'] += 1
             with open(missing_class_list_path, 'a', encoding='utf-8') as f:
@@ -448,63 +827,42 @@ def find_images_without_class(input_path, output_path, target_class):
                 f.write(f"라벨 파일 없음 - {full_path}\n")
             continue
 
-        # 라벨 파일에서 클래스 확인
-        has_target_class = False
-        try:
-            with open(label_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                if not lines:  # 빈 파일 처리 (배경 이미지)
-                    stats['empty_label_cnt'] += 1
-                    stats['missing_class_cnt'] += 1
-                    with open(missing_class_list_path, 'a', encoding='utf-8') as mf:
-                        mf.write(f"{full_path}\n")
-                else:
-                    for line_num, line in enumerate(lines, 1):
-                        line = line.strip()
-                        if not line:
-                            continue
-
-                        split_line = line.split()
-                        if len(split_line) < 5:  # YOLO 형식은 최소 5개 값 필요
-                            logger.warning(f"잘못된 어노테이션 형식 {label_path}:{line_num} - {line}")
-                            continue
-
-                        try:
-                            class_id = int(float(split_line[0]))
-                            if class_id == target_class:
-                                has_target_class = True
-                                break
-                        except (ValueError, IndexError) as e:
-                            logger.warning(f"어노테이션 파싱 오류 {label_path}:{line_num} - {e}")
-                            continue
-
-                    # 결과에 따라 분류
-                    if has_target_class:
-                        stats['has_class_cnt'] += 1
-                        with open(has_class_list_path, 'a', encoding='utf-8') as f:
-                            f.write(f"{full_path}\n")
-                    else:
-                        stats['missing_class_cnt'] += 1
-                        with open(missing_class_list_path, 'a', encoding='utf-8') as f:
-                            f.write(f"{full_path}\n")
+        # 라벨 정보에서 클래스 확인
+        if label_info['empty']:  # 빈 파일 처리 (배경 이미지)
+            stats['empty_label_cnt'] += 1
+            stats['missing_class_cnt'] += 1
+            with open(missing_class_list_path, 'a', encoding='utf-8') as mf:
+                mf.write(f"{full_path}\n")
+        else:
+            for line_num, line in label_info['bad_lines']:  # YOLO 형식은 최소 5개 값 필요
+                logger.warning(f"잘못된 어노테이션 형식 {label_path}:{line_num} - {line}")
 
-        except Exception as e:
-            logger.error(f"라벨 파일 처리 오류 {label_path}: {e}")
-            stats['error_cnt'] += 1
-            with open(error_log_path, 'a', encoding='utf-8') as f:
-                f.write(f"라벨 처리 오류 - {label_path}: {e}\n")
-            continue
+            # 결과에 따라 분류
+            if target_class in label_info['classes']:
+                stats['has_class_cnt'] += 1
+                with open(has_class_list_path, 'a', encoding='utf-8') as f:
+                    f.write(f"{full_path}\n")
+            else:
+                stats['missing_class_cnt'] += 1
+                with open(missing_class_list_path, 'a', encoding='utf-8') as f:
+                    f.write(f"{full_path}\n")
 
         # 진행률 표시 (1000개마다 로그)
         if stats['total_cnt'] % 1000 == 0:
-            logger.info(f"진행률: {progress:.1f}% ({stats['total_cnt']}/{total_files})")
+            logger.info(f"진행률: {progress}")
 
-        print(f"\r진행률: {progress:.1f}% ({stats['total_cnt']}/{total_files}) | "
+        print(f"\r진행률: {progress} | "
               f"클래스 없음: {stats['missing_class_cnt']} | "
               f"클래스 있음: {stats['has_class_cnt']}", end='')
 
     print("\n")  # 진행률 표시 줄바꿈
 
+    logger.info(f"입력 경로에서 총 {all_files.found}개의 이미지 파일 발견")
+    if all_files.found == 0:
+        logger.error("입력 경로에 이미지 파일이 없습니다.")
+        return None
+
+    manifest.save(logger)
     logger.info(f"클래스 {target_class} 검색 완료")
     logger.info(f"전체 파일: {stats['total_cnt']}개")
     logger.info(f"클래스 없음: {stats['missing_class_cnt']}개")
@@ -556,21 +914,16 @@ def find_missing_labels(input_path, output_path):
         f.write("# 형식: 이미지경로 | 예상라벨경로\n")
         f.write("=" * 80 + "\n")
 
-    # 전체 파일 수 계산 (폴더 또는 파일 리스트 지원)
-    all_files, _ = collect_image_files_from_source(input_path)
-    total_files = len(all_files)
-    logger.info(f"입력 경로에서 총 {total_files}개의 이미지 파일 발견")
-
-    if total_files == 0:
-        logger.error("입력 경로에 이미지 파일이 없습니다.")
-        return None
+    # 이미지 스트림 (폴더 또는 파일 리스트 지원)
+    manifest = DatasetManifest(input_path)
+    all_files = ImageFileStream(input_path, manifest=manifest)
 
-    # 입력 경로 순회
-    logger.info(f"전체 {total_files}개 파일 처리 시작...")
+    # 입력 경로 순회 (탐색과 처리를 동시에 진행)
+    logger.info("이미지 파일 탐색 및 처리 시작...")
 
     for full_path in all_files:
         stats['total_cnt'] += 1
-        progress = (stats['total_cnt'] / total_files) * 100
+        progress = all_files.progress_text(stats['total_cnt'])
 
         label_path = get_label_path_from_image(full_path)
 
@@ -581,8 +934,14 @@ def find_missing_labels(input_path, output_path):
             rel_dir = os.path.basename(os.path.dirname(full_path))
         stats['dir_stats'][rel_dir]['total'] += 1
 
-        # 라벨 파일 존재 확인
-        if not os.path.isfile(label_path):
+        # 라벨 파일 존재 확인 (매니페스트에 라벨 정보도 함께 기록)
+        try:
+            has_label = manifest.label_info(full_path, label_path)['exists']
+        except Exception as e:
+            logger.warning(f"라벨 파일 읽기 실패: {label_path} - {e}")
+            has_label = True
+
+        if not has_label:
             stats['missing_label_cnt'] += 1
             stats['dir_stats'][rel_dir]['missing'] += 1
 
@@ -598,14 +957,19 @@ def find_missing_labels(input_path, output_path):
 
         # 진행률 표시 (1000개마다 로그)
         if stats['total_cnt'] % 1000 == 0:
-            logger.info(f"진행률: {progress:.1f}% ({stats['total_cnt']}/{total_files})")
+            logger.info(f"진행률: {progress}")
 
-        print(f"\r진행률: {progress:.1f}% ({stats['total_cnt']}/{total_files}) | "
+        print(f"\r진행률: {progress} | "
               f"라벨 없음: {stats['missing_label_cnt']} | "
               f"라벨 있음: {stats['has_label_cnt']}", end='')
 
     print("\n")  # 진행률 표시 줄바꿈
 
+    logger.info(f"입력 경로에서 총 {all_files.found}개의 이미지 파일 발견")
+    if all_files.found == 0:
+        logger.error("입력 경로에 이미지 파일이 없습니다.")
+        return None
+
     # 디렉토리별 통계 로그 및 파일 출력
     if stats['missing_label_cnt'] > 0:
         with open(missing_label_detail_path, 'a', encoding='utf-8') as f:
@@ -618,6 +982,7 @@ def find_missing_labels(input_path, output_path):
                     f.write(f"{dir_name}: {dir_stat['missing']}/{dir_stat['total']}개 "
                             f"({dir_stat['missing']/dir_stat['total']*100:.1f}%)\n")
 
+    manifest.save(logger)
     logger.info(f"라벨 미존재 이미지 검색 완료")
     logger.info(f"전체 파일: {stats['total_cnt']}개")
     logger.info(f"라벨 없음: {stats['missing_label_cnt']}개")
@@ -678,7 +1043,8 @@ def create_limited_dataset(input_path, output_path, num_files, keyword=None, bac
     
     # 전체 파일 리스트 수집 (폴더 또는 파일 리스트 지원)
     print(f"입력 경로에서 이미지 파일 찾는 중...")
-    all_files, filtered_cnt = collect_image_files_from_source(input_path, keyword)
+    manifest = DatasetManifest(input_path)
+    all_files, filtered_cnt = collect_image_files_from_source(input_path, keyword, manifest=manifest)
     stats['filtered_cnt'] = filtered_cnt
 
     total_available = len(all_files)
@@ -692,19 +1058,12 @@ def create_limited_dataset(input_path, output_path, num_files, keyword=None, bac
             if (i + 1) % 100 == 0:
                 print(f"\r배경 필터링 진행률: {(i+1)/len(all_files)*100:.1f}% ({i+1}/{len(all_files)})", end='')
 
-            label_path = get_label_path_from_image(full_path)
             is_background = False
-
-            if not os.path.isfile(label_path):
-                is_background = True
-            else:
-                try:
-                    with open(label_path, 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                        if not lines or all(not line.strip() for line in lines):
-                            is_background = True
-                except Exception:
-                    pass
+            try:
+                # 라벨 파일이 없거나 내용 있는 줄이 없으면 배경
+                is_background = manifest.label_info(full_path)['lines'] == 0
+            except Exception:
+                pass
 
             if is_background:
                 background_files.append(full_path)
@@ -724,24 +1083,12 @@ def create_limited_dataset(input_path, output_path, num_files, keyword=None, bac
             if (i + 1) % 100 == 0:
                 print(f"\r클래스 분석 진행률: {(i+1)/len(all_files)*100:.1f}% ({i+1}/{len(all_files)})", end='')
 
-            label_path = get_label_path_from_image(full_path)
             classes_in_file = set()
-
-            if os.path.isfile(label_path):
-                try:
-                    with open(label_path, 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                        for line in lines:
-                            split_line = line.strip().split()
-                            if split_line and len(split_line) >= 5:
-                                try:
-                                    class_id = int(float(split_line[0]))
-                                    if 0 <= class_id < 89:
-                                        classes_in_file.add(class_id)
-                                except (ValueError, IndexError):
-                                    continue
-                except Exception:
-                    pass
+            try:
+                classes_in_file = {class_id for class_id in manifest.label_info(full_path)['classes']
+                                   if 0 <= class_id < 89}
+            except Exception:
+                pass
 
             if classes_in_file:  # 클래스가 있는 파일만 저장
                 file_classes[full_path] = classes_in_file
@@ -929,33 +1276,21 @@ def create_limited_dataset(input_path, output_path, num_files, keyword=None, bac
         label_path = get_label_path_from_image(full_path)
         
         # 라벨 파일 존재 확인 및 처리
-        if not os.path.isfile(label_path):
-            if create_empty_label(label_path, logger):
-                stats['created_labels'] += 1
-                stats['no_label_cnt'] += 1
-            else:
-                stats['error_cnt'] += 1
-                continue
-        
-        # 어노테이션 처리
-        current_annotation = np.zeros(90)
         try:
-            with open(label_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                if not lines:
-                    stats['empty_label_cnt'] += 1
+            label_info = manifest.label_info(full_path, label_path)
+            if not label_info['exists']:
+                if create_empty_label(label_path, logger):
+                    stats['created_labels'] += 1
+                    stats['no_label_cnt'] += 1
                 else:
-                    for line in lines:
-                        split_line = line.strip().split()
-                        if not split_line or len(split_line) < 5:
-                            continue
-                        try:
-                            class_id = int(float(split_line[0]))
-                            if 0 <= class_id < 89:
-                                current_annotation[0] += 1
-                                current_annotation[class_id + 1] += 1
-                        except (ValueError, IndexError):
-                            continue
+                    stats['error_cnt'] += 1
+                    continue
+                label_info = manifest.label_info(full_path, label_path)
+
+            # 어노테이션 처리
+            if label_info['empty']:
+                stats['empty_label_cnt'] += 1
+            current_annotation = class_count_vector(label_info['classes'])
         except Exception as e:
             logger.error(f"어노테이션 처리 오류 {label_path}: {e}")
             stats['error_cnt'] += 1
@@ -975,6 +1310,7 @@ def create_limited_dataset(input_path, output_path, num_files, keyword=None, bac
               f"빈 라벨: {stats['empty_label_cnt']}", end='')
     
     print("\n")
+    manifest.save(logger)
     
     # 최종 통계 저장
     np.savetxt(limited_annotation_path, stats['obj_annotation'], fmt='%2d', 
@@ -1048,7 +1384,8 @@ def create_balanced_class_dataset(input_path, output_path, num_files, target_cla
 
     # 1단계: 전체 이미지 수집 (폴더 또는 파일 리스트 지원)
     print(f"입력 경로에서 이미지 파일 찾는 중...")
-    all_files, _ = collect_image_files_from_source(input_path)
+    manifest = DatasetManifest(input_path)
+    all_files, _ = collect_image_files_from_source(input_path, manifest=manifest)
 
     total_available = len(all_files)
     logger.info(f"총 {total_available}개의 이미지 파일 발견")
@@ -1072,38 +1409,19 @@ def create_balanced_class_dataset(input_path, output_path, num_files, target_cla
         db_name = extract_db_name(image_path, input_path)
         db_set.add(db_name)
 
-        label_path = get_label_path_from_image(image_path)
-
-        if not os.path.isfile(label_path):
-            continue
-
         try:
-            with open(label_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                if not lines:
-                    continue
-
-                # 이 이미지가 포함하는 클래스 수집
-                image_classes = set()
-                for line in lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        class_id = int(parts[0])
-                        image_classes.add(class_id)
-
-                # 각 클래스별, DB별로 이미지 기록
-                for class_id in image_classes:
-                    if class_id in target_classes:
-                        class_db_to_images[class_id][db_name].append(image_path)
-                        image_class_count[class_id] += 1
-
+            # 이 이미지가 포함하는 클래스 (라벨 없음/빈 라벨은 빈 집합)
+            image_classes = manifest.label_info(image_path)['classes']
         except Exception as e:
-            logger.warning(f"라벨 파일 읽기 실패: {label_path} - {e}")
+            logger.warning(f"라벨 파일 읽기 실패: {get_label_path_from_image(image_path)} - {e}")
             continue
 
+        # 각 클래스별, DB별로 이미지 기록
+        for class_id in image_classes:
+            if class_id in target_classes:
+                class_db_to_images[class_id][db_name].append(image_path)
+                image_class_count[class_id] += 1
+
     print(f"\r클래스 및 DB 분석 완료: 100.0%                    ")
 
     # 발견된 DB 출력
@@ -1189,30 +1507,15 @@ def create_balanced_class_dataset(input_path, output_path, num_files, target_cla
         db_name = extract_db_name(image_path, input_path)
         selected_db_count[db_name] += 1
 
-        label_path = get_label_path_from_image(image_path)
-
-        if not os.path.isfile(label_path):
+        try:
+            image_classes = manifest.label_info(image_path)['classes']
+        except Exception:
             continue
 
-        try:
-            with open(label_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                image_classes = set()
-                for line in lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        class_id = int(parts[0])
-                        image_classes.add(class_id)
-
-                for class_id in image_classes:
-                    if class_id in target_classes:
-                        selected_class_count[class_id] += 1
-                        selected_class_db_count[class_id][db_name] += 1
-        except:
-            pass
+        for class_id in image_classes:
+            if class_id in target_classes:
+                selected_class_count[class_id] += 1
+                selected_class_db_count[class_id][db_name] += 1
 
     print(f"\n선택된 이미지의 클래스별 분포:")
     for class_id in sorted(target_classes):
@@ -1336,37 +1639,24 @@ def extract_background_images(input_path, output_path):
     with open(background_list_path, 'w', encoding='utf-8') as f:
         pass
     
-    # 전체 파일 수 계산 (폴더 또는 파일 리스트 지원)
-    all_files, _ = collect_image_files_from_source(input_path)
-    total_files = len(all_files)
-    logger.info(f"입력 경로에서 총 {total_files}개의 이미지 파일 발견")
-
-    if total_files == 0:
-        logger.error("입력 경로에 이미지 파일이 없습니다.")
-        return None
+    # 이미지 스트림 (폴더 또는 파일 리스트 지원)
+    manifest = DatasetManifest(input_path)
+    all_files = ImageFileStream(input_path, manifest=manifest)
 
     # 입력 경로 순회
     for full_path in all_files:
         stats['total_cnt'] += 1
-        progress = (stats['total_cnt'] / total_files) * 100
+        progress = all_files.progress_text(stats['total_cnt'])
 
         label_path = get_label_path_from_image(full_path)
 
-        # 라벨 파일 존재 확인 및 처리
-        is_background = False
-
-        if not os.path.isfile(label_path):
-            is_background = True
-        else:
-            try:
-                with open(label_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    if not lines:
-                        is_background = True
-            except Exception as e:
-                logger.error(f"라벨 처리 오류 {label_path}: {e}")
-                stats['error_cnt'] += 1
-                continue
+        # 라벨 파일 존재 확인 및 처리 (없거나 빈 파일이면 배경)
+        try:
+            is_background = manifest.label_info(full_path, label_path)['empty']
+        except Exception as e:
+            logger.error(f"라벨 처리 오류 {label_path}: {e}")
+            stats['error_cnt'] += 1
+            continue
 
         # 배경 이미지인 경우 목록에 추가
         if is_background:
@@ -1374,16 +1664,253 @@ def extract_background_images(input_path, output_path):
             with open(background_list_path, 'a', encoding='utf-8') as f:
                 f.write(f"{full_path}\n")
 
-        print(f"\r진행률: {progress:.1f}% ({stats['total_cnt']}/{total_files}) | "
+        print(f"\r진행률: {progress} | "
               f"처리: {stats['total_cnt']} | "
               f"배경 이미지: {stats['background_cnt']}", end='')
     
     print("\n")
+    logger.info(f"입력 경로에서 총 {all_files.found}개의 이미지 파일 발견")
+    if all_files.found == 0:
+        logger.error("입력 경로에 이미지 파일이 없습니다.")
+        return None
+    manifest.save(logger)
     logger.info("배경 이미지 추출 완료")
     return stats
 
-def process_dataset(input_path, output_path, train_rate=0.8, skip_rate=0):
-    """데이터셋을 처리하고 train/validation 세트로 분할하는 함수"""
+SPLIT_CHUNK_SIZE = 2000  # 작업 프로세스에 한 번에 넘기는 이미지 수
+
+def split_draws(image_path, seed):
+    """
+    이미지 경로와 시드로 정해지는 [0, 1) 난수 두 개 (스킵 판정용, 학습/검증 판정용)
+
+    처리 순서나 작업 프로세스 수와 관계없이 같은 시드면 항상 같은 분할이 나옵니다.
+    """
+    digest = hashlib.blake2b(f"{seed}:{image_path}".encode('utf-8'), digest_size=16).digest()
+    return ((int.from_bytes(digest[:8], 'little') >> 11) / (1 << 53),
+            (int.from_bytes(digest[8:], 'little') >> 11) / (1 << 53))
+
+class LogBuffer:
+    """작업 프로세스의 로그 메시지를 모아 두었다가 부모 프로세스 logger로 다시 기록하기 위한 버퍼"""
+
+    def __init__(self):
+        self.records = []  # [(레벨, 메시지)]
+
+    def debug(self, msg):
+        self.records.append(('debug', msg))
+
+    def info(self, msg):
+        self.records.append(('info', msg))
+
+    def warning(self, msg):
+        self.records.append(('warning', msg))
+
+    def error(self, msg):
+        self.records.append(('error', msg))
+
+    @staticmethod
+    def replay(records, logger):
+        for level, msg in records:
+            getattr(logger, level)(msg)
+
+def split_label_chunk(items, options):
+    """
+    process_dataset / process_dataset_advanced의 이미지 묶음 처리 (작업 프로세스에서 실행)
+
+    Args:
+        items: [(이미지 경로, 라벨 경로, 매니페스트에 저장된 라벨 항목 또는 None)]
+        options: 분할/필터링 설정 (seed, train_rate, skip_rate, filter_by_class,
+                 target_classes, exclude_background, combined_filter, input_source)
+
+    Returns:
+        dict: counts(통계 카운트), hist(train/valid 90칸 어노테이션 배열),
+              lines(출력 파일 종류별 기록할 내용), labels(새로 읽은 매니페스트 항목),
+              reused/parsed(라벨 재사용/파싱 수), logs(로그 메시지)
+    """
+    log = LogBuffer()
+    manifest = DatasetManifest(options['input_source'], cache_dir=None)
+    known = {image_path: record for image_path, label_path, record in items if record is not None}
+    manifest.labels = dict(known)
+
+    filter_by_class = options['filter_by_class']
+    exclude_background = options['exclude_background']
+    combined_filter = options['combined_filter']
+    target_classes = set(options['target_classes'] or ())
+
+    counts = Counter()
+    split_classes = {'train': Counter(), 'valid': Counter()}
+    lines = defaultdict(list)
+
+    for image_path, label_path, record in items:
+        skip_draw, split_draw = split_draws(image_path, options['seed'])
+
+        # 스킵 처리
+        if skip_draw < options['skip_rate']:
+            counts['skip_cnt'] += 1
+            continue
+
+        # train/valid 분할 결정
+        split = 'train' if split_draw < options['train_rate'] else 'valid'
+
+        # 라벨 파일 존재 확인 및 처리
+        try:
+            label_info = manifest.label_info(image_path, label_path)
+            no_label = not label_info['exists']
+            if no_label:
+                if not create_empty_label(label_path, log):
+                    counts['error_cnt'] += 1
+                    continue
+                counts['created_labels'] += 1
+                label_info = manifest.label_info(image_path, label_path)
+        except Exception as e:
+            log.error(f"어노테이션 처리 오류 {label_path}: {e}")
+            counts['error_cnt'] += 1
+            lines['error'].append(f"{label_path}: {e}\n")
+            continue
+
+        classes = label_info['classes']
+        empty_label = label_info['empty']
+        background = empty_label or not any(0 <= class_id < 89 for class_id in classes)
+
+        # 대상 클래스 포함 여부 확인
+        contains_target_class = False
+        if filter_by_class:
+            for class_id, count in classes.items():
+                if 0 <= class_id < 89 and class_id in target_classes:
+                    contains_target_class = True
+                    counts['target_class_annotations'] += count
+
+        # 필터링 조건 적용 (process_dataset_advanced와 같은 규칙)
+        include_file = True
+        if filter_by_class and not combined_filter:
+            include_file = contains_target_class
+            if contains_target_class:
+                counts['class_filtered'] += 1
+        if exclude_background and not combined_filter:
+            if background:
+                include_file = False
+                counts['background_excluded'] += 1
+        if combined_filter:
+            include_file = contains_target_class and not background
+            if contains_target_class:
+                counts['class_filtered'] += 1
+            if background:
+                counts['background_excluded'] += 1
+
+        if not include_file:
+            counts['excluded_cnt'] += 1
+            lines['excluded'].append(f"{image_path}\n")
+            continue
+
+        counts['filtered_cnt'] += 1
+        counts['processed_cnt'] += 1
+        lines['filtered'].append(f"{image_path}\n")
+
+        if no_label:
+            counts[f'{split}_no_label'] += 1
+        if empty_label:
+            counts[f'{split}_empty_label'] += 1
+        counts[f'{split}_img_cnt'] += 1
+        split_classes[split].update(classes)
+        lines[split].append(f"{image_path}\n")
+
+    return {
+        'counts': dict(counts),
+        'hist': {split: class_count_vector(classes) for split, classes in split_classes.items()},
+        'lines': {key: ''.join(value) for key, value in lines.items()},
+        'labels': {image_path: record for image_path, record in manifest.labels.items()
+                   if record is not known.get(image_path)},
+        'reused': manifest.reused_labels,
+        'parsed': manifest.parsed_labels,
+        'logs': log.records,
+    }
+
+def run_split_chunks(all_files, manifest, options, workers=None, chunk_size=SPLIT_CHUNK_SIZE):
+    """
+    이미지 스트림을 chunk_size개씩 묶어 split_label_chunk로 처리하고 (묶음 크기, 결과)를 입력 순서대로 반환
+
+    묶음이 두 개 이상이면 작업 프로세스 풀(spawn)을 사용하고, 동시에 처리 중인 묶음은
+    작업 프로세스 수의 2배로 제한합니다. 작업 프로세스가 읽은 라벨 정보는 매니페스트에 반영합니다.
+    빈 라벨을 만들 라벨 폴더는 묶음을 넘기기 전에 이 프로세스에서 만들어, 폴더 생성으로
+    바뀌는 label_path_resolver 탐색 결과가 이후 묶음에 반영되도록 합니다.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    def chunks():
+        chunk = []
+        for image_path in all_files:
+            chunk.append(image_path)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def items_of(chunk):
+        # 스킵되지 않을 이미지의 라벨 폴더를 순서대로 먼저 만들고, 새로 만들면 남은 이미지 경로를 다시 구함
+        label_paths = label_path_resolver.resolve_many(chunk)
+        for index, image_path in enumerate(chunk):
+            if split_draws(image_path, options['seed'])[0] < options['skip_rate']:
+                continue
+            try:
+                if label_path_resolver.ensure_dir(os.path.dirname(label_paths[index])):
+                    label_paths[index + 1:] = label_path_resolver.resolve_many(chunk[index + 1:])
+            except OSError:
+                pass  # 작업 프로세스의 create_empty_label에서 오류로 집계
+        return [(image_path, label_path, manifest.labels.get(image_path))
+                for image_path, label_path in zip(chunk, label_paths)]
+
+    def finish(chunk, result):
+        manifest.merge(result['labels'], result['reused'], result['parsed'])
+        return len(chunk), result
+
+    chunk_iter = chunks()
+    first_chunks = [chunk for _, chunk in zip(range(2), chunk_iter)]
+    if len(first_chunks) < 2 or workers <= 1:
+        # 작은 데이터셋 (또는 단일 프로세스 지정) - 현재 프로세스에서 처리
+        for chunk in first_chunks:
+            yield finish(chunk, split_label_chunk(items_of(chunk), options))
+        for chunk in chunk_iter:
+            yield finish(chunk, split_label_chunk(items_of(chunk), options))
+        return
+
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        running = deque()
+        for chunk in first_chunks:
+            running.append((chunk, executor.submit(split_label_chunk, items_of(chunk), options)))
+        for chunk in chunk_iter:
+            while len(running) >= workers * 2:
+                done_chunk, future = running.popleft()
+                yield finish(done_chunk, future.result())
+            running.append((chunk, executor.submit(split_label_chunk, items_of(chunk), options)))
+        while running:
+            done_chunk, future = running.popleft()
+            yield finish(done_chunk, future.result())
+
+def merge_split_result(stats, result, count, logger):
+    """작업 결과를 통계에 합산 (어노테이션 배열은 NumPy로 합산, 모드별 통계에 있는 카운트만 반영)"""
+    LogBuffer.replay(result['logs'], logger)
+    stats['total_cnt'] += count
+    for key, value in result['counts'].items():
+        if key in stats:
+            stats[key] += value
+
+    train_hist = result['hist']['train']
+    valid_hist = result['hist']['valid']
+    stats['obj_annotation'] += train_hist + valid_hist
+    stats['obj_annotation_train'] += train_hist
+    stats['obj_annotation_val'] += valid_hist
+    stats['train_annotations'] += train_hist[0]
+    stats['valid_annotations'] += valid_hist[0]
+    stats['total_annotations'] = stats['train_annotations'] + stats['valid_annotations']
+
+def process_dataset(input_path, output_path, train_rate=0.8, skip_rate=0, seed=None, workers=None):
+    """
+    데이터셋을 처리하고 train/validation 세트로 분할하는 함수
+
+    라벨 파싱은 이미지 묶음 단위로 작업 프로세스(workers개, 기본 CPU 수)에서 수행하고,
+    train/valid 분할은 이미지 경로와 seed로 정해지므로 같은 seed면 항상 같은 결과가 나옵니다.
+    """
     valid_rate = 1.0 - train_rate
     
     # 출력 디렉토리 생성
@@ -1393,12 +1920,13 @@ def process_dataset(input_path, output_path, train_rate=0.8, skip_rate=0):
     # 로깅 설정
     logger = setup_logging(output_path)
     logger.info(f"데이터셋 처리 시작: {input_path}")
+    if seed is None:
+        seed = random.randrange(1 << 32)
+    logger.info(f"분할 시드: {seed}")
     
-    # 전체 파일 수 계산
-    # 전체 파일 수 계산 (폴더 또는 파일 리스트 지원)
-    all_files, _ = collect_image_files_from_source(input_path)
-    total_files = len(all_files)
-    logger.info(f"전체 처리할 파일 수: {total_files}")
+    # 이미지 스트림 (폴더 또는 파일 리스트 지원)
+    manifest = DatasetManifest(input_path)
+    all_files = ImageFileStream(input_path, manifest=manifest)
 
     # 결과 파일 경로 설정
     val_path = output_path / 'valid.txt'
@@ -1428,109 +1956,41 @@ def process_dataset(input_path, output_path, train_rate=0.8, skip_rate=0):
         'valid_no_label': 0,
         'train_empty_label': 0,
         'valid_empty_label': 0,
-        'created_labels': 0
+        'created_labels': 0,
+        'seed': seed,
+    }
+    options = {
+        'input_source': input_path, 'seed': seed, 'train_rate': train_rate, 'skip_rate': skip_rate,
+        'filter_by_class': False, 'target_classes': None,
+        'exclude_background': False, 'combined_filter': False,
     }
 
     # train/valid 파일 초기화
-    with open(train_path, 'w', encoding='utf-8') as f:
-        pass
-    with open(val_path, 'w', encoding='utf-8') as f:
-        pass
-    with open(error_path, 'w', encoding='utf-8') as f:
-        f.write("에러 로그\n")
-
-    # 입력 경로 순회
-    for full_path in all_files:
-        stats['total_cnt'] += 1
-        progress = (stats['total_cnt'] / total_files) * 100
-
-        # 스킵 처리
-        if random.random() < skip_rate:
-            stats['skip_cnt'] += 1
-            continue
-
-        label_path = get_label_path_from_image(full_path)
-
-        # train/valid 분할 결정
-        is_train = random.random() < train_rate
-
-        # 라벨 파일 존재 확인 및 처리
-        no_label = False
-        empty_label = False
-
-        if not os.path.isfile(label_path):
-            if create_empty_label(label_path, logger):
-                stats['created_labels'] += 1
-                no_label = True
-                if is_train:
-                    stats['train_no_label'] += 1
-                else:
-                    stats['valid_no_label'] += 1
-            else:
-                stats['error_cnt'] += 1
-                continue
-
-        # 어노테이션 처리
-        current_annotation = np.zeros(90)
-        try:
-            with open(label_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                if not lines:  # 빈 파일 처리
-                    empty_label = True
-                    if is_train:
-                        stats['train_empty_label'] += 1
-                    else:
-                        stats['valid_empty_label'] += 1
-                else:
-                    for line in lines:
-                        split_line = line.strip().split()
-                        if not split_line or len(split_line) < 5:
-                            continue
-                        try:
-                            class_id = int(float(split_line[0]))
-                            if 0 <= class_id < 89:
-                                current_annotation[0] += 1  # 전체 어노테이션 카운트
-                                current_annotation[class_id + 1] += 1  # 클래스별 카운트
-                        except (ValueError, IndexError):
-                            continue
-
-        except Exception as e:
-            logger.error(f"어노테이션 처리 오류 {label_path}: {e}")
-            stats['error_cnt'] += 1
-            with open(error_path, 'a', encoding='utf-8') as f:
-                f.write(f"{label_path}: {e}\n")
-            continue
-
-        # 결과 저장 - UTF-8 인코딩 추가
-        if is_train:
-            with open(train_path, 'a', encoding='utf-8') as f:
-                f.write(f"{full_path}\n")
-        else:
-            with open(val_path, 'a', encoding='utf-8') as f:
-                f.write(f"{full_path}\n")
-
-        stats['obj_annotation'] += current_annotation
-        if is_train:
-            stats['obj_annotation_train'] += current_annotation
-            stats['train_img_cnt'] += 1
-            stats['train_annotations'] += current_annotation[0]
-        else:
-            stats['obj_annotation_val'] += current_annotation
-            stats['valid_img_cnt'] += 1
-            stats['valid_annotations'] += current_annotation[0]
-
-        stats['total_annotations'] = stats['train_annotations'] + stats['valid_annotations']
+    outputs = OutputFiles()
+    outputs.open(train_path)
+    outputs.open(val_path)
+    outputs.open(error_path, "에러 로그\n")
+
+    # 입력 경로 순회 (묶음 단위 병렬 처리, 결과는 입력 순서대로 합산)
+    for count, result in run_split_chunks(all_files, manifest, options, workers):
+        merge_split_result(stats, result, count, logger)
+        for key, path in (('train', train_path), ('valid', val_path), ('error', error_path)):
+            if key in result['lines']:
+                outputs.write(path, result['lines'][key])
 
         # 진행률 표시
-        if stats['total_cnt'] % 1000 == 0:
-            logger.info(f"진행률: {progress:.1f}%")
+        progress = all_files.progress_text(stats['total_cnt'])
+        logger.info(f"진행률: {progress}")
 
-        print(f"\r진행률: {progress:.1f}% ({stats['total_cnt']}/{total_files}) | "
+        print(f"\r진행률: {progress} | "
               f"학습: {stats['train_img_cnt']}(어노테이션: {stats['train_annotations']}) | "
               f"검증: {stats['valid_img_cnt']}(어노테이션: {stats['valid_annotations']}) | "
               f"전체 어노테이션: {stats['total_annotations']}", end='')
 
     print("\n")  # 진행률 표시 줄바꿈
+    outputs.commit()
+    logger.info(f"전체 처리한 파일 수: {all_files.found}")
+    manifest.save(logger)
 
     # 최종 통계 저장
     np.savetxt(train_annotation_path, stats['obj_annotation_train'], fmt='%2d', 
@@ -1892,14 +2352,13 @@ def validate_dataset_from_list(list_path, output_path):
         'file_annotations': {},
     }
     
-    # 파일 초기화
-    for file_path in [missing_jpg_list_path, missing_txt_list_path, complete_pairs_path, both_missing_path, annotation_details_path]:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            pass
+    # 파일 초기화 (완료 시 한 번에 교체)
+    outputs = OutputFiles()
+    for file_path in [missing_jpg_list_path, missing_txt_list_path, complete_pairs_path, both_missing_path]:
+        outputs.open(file_path)
     
     # 상세 어노테이션 파일 헤더 작성
-    with open(annotation_details_path, 'w', encoding='utf-8') as f:
-        f.write("파일경로,총어노테이션수,클래스별카운트\n")
+    outputs.open(annotation_details_path, "파일경로,총어노테이션수,클래스별카운트\n")
     
     # 경로 목록 파일 읽기
     try:
@@ -1912,6 +2371,7 @@ def validate_dataset_from_list(list_path, output_path):
         
         if total_paths == 0:
             logger.error("경로 목록 파일이 비어 있습니다.")
+            outputs.commit()
             return None
         
         # 각 경로 처리
@@ -1941,8 +2401,7 @@ def validate_dataset_from_list(list_path, output_path):
             # 상태에 따른 처리
             if jpg_exists and txt_exists:
                 stats['valid_pairs'] += 1
-                with open(complete_pairs_path, 'a', encoding='utf-8') as f:
-                    f.write(f"{jpg_path}\n")
+                outputs.write(complete_pairs_path, f"{jpg_path}\n")
                 
                 # 어노테이션 처리
                 current_annotation = np.zeros(90)
@@ -1973,8 +2432,7 @@ def validate_dataset_from_list(list_path, output_path):
                         if current_annotation[j] > 0:
                             class_counts.append(f"{j-1}:{int(current_annotation[j])}")
                     
-                    with open(annotation_details_path, 'a', encoding='utf-8') as f:
-                        f.write(f"{jpg_path},{int(current_annotation[0])},{';'.join(class_counts)}\n")
+                    outputs.write(annotation_details_path, f"{jpg_path},{int(current_annotation[0])},{';'.join(class_counts)}\n")
                     
                 except Exception as e:
                     logger.error(f"어노테이션 처리 오류 {txt_path}: {e}")
@@ -1986,18 +2444,15 @@ def validate_dataset_from_list(list_path, output_path):
                 
             elif jpg_exists and not txt_exists:
                 stats['jpg_only'] += 1
-                with open(missing_txt_list_path, 'a', encoding='utf-8') as f:
-                    f.write(f"{jpg_path}\n")
+                outputs.write(missing_txt_list_path, f"{jpg_path}\n")
                     
             elif not jpg_exists and txt_exists:
                 stats['txt_only'] += 1
-                with open(missing_jpg_list_path, 'a', encoding='utf-8') as f:
-                    f.write(f"{txt_path}\n")
+                outputs.write(missing_jpg_list_path, f"{txt_path}\n")
                     
             else:
                 stats['both_missing'] += 1
-                with open(both_missing_path, 'a', encoding='utf-8') as f:
-                    f.write(f"{path}\n")
+                outputs.write(both_missing_path, f"{path}\n")
                 
             print(f"\r진행률: {progress:.1f}% ({i+1}/{total_paths}) | "
                   f"정상: {stats['valid_pairs']} | "
@@ -2006,6 +2461,7 @@ def validate_dataset_from_list(list_path, output_path):
                   f"모두 없음: {stats['both_missing']}", end='')
         
         print("\n")
+        outputs.commit()
         
         # 최종 통계 저장
         np.savetxt(validation_annotation_path, stats['obj_annotation'], fmt='%2d', 
@@ -2043,14 +2499,15 @@ def validate_dataset_from_list(list_path, output_path):
         
     except Exception as e:
         logger.error(f"경로 목록 파일 처리 중 오류 발생: {e}")
+        outputs.abort()
         return None
     
     return stats
 
 def process_dataset_advanced(input_path, output_path, train_rate=0.8, skip_rate=0, 
                         filter_by_class=False, target_classes=None, 
-                        exclude_background=False, combined_filter=False):
-    """데이터셋을 처리하고 train/validation 세트로 분할하는 고급 함수"""
+                        exclude_background=False, combined_filter=False, seed=None, workers=None):
+    """데이터셋을 처리하고 train/validation 세트로 분할하는 고급 함수 (묶음 병렬 처리/seed 분할은 process_dataset과 동일)"""
     
     valid_rate = 1.0 - train_rate
     
@@ -2061,11 +2518,13 @@ def process_dataset_advanced(input_path, output_path, train_rate=0.8, skip_rate=
     # 로깅 설정
     logger = setup_logging(output_path)
     logger.info(f"고급 데이터셋 처리 시작: {input_path}")
+    if seed is None:
+        seed = random.randrange(1 << 32)
+    logger.info(f"분할 시드: {seed}")
     
-    # 전체 파일 수 계산 (폴더 또는 파일 리스트 지원)
-    all_files, _ = collect_image_files_from_source(input_path)
-    total_files = len(all_files)
-    logger.info(f"전체 처리 대상 파일 수: {total_files}")
+    # 이미지 스트림 (폴더 또는 파일 리스트 지원)
+    manifest = DatasetManifest(input_path)
+    all_files = ImageFileStream(input_path, manifest=manifest)
 
     # 결과 파일 경로 설정
     val_path = output_path / 'valid.txt'
@@ -2102,150 +2561,31 @@ def process_dataset_advanced(input_path, output_path, train_rate=0.8, skip_rate=
         'created_labels': 0,      
         'class_filtered': 0,      
         'background_excluded': 0, 
-        'target_class_annotations': 0  
+        'target_class_annotations': 0,
+        'seed': seed,
+    }
+    options = {
+        'input_source': input_path, 'seed': seed, 'train_rate': train_rate, 'skip_rate': skip_rate,
+        'filter_by_class': filter_by_class, 'target_classes': target_classes,
+        'exclude_background': exclude_background, 'combined_filter': combined_filter,
     }
 
     # 출력 파일 초기화
-    with open(train_path, 'w', encoding='utf-8') as f:
-        pass
-    with open(val_path, 'w', encoding='utf-8') as f:
-        pass
-    with open(filtered_path, 'w', encoding='utf-8') as f:
-        pass
-    with open(excluded_path, 'w', encoding='utf-8') as f:
-        pass
-
-    # 입력 경로 순회
-    for full_path in all_files:
-        stats['total_cnt'] += 1
-        progress = (stats['total_cnt'] / total_files) * 100
-
-        # 스킵 처리
-        if random.random() < skip_rate:
-            stats['skip_cnt'] += 1
-            continue
-
-        label_path = get_label_path_from_image(full_path)
-
-        # 라벨 파일 존재 확인 및 처리
-        no_label = False
-        empty_label = False
-
-        if not os.path.isfile(label_path):
-            if create_empty_label(label_path, logger):
-                stats['created_labels'] += 1
-                no_label = True
-            else:
-                stats['error_cnt'] += 1
-                continue
-
-        # 어노테이션 처리 및 필터링 조건 검사
-        current_annotation = np.zeros(90)
-        contains_target_class = False
-
-        try:
-            with open(label_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                if not lines:
-                    empty_label = True
-                else:
-                    for line in lines:
-                        split_line = line.strip().split()
-                        if not split_line or len(split_line) < 5:
-                            continue
-                        try:
-                            class_id = int(float(split_line[0]))
-                            if 0 <= class_id < 89:
-                                current_annotation[0] += 1
-                                current_annotation[class_id + 1] += 1
-
-                                # 대상 클래스 포함 여부 확인
-                                if filter_by_class and class_id in target_classes:
-                                    contains_target_class = True
-                                    stats['target_class_annotations'] += 1
-                        except (ValueError, IndexError):
-                            continue
-        except Exception as e:
-            logger.error(f"어노테이션 처리 오류 {label_path}: {e}")
-            stats['error_cnt'] += 1
-            continue
-
-        # 필터링 조건 적용
-        include_file = True
-
-        # 1. 클래스 필터링
-        if filter_by_class and not combined_filter:
-            include_file = contains_target_class
-            if contains_target_class:
-                stats['class_filtered'] += 1
-
-        # 2. 배경 이미지 제외
-        if exclude_background and not combined_filter:
-            if empty_label or current_annotation[0] == 0:
-                include_file = False
-                stats['background_excluded'] += 1
-
-        # 3. 복합 필터링 (클래스 필터링 + 배경 제외)
-        if combined_filter:
-            include_file = contains_target_class and not (empty_label or current_annotation[0] == 0)
-            if contains_target_class:
-                stats['class_filtered'] += 1
-            if empty_label or current_annotation[0] == 0:
-                stats['background_excluded'] += 1
-
-        # 필터링 결과에 따라 처리
-        if include_file:
-            stats['filtered_cnt'] += 1
-            stats['processed_cnt'] += 1
-
-            # 필터링된 전체 목록에 추가
-            with open(filtered_path, 'a', encoding='utf-8') as f:
-                f.write(f"{full_path}\n")
-
-            # train/valid 분할 결정
-            is_train = random.random() < train_rate
-
-            # 라벨 상태 통계 업데이트
-            if no_label:
-                if is_train:
-                    stats['train_no_label'] += 1
-                else:
-                    stats['valid_no_label'] += 1
-
-            if empty_label:
-                if is_train:
-                    stats['train_empty_label'] += 1
-                else:
-                    stats['valid_empty_label'] += 1
-
-            # 결과 저장
-            if is_train:
-                with open(train_path, 'a', encoding='utf-8') as f:
-                    f.write(f"{full_path}\n")
-            else:
-                with open(val_path, 'a', encoding='utf-8') as f:
-                    f.write(f"{full_path}\n")
-
-            # 어노테이션 통계 업데이트
-            stats['obj_annotation'] += current_annotation
-            if is_train:
-                stats['obj_annotation_train'] += current_annotation
-                stats['train_img_cnt'] += 1
-                stats['train_annotations'] += current_annotation[0]
-            else:
-                stats['obj_annotation_val'] += current_annotation
-                stats['valid_img_cnt'] += 1
-                stats['valid_annotations'] += current_annotation[0]
-
-            stats['total_annotations'] = stats['train_annotations'] + stats['valid_annotations']
-        else:
-            # 제외된 파일 목록에 추가
-            stats['excluded_cnt'] += 1
-            with open(excluded_path, 'a', encoding='utf-8') as f:
-                f.write(f"{full_path}\n")
+    outputs = OutputFiles()
+    for file_path in [train_path, val_path, filtered_path, excluded_path]:
+        outputs.open(file_path)
+
+    # 입력 경로 순회 (묶음 단위 병렬 처리, 결과는 입력 순서대로 합산)
+    for count, result in run_split_chunks(all_files, manifest, options, workers):
+        merge_split_result(stats, result, count, logger)
+        for key, path in (('filtered', filtered_path), ('train', train_path),
+                          ('valid', val_path), ('excluded', excluded_path)):
+            if key in result['lines']:
+                outputs.write(path, result['lines'][key])
 
         # 진행 상황 출력
-        print(f"\r진행률: {progress:.1f}% ({stats['total_cnt']}/{total_files}) | "
+        progress = all_files.progress_text(stats['total_cnt'])
+        print(f"\r진행률: {progress} | "
               f"처리: {stats['processed_cnt']} | "
               f"필터링: {stats['filtered_cnt']} | "
               f"제외: {stats['excluded_cnt']} | "
@@ -2253,6 +2593,9 @@ def process_dataset_advanced(input_path, output_path, train_rate=0.8, skip_rate=
               f"검증: {stats['valid_img_cnt']}", end='')
 
     print("\n")  # 진행률 표시 줄바꿈
+    outputs.commit()
+    logger.info(f"전체 처리 대상 파일 수: {all_files.found}")
+    manifest.save(logger)
 
     # 최종 통계 저장
     np.savetxt(train_annotation_path, stats['obj_annotation_train'], fmt='%2d', 
@@ -2268,6 +2611,7 @@ def process_dataset_advanced(input_path, output_path, train_rate=0.8, skip_rate=
         f.write(f"출력 경로: {output_path}\n")
         f.write(f"학습 비율: {train_rate:.2f}\n")
         f.write(f"스킵 비율: {skip_rate:.2f}\n")
+        f.write(f"분할 시드: {seed}\n")
         
         f.write("\n=== 필터링 설정 ===\n")
         f.write(f"클래스 필터링: {'활성화' if filter_by_class else '비활성화'}\n")
@@ -2386,6 +2730,9 @@ def main():
                     if not (0 <= skip_rate < 1):
                         print("오류: 스킵 비율은 0과 1 사이여야 합니다")
                         continue
+
+                    seed_input = input("분할 시드를 입력하세요 (같은 시드면 같은 분할, 무작위: Enter): ").strip()
+                    seed = int(seed_input) if seed_input else None
                         
                 except ValueError:
                     print("오류: 올바른 숫자를 입력하세요")
@@ -2400,10 +2747,11 @@ def main():
                 print(f"스킵 비율: {skip_rate:.1%}")
 
                 try:
-                    stats = process_dataset(input_path, output_path, train_rate, skip_rate)
+                    stats = process_dataset(input_path, output_path, train_rate, skip_rate, seed)
                     
                     # 결과 출력
                     print("\n처리 완료!")
+                    print(f"분할 시드: {stats['seed']}")
                     print(f"총 이미지 수: {stats['total_cnt']}")
                     print(f"학습 이미지 수: {stats['train_img_cnt']}")
                     print(f"검증 이미지 수: {stats['valid_img_cnt']}")
@@ -2791,6 +3139,9 @@ def main():
                     if not (0 <= skip_rate < 1):
                         print("오류: 스킵 비율은 0과 1 사이여야 합니다")
                         continue
+
+                    seed_input = input("분할 시드를 입력하세요 (같은 시드면 같은 분할, 무작위: Enter): ").strip()
+                    seed = int(seed_input) if seed_input else None
                         
                 except ValueError:
                     print("오류: 올바른 숫자를 입력하세요")
@@ -2859,10 +3210,11 @@ def main():
                     stats = process_dataset_advanced(
                         input_path, output_path, train_rate, skip_rate,
                         filter_by_class, target_classes,
-                        exclude_background, combined_filter
+                        exclude_background, combined_filter, seed
                     )
                     
                     print("\n고급 데이터셋 처리 완료!")
+                    print(f"분할 시드: {stats['seed']}")
                     print(f"총 이미지 수: {stats['total_cnt']}")
                     print(f"필터링으로 선택된 이미지 수: {stats['filtered_cnt']}")
                     print(f"학습 이미지 수: {stats['train_img_cnt']}")
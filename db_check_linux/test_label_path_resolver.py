@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+01.make_label_list LabelPathResolver (폴더별 라벨 경로 캐시) 동작 테스트
+
+검증 대상:
+1. resolve / resolve_many 결과가 캐시 없는 기존 get_label_path_from_image와 같은지
+2. ensure_dir로 labels 폴더를 만들면 저장된 탐색 결과를 버리고 다시 찾는지
+"""
+
+import os
+
+
+def uncached_label_path(image_path):
+    """캐시 도입 전 get_label_path_from_image"""
+    if 'JPEGImages' in image_path:
+        return image_path.replace('JPEGImages', 'labels').replace('.jpg', '.txt')
+
+    directory = os.path.dirname(image_path)
+    base_filename = os.path.splitext(os.path.basename(image_path))[0] + '.txt'
+    current_dir = directory
+    while current_dir and current_dir != os.path.dirname(current_dir):
+        parent_dir = os.path.dirname(current_dir)
+        labels_dir = os.path.join(parent_dir, 'labels')
+        if os.path.exists(labels_dir):
+            relative_path = os.path.relpath(directory, os.path.dirname(labels_dir))
+            if relative_path.startswith('JPEGImages'):
+                relative_path = relative_path.replace('JPEGImages', 'labels', 1)
+            else:
+                relative_path = os.path.join('labels', os.path.basename(directory))
+            return os.path.join(parent_dir, relative_path, base_filename)
+        current_dir = parent_dir
+    return os.path.join(directory, 'labels', base_filename)
+
+
+def make_tree(root):
+    (root / "ds" / "JPEGImages" / "sub").mkdir(parents=True)
+    (root / "ds2" / "images" / "cam1").mkdir(parents=True)
+    (root / "ds2" / "labels").mkdir()
+    (root / "ds3" / "x" / "y").mkdir(parents=True)
+    return [
+        str(root / "ds" / "JPEGImages" / "sub" / "a.jpg"),
+        str(root / "ds2" / "images" / "cam1" / "b1.jpg"),
+        str(root / "ds2" / "images" / "cam1" / "b2.png"),
+        str(root / "ds2" / "images" / "c.jpg"),
+        str(root / "ds3" / "x" / "y" / "d.jpg"),
+        str(root / "ds3" / "x" / "e.jpg"),
+    ]
+
+
+def test_matches_uncached_resolver(make_label_list, tmp_path):
+    image_paths = make_tree(tmp_path)
+    resolver = make_label_list.LabelPathResolver()
+    expected = [uncached_label_path(path) for path in image_paths]
+
+    assert resolver.resolve_many(image_paths) == expected
+    assert [resolver.resolve(path) for path in image_paths] == expected
+    assert expected[1] == str(tmp_path / "ds2" / "labels" / "cam1" / "b1.txt")
+
+
+def test_ensure_dir_invalidates_cached_lookup(make_label_list, tmp_path):
+    image_paths = make_tree(tmp_path)
+    resolver = make_label_list.LabelPathResolver()
+    deep_image = image_paths[4]
+    assert resolver.resolve(deep_image) == str(tmp_path / "ds3" / "x" / "y" / "labels" / "d.txt")
+
+    # 상위 폴더에 labels를 만들면 아래 폴더의 탐색 결과가 달라짐
+    assert resolver.ensure_dir(str(tmp_path / "ds3" / "x" / "labels"))
+    assert not resolver.ensure_dir(str(tmp_path / "ds3" / "x" / "labels"))
+    assert resolver.resolve(deep_image) == str(tmp_path / "ds3" / "x" / "labels" / "y" / "d.txt")
+    assert resolver.resolve(deep_image) == uncached_label_path(deep_image)
+    assert resolver.resolve_many(image_paths) == [uncached_label_path(path) for path in image_paths]
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+01.make_label_list OutputFiles (결과 리스트 임시 파일 출력기) 동작 테스트
+
+검증 대상:
+1. commit() 전에는 기존 결과 파일이 그대로이고, commit() 후 새 내용으로 교체
+2. abort()는 임시 파일만 지우고 기존 결과 파일을 유지
+"""
+
+
+def test_commit_replaces_files(make_label_list, tmp_path):
+    train = tmp_path / "train.txt"
+    valid = tmp_path / "valid.txt"
+    train.write_text("old\n", encoding='utf-8')
+
+    outputs = make_label_list.OutputFiles(flush_interval=0)
+    outputs.open(train)
+    outputs.open(valid, header="# valid\n")
+    outputs.write(train, "a.jpg\n")
+    outputs.write(valid, "b.jpg\n")
+    assert train.read_text(encoding='utf-8') == "old\n"
+    assert not valid.exists()
+
+    outputs.commit()
+    assert train.read_text(encoding='utf-8') == "a.jpg\n"
+    assert valid.read_text(encoding='utf-8') == "# valid\nb.jpg\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["train.txt", "valid.txt"]
+    assert outputs not in make_label_list.OutputFiles.active
+
+
+def test_abort_keeps_previous_files(make_label_list, tmp_path):
+    train = tmp_path / "train.txt"
+    train.write_text("old\n", encoding='utf-8')
+
+    outputs = make_label_list.OutputFiles()
+    outputs.open(train)
+    outputs.open(tmp_path / "valid.txt")
+    outputs.write(train, "a.jpg\n")
+    outputs.flush()
+    assert (tmp_path / "train.txt.tmp").exists()
+
+    make_label_list.OutputFiles.abort_all()
+    assert train.read_text(encoding='utf-8') == "old\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["train.txt"]
+    assert outputs not in make_label_list.OutputFiles.active
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+01.make_label_list split_draws / run_split_chunks (시드 기반 train/valid 분할) 동작 테스트
+
+검증 대상:
+1. 같은 이미지 경로와 시드면 항상 같은 난수, 시드가 다르면 다른 분할
+2. 묶음 크기(처리 순서)와 관계없이 같은 분할 결과
+3. 빈 라벨을 만들 라벨 폴더는 묶음을 넘기기 전에 부모 프로세스에서 생성
+"""
+
+import os
+
+
+def make_images(root, count):
+    (root / "x" / "sub").mkdir(parents=True)
+    paths = []
+    for i in range(count):
+        folder = root / "x" / "sub" if i % 3 == 0 else root / "x"
+        path = folder / f"img{i:03d}.jpg"
+        path.write_bytes(b"")
+        paths.append(str(path))
+    return paths
+
+
+def split_options(root, seed, skip_rate=0):
+    return {
+        'input_source': str(root), 'seed': seed, 'train_rate': 0.7, 'skip_rate': skip_rate,
+        'filter_by_class': False, 'target_classes': None,
+        'exclude_background': False, 'combined_filter': False,
+    }
+
+
+def run_split(make_label_list, root, image_paths, options, chunk_size):
+    make_label_list.label_path_resolver.clear()
+    manifest = make_label_list.DatasetManifest(str(root), cache_dir=None)
+    splits = {'train': set(), 'valid': set()}
+    for count, result in make_label_list.run_split_chunks(image_paths, manifest, options,
+                                                          workers=1, chunk_size=chunk_size):
+        for split in splits:
+            splits[split].update(result['lines'].get(split, '').split())
+    return splits
+
+
+def test_split_draws_is_deterministic(make_label_list):
+    draws = make_label_list.split_draws("/data/JPEGImages/a.jpg", 42)
+    assert draws == make_label_list.split_draws("/data/JPEGImages/a.jpg", 42)
+    assert all(0.0 <= value < 1.0 for value in draws)
+    assert draws != make_label_list.split_draws("/data/JPEGImages/a.jpg", 43)
+    assert draws != make_label_list.split_draws("/data/JPEGImages/b.jpg", 42)
+
+
+def test_split_does_not_depend_on_chunking(make_label_list, tmp_path):
+    image_paths = make_images(tmp_path, 30)
+    options = split_options(tmp_path, seed=7)
+
+    whole = run_split(make_label_list, tmp_path, image_paths, options, chunk_size=100)
+    chunked = run_split(make_label_list, tmp_path, list(reversed(image_paths)), options, chunk_size=4)
+    assert whole == chunked
+    assert whole['train'] | whole['valid'] == set(image_paths)
+    assert whole['train'] and whole['valid']
+
+    other_seed = run_split(make_label_list, tmp_path, image_paths, split_options(tmp_path, seed=8), chunk_size=100)
+    assert other_seed != whole
+
+
+def test_label_dirs_created_before_dispatch(make_label_list, tmp_path, monkeypatch):
+    image_paths = make_images(tmp_path, 12)
+    original = make_label_list.split_label_chunk
+    dispatched = []
+
+    def checking_chunk(items, options):
+        for image_path, label_path, record in items:
+            dispatched.append((label_path, os.path.isdir(os.path.dirname(label_path))))
+        return original(items, options)
+
+    monkeypatch.setattr(make_label_list, 'split_label_chunk', checking_chunk)
+    run_split(make_label_list, tmp_path, image_paths, split_options(tmp_path, seed=1), chunk_size=2)
+
+    assert len(dispatched) == len(image_paths)
+    assert all(exists for label_path, exists in dispatched)
+    assert all(os.path.isfile(label_path) for label_path, exists in dispatched)
+    # 한 프로세스에서 순서대로 처리할 때와 같은 경로: 첫 하위 폴더 이미지는 같은 폴더 아래 labels,
+    # 상위 폴더에 labels가 생긴 뒤의 하위 폴더 이미지는 그 labels 폴더 기준
+    label_paths = {path for path, exists in dispatched}
+    assert str(tmp_path / "x" / "sub" / "labels" / "img000.txt") in label_paths
+    assert str(tmp_path / "x" / "labels" / "img001.txt") in label_paths
+    assert str(tmp_path / "x" / "labels" / "sub" / "img003.txt") in label_paths
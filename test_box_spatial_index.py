@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+06.label_check BoxSpatialIndex (데이터셋 전체 박스 격자 인덱스) 테스트
+
+검증 대상:
+1. query_center가 선형 탐색과 같은 결과를 내는지
+2. query_pixel_center가 해상도가 다른 이미지에서도 픽셀 허용 오차로 정확히 찾는지
+3. update()가 바뀐 파일만 다시 읽는지
+4. 이미지 크기는 update() 때 바뀐/모르는 파일만 조회하고 최소 크기를 유지하는지
+"""
+
+import os
+
+import numpy as np
+
+
+def box(line_idx, class_idx, x, y, w=0.1, h=0.1):
+    return [line_idx, class_idx, x, y, w, h]
+
+
+def build_index(label_check, tmp_path, file_boxes, image_size_of=None):
+    paths = []
+    for name in file_boxes:
+        path = str(tmp_path / f"{name}.txt")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(name)
+        paths.append(path)
+    index = label_check.BoxSpatialIndex()
+    index.update(paths, lambda path: np.array(file_boxes[os.path.basename(path)[:-4]],
+                                              dtype=np.float32).reshape(-1, 6), image_size_of=image_size_of)
+    return index, paths
+
+
+def test_query_center_matches_linear_scan(label_check, tmp_path):
+    rng = np.random.default_rng(0)
+    file_boxes = {f"f{i}": [box(j, int(rng.integers(3)), *rng.random(2)) for j in range(20)]
+                  for i in range(30)}
+    index, _ = build_index(label_check, tmp_path, file_boxes)
+
+    for x, y, r in [(0.5, 0.5, 0.05), (0.01, 0.99, 0.03), (0.3, 0.7, 0.2)]:
+        rows = index.query_center(x, y, r, r, classes=[1])
+        expected = np.flatnonzero((np.abs(index.boxes[:, 2] - x) <= r) &
+                                  (np.abs(index.boxes[:, 3] - y) <= r) & (index.boxes[:, 1] == 1))
+        np.testing.assert_array_equal(rows, expected)
+
+
+def test_query_pixel_center_uses_each_image_size(label_check, tmp_path):
+    # 기준 이미지는 1920px, 비교 이미지는 640px (4px 이내는 일치, 6px은 불일치)
+    file_boxes = {
+        "ref": [box(0, 0, 0.5, 0.5)],
+        "low_near": [box(0, 0, 0.5 + 4 / 640, 0.5)],
+        "low_far": [box(0, 0, 0.5 + 6 / 640, 0.5)],
+        "high_far": [box(0, 0, 0.5 + 6 / 1920, 0.5)],
+    }
+    sizes = {"ref": (1920, 1080), "low_near": (640, 360), "low_far": (640, 360), "high_far": (1920, 1080)}
+
+    def image_size_of(path):
+        return sizes[os.path.basename(path)[:-4]]
+
+    index, _ = build_index(label_check, tmp_path, file_boxes, image_size_of)
+    assert index.min_size == (640, 360)
+    rows = index.query_pixel_center(0.5, 0.5, 5, classes=[0])
+    found = {os.path.basename(index.row_info(row)[0])[:-4] for row in rows}
+    assert found == {"ref", "low_near"}
+
+
+def test_update_rereads_only_changed_files(label_check, tmp_path):
+    index, paths = build_index(label_check, tmp_path, {"a": [box(0, 0, 0.2, 0.2)], "b": [box(0, 1, 0.8, 0.8)]})
+    read = []
+
+    def read_boxes(path):
+        read.append(path)
+        return np.array([box(0, 2, 0.4, 0.4)], dtype=np.float32)
+
+    assert index.update(paths, read_boxes) == 0
+    with open(paths[0], 'a', encoding='utf-8') as f:
+        f.write("changed")
+    assert index.update(paths, read_boxes) == 1
+    assert read == [paths[0]]
+    assert sorted(index.boxes[:, 1].tolist()) == [1, 2]
+
+
+def test_image_sizes_are_read_only_for_changed_files(label_check, tmp_path):
+    file_boxes = {"small": [box(0, 0, 0.5, 0.5)], "big": [box(0, 0, 0.5, 0.5)], "empty": []}
+    sizes = {"small": (640, 360), "big": (1920, 1080)}
+    looked_up = []
+
+    def image_size_of(path):
+        name = os.path.basename(path)[:-4]
+        looked_up.append(name)
+        return sizes[name]
+
+    # 크기 없이 만든 인덱스도 크기 조회 시 모르는 파일만 채움 (박스 없는 파일은 조회 안 함)
+    index, paths = build_index(label_check, tmp_path, file_boxes)
+    assert index.min_size is None
+    read_boxes = lambda path: np.array(file_boxes[os.path.basename(path)[:-4]], dtype=np.float32).reshape(-1, 6)
+    assert index.update(paths, read_boxes, image_size_of=image_size_of) == 0
+    assert sorted(looked_up) == ["big", "small"]
+    assert index.min_size == (640, 360)
+
+    looked_up.clear()
+    index.update(paths, read_boxes, image_size_of=image_size_of)
+    assert looked_up == []
+
+    # 최소 크기 파일이 목록에서 빠지면 남은 크기로 다시 계산 (이미지는 다시 열지 않음)
+    index.update([path for path in paths if "small" not in path], read_boxes, image_size_of=image_size_of)
+    assert looked_up == []
+    assert index.min_size == (1920, 1080)
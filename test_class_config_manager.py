@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+04.GTGEN ClassConfigManager 동작 테스트
+
+검증 대상:
+1. base_dir 기준으로 설정/마지막 사용 설정 파일 경로 결정
+2. remember=False로 읽으면 마지막 사용 설정을 바꾸지 않음 (--apply-rules 일괄 모드)
+"""
+
+import json
+
+
+def write_config(path, names):
+    classes = [{'id': i, 'name': name, 'color': 'red', 'key': ''} for i, name in enumerate(names)]
+    path.write_text(json.dumps({'classes': classes}), encoding='utf-8')
+
+
+def test_base_dir_and_last_config(gtgen, tmp_path):
+    write_config(tmp_path / "class_config_a.json", ["person"])
+    write_config(tmp_path / "class_config_b.json", ["car", "bus"])
+    manager = gtgen.ClassConfigManager(base_dir=str(tmp_path))
+    assert manager.last_config_file == str(tmp_path / ".last_class_config.txt")
+
+    assert manager.load_config("class_config_a")
+    assert manager.load_last_config() == "class_config_a.json"
+
+    batch = gtgen.ClassConfigManager(base_dir=str(tmp_path))
+    assert batch.load_config("class_config_b", remember=False)
+    assert batch.get_class_names() == ["car", "bus"]
+    assert batch.load_last_config() == "class_config_a.json"
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+06.label_check LabelEditEngine (라벨 일괄 편집/되돌리기) 동작 테스트
+
+검증 대상:
+1. 삭제/클래스 변경 적용 후 undo()로 원래 내용 복원, 같은 편집 재적용
+2. 편집 이후 바뀐 파일은 되돌리지 않고 실행 기록 유지
+3. 실행 기록 정리 (discard, 오래된 기록 prune_stale)
+4. 원자적 쓰기 시 원본 파일 권한 유지
+"""
+
+import os
+import stat
+import time
+
+ORIGINAL = "0 0.1 0.1 0.1 0.1\n1 0.2 0.2 0.1 0.1\n2 0.3 0.3 0.1 0.1\n"
+
+
+def write_label(path, text=ORIGINAL):
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(text)
+    return str(path)
+
+
+def read_label(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def make_operations(engine_cls, label_path):
+    """첫 번째 박스 삭제 + 세 번째 박스 클래스 5로 변경"""
+    operations = engine_cls.group_operations([{'path': label_path, 'boxes': [{'line_idx': 0}]}], delete=True)
+    operations[label_path]['change'][2] = 5
+    return operations
+
+
+def test_apply_undo_and_reapply(label_check, tmp_path):
+    label_path = write_label(tmp_path / "a.txt")
+    engine = label_check.LabelEditEngine(str(tmp_path / "journal"))
+    operations = make_operations(label_check.LabelEditEngine, label_path)
+
+    results, journal_path = engine.apply(operations)
+    assert results[0]['deleted'] == [0] and results[0]['changed'] == [2]
+    assert read_label(label_path) == "1 0.2 0.2 0.1 0.1\n5 0.3 0.3 0.1 0.1\n"
+
+    restored, skipped = engine.undo(journal_path)
+    assert (restored, skipped) == ([label_path], [])
+    assert read_label(label_path) == ORIGINAL
+    assert not os.path.exists(journal_path)
+
+    _, journal_path = engine.apply(operations)
+    assert read_label(label_path) == "1 0.2 0.2 0.1 0.1\n5 0.3 0.3 0.1 0.1\n"
+    assert os.path.exists(journal_path)
+
+
+def test_undo_skips_file_changed_after_edit(label_check, tmp_path):
+    label_path = write_label(tmp_path / "a.txt")
+    engine = label_check.LabelEditEngine(str(tmp_path / "journal"))
+    _, journal_path = engine.apply(make_operations(label_check.LabelEditEngine, label_path))
+
+    write_label(label_path, "9 0.5 0.5 0.1 0.1\n")
+    restored, skipped = engine.undo(journal_path)
+    assert restored == [] and len(skipped) == 1
+    assert read_label(label_path) == "9 0.5 0.5 0.1 0.1\n"
+    assert os.path.exists(journal_path)
+
+
+def test_discard_and_prune_stale_journals(label_check, tmp_path):
+    journal_dir = tmp_path / "journal"
+    engine = label_check.LabelEditEngine(str(journal_dir))
+    label_path = write_label(tmp_path / "a.txt")
+    _, old_journal = engine.apply(make_operations(label_check.LabelEditEngine, label_path))
+
+    expired = time.time() - engine.JOURNAL_MAX_AGE - 60
+    os.utime(old_journal, (expired, expired))
+    other = write_label(tmp_path / "b.txt")
+    _, new_journal = engine.apply(make_operations(label_check.LabelEditEngine, other))
+    assert not os.path.exists(old_journal)
+    assert os.path.exists(new_journal)
+
+    assert label_check.LabelEditEngine.discard([new_journal, old_journal]) == 1
+    assert not journal_dir.exists()
+
+
+def test_atomic_write_keeps_file_mode(label_check, tmp_path):
+    label_path = write_label(tmp_path / "a.txt")
+    os.chmod(label_path, 0o640)
+    engine = label_check.LabelEditEngine(str(tmp_path / "journal"))
+
+    engine.apply(make_operations(label_check.LabelEditEngine, label_path))
+    assert stat.S_IMODE(os.stat(label_path).st_mode) == 0o640
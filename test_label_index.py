@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+06.label_check LabelIndex (리스트 옆 SQLite 라벨 인덱스) 동작 테스트
+
+검증 대상:
+1. 저장 후 다시 열면 stat이 같은 항목만 재사용
+2. 박스 배열 저장/복원
+3. 현재 리스트에 없는 항목 정리
+4. 스키마 버전이 다르면 인덱스 초기화
+"""
+
+import os
+from collections import Counter
+
+import numpy as np
+
+
+def write_label(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return os.stat(path)
+
+
+def test_reopen_reuses_entry_only_when_stat_matches(label_check, tmp_path):
+    list_path = str(tmp_path / "list.txt")
+    label_path = str(tmp_path / "a.txt")
+    st = write_label(label_path, "1 0.5 0.5 0.1 0.1\n")
+    boxes = np.array([[0, 1, 0.5, 0.5, 0.1, 0.1]], dtype=np.float32)
+
+    index = label_check.LabelIndex(list_path).open()
+    index.put(label_path, st, "성공", Counter({"1": 1}), boxes)
+    assert index.commit() == (1, 0)
+    index.close()
+
+    index = label_check.LabelIndex(list_path).open()
+    assert index.lookup(label_path, st) == ("성공", Counter({"1": 1}))
+    np.testing.assert_array_equal(index.get_boxes(label_path, st), boxes)
+
+    st_changed = write_label(label_path, "1 0.5 0.5 0.1 0.1\n2 0.2 0.2 0.1 0.1\n")
+    assert index.lookup(label_path, st_changed) is None
+    assert index.get_boxes(label_path, st_changed) is None
+    index.close()
+
+
+def test_commit_prunes_paths_missing_from_list(label_check, tmp_path):
+    list_path = str(tmp_path / "list.txt")
+    kept = str(tmp_path / "kept.txt")
+    dropped = str(tmp_path / "dropped.txt")
+    empty = np.zeros((0, 6), dtype=np.float32)
+
+    index = label_check.LabelIndex(list_path).open()
+    index.put(kept, write_label(kept, ""), "빈 파일", Counter(), empty)
+    index.put(dropped, write_label(dropped, ""), "빈 파일", Counter(), empty)
+    index.commit()
+
+    written, pruned = index.commit(live_paths=[kept])
+    assert (written, pruned) == (0, 1)
+    assert set(index.entries) == {kept}
+    index.close()
+
+    index = label_check.LabelIndex(list_path).open()
+    assert set(index.entries) == {kept}
+    index.close()
+
+
+def test_schema_change_resets_index(label_check, tmp_path):
+    list_path = str(tmp_path / "list.txt")
+    label_path = str(tmp_path / "a.txt")
+    st = write_label(label_path, "0 0.5 0.5 0.1 0.1\n")
+
+    index = label_check.LabelIndex(list_path).open()
+    index.put(label_path, st, "성공", Counter({"0": 1}), np.zeros((0, 6), dtype=np.float32))
+    index.commit()
+    index.conn.execute("UPDATE meta SET value='old' WHERE key='schema'")
+    index.conn.commit()
+    index.close()
+
+    index = label_check.LabelIndex(list_path).open()
+    assert index.entries == {}
+    assert index.lookup(label_path, st) is None
+    index.close()
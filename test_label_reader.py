@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+06.label_check LabelReader (라벨 파일 인코딩 처리) 동작 테스트
+
+검증 대상:
+1. ASCII / BOM 파일은 인코딩 결정 없이 바로 변환
+2. 비 ASCII 파일에서 LABEL_ENCODINGS 순서로 cp949 폴백 후 인코딩 고정
+3. readlines()와 같은 형태의 줄 목록 (유니버설 개행)
+"""
+
+
+def test_ascii_does_not_fix_encoding(label_check, tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"0 0.5 0.5 0.1 0.1\n1 0.2 0.2 0.1 0.1\n")
+    reader = label_check.LabelReader()
+
+    assert reader.read_lines(str(path)) == ["0 0.5 0.5 0.1 0.1\n", "1 0.2 0.2 0.1 0.1\n"]
+    assert reader.encoding is None
+
+
+def test_utf8_bom_is_stripped(label_check, tmp_path):
+    path = tmp_path / "bom.txt"
+    path.write_bytes(b"\xef\xbb\xbf0 0.5 0.5 0.1 0.1\n")
+    reader = label_check.LabelReader()
+
+    assert reader.read_lines(str(path)) == ["0 0.5 0.5 0.1 0.1\n"]
+    assert reader.encoding is None
+
+
+def test_cp949_fallback_is_kept_for_dataset(label_check, tmp_path):
+    korean = tmp_path / "ko.txt"
+    korean.write_bytes("0 0.5 0.5 0.1 0.1 # 사람\n".encode('cp949'))
+    reader = label_check.LabelReader()
+
+    assert reader.read_lines(str(korean)) == ["0 0.5 0.5 0.1 0.1 # 사람\n"]
+    assert reader.encoding == 'cp949'
+
+    # 이후 파일은 고정된 인코딩을 먼저 시도
+    other = tmp_path / "other.txt"
+    other.write_bytes("차량".encode('cp949'))
+    assert reader.read_lines(str(other)) == ["차량"]
+    assert reader.encoding == 'cp949'
+
+
+def test_utf8_first_non_ascii_file_fixes_utf8(label_check, tmp_path):
+    path = tmp_path / "utf8.txt"
+    path.write_bytes("1 0.5 0.5 0.1 0.1 # 사람\n".encode('utf-8'))
+    reader = label_check.LabelReader()
+
+    assert reader.read_lines(str(path)) == ["1 0.5 0.5 0.1 0.1 # 사람\n"]
+    assert reader.encoding == 'utf-8'
+
+
+def test_split_lines_matches_readlines(label_check):
+    reader = label_check.LabelReader()
+
+    assert reader.split_lines(b"") == []
+    assert reader.split_lines(b"0 1 2 3 4\r\n1 1 2 3 4\r2 1 2 3 4") == [
+        "0 1 2 3 4\n", "1 1 2 3 4\n", "2 1 2 3 4"]
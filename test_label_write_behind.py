@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+04.GTGEN LabelWriteBehind (라벨 write-behind 저장기) 동작 테스트
+
+검증 대상:
+1. 같은 파일 연속 저장은 마지막 내용 하나로 합쳐짐
+2. flush(path)는 해당 파일만 즉시 저장, flush()는 전부 저장
+3. 쓰기 중 예외가 나도 flush 대기가 끝나고 스레드가 계속 동작
+"""
+
+import threading
+
+
+def flush_with_timeout(writer, path=None, timeout=5.0):
+    """flush가 끝나지 않으면 테스트가 멈추지 않도록 별도 스레드에서 실행"""
+    worker = threading.Thread(target=writer.flush, args=(path,), daemon=True)
+    worker.start()
+    worker.join(timeout)
+    assert not worker.is_alive(), "flush가 끝나지 않음"
+
+
+def test_repeated_submits_are_coalesced(gtgen, tmp_path, monkeypatch):
+    written = []
+    original = gtgen.write_text_atomic
+    monkeypatch.setattr(gtgen, 'write_text_atomic', lambda path, text: (written.append(text), original(path, text)))
+    writer = gtgen.LabelWriteBehind(delay=60, max_delay=60)
+    path = str(tmp_path / "a.txt")
+
+    for i in range(5):
+        writer.submit(path, f"{i} 0.5 0.5 0.1 0.1\n")
+    assert writer.pending_count() == 1
+    flush_with_timeout(writer)
+
+    assert written == ["4 0.5 0.5 0.1 0.1\n"]
+    assert open(path).read() == "4 0.5 0.5 0.1 0.1\n"
+    writer.close()
+
+
+def test_flush_path_writes_only_that_file(gtgen, tmp_path):
+    writer = gtgen.LabelWriteBehind(delay=60, max_delay=60)
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    writer.submit(str(first), "0 0.1 0.1 0.1 0.1\n")
+    writer.submit(str(second), "1 0.2 0.2 0.1 0.1\n")
+
+    flush_with_timeout(writer, str(first))
+    assert first.exists() and not second.exists()
+    assert writer.pending_count() == 1
+
+    flush_with_timeout(writer)
+    assert second.read_text() == "1 0.2 0.2 0.1 0.1\n"
+    writer.close()
+
+    # 종료 후 요청은 바로 씀
+    writer.submit(str(first), "2 0.3 0.3 0.1 0.1\n")
+    assert first.read_text() == "2 0.3 0.3 0.1 0.1\n"
+
+
+def test_write_error_does_not_stop_writer(gtgen, tmp_path, monkeypatch):
+    original = gtgen.write_text_atomic
+    bad = str(tmp_path / "bad.txt")
+
+    def failing_write(path, text):
+        if path == bad:
+            raise ValueError("쓰기 실패")
+        original(path, text)
+
+    monkeypatch.setattr(gtgen, 'write_text_atomic', failing_write)
+    writer = gtgen.LabelWriteBehind(delay=60, max_delay=60)
+    writer.submit(bad, "0 0.1 0.1 0.1 0.1\n")
+    flush_with_timeout(writer, bad)
+
+    errors = writer.pop_errors()
+    assert [(path, type(e)) for path, e in errors] == [(bad, ValueError)]
+    assert writer.pending_count() == 0
+
+    good = tmp_path / "good.txt"
+    writer.submit(str(good), "1 0.2 0.2 0.1 0.1\n")
+    flush_with_timeout(writer)
+    assert writer.thread.is_alive()
+    assert good.read_text() == "1 0.2 0.2 0.1 0.1\n"
+    writer.close()
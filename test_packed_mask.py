@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+04.GTGEN PackedMask (비트 압축 마스킹) 동작 테스트
+
+검증 대상:
+1. 이전 형식(masking_y/masking_x 좌표) 마스크 파일 읽기
+2. 새 형식 저장/읽기 왕복
+3. apply/is_applied/bounds가 기존 좌표 방식과 같은 픽셀을 칠하는지
+"""
+
+import numpy as np
+
+
+def make_mask(width=37, height=21):
+    mask = np.zeros((height, width), dtype=bool)
+    mask[3:9, 5:20] = True
+    mask[15, 30:37] = True  # 8의 배수가 아닌 폭의 마지막 바이트
+    return mask
+
+
+def test_load_legacy_coordinate_file(gtgen, tmp_path):
+    mask = make_mask()
+    ys, xs = np.where(mask)
+    path = str(tmp_path / "frame_mask.npz")
+    np.savez_compressed(path, masking_y=ys, masking_x=xs, width=mask.shape[1], height=mask.shape[0])
+
+    packed = gtgen.PackedMask.load(path)
+    assert (packed.width, packed.height) == (37, 21)
+    assert packed.count() == mask.sum()
+    np.testing.assert_array_equal(packed.region(0, 0, 37, 21), mask)
+
+
+def test_save_load_roundtrip(gtgen, tmp_path):
+    mask = make_mask()
+    path = str(tmp_path / "frame_mask.npz")
+    gtgen.PackedMask.from_bool(mask).save(path)
+
+    with np.load(path) as data:
+        assert int(data['version']) == gtgen.PackedMask.FILE_VERSION
+        assert 'masking_y' not in data.files
+    loaded = gtgen.PackedMask.load(path)
+    np.testing.assert_array_equal(loaded.region(0, 0, 37, 21), mask)
+
+
+def test_apply_matches_coordinate_masking(gtgen):
+    mask = make_mask()
+    packed = gtgen.PackedMask.from_bool(mask)
+    assert packed.bounds() == (5, 3, 36, 15)
+
+    image = np.zeros((21, 37, 3), dtype=np.uint8)
+    expected = image.copy()
+    expected[np.where(mask)] = gtgen.MASK_COLOR  # 기존 좌표 튜플 방식
+    packed.apply(image)
+    np.testing.assert_array_equal(image, expected)
+    assert packed.is_applied(image)
+    assert not packed.is_applied(np.zeros_like(image))
+
+    empty = gtgen.PackedMask.from_bool(np.zeros((4, 4), dtype=bool))
+    assert not empty and empty.bounds() is None
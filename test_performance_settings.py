@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+06.label_check 성능 설정 파일(performance.json) 읽기 테스트
+"""
+
+import json
+
+
+def test_missing_or_invalid_file_gives_defaults(label_check, tmp_path):
+    assert label_check.load_performance_settings(str(tmp_path / "none.json")) == {}
+
+    broken = tmp_path / "broken.json"
+    broken.write_text("{prefetch_depth: ", encoding='utf-8')
+    assert label_check.load_performance_settings(str(broken)) == {}
+
+    not_dict = tmp_path / "list.json"
+    not_dict.write_text("[1, 2]", encoding='utf-8')
+    assert label_check.load_performance_settings(str(not_dict)) == {}
+
+
+def test_prefetch_depth_is_read(label_check, tmp_path):
+    path = tmp_path / "performance.json"
+    path.write_text(json.dumps({"prefetch_depth": 3}), encoding='utf-8')
+    assert label_check.load_performance_settings(str(path))["prefetch_depth"] == 3
+
+
+def test_viewer_uses_configured_prefetch_depth(label_check, monkeypatch):
+    import gc
+    import types
+
+    threshold = gc.get_threshold()
+    try:
+        for settings, expected in [({}, 1), ({"prefetch_depth": 2}, 2),
+                                   ({"prefetch_depth": -1}, 0), ({"prefetch_depth": "x"}, 1)]:
+            monkeypatch.setattr(label_check, "load_performance_settings", lambda s=settings: s)
+            viewer = types.SimpleNamespace()
+            label_check.ImageViewer.setup_performance_settings(viewer)
+            assert viewer.prefetch_depth == expected
+    finally:
+        gc.set_threshold(*threshold)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+06.label_check ThumbnailCache 동작 테스트
+
+검증 대상:
+1. 메모리 -> 디스크 -> 디코딩 순서의 캐시 적중
+2. 프리페치 스레드가 채우는 동안 UI 쪽 정리(trim/discard_where)를 동시에 호출해도 안전한지
+"""
+
+import threading
+
+from PIL import Image
+
+
+def make_images(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = str(tmp_path / f"img{i}.jpg")
+        Image.new('RGB', (64, 48), (i * 10 % 256, 0, 0)).save(path)
+        paths.append(path)
+    return paths
+
+
+def test_memory_then_disk_hits(label_check, tmp_path):
+    path = make_images(tmp_path, 1)[0]
+    cache = label_check.ThumbnailCache(cache_dir=str(tmp_path / "cache"))
+
+    assert cache.get(path, (32, 32)).size == (32, 32)
+    cache.get(path, (32, 32))
+    assert cache.stats == {'memory': 1, 'disk': 0, 'decode': 1}
+
+    cache.flush()
+    assert cache.trim(0) == 1
+    cache.get(path, (32, 32))
+    assert cache.stats['disk'] == 1
+
+
+def test_concurrent_fill_and_cleanup(label_check, tmp_path):
+    paths = make_images(tmp_path, 40)
+    cache = label_check.ThumbnailCache(memory_limit=25, cache_dir=str(tmp_path / "cache"))
+    errors = []
+    stop = threading.Event()
+
+    def prefetch():
+        try:
+            for _ in range(5):
+                for path in paths:
+                    cache.get(path, (16, 16))
+        except Exception as e:
+            errors.append(e)
+        finally:
+            stop.set()
+
+    workers = [threading.Thread(target=prefetch) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    while not stop.is_set():
+        cache.trim(10)
+        cache.discard_where(lambda key: key.startswith(paths[0]))
+        len(cache)
+    for worker in workers:
+        worker.join()
+
+    assert errors == []
+    assert len(cache) <= 25
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+06.label_check 가상화 그리드 (grid_layout / visible_grid_items / VirtualGrid) 테스트
+
+검증 대상:
+1. grid_layout이 tk grid와 같이 행/열 최대 크기로 셀 영역을 계산하는지
+2. 보이는 행과 위아래 한 행의 항목만 고르고, 셀 수가 풀 크기를 넘지 않는지 (페이지 크기와 무관)
+3. 라인 삭제 후 항목 line_idx와 선택 키가 함께 고쳐지는지
+"""
+
+
+def make_page(label_check, boxes_per_image, images):
+    """update_display와 같은 배치: 박스 크롭은 12열, 박스가 없는 이미지는 5열"""
+    items = []
+    row = col = 0
+    for n in range(images):
+        label_path = f"/data/labels/{n}.txt"
+        if boxes_per_image:
+            for line_idx in range(boxes_per_image):
+                items.append(label_check.GridItem(label_path, f"/data/JPEGImages/{n}.jpg", row, col, n,
+                                                  class_idx=0, line_idx=line_idx, box_idx=line_idx,
+                                                  box=(0.5, 0.5, 0.1, 0.1)))
+                col += 1
+                if col >= 12:
+                    col, row = 0, row + 2
+        else:
+            items.append(label_check.GridItem(label_path, f"/data/JPEGImages/{n}.jpg", row, col, n))
+            col += 1
+            if col >= 5:
+                col, row = 0, row + 2
+    return items
+
+
+def test_grid_layout_matches_grid_rows_and_columns(label_check):
+    items = make_page(label_check, 0, 7) + make_page(label_check, 1, 1)
+    items[-1].row, items[-1].col = 4, 0
+    positions, row_spans, width, height = label_check.grid_layout(items, pad=10, border=4)
+
+    assert [(top, bottom) for top, bottom, _ in row_spans] == [(0, 228), (228, 456), (456, 584)]
+    assert positions[0] == (0, 0, 228, 228)
+    assert positions[6] == (228, 228, 228, 228)
+    assert positions[-1] == (0, 456, 228, 128)
+    assert width == 5 * 228 and height == 584
+    assert sorted(i for _, _, members in row_spans for i in members) == list(range(len(items)))
+
+
+def test_visible_items_stay_within_pool(label_check):
+    view_height = 700
+    capacities = []
+    for images in (10, 100, 500):
+        items = make_page(label_check, 3, images)
+        _, row_spans, _, height = label_check.grid_layout(items)
+        capacity = label_check.grid_pool_capacity(row_spans, view_height)
+        capacities.append(capacity)
+        for top in range(0, height, 37):
+            visible = label_check.visible_grid_items(row_spans, top, top + view_height)
+            assert len(visible) <= capacity
+            rows = {items[i].row for i in visible}
+            # 보이는 행에 걸친 항목은 모두 포함
+            for span_top, span_bottom, members in row_spans:
+                if span_bottom > top and span_top < top + view_height:
+                    assert set(members) <= visible
+            assert len(rows) <= -(-view_height // 128) + 3
+    # 페이지가 커져도 풀 크기는 화면 크기로 제한
+    assert capacities[1] == capacities[2]
+    assert capacities[2] < len(make_page(label_check, 3, 500))
+
+
+def test_visible_items_include_one_row_margin(label_check):
+    items = make_page(label_check, 12, 10)
+    _, row_spans, _, _ = label_check.grid_layout(items)
+    visible = label_check.visible_grid_items(row_spans, 300, 400, margin=1)
+    assert {items[i].row for i in visible} == {2, 4, 6, 8}
+    assert label_check.visible_grid_items([], 0, 100) == set()
+
+
+def test_update_line_indices_moves_checked_keys(label_check):
+    grid = label_check.VirtualGrid(None, None, None)
+    grid.items = make_page(label_check, 3, 2)
+    grid.checked = {("/data/labels/0.txt", 0), ("/data/labels/0.txt", 2), ("/data/labels/1.txt", 1)}
+
+    deleted = [0]
+    updated = grid.update_line_indices(
+        "/data/labels/0.txt", lambda line_idx: None if line_idx in deleted else line_idx - 1)
+
+    assert updated == 3
+    assert [item.line_idx for item in grid.items[:3]] == [None, 0, 1]
+    assert grid.checked == {("/data/labels/0.txt", 1), ("/data/labels/1.txt", 1)}
+    assert grid.index_of[("/data/labels/0.txt", 1)] == 2